@@ -9,6 +9,7 @@ from ..services.cache_manager import CacheManager
 from ..core.exceptions import (
     CacheKeyError,
     CacheOperationError,
+    CacheSerializationError,
     InvalidKeyspaceError,
     CircuitBreakerError,
 )
@@ -32,6 +33,7 @@ class CacheSetRequest(BaseModel):
     value: Any = Field(..., description="Value to cache")
     ttl: Optional[int] = Field(None, description="Time-to-live in seconds")
     update_local: bool = Field(default=True, description="Update local cache")
+    tags: List[str] = Field(default_factory=list, description="Invalidation tags")
 
 
 class CacheDeleteRequest(BaseModel):
@@ -51,6 +53,7 @@ class CacheBatchSetRequest(BaseModel):
     items: Dict[str, Any] = Field(..., description="Key-value pairs to cache")
     ttl: Optional[int] = Field(None, description="Time-to-live in seconds")
     update_local: bool = Field(default=True, description="Update local cache")
+    tags: List[str] = Field(default_factory=list, description="Invalidation tags")
 
 
 class CacheBatchDeleteRequest(BaseModel):
@@ -65,6 +68,11 @@ class CacheFlushRequest(BaseModel):
     pattern: Optional[str] = Field(None, description="Pattern to match")
 
 
+class CacheInvalidateRequest(BaseModel):
+    """Cache tag invalidation request model."""
+    tags: List[str] = Field(..., min_length=1, description="Tags to invalidate")
+
+
 class CacheResponse(BaseModel):
     """Generic cache response model."""
     status: str = Field(..., description="Operation status")
@@ -151,7 +159,8 @@ async def set_cache_item(
             value=request.value,
             ttl=request.ttl,
             service=service_id,
-            update_local=request.update_local
+            update_local=request.update_local,
+            tags=request.tags
         )
         
         return CacheResponse(
@@ -276,7 +285,8 @@ async def batch_set_cache_items(
             items=request.items,
             ttl=request.ttl,
             service=service_id,
-            update_local=request.update_local
+            update_local=request.update_local,
+            tags=request.tags
         )
         
         return CacheResponse(
@@ -354,14 +364,21 @@ async def batch_delete_cache_items(
 @api_router.get("/pattern/{pattern}")
 async def scan_cache_keys(
     pattern: str,
-    count: int = Query(100, ge=1, le=10000, description="Maximum keys to return"),
+    cursor: str = Query("0", description="Cursor from the previous page, 0 to start"),
+    count: int = Query(100, ge=1, le=10000, description="Keys per page"),
     cache_manager: CacheManager = Depends(get_cache_manager),
     service_id: Optional[str] = Depends(get_service_id),
 ) -> CacheResponse:
-    """Scan for keys matching pattern."""
+    """Scan a page of keys matching pattern.
+    
+    Pass the returned next_cursor to get the following page; the scan is
+    complete when next_cursor is "0". Pages may be smaller than count, or
+    empty, before the scan is complete.
+    """
     try:
-        keys = await cache_manager.scan_keys(
+        next_cursor, keys = await cache_manager.scan_page(
             pattern=pattern,
+            cursor=cursor,
             count=count,
             service=service_id
         )
@@ -372,10 +389,61 @@ async def scan_cache_keys(
             metadata={
                 "pattern": pattern,
                 "count": len(keys),
+                "cursor": cursor,
+                "next_cursor": next_cursor,
+                "complete": next_cursor == "0",
+                "service": service_id
+            }
+        )
+        
+    except CacheKeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Cache scan error", pattern=pattern, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Cache operation failed"
+        )
+
+
+@api_router.get("/pattern/{pattern}/values")
+async def scan_cache_values(
+    pattern: str,
+    cursor: str = Query("0", description="Cursor from the previous page, 0 to start"),
+    count: int = Query(100, ge=1, le=1000, description="Keys per page"),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    service_id: Optional[str] = Depends(get_service_id),
+) -> CacheResponse:
+    """Scan a page of entries matching pattern, paged like the key scan."""
+    try:
+        next_cursor, items = await cache_manager.scan_items_page(
+            pattern=pattern,
+            cursor=cursor,
+            count=count,
+            service=service_id
+        )
+        
+        return CacheResponse(
+            status="success",
+            data=items,
+            metadata={
+                "pattern": pattern,
+                "count": len(items),
+                "cursor": cursor,
+                "next_cursor": next_cursor,
+                "complete": next_cursor == "0",
                 "service": service_id
             }
         )
         
+    except CacheKeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error("Cache scan error", pattern=pattern, error=str(e))
         raise HTTPException(
@@ -423,6 +491,106 @@ async def flush_cache(
         )
 
 
+@api_router.post("/invalidate")
+async def invalidate_cache_tags(
+    request: CacheInvalidateRequest,
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    service_id: Optional[str] = Depends(get_service_id),
+) -> CacheResponse:
+    """Invalidate every entry carrying any of the given tags.
+    
+    Namespace tags (``ns:<service>``) may only be invalidated by their own
+    service. Other replicas may serve invalidated entries for up to
+    TAG_GENERATION_TTL seconds (1 by default) while their cached tag
+    generations expire.
+    """
+    try:
+        if not service_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Service authentication required for invalidation"
+            )
+
+        foreign = [
+            tag for tag in request.tags
+            if tag.startswith("ns:") and tag != f"ns:{service_id}"
+        ]
+        if foreign:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Cannot invalidate another service's namespace: {', '.join(foreign)}"
+            )
+
+        generations = await cache_manager.invalidate_tags(request.tags)
+        
+        return CacheResponse(
+            status="success",
+            data={"generations": generations},
+            metadata={
+                "tags": request.tags,
+                "requested_by": service_id
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except CircuitBreakerError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Cache invalidate error", tags=request.tags, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Cache operation failed"
+        )
+
+
+@api_router.post("/codec/dictionaries/{namespace}")
+async def train_codec_dictionary(
+    namespace: str,
+    samples: Optional[int] = Query(None, ge=1, description="Maximum entries to sample"),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    service_id: Optional[str] = Depends(get_service_id),
+) -> CacheResponse:
+    """Train a compression dictionary for a namespace, e.g. "character:sheets"."""
+    try:
+        if not service_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Service authentication required for dictionary training"
+            )
+        
+        if samples is None:
+            result = await cache_manager.train_codec_dictionary(namespace)
+        else:
+            result = await cache_manager.train_codec_dictionary(namespace, samples)
+        
+        return CacheResponse(
+            status="success",
+            data=result,
+            metadata={
+                "namespace": namespace,
+                "requested_by": service_id
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except (CacheKeyError, CacheSerializationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Codec dictionary training error", namespace=namespace, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Cache operation failed"
+        )
+
+
 @api_router.get("/stats")
 async def get_cache_stats(
     cache_manager: CacheManager = Depends(get_cache_manager),
@@ -446,6 +614,31 @@ async def get_cache_stats(
         )
 
 
+@api_router.get("/admin/hot-keys")
+async def get_hot_keys(
+    service: Optional[str] = Query(None, description="Only report this service"),
+    limit: int = Query(10, ge=1, le=100, description="Keys per service"),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    service_id: Optional[str] = Depends(get_service_id),
+) -> CacheResponse:
+    """Get the most read keys per service, with their estimated recent reads."""
+    if not service_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Service authentication required for admin operations"
+        )
+    
+    return CacheResponse(
+        status="success",
+        data=cache_manager.get_hot_keys(service, limit),
+        metadata={
+            "service": service,
+            "limit": limit,
+            "requested_by": service_id
+        }
+    )
+
+
 @api_router.post("/reload")
 async def reload_cache(
     cache_manager: CacheManager = Depends(get_cache_manager),
@@ -2,7 +2,7 @@
 
 import json
 import zlib
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 import redis.asyncio as redis
 
 from ..integrations.message_hub import CacheServiceIntegration
@@ -119,21 +119,41 @@ class CacheOperations:
         """
         return bool(await self.redis.exists(key))
         
-    async def get_pattern(self, pattern: str) -> Dict[str, Any]:
-        """Get all keys matching pattern.
+    async def iter_pattern(
+        self,
+        pattern: str,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over keys matching pattern and their values in chunks.
+
+        Keys are found with an incremental SCAN and each chunk is read with a
+        single MGET, so only one chunk is held in memory at a time.
 
         Args:
             pattern: Redis key pattern
+            batch_size: Keys per chunk
 
-        Returns:
-            Dict of key-value pairs
+        Yields:
+            Dict of key-value pairs for each chunk
         """
-        keys = await self.redis.keys(pattern)
+        batch_size = batch_size or self.config.get("scan_batch_size", 1000)
+        batch = []
         
-        if not keys:
-            return {}
-            
-        # Get all values
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                chunk = await self._get_chunk(batch)
+                batch = []
+                if chunk:
+                    yield chunk
+                    
+        if batch:
+            chunk = await self._get_chunk(batch)
+            if chunk:
+                yield chunk
+
+    async def _get_chunk(self, keys: List[Any]) -> Dict[str, Any]:
+        """Get and decode a chunk of keys with one MGET."""
         values = await self.redis.mget(keys)
         
         result = {}
@@ -153,22 +173,48 @@ class CacheOperations:
                 continue
                 
         return result
+
+    async def get_pattern(self, pattern: str) -> Dict[str, Any]:
+        """Get all keys matching pattern.
+
+        Prefer iter_pattern for patterns that may match many keys.
+
+        Args:
+            pattern: Redis key pattern
+
+        Returns:
+            Dict of key-value pairs
+        """
+        result = {}
+        async for chunk in self.iter_pattern(pattern):
+            result.update(chunk)
+                
+        return result
         
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern.
 
+        Keys are found with an incremental SCAN and deleted in batches rather
+        than with a single blocking KEYS call.
+
         Args:
             pattern: Redis key pattern
 
         Returns:
             int: Number of keys deleted
         """
-        keys = await self.redis.keys(pattern)
+        batch_size = self.config.get("scan_batch_size", 1000)
+        deleted = 0
+        batch = []
         
-        if not keys:
-            return 0
-            
-        deleted = await self.redis.delete(*keys)
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.redis.delete(*batch)
+                batch = []
+                
+        if batch:
+            deleted += await self.redis.delete(*batch)
         
         if deleted:
             await self.message_hub.notify_cache_operation(
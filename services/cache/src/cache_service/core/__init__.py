@@ -5,6 +5,7 @@ from .exceptions import (
     CacheServiceError,
     CacheOperationError,
     CacheKeyError,
+    CacheSerializationError,
     CacheConnectionError,
     CacheConsistencyError,
     CacheOverflowError,
@@ -20,6 +21,7 @@ __all__ = [
     "CacheServiceError",
     "CacheOperationError",
     "CacheKeyError",
+    "CacheSerializationError",
     "CacheConnectionError",
     "CacheConsistencyError",
     "CacheOverflowError",
@@ -62,6 +62,19 @@ class Settings(BaseSettings):
     # Performance Settings
     COMPRESSION_ENABLED: bool = True
     COMPRESSION_THRESHOLD: int = 1024  # bytes
+    
+    # Codec Settings
+    # Format new values are written in: "legacy" (one-byte prefix, readable by
+    # every replica) or "v1" (versioned header). Switch to v1 only after every
+    # replica runs a build that decodes it.
+    CODEC_WRITE_FORMAT: str = "legacy"
+    CODEC_ENCODER: str = "msgpack"  # msgpack, orjson or json
+    CODEC_COMPRESSOR: str = "zstd"  # zstd, lz4, zlib or none
+    CODEC_COMPRESSION_LEVEL: int = 3
+    CODEC_ALLOW_PICKLE: bool = False  # unpickling cached bytes runs code; opt in explicitly
+    CODEC_DICTIONARY_SIZE: int = 16384  # bytes
+    CODEC_DICTIONARY_MIN_SIZE: int = 64  # smaller payloads are stored uncompressed
+    CODEC_DICTIONARY_SAMPLES: int = 2000
 
     # Cache config
     CACHE_MEMORY_LIMIT: str = "26GB"  # 80% of 32GB
@@ -104,7 +117,37 @@ class Settings(BaseSettings):
     
     # Local cache config
     LOCAL_CACHE_SIZE: int = 10000
-    LOCAL_CACHE_TTL: int = 60  # 1 minute
+    LOCAL_CACHE_TTL: int = 600  # 10 minutes; kept coherent by the invalidation channel
+    
+    # Near-cache invalidation config
+    NEAR_CACHE_INVALIDATION_ENABLED: bool = True
+    NEAR_CACHE_CHANNEL: str = "cache:invalidations"
+    NEAR_CACHE_RECONNECT_DELAY: float = 1.0
+    
+    # Hot key detection and local promotion
+    HOT_KEY_TRACKING_ENABLED: bool = True
+    HOT_KEY_SKETCH_WIDTH: int = 4096
+    HOT_KEY_SKETCH_DEPTH: int = 4
+    HOT_KEY_TOP_K: int = 20  # keys reported per service
+    HOT_KEY_THRESHOLD: int = 100  # reads per decay interval
+    HOT_KEY_DECAY_INTERVAL: float = 60.0  # seconds
+    HOT_KEY_LOCAL_SIZE: int = 1000
+    HOT_KEY_LOCAL_TTL: int = 3600  # seconds, capped by the Redis entry's TTL
+    
+    # Tag invalidation config
+    TAG_GENERATION_TTL: float = 1.0  # seconds a tag generation is trusted locally
+    TAG_CLEANUP_INTERVAL: float = 1.0
+    TAG_CLEANUP_BATCH_SIZE: int = 500
+    TAG_CLEANUP_MAX_BATCHES: int = 20
+    SCAN_BATCH_SIZE: int = 1000
+    BULK_CHUNK_SIZE: int = 500  # keys per pipeline in bulk get/delete
+    
+    # Request coalescing config (get_or_compute)
+    COMPUTE_STALE_TTL: int = 60  # seconds a stale value is served while refreshing
+    COMPUTE_LOCK_TTL: float = 10.0  # longest a replica may hold a recompute lock
+    COMPUTE_LOCK_WAIT: float = 5.0  # seconds a miss waits on another replica's recompute
+    COMPUTE_POLL_INTERVAL: float = 0.05
+    COMPUTE_EARLY_REFRESH_BETA: float = 1.0  # 0 disables probabilistic early refresh
     
     @property
     def get_database_url(self) -> str:
@@ -43,6 +43,18 @@ class CacheOperationError(CacheServiceError):
         )
 
 
+class CacheSerializationError(CacheServiceError):
+    """Cache value serialization error"""
+
+    def __init__(self, message: str, encoder: str):
+        super().__init__(
+            message=f"Cache serialization error: {message}",
+            error_code="CACHE_SERIALIZATION_ERROR",
+            status_code=400,
+            details={"encoder": encoder},
+        )
+
+
 class CacheKeyError(CacheServiceError):
     """Cache key error"""
 
@@ -29,6 +29,8 @@ app.add_middleware(
 local_cache = LocalCache(
     maxsize=settings.LOCAL_CACHE_SIZE,
     ttl=settings.LOCAL_CACHE_TTL,
+    hot_maxsize=settings.HOT_KEY_LOCAL_SIZE,
+    hot_ttl=settings.HOT_KEY_LOCAL_TTL,
 )
 circuit_breaker = CircuitBreaker(
     threshold=settings.CIRCUIT_BREAKER_THRESHOLD,
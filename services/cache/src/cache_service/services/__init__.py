@@ -3,6 +3,8 @@
 from .redis_client import RedisClient
 from .local_cache import LocalCache
 from .circuit_breaker import CircuitBreaker, CircuitState
+from .tag_invalidation import TagInvalidator
+from .invalidation_bus import InvalidationBus
 from .cache_manager import CacheManager
 
 __all__ = [
@@ -10,5 +12,7 @@ __all__ = [
     "LocalCache",
     "CircuitBreaker",
     "CircuitState",
+    "TagInvalidator",
+    "InvalidationBus",
     "CacheManager",
 ]
@@ -2,16 +2,24 @@
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional, Set
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple,
+)
 import structlog
 
 from .redis_client import RedisClient
 from .local_cache import LocalCache
 from .circuit_breaker import CircuitBreaker
+from .tag_invalidation import TagInvalidator, namespace_tag, remaining_ttl
+from .invalidation_bus import InvalidationBus
+from .coalescing import SingleFlight, make_record, should_refresh_early, unpack_record
+from .hot_keys import HotKeyTracker
 from ..core.config import settings
 from ..core.exceptions import (
     CacheOperationError,
+    CacheConnectionError,
     CacheKeyError,
+    CircuitBreakerError,
     InvalidKeyspaceError,
 )
 from ..core.monitoring import (
@@ -49,12 +57,29 @@ class CacheManager:
         self.redis_client = RedisClient()
         self.local_cache = local_cache
         self.circuit_breaker = circuit_breaker
+        self.tags = TagInvalidator(self.redis_client, local_cache)
+        self.invalidation_bus = (
+            InvalidationBus(self.redis_client, local_cache, self.tags)
+            if local_cache is not None and settings.NEAR_CACHE_INVALIDATION_ENABLED
+            else None
+        )
+        self.hot_keys = HotKeyTracker() if settings.HOT_KEY_TRACKING_ENABLED else None
         self.stats = {
             "operations": 0,
             "hits": 0,
             "misses": 0,
             "errors": 0,
         }
+        self._single_flight = SingleFlight()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.compute_stats = {
+            "loader_calls": 0,
+            "loader_errors": 0,
+            "stale_served": 0,
+            "early_refreshes": 0,
+            "lock_contended": 0,
+            "peer_wait_timeouts": 0,
+        }
 
     async def setup(self) -> None:
         """Setup cache manager."""
@@ -65,6 +90,13 @@ class CacheManager:
             # Initialize monitoring
             asyncio.create_task(self._update_metrics_loop())
             
+            # Start sweeping entries of invalidated tags
+            self.tags.start()
+            
+            # Keep local caches of all replicas coherent
+            if self.invalidation_bus:
+                self.invalidation_bus.start()
+            
             logger.info("Cache manager initialized")
         except Exception as e:
             logger.error("Failed to setup cache manager", error=str(e))
@@ -73,11 +105,26 @@ class CacheManager:
     async def cleanup(self) -> None:
         """Cleanup cache manager resources."""
         try:
+            if self.invalidation_bus:
+                await self.invalidation_bus.stop()
+            for task in list(self._refresh_tasks):
+                task.cancel()
+            await self.tags.stop()
             await self.redis_client.disconnect()
             logger.info("Cache manager cleanup complete")
         except Exception as e:
             logger.error("Error during cache manager cleanup", error=str(e))
 
+    def _local_reads_enabled(self, use_local: bool) -> bool:
+        """Check whether reads may be served from the local cache.
+        
+        While the invalidation channel is down, writes made by other replicas
+        would go unnoticed, so the local tier is bypassed until it is back.
+        """
+        if not use_local or self.local_cache is None:
+            return False
+        return self.invalidation_bus is None or self.invalidation_bus.connected
+
     def _validate_key(self, key: str, service: Optional[str] = None) -> None:
         """Validate cache key format and permissions.
         
@@ -138,32 +185,50 @@ class CacheManager:
             # Validate key
             self._validate_key(key, service)
             
+            hot = self.hot_keys.record(key) if self.hot_keys else False
+            use_local = self._local_reads_enabled(use_local)
+            
             # Check local cache first if enabled
-            if use_local and self.local_cache:
-                value = self.local_cache.get(key)
+            if use_local:
+                stored = self.local_cache.get(key)
+                value = await self.tags.resolve(key, stored) if stored is not None else None
                 if value is not None:
+                    if hot and not self.local_cache.is_promoted(key):
+                        self.local_cache.promote(
+                            key, stored, self._promoted_ttl(stored),
+                            version=self.local_cache.fill_version()
+                        )
                     self.stats["hits"] += 1
                     record_cache_operation(
                         "get", "hit", service or "unknown",
                         time.time() - start_time
                     )
                     return value
+                
+                fill_version = self.local_cache.fill_version()
             
             # Get from Redis
             if self.circuit_breaker:
-                value = await self.circuit_breaker.call(
+                stored = await self.circuit_breaker.call(
                     self.redis_client.get,
-                    operation="get",
-                    node="primary",
+                    "get",
+                    "primary",
                     key
                 )
             else:
-                value = await self.redis_client.get(key)
+                stored = await self.redis_client.get(key)
             
+            value = await self.tags.resolve(key, stored) if stored is not None else None
             if value is not None:
-                # Update local cache if enabled
-                if use_local and self.local_cache:
-                    self.local_cache.set(key, value)
+                # Update local cache if enabled, promoting hot keys
+                if use_local and hot:
+                    self.local_cache.promote(
+                        key, stored, self._promoted_ttl(stored), version=fill_version
+                    )
+                elif use_local:
+                    self.local_cache.set(
+                        key, stored, remaining_ttl(stored), version=fill_version
+                    )
                 
                 self.stats["hits"] += 1
                 record_cache_operation(
@@ -188,6 +253,12 @@ class CacheManager:
             logger.error("Cache get error", key=key, error=str(e))
             raise
 
+    @staticmethod
+    def _promoted_ttl(stored: Any) -> float:
+        """Get the local TTL of a promoted entry, never past its Redis expiry."""
+        ttl = remaining_ttl(stored)
+        return settings.HOT_KEY_LOCAL_TTL if ttl is None else min(ttl, settings.HOT_KEY_LOCAL_TTL)
+
     async def set(
         self,
         key: str,
@@ -195,6 +266,7 @@ class CacheManager:
         ttl: Optional[int] = None,
         service: Optional[str] = None,
         update_local: bool = True,
+        tags: Optional[List[str]] = None,
     ) -> bool:
         """Set value in cache.
         
@@ -204,6 +276,7 @@ class CacheManager:
             ttl: Time-to-live in seconds
             service: Service making the request
             update_local: Whether to update local cache
+            tags: Tags to invalidate the entry by, e.g. "campaign:<id>"
             
         Returns:
             True if successful
@@ -218,20 +291,29 @@ class CacheManager:
             if ttl is None:
                 ttl = settings.CACHE_DEFAULT_TTL
             
+            envelope = await self.tags.wrap(key, value, tags, ttl)
+            
             # Set in Redis
             if self.circuit_breaker:
                 result = await self.circuit_breaker.call(
                     self.redis_client.set,
-                    operation="set",
-                    node="primary",
-                    key, value, ttl
+                    "set",
+                    "primary",
+                    key, envelope, ttl
                 )
             else:
-                result = await self.redis_client.set(key, value, ttl)
+                result = await self.redis_client.set(key, envelope, ttl)
             
-            # Update local cache if enabled
-            if result and update_local and self.local_cache:
-                self.local_cache.set(key, value, ttl)
+            if result:
+                await self.tags.track({key: envelope}, ttl)
+                await self._publish_keys([key])
+            
+            # Update local cache if enabled, and never leave an old copy behind
+            if self.local_cache is not None:
+                if result and update_local:
+                    self.local_cache.set(key, envelope, ttl)
+                else:
+                    self.local_cache.delete(key)
             
             record_cache_operation(
                 "set", "success" if result else "failed",
@@ -276,15 +358,17 @@ class CacheManager:
             if self.circuit_breaker:
                 result = await self.circuit_breaker.call(
                     self.redis_client.delete,
-                    operation="delete",
-                    node="primary",
+                    "delete",
+                    "primary",
                     key
                 )
             else:
                 result = await self.redis_client.delete(key)
             
+            await self._publish_keys([key])
+            
             # Delete from local cache if enabled
-            if delete_local and self.local_cache:
+            if delete_local and self.local_cache is not None:
                 self.local_cache.delete(key)
             
             record_cache_operation(
@@ -330,14 +414,21 @@ class CacheManager:
             result = {}
             redis_keys = []
             
+            use_local = self._local_reads_enabled(use_local)
+            
             # Check local cache first if enabled
-            if use_local and self.local_cache:
+            if use_local:
+                fill_version = self.local_cache.fill_version()
+                local_entries = {}
                 for key in keys:
-                    value = self.local_cache.get(key)
-                    if value is not None:
-                        result[key] = value
+                    stored = self.local_cache.get(key)
+                    if stored is not None:
+                        local_entries[key] = stored
                     else:
                         redis_keys.append(key)
+                
+                result = await self.tags.resolve_many(local_entries)
+                redis_keys.extend(key for key in local_entries if key not in result)
             else:
                 redis_keys = keys
             
@@ -346,19 +437,26 @@ class CacheManager:
                 if self.circuit_breaker:
                     redis_result = await self.circuit_breaker.call(
                         self.redis_client.get_many,
-                        operation="get_many",
-                        node="primary",
+                        "get_many",
+                        "primary",
                         redis_keys
                     )
                 else:
                     redis_result = await self.redis_client.get_many(redis_keys)
                 
+                stored_entries = {
+                    key: stored for key, stored in redis_result.items() if stored is not None
+                }
+                current = await self.tags.resolve_many(stored_entries)
+                
                 # Update result and local cache
-                for key, value in redis_result.items():
-                    if value is not None:
-                        result[key] = value
-                        if use_local and self.local_cache:
-                            self.local_cache.set(key, value)
+                for key, value in current.items():
+                    result[key] = value
+                    if use_local:
+                        stored = stored_entries[key]
+                        self.local_cache.set(
+                            key, stored, remaining_ttl(stored), version=fill_version
+                        )
             
             record_cache_operation(
                 "get_many", "success", service or "unknown",
@@ -382,6 +480,7 @@ class CacheManager:
         ttl: Optional[int] = None,
         service: Optional[str] = None,
         update_local: bool = True,
+        tags: Optional[List[str]] = None,
     ) -> int:
         """Set multiple values in cache.
         
@@ -390,6 +489,7 @@ class CacheManager:
             ttl: Time-to-live in seconds
             service: Service making the request
             update_local: Whether to update local cache
+            tags: Tags applied to every item
             
         Returns:
             Number of items successfully set
@@ -405,21 +505,29 @@ class CacheManager:
             if ttl is None:
                 ttl = settings.CACHE_DEFAULT_TTL
             
+            envelopes = await self.tags.wrap_many(items, tags, ttl)
+            
             # Set in Redis
             if self.circuit_breaker:
                 count = await self.circuit_breaker.call(
                     self.redis_client.set_many,
-                    operation="set_many",
-                    node="primary",
-                    items, ttl
+                    "set_many",
+                    "primary",
+                    envelopes, ttl
                 )
             else:
-                count = await self.redis_client.set_many(items, ttl)
+                count = await self.redis_client.set_many(envelopes, ttl)
             
-            # Update local cache if enabled
-            if update_local and self.local_cache:
-                for key, value in items.items():
-                    self.local_cache.set(key, value, ttl)
+            await self.tags.track(envelopes, ttl)
+            await self._publish_keys(envelopes.keys())
+            
+            # Update local cache if enabled, and never leave old copies behind
+            if self.local_cache is not None:
+                for key, envelope in envelopes.items():
+                    if update_local:
+                        self.local_cache.set(key, envelope, ttl)
+                    else:
+                        self.local_cache.delete(key)
             
             record_cache_operation(
                 "set_many", "success", service or "unknown",
@@ -464,15 +572,17 @@ class CacheManager:
             if self.circuit_breaker:
                 count = await self.circuit_breaker.call(
                     self.redis_client.delete_many,
-                    operation="delete_many",
-                    node="primary",
+                    "delete_many",
+                    "primary",
                     keys
                 )
             else:
                 count = await self.redis_client.delete_many(keys)
             
+            await self._publish_keys(keys)
+            
             # Delete from local cache if enabled
-            if delete_local and self.local_cache:
+            if delete_local and self.local_cache is not None:
                 for key in keys:
                     self.local_cache.delete(key)
             
@@ -492,6 +602,172 @@ class CacheManager:
             logger.error("Cache delete_many error", error=str(e))
             raise
 
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        service: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        early_refresh_beta: float = settings.COMPUTE_EARLY_REFRESH_BETA,
+    ) -> Any:
+        """Get a value, computing and caching it on a miss.
+        
+        Concurrent misses in this process share one loader call, and a short
+        Redis lock keeps other replicas from running the loader at the same
+        time; they wait for the lock holder's result instead. A value older
+        than ttl is still returned for up to stale_ttl more seconds while one
+        caller refreshes it in the background, and fresh values may be
+        refreshed early on a probabilistic schedule so hot keys rarely go
+        stale at all.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function computing the value
+            ttl: Seconds the value is fresh for
+            stale_ttl: Seconds a stale value may still be served
+            service: Service making the request
+            tags: Tags to invalidate the entry by
+            early_refresh_beta: Eagerness of early refresh; 0 disables it
+            
+        Returns:
+            Cached or computed value
+        """
+        ttl = settings.CACHE_DEFAULT_TTL if ttl is None else ttl
+        stale_ttl = settings.COMPUTE_STALE_TTL if stale_ttl is None else stale_ttl
+        
+        try:
+            record = unpack_record(await self.get(key, service=service))
+        except (CacheOperationError, CacheConnectionError, CircuitBreakerError) as e:
+            # Cache unavailable: still answer, coalescing what we can locally
+            logger.warning("Cache unavailable for get_or_compute", key=key, error=str(e))
+            return await self._single_flight.do(key, loader)
+        
+        if record is not None:
+            value, fresh_until, compute_time = record
+            if time.time() >= fresh_until:
+                self.compute_stats["stale_served"] += 1
+                self._refresh_in_background(key, loader, ttl, stale_ttl, service, tags)
+            elif should_refresh_early(fresh_until, compute_time, early_refresh_beta):
+                self.compute_stats["early_refreshes"] += 1
+                self._refresh_in_background(key, loader, ttl, stale_ttl, service, tags)
+            return value
+        
+        return await self._single_flight.do(
+            key,
+            lambda: self._compute(key, loader, ttl, stale_ttl, service, tags, wait=True)
+        )
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        service: Optional[str],
+        tags: Optional[List[str]],
+    ) -> None:
+        """Start refreshing a key unless a load of it is already running here."""
+        flight_key = f"refresh:{key}"
+        if self._single_flight.in_flight(key) or self._single_flight.in_flight(flight_key):
+            return
+        
+        task = asyncio.create_task(self._single_flight.do(
+            flight_key,
+            lambda: self._compute(key, loader, ttl, stale_ttl, service, tags, wait=False)
+        ))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background refresh and log its failure."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning("Background cache refresh failed", error=str(task.exception()))
+
+    async def _compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        service: Optional[str],
+        tags: Optional[List[str]],
+        wait: bool,
+    ) -> Any:
+        """Run the loader under the key's recompute lock and store the result.
+        
+        Args:
+            wait: Whether to wait for another replica holding the lock rather
+                than give up; misses wait, background refreshes do not
+        """
+        lock_name = f"{settings.CACHE_KEY_PREFIX}lock:{key}"
+        token = None
+        try:
+            token = await self.redis_client.acquire_lock(lock_name, settings.COMPUTE_LOCK_TTL)
+            contended = token is None
+        except Exception as e:
+            logger.warning("Failed to take recompute lock", key=key, error=str(e))
+            contended = False
+        
+        if contended:
+            self.compute_stats["lock_contended"] += 1
+            if not wait:
+                return None
+            record = await self._wait_for_peer(key, service)
+            if record is not None:
+                return record[0]
+            # The lock holder is slow or gone; compute rather than keep waiting
+            self.compute_stats["peer_wait_timeouts"] += 1
+        
+        try:
+            start = time.monotonic()
+            try:
+                value = await loader()
+            except Exception:
+                self.compute_stats["loader_errors"] += 1
+                raise
+            compute_time = time.monotonic() - start
+            self.compute_stats["loader_calls"] += 1
+            
+            try:
+                await self.set(
+                    key,
+                    make_record(value, ttl, compute_time),
+                    ttl=ttl + stale_ttl,
+                    service=service,
+                    tags=tags,
+                )
+            except Exception as e:
+                logger.warning("Failed to store computed value", key=key, error=str(e))
+            
+            return value
+        finally:
+            if token:
+                await self.redis_client.release_lock(lock_name, token)
+
+    async def _wait_for_peer(
+        self,
+        key: str,
+        service: Optional[str],
+    ) -> Optional[Tuple[Any, float, float]]:
+        """Poll for the value another replica is computing.
+        
+        Returns:
+            The stored record, or None if it did not appear in time
+        """
+        deadline = time.monotonic() + settings.COMPUTE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.COMPUTE_POLL_INTERVAL)
+            try:
+                record = unpack_record(await self.get(key, service=service, use_local=False))
+            except Exception:
+                return None
+            if record is not None:
+                return record
+        return None
+
     async def scan_keys(
         self,
         pattern: str = "*",
@@ -519,6 +795,103 @@ class CacheManager:
             logger.error("Cache scan_keys error", pattern=pattern, error=str(e))
             return []
 
+    async def scan_page(
+        self,
+        pattern: str = "*",
+        cursor: str = "0",
+        count: int = 100,
+        service: Optional[str] = None,
+    ) -> Tuple[str, List[str]]:
+        """Scan one page of keys matching pattern.
+        
+        Args:
+            pattern: Key pattern to match
+            cursor: Cursor returned with the previous page, "0" to start
+            count: Number of keys wanted; a page may hold fewer
+            service: Service making the request
+            
+        Returns:
+            Cursor of the next page ("0" when the scan is complete) and the keys
+        """
+        if service:
+            pattern = f"{service}:{pattern}"
+        
+        return await self.redis_client.scan_page(pattern, cursor, count)
+
+    async def scan_items_page(
+        self,
+        pattern: str = "*",
+        cursor: str = "0",
+        count: int = 100,
+        service: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Scan one page of entries matching pattern.
+        
+        The page's keys are read with pipelined GETs. Like iter_items, entries
+        invalidated by tag are left out and the local cache is not used.
+        
+        Returns:
+            Cursor of the next page ("0" when the scan is complete) and the entries
+        """
+        cursor, keys = await self.scan_page(pattern, cursor, count, service)
+        if not keys:
+            return cursor, {}
+        
+        stored = await self.redis_client.get_many(keys)
+        items = await self.tags.resolve_many(
+            {key: value for key, value in stored.items() if value is not None}
+        )
+        return cursor, items
+
+    async def iter_keys(
+        self,
+        pattern: str = "*",
+        service: Optional[str] = None,
+        batch_size: int = settings.SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[List[str]]:
+        """Iterate over the keys matching pattern in chunks.
+        
+        Args:
+            pattern: Key pattern to match
+            service: Service making the request
+            batch_size: Approximate number of keys per chunk
+            
+        Yields:
+            Non-empty lists of keys
+        """
+        if service:
+            pattern = f"{service}:{pattern}"
+        
+        async for keys in self.redis_client.iter_keys(pattern, batch_size):
+            yield keys
+
+    async def iter_items(
+        self,
+        pattern: str = "*",
+        service: Optional[str] = None,
+        batch_size: int = settings.SCAN_BATCH_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the entries matching pattern in chunks.
+        
+        Entries invalidated by tag but not yet reclaimed are left out, as
+        they would be on a get. The local cache is not consulted or filled.
+        
+        Args:
+            pattern: Key pattern to match
+            service: Service making the request
+            batch_size: Approximate number of keys per chunk
+            
+        Yields:
+            Non-empty mappings of key to value
+        """
+        if service:
+            pattern = f"{service}:{pattern}"
+        
+        async for stored in self.redis_client.iter_items(pattern, batch_size):
+            items = await self.tags.resolve_many(stored)
+            if items:
+                yield items
+
     async def flush(
         self,
         service: Optional[str] = None,
@@ -526,6 +899,10 @@ class CacheManager:
     ) -> bool:
         """Flush cache entries.
         
+        A service flush invalidates the service's namespace tag, which takes
+        constant time; the entries are reclaimed in the background. A pattern
+        flush deletes matching keys with an incremental SCAN.
+        
         Args:
             service: Flush only keys for specific service
             pattern: Flush only keys matching pattern
@@ -534,21 +911,18 @@ class CacheManager:
             True if successful
         """
         try:
-            if service or pattern:
-                # Selective flush
-                if service:
-                    pattern = f"{service}:*"
-                
-                keys = await self.scan_keys(pattern or "*", count=10000)
-                if keys:
-                    await self.delete_many(keys)
+            if service:
+                await self.invalidate_namespace(service)
+                logger.info("Cache flushed", service=service)
+            elif pattern:
+                count = await self.redis_client.delete_matching(pattern)
+                await self._publish_clear()
                 
-                logger.info("Cache flushed", service=service, pattern=pattern, count=len(keys))
+                logger.info("Cache flushed", pattern=pattern, count=count)
             else:
                 # Full flush
                 result = await self.redis_client.flush_db()
-                if self.local_cache:
-                    self.local_cache.clear()
+                await self._publish_clear()
                 
                 logger.info("Cache fully flushed")
                 return result
@@ -559,6 +933,118 @@ class CacheManager:
             logger.error("Cache flush error", error=str(e))
             return False
 
+    async def invalidate_tags(self, tags: List[str]) -> Dict[str, int]:
+        """Invalidate every entry written with any of the given tags.
+        
+        Reads through this replica see the invalidation immediately. Other
+        replicas cache tag generations for up to settings.TAG_GENERATION_TTL
+        seconds (1 by default) and may return invalidated entries for that
+        long unless the invalidation bus delivers the new generations sooner.
+        
+        Args:
+            tags: Tags to invalidate, e.g. ["campaign:123"]
+            
+        Returns:
+            Mapping of tag to its new generation
+        """
+        start_time = time.time()
+        
+        try:
+            generations = await self.tags.invalidate(tags)
+            if self.invalidation_bus:
+                await self.invalidation_bus.publish_tags(generations)
+            record_cache_operation(
+                "invalidate", "success", "unknown",
+                time.time() - start_time
+            )
+            return generations
+        except Exception as e:
+            self.stats["errors"] += 1
+            record_cache_operation(
+                "invalidate", "error", "unknown",
+                time.time() - start_time
+            )
+            logger.error("Cache invalidate error", tags=tags, error=str(e))
+            raise
+
+    async def invalidate_namespace(self, service: str) -> Dict[str, int]:
+        """Invalidate every entry of a service's namespace.
+        
+        Args:
+            service: Service whose keys should be invalidated
+            
+        Returns:
+            Mapping of the namespace tag to its new generation
+        """
+        return await self.invalidate_tags([namespace_tag(service)])
+
+    async def _publish_keys(self, keys: Iterable[str]) -> None:
+        """Tell other replicas to drop keys from their local caches."""
+        if self.invalidation_bus:
+            await self.invalidation_bus.publish_keys(keys)
+
+    async def _publish_clear(self) -> None:
+        """Clear the local cache here and on every other replica."""
+        if self.local_cache is not None:
+            self.local_cache.clear()
+        if self.invalidation_bus:
+            await self.invalidation_bus.publish_clear()
+
+    async def train_codec_dictionary(
+        self,
+        namespace: str,
+        samples: int = settings.CODEC_DICTIONARY_SAMPLES,
+    ) -> Dict[str, Any]:
+        """Train a compression dictionary from a namespace's current entries.
+        
+        Small values of one keyspace share most of their structure, which
+        plain compression cannot exploit one value at a time. The dictionary
+        is stored in Redis so every replica can decode what this one writes.
+        It is only used for writes once CODEC_WRITE_FORMAT is "v1".
+        
+        Args:
+            namespace: Namespace to train for, e.g. "character:sheets"
+            samples: Maximum number of entries to sample
+            
+        Returns:
+            Dictionary id and the number of samples it was trained on
+        """
+        keys = await self.redis_client.scan_keys(f"{namespace}:*", count=samples)
+        values = await self.redis_client.get_many(keys) if keys else {}
+        payloads = [
+            self.redis_client.codec.encode_payload(value)
+            for value in values.values()
+            if value is not None
+        ]
+        if not payloads:
+            raise CacheKeyError("No entries to sample", namespace)
+        
+        dictionary = self.redis_client.codec.train_dictionary(payloads)
+        dictionary_id = await self.redis_client.store_codec_dictionary(namespace, dictionary)
+        
+        logger.info("Codec dictionary trained", namespace=namespace,
+                   dictionary_id=dictionary_id, samples=len(payloads))
+        return {"dictionary_id": dictionary_id, "samples": len(payloads)}
+
+    def get_hot_keys(
+        self,
+        service: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the most read keys per service.
+        
+        Args:
+            service: Only report this service
+            limit: Keys to report per service
+            
+        Returns:
+            Mapping of service to its keys, estimated recent reads and whether
+            each is hot, most read first
+        """
+        if not self.hot_keys:
+            return {}
+        return self.hot_keys.top(service, limit)
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         try:
@@ -571,7 +1057,7 @@ class CacheManager:
             miss_rate = (self.stats["misses"] / total_requests * 100) if total_requests > 0 else 0
             
             # Get local cache stats if available
-            local_stats = self.local_cache.get_stats() if self.local_cache else {}
+            local_stats = self.local_cache.get_stats() if self.local_cache is not None else {}
             
             return {
                 "hit_rate": hit_rate,
@@ -585,6 +1071,16 @@ class CacheManager:
                 "total_keys": redis_info.get("stats", {}).get("keyspace_hits", 0),
                 "replication_lag": self._calculate_replication_lag(redis_info),
                 "local_cache": local_stats,
+                "invalidation": self.tags.get_stats(),
+                "compute": {
+                    **self.compute_stats,
+                    "coalesced": self._single_flight.coalesced,
+                },
+                "invalidation_bus": (
+                    self.invalidation_bus.get_stats() if self.invalidation_bus else {}
+                ),
+                "codec": self.redis_client.codec.get_stats(),
+                "hot_keys": self.hot_keys.get_stats() if self.hot_keys else {},
                 "redis": redis_info,
             }
         except Exception as e:
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Any, Callable, Dict, Optional
 import structlog
 
-from ..core.exceptions import CircuitBreakerError
+from ..core.exceptions import CacheSerializationError, CircuitBreakerError
 from ..core.monitoring import metrics_collector
 
 logger = structlog.get_logger()
@@ -139,6 +139,9 @@ class CircuitBreaker:
             
             return result
             
+        except CacheSerializationError:
+            # A value that cannot be encoded says nothing about the node
+            raise
         except Exception as e:
             # Record failure
             self._record_failure(node_state)
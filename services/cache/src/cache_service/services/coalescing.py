@@ -0,0 +1,116 @@
+"""Request coalescing helpers for cache service.
+
+Computed values are stored in a record holding the time they stop being fresh
+and how long they took to compute. A record past its fresh time is still
+served, while one caller refreshes it, until its stale window runs out and
+Redis expires it. Fresh records may also be refreshed early on a probabilistic
+schedule (XFetch) that makes the refresh likelier the closer the record is to
+going stale and the longer it takes to compute.
+"""
+
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+COMPUTED_VALUE_KEY = "__computed_value__"
+FRESH_UNTIL_KEY = "__fresh_until__"
+COMPUTE_TIME_KEY = "__compute_time__"
+
+
+def make_record(value: Any, ttl: float, compute_time: float) -> Dict[str, Any]:
+    """Build the stored record of a computed value.
+
+    Args:
+        value: Computed value
+        ttl: Seconds the value is fresh for
+        compute_time: Seconds the loader took
+
+    Returns:
+        Record to store in the cache
+    """
+    return {
+        COMPUTED_VALUE_KEY: value,
+        FRESH_UNTIL_KEY: time.time() + ttl,
+        COMPUTE_TIME_KEY: compute_time,
+    }
+
+
+def unpack_record(stored: Any) -> Optional[Tuple[Any, float, float]]:
+    """Split a stored record into value, fresh-until time and compute time.
+
+    Returns:
+        The record's parts, or None if the stored value is not a record
+    """
+    if not isinstance(stored, dict) or COMPUTED_VALUE_KEY not in stored:
+        return None
+    return stored[COMPUTED_VALUE_KEY], stored[FRESH_UNTIL_KEY], stored[COMPUTE_TIME_KEY]
+
+
+def should_refresh_early(
+    fresh_until: float,
+    compute_time: float,
+    beta: float,
+    now: Optional[float] = None,
+) -> bool:
+    """Decide whether to refresh a fresh record ahead of time.
+
+    Args:
+        fresh_until: Time the record goes stale
+        compute_time: Seconds the record took to compute
+        beta: Eagerness; 0 disables early refresh, above 1 refreshes earlier
+        now: Current time, for testing
+
+    Returns:
+        True if this caller should refresh the record now
+    """
+    if beta <= 0 or compute_time <= 0:
+        return False
+    now = time.time() if now is None else now
+    # -log(U) is exponentially distributed, so refreshes spread out ahead of
+    # expiry instead of all landing at the same instant
+    return now - compute_time * beta * math.log(1.0 - random.random()) >= fresh_until
+
+
+class SingleFlight:
+    """Shares one in-flight call per key between concurrent callers."""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for a key is running."""
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for a key, or wait for the call already running for it.
+
+        The call runs as its own task, so a caller being cancelled does not
+        cancel it for the others.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine function to run
+
+        Returns:
+            Result of the shared call; its exception is raised to every caller
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(call)
+
+    def _finish(self, key: str, call: asyncio.Future) -> None:
+        """Forget a finished call."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Retrieve so a failure nobody waited for is not reported as unhandled
+            call.exception()
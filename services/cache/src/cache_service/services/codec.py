@@ -0,0 +1,488 @@
+"""Value codec for cache service.
+
+Stored values start with a small versioned header followed by the encoded and
+optionally compressed payload:
+
+    magic (1) | format version (1) | encoder << 4 | compressor (1) [| dictionary id (4)]
+
+The dictionary id is only present for payloads compressed with a trained
+per-namespace zstd dictionary. Entries written before the header existed start
+with a one-byte format prefix (J, Z, P or z) and still decode.
+
+Readers always accept both formats, but writers keep producing the legacy
+format until CODEC_WRITE_FORMAT is set to "v1". Roll out in two steps: deploy
+every replica with this codec first, then switch the write format, so no
+replica ever reads a header it does not understand.
+
+Encoders and compressors whose libraries are not installed fall back to the
+next best available one: orjson and msgpack to the standard json module,
+zstd and lz4 to zlib.
+"""
+
+import json
+import pickle
+import struct
+import zlib
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import structlog
+
+from ..core.config import settings
+from ..core.exceptions import CacheSerializationError
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+logger = structlog.get_logger()
+
+# 0xFF never occurs in UTF-8 text or in the legacy one-byte prefixes
+MAGIC = 0xFF
+FORMAT_VERSION = 1
+HEADER = struct.Struct(">BBB")
+DICTIONARY_ID = struct.Struct(">I")
+
+
+class Encoder(IntEnum):
+    """Payload encoders."""
+    JSON = 1
+    ORJSON = 2
+    MSGPACK = 3
+    PICKLE = 4
+
+
+class Compressor(IntEnum):
+    """Payload compressors."""
+    NONE = 0
+    ZLIB = 1
+    LZ4 = 2
+    ZSTD = 3
+    ZSTD_DICTIONARY = 4
+
+
+ENCODER_NAMES = {
+    "json": Encoder.JSON,
+    "orjson": Encoder.ORJSON,
+    "msgpack": Encoder.MSGPACK,
+}
+
+WRITE_FORMATS = ("legacy", "v1")
+
+COMPRESSOR_NAMES = {
+    "none": Compressor.NONE,
+    "zlib": Compressor.ZLIB,
+    "lz4": Compressor.LZ4,
+    "zstd": Compressor.ZSTD,
+}
+
+
+class UnknownDictionaryError(Exception):
+    """Payload was compressed with a dictionary this codec has not loaded."""
+
+    def __init__(self, dictionary_id: int):
+        super().__init__(f"Unknown compression dictionary {dictionary_id}")
+        self.dictionary_id = dictionary_id
+
+
+def _available_encoder(encoder: Encoder) -> Encoder:
+    """Fall back to the json module if an encoder's library is missing."""
+    if encoder == Encoder.ORJSON and orjson is None:
+        return Encoder.JSON
+    if encoder == Encoder.MSGPACK and msgpack is None:
+        return Encoder.JSON
+    return encoder
+
+
+def _available_compressor(compressor: Compressor) -> Compressor:
+    """Fall back to zlib if a compressor's library is missing."""
+    if compressor == Compressor.ZSTD and zstandard is None:
+        compressor = Compressor.LZ4
+    if compressor == Compressor.LZ4 and lz4_frame is None:
+        compressor = Compressor.ZLIB
+    return compressor
+
+
+def namespace_of(key: str) -> str:
+    """Get the dictionary namespace of a key (its service and keyspace)."""
+    return ":".join(key.split(":", 2)[:2])
+
+
+class Codec:
+    """Encodes cache values to bytes and back."""
+
+    def __init__(
+        self,
+        encoder: str = settings.CODEC_ENCODER,
+        compressor: str = settings.CODEC_COMPRESSOR,
+        compression_enabled: bool = settings.COMPRESSION_ENABLED,
+        compression_threshold: int = settings.COMPRESSION_THRESHOLD,
+        compression_level: int = settings.CODEC_COMPRESSION_LEVEL,
+        allow_pickle: bool = settings.CODEC_ALLOW_PICKLE,
+        dictionary_min_size: int = settings.CODEC_DICTIONARY_MIN_SIZE,
+        write_format: str = settings.CODEC_WRITE_FORMAT,
+    ):
+        """Initialize codec.
+
+        Args:
+            encoder: Encoder name (msgpack, orjson or json)
+            compressor: Compressor name (zstd, lz4, zlib or none)
+            compression_enabled: Whether to compress large payloads
+            compression_threshold: Payload size in bytes above which to compress
+            compression_level: Compression level for zstd and zlib
+            allow_pickle: Whether values the encoder cannot handle may be
+                pickled, and pickled entries decoded. Unpickling runs code from
+                the cache, so this is off unless explicitly enabled.
+            dictionary_min_size: Smallest payload compressed with a dictionary
+            write_format: Format of encoded values, "legacy" (one-byte
+                prefix, JSON and zlib only) or "v1" (versioned header)
+        """
+        if encoder not in ENCODER_NAMES:
+            raise ValueError(f"Unknown codec encoder: {encoder}")
+        if compressor not in COMPRESSOR_NAMES:
+            raise ValueError(f"Unknown codec compressor: {compressor}")
+        if write_format not in WRITE_FORMATS:
+            raise ValueError(f"Unknown codec write format: {write_format}")
+
+        self.encoder = _available_encoder(ENCODER_NAMES[encoder])
+        self.compressor = _available_compressor(COMPRESSOR_NAMES[compressor])
+        self.compression_enabled = compression_enabled
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self.allow_pickle = allow_pickle
+        self.dictionary_min_size = dictionary_min_size
+        self.write_format = write_format
+
+        self._dictionaries: Dict[int, Any] = {}
+        self._namespace_dictionaries: Dict[str, int] = {}
+        self._dictionary_compressors: Dict[int, Any] = {}
+        self._dictionary_decompressors: Dict[int, Any] = {}
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if zstandard else None
+        )
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+        self.stats = {
+            "encoded": 0,
+            "decoded": 0,
+            "legacy_decoded": 0,
+            "pickled": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+        }
+
+        if (self.encoder.name.lower(), self.compressor.name.lower()) != (encoder, compressor):
+            logger.warning(
+                "Codec library missing, falling back",
+                encoder=self.encoder.name.lower(),
+                compressor=self.compressor.name.lower(),
+            )
+
+    # Encoding
+
+    def encode(self, value: Any, namespace: Optional[str] = None) -> bytes:
+        """Encode a value for storage.
+
+        Args:
+            value: Value to encode
+            namespace: Dictionary namespace of the value's key
+
+        Returns:
+            Header and payload bytes
+
+        Raises:
+            CacheSerializationError: If the value cannot be encoded
+        """
+        if self.write_format == "legacy":
+            return self._encode_legacy(value)
+
+        encoder, payload = self._encode_payload(value)
+        compressor, dictionary_id, payload = self._compress(payload, namespace)
+
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, (encoder << 4) | compressor)
+        if dictionary_id is not None:
+            header += DICTIONARY_ID.pack(dictionary_id)
+
+        self.stats["encoded"] += 1
+        self.stats["bytes_out"] += len(header) + len(payload)
+        return header + payload
+
+    def _encode_legacy(self, value: Any) -> bytes:
+        """Encode a value in the one-byte prefix format."""
+        try:
+            payload, prefix, compressed_prefix = (
+                json.dumps(value, separators=(",", ":")).encode("utf-8"), b"J", b"Z"
+            )
+        except (TypeError, ValueError, OverflowError) as e:
+            if not self.allow_pickle:
+                raise CacheSerializationError(
+                    message=f"Value of type {type(value).__name__} cannot be encoded "
+                            f"with json: {e}",
+                    encoder="json",
+                )
+            payload, prefix, compressed_prefix = (
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), b"P", b"z"
+            )
+            self.stats["pickled"] += 1
+
+        self.stats["bytes_in"] += len(payload)
+        if self.compression_enabled and len(payload) > self.compression_threshold:
+            compressed = zlib.compress(payload, level=min(self.compression_level, 9))
+            # Only keep the compressed form if it is actually smaller
+            if len(compressed) < len(payload):
+                payload, prefix = compressed, compressed_prefix
+
+        self.stats["encoded"] += 1
+        self.stats["bytes_out"] += 1 + len(payload)
+        return prefix + payload
+
+    def encode_payload(self, value: Any) -> bytes:
+        """Encode a value without header or compression, e.g. as a training sample."""
+        return self._encode_payload(value)[1]
+
+    def _encode_payload(self, value: Any) -> Tuple[Encoder, bytes]:
+        """Encode with the configured encoder, falling back to pickle if allowed."""
+        try:
+            if self.encoder == Encoder.MSGPACK:
+                payload = msgpack.packb(value, use_bin_type=True)
+            elif self.encoder == Encoder.ORJSON:
+                payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+            self.stats["bytes_in"] += len(payload)
+            return self.encoder, payload
+        except (TypeError, ValueError, OverflowError) as e:
+            if not self.allow_pickle:
+                raise CacheSerializationError(
+                    message=f"Value of type {type(value).__name__} cannot be encoded "
+                            f"with {self.encoder.name.lower()}: {e}",
+                    encoder=self.encoder.name.lower(),
+                )
+
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.stats["pickled"] += 1
+        self.stats["bytes_in"] += len(payload)
+        return Encoder.PICKLE, payload
+
+    def _compress(
+        self,
+        payload: bytes,
+        namespace: Optional[str],
+    ) -> Tuple[Compressor, Optional[int], bytes]:
+        """Compress a payload if it pays off.
+
+        Returns:
+            Compressor used, dictionary id (or None) and the resulting bytes
+        """
+        dictionary_id = self._namespace_dictionaries.get(namespace) if namespace else None
+
+        if dictionary_id is not None and len(payload) >= self.dictionary_min_size:
+            compressor, compressed = Compressor.ZSTD_DICTIONARY, (
+                self._dictionary_compressors[dictionary_id].compress(payload)
+            )
+        elif self.compression_enabled and len(payload) > self.compression_threshold:
+            dictionary_id = None
+            compressor = self.compressor
+            if compressor == Compressor.ZSTD:
+                compressed = self._zstd_compressor.compress(payload)
+            elif compressor == Compressor.LZ4:
+                compressed = lz4_frame.compress(payload)
+            elif compressor == Compressor.ZLIB:
+                compressed = zlib.compress(payload, level=min(self.compression_level, 9))
+            else:
+                return Compressor.NONE, None, payload
+        else:
+            return Compressor.NONE, None, payload
+
+        # Only keep the compressed form if it is actually smaller
+        if len(compressed) >= len(payload):
+            return Compressor.NONE, None, payload
+        return compressor, dictionary_id, compressed
+
+    # Decoding
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a stored value.
+
+        Args:
+            data: Bytes read from the cache
+
+        Returns:
+            Decoded value
+
+        Raises:
+            UnknownDictionaryError: If the dictionary the value was compressed
+                with has not been loaded
+            CacheSerializationError: If the value cannot be decoded
+        """
+        if not data:
+            return None
+        if data[0] != MAGIC:
+            return self._decode_legacy(data)
+
+        _, version, formats = HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise CacheSerializationError(
+                message=f"Unsupported codec format version {version}",
+                encoder="unknown",
+            )
+
+        encoder, compressor = Encoder(formats >> 4), Compressor(formats & 0x0F)
+        offset = HEADER.size
+        payload = memoryview(data)[offset:]
+
+        if compressor == Compressor.ZSTD_DICTIONARY:
+            (dictionary_id,) = DICTIONARY_ID.unpack_from(data, offset)
+            payload = payload[DICTIONARY_ID.size:]
+            decompressor = self._dictionary_decompressors.get(dictionary_id)
+            if decompressor is None:
+                raise UnknownDictionaryError(dictionary_id)
+            payload = decompressor.decompress(payload)
+        elif compressor == Compressor.ZSTD:
+            self._require(zstandard, "zstandard")
+            payload = self._zstd_decompressor.decompress(payload)
+        elif compressor == Compressor.LZ4:
+            self._require(lz4_frame, "lz4")
+            payload = lz4_frame.decompress(payload)
+        elif compressor == Compressor.ZLIB:
+            payload = zlib.decompress(payload)
+
+        self.stats["decoded"] += 1
+        return self._decode_payload(encoder, payload)
+
+    def _decode_payload(self, encoder: Encoder, payload: Any) -> Any:
+        """Decode an uncompressed payload."""
+        if encoder == Encoder.MSGPACK:
+            self._require(msgpack, "msgpack")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if encoder == Encoder.ORJSON:
+            # orjson output is plain JSON, readable without orjson installed
+            return orjson.loads(payload) if orjson else json.loads(bytes(payload))
+        if encoder == Encoder.JSON:
+            return json.loads(bytes(payload))
+        if encoder == Encoder.PICKLE:
+            if not self.allow_pickle:
+                raise CacheSerializationError(
+                    message="Refusing to unpickle cached value; pickle is not enabled",
+                    encoder="pickle",
+                )
+            return pickle.loads(payload)
+        raise CacheSerializationError(message=f"Unknown encoder {encoder}", encoder="unknown")
+
+    def _decode_legacy(self, data: bytes) -> Any:
+        """Decode an entry written with the one-byte prefix format."""
+        self.stats["legacy_decoded"] += 1
+        prefix, content = data[0:1], data[1:]
+
+        if prefix == b"Z":  # Compressed JSON
+            return json.loads(zlib.decompress(content).decode("utf-8"))
+        if prefix == b"J":  # Plain JSON
+            return json.loads(content.decode("utf-8"))
+        if prefix in (b"z", b"P"):  # Pickle, compressed or plain
+            if not self.allow_pickle:
+                raise CacheSerializationError(
+                    message="Refusing to unpickle cached value; pickle is not enabled",
+                    encoder="pickle",
+                )
+            return pickle.loads(zlib.decompress(content) if prefix == b"z" else content)
+
+        # Raw strings written by other clients
+        return data.decode("utf-8")
+
+    @staticmethod
+    def _require(module: Any, name: str) -> None:
+        """Fail clearly when a value needs a library that is not installed."""
+        if module is None:
+            raise CacheSerializationError(
+                message=f"Cached value needs {name}, which is not installed",
+                encoder=name,
+            )
+
+    # Dictionaries
+
+    def train_dictionary(
+        self,
+        samples: Iterable[bytes],
+        size: int = settings.CODEC_DICTIONARY_SIZE,
+    ) -> bytes:
+        """Train a zstd dictionary from encoded payload samples.
+
+        Args:
+            samples: Payloads from ``encode_payload``
+            size: Dictionary size in bytes
+
+        Returns:
+            Dictionary bytes to pass to ``add_dictionary``
+        """
+        self._require(zstandard, "zstandard")
+        return zstandard.train_dictionary(size, list(samples)).as_bytes()
+
+    def add_dictionary(self, namespace: str, dictionary: bytes) -> int:
+        """Use a trained dictionary for a namespace.
+
+        Dictionaries stay loaded after a namespace moves to a newer one, so
+        entries compressed with older dictionaries still decode.
+
+        Args:
+            namespace: Namespace, e.g. "character:sheets"
+            dictionary: Dictionary bytes
+
+        Returns:
+            Dictionary id written into the header of values it compresses
+        """
+        self._require(zstandard, "zstandard")
+        compression_dict = zstandard.ZstdCompressionDict(dictionary)
+        dictionary_id = compression_dict.dict_id()
+
+        if dictionary_id not in self._dictionaries:
+            self._dictionaries[dictionary_id] = compression_dict
+            self._dictionary_compressors[dictionary_id] = zstandard.ZstdCompressor(
+                level=self.compression_level, dict_data=compression_dict
+            )
+            self._dictionary_decompressors[dictionary_id] = zstandard.ZstdDecompressor(
+                dict_data=compression_dict
+            )
+
+        self._namespace_dictionaries[namespace] = dictionary_id
+        return dictionary_id
+
+    def add_decoding_dictionary(self, dictionary: bytes) -> int:
+        """Load a retired dictionary for decoding only."""
+        self._require(zstandard, "zstandard")
+        compression_dict = zstandard.ZstdCompressionDict(dictionary)
+        dictionary_id = compression_dict.dict_id()
+        if dictionary_id not in self._dictionary_decompressors:
+            self._dictionaries[dictionary_id] = compression_dict
+            self._dictionary_decompressors[dictionary_id] = zstandard.ZstdDecompressor(
+                dict_data=compression_dict
+            )
+        return dictionary_id
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get codec statistics."""
+        return {
+            **self.stats,
+            "encoder": self.encoder.name.lower(),
+            "compressor": self.compressor.name.lower(),
+            "write_format": self.write_format,
+            "dictionaries": {
+                namespace: dictionary_id
+                for namespace, dictionary_id in self._namespace_dictionaries.items()
+            },
+        }
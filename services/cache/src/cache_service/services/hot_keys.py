@@ -0,0 +1,183 @@
+"""Hot key detection for cache service.
+
+Every read is counted in a count-min sketch, which estimates per-key access
+counts in fixed memory however many distinct keys are read. Keys whose
+estimate crosses a threshold are hot; the most accessed keys of each service
+are kept in a small top-k table for reporting. Counts are halved at a fixed
+interval so the estimates follow recent traffic rather than all-time totals.
+"""
+
+import hashlib
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from ..core.config import settings
+
+MAX_COUNT = 0xFFFFFFFF
+
+
+class CountMinSketch:
+    """Approximate frequency counter in fixed memory.
+
+    Estimates never undercount; they overcount by at most a small fraction of
+    the total, shrinking as the width grows. Conservative update (only
+    raising the counters that hold the minimum) keeps overcounting low.
+    """
+
+    def __init__(self, width: int, depth: int):
+        """Initialize sketch.
+
+        Args:
+            width: Counters per row
+            depth: Number of rows, each with its own hash
+        """
+        self.width = width
+        self.depth = depth
+        self._rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        """Get the counter index of a key in every row."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        # Double hashing derives every row's hash from two 64-bit halves
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Count occurrences of a key.
+
+        Returns:
+            The key's new estimated count
+        """
+        indexes = self._indexes(key)
+        estimate = min(
+            min(row[index] for row, index in zip(self._rows, indexes)) + count, MAX_COUNT
+        )
+        for row, index in zip(self._rows, indexes):
+            if row[index] < estimate:
+                row[index] = estimate
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """Get the estimated count of a key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def decay(self) -> None:
+        """Halve every counter."""
+        self._rows = [array("I", (count >> 1 for count in row)) for row in self._rows]
+
+
+class HotKeyTracker:
+    """Tracks key access frequencies and the most accessed keys per service."""
+
+    def __init__(
+        self,
+        width: int = settings.HOT_KEY_SKETCH_WIDTH,
+        depth: int = settings.HOT_KEY_SKETCH_DEPTH,
+        top_k: int = settings.HOT_KEY_TOP_K,
+        threshold: int = settings.HOT_KEY_THRESHOLD,
+        decay_interval: float = settings.HOT_KEY_DECAY_INTERVAL,
+    ):
+        """Initialize tracker.
+
+        Args:
+            width: Count-min sketch width
+            depth: Count-min sketch depth
+            top_k: Keys kept per service in the top table
+            threshold: Estimated accesses per decay interval above which a key is hot
+            decay_interval: Seconds between halving all counts
+        """
+        self.sketch = CountMinSketch(width, depth)
+        self.top_k = top_k
+        self.threshold = threshold
+        self.decay_interval = decay_interval
+        self._top: Dict[str, Dict[str, int]] = {}
+        self._last_decay = time.monotonic()
+        self.stats = {
+            "recorded": 0,
+            "hot_hits": 0,
+            "decays": 0,
+        }
+
+    def record(self, key: str) -> bool:
+        """Count an access to a key.
+
+        Returns:
+            True if the key is hot
+        """
+        now = time.monotonic()
+        if now - self._last_decay >= self.decay_interval:
+            self.decay()
+            self._last_decay = now
+
+        estimate = self.sketch.add(key)
+        self._update_top(key, estimate)
+        self.stats["recorded"] += 1
+
+        if estimate >= self.threshold:
+            self.stats["hot_hits"] += 1
+            return True
+        return False
+
+    def is_hot(self, key: str) -> bool:
+        """Check whether a key is hot without counting an access."""
+        return self.sketch.estimate(key) >= self.threshold
+
+    def _update_top(self, key: str, estimate: int) -> None:
+        """Keep a key in its service's top table if it is among the most accessed."""
+        top = self._top.setdefault(key.split(":", 1)[0], {})
+        if key in top or len(top) < self.top_k:
+            top[key] = estimate
+            return
+
+        coldest = min(top, key=top.get)
+        if estimate > top[coldest]:
+            del top[coldest]
+            top[key] = estimate
+
+    def decay(self) -> None:
+        """Halve all counts so estimates follow recent traffic."""
+        self.sketch.decay()
+        for service, top in list(self._top.items()):
+            for key in list(top):
+                top[key] >>= 1
+                if not top[key]:
+                    del top[key]
+            if not top:
+                del self._top[service]
+        self.stats["decays"] += 1
+
+    def top(
+        self,
+        service: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the most accessed keys per service.
+
+        Args:
+            service: Only report this service
+            limit: Keys to report per service
+
+        Returns:
+            Mapping of service to its keys and estimated counts, most accessed first
+        """
+        services = [service] if service else sorted(self._top)
+        return {
+            name: [
+                {"key": key, "count": count, "hot": count >= self.threshold}
+                for key, count in sorted(
+                    self._top.get(name, {}).items(), key=lambda item: item[1], reverse=True
+                )[:limit]
+            ]
+            for name in services
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hot key statistics."""
+        return {
+            **self.stats,
+            "threshold": self.threshold,
+            "decay_interval": self.decay_interval,
+            "top": self.top(),
+        }
@@ -0,0 +1,178 @@
+"""Cross-replica invalidation of local caches for cache service.
+
+Every replica publishes the keys it writes or deletes, and the tags it
+invalidates, on a Redis pub/sub channel. Every other replica drops those keys
+from its local cache and records the new tag generations, which keeps the
+local tier coherent enough to run with long TTLs.
+
+Pub/sub delivery is at most once, so the local cache is cleared whenever the
+subscription is (re)established and the local tier is bypassed while it is
+down.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+import structlog
+
+from .local_cache import LocalCache
+from .redis_client import RedisClient
+from .tag_invalidation import TagInvalidator
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+
+class InvalidationBus:
+    """Publishes and applies local cache invalidations over Redis pub/sub."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        local_cache: LocalCache,
+        tags: Optional[TagInvalidator] = None,
+        channel: str = settings.NEAR_CACHE_CHANNEL,
+        reconnect_delay: float = settings.NEAR_CACHE_RECONNECT_DELAY,
+    ):
+        """Initialize invalidation bus.
+
+        Args:
+            redis_client: Redis client used for publishing and subscribing
+            local_cache: Local cache kept coherent by the bus
+            tags: Tag invalidator to pass announced generations to
+            channel: Pub/sub channel name
+            reconnect_delay: Seconds to wait before resubscribing after an error
+        """
+        self.redis_client = redis_client
+        self.local_cache = local_cache
+        self.tags = tags
+        self.channel = f"{settings.CACHE_KEY_PREFIX}{channel}"
+        self.reconnect_delay = reconnect_delay
+        self.node_id = uuid.uuid4().hex
+        self.connected = False
+        self._listener_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "published": 0,
+            "publish_errors": 0,
+            "received": 0,
+            "keys_invalidated": 0,
+            "resubscribes": 0,
+        }
+
+    def start(self) -> None:
+        """Start listening for invalidations from other replicas."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self.connected = False
+
+    async def publish_keys(self, keys: Iterable[str]) -> None:
+        """Announce that keys were written or deleted."""
+        keys = list(keys)
+        if keys:
+            await self._publish({"op": "keys", "keys": keys})
+
+    async def publish_tags(self, generations: Dict[str, int]) -> None:
+        """Announce new tag generations."""
+        if generations:
+            await self._publish({"op": "tags", "generations": generations})
+
+    async def publish_clear(self) -> None:
+        """Announce that every local entry should be dropped."""
+        await self._publish({"op": "clear"})
+
+    async def _publish(self, message: Dict[str, Any]) -> None:
+        """Publish a message, logging rather than failing the write on errors.
+
+        A lost message only leaves other replicas stale until their local TTL,
+        which is the behaviour without the bus.
+        """
+        message["origin"] = self.node_id
+        try:
+            await self.redis_client.get_pubsub_client().publish(
+                self.channel, json.dumps(message)
+            )
+            self.stats["published"] += 1
+        except Exception as e:
+            self.stats["publish_errors"] += 1
+            logger.warning("Failed to publish cache invalidation", op=message["op"], error=str(e))
+
+    def apply(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation message from another replica.
+
+        Args:
+            message: Decoded invalidation message
+        """
+        if message.get("origin") == self.node_id:
+            return
+
+        self.stats["received"] += 1
+        op = message.get("op")
+        if op == "keys":
+            for key in message.get("keys", []):
+                self.local_cache.invalidate(key)
+            self.stats["keys_invalidated"] += len(message.get("keys", []))
+        elif op == "tags":
+            if self.tags:
+                self.tags.observe(
+                    {tag: int(generation) for tag, generation in message["generations"].items()}
+                )
+        elif op == "clear":
+            self.local_cache.clear()
+        else:
+            logger.warning("Unknown cache invalidation message", op=op)
+
+    async def _listen_loop(self) -> None:
+        """Subscribe to the channel and apply messages until cancelled."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis_client.get_pubsub_client().pubsub()
+                await pubsub.subscribe(self.channel)
+
+                # Anything published while unsubscribed was missed
+                self.local_cache.clear()
+                self.connected = True
+                self.stats["resubscribes"] += 1
+                logger.info("Subscribed to cache invalidations", channel=self.channel)
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.apply(json.loads(message["data"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning("Malformed cache invalidation message", error=str(e))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Cache invalidation subscription failed", error=str(e))
+            finally:
+                self.connected = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get invalidation bus statistics."""
+        return {
+            **self.stats,
+            "connected": self.connected,
+            "channel": self.channel,
+        }
@@ -0,0 +1,89 @@
+"""Cache key helpers for cache service.
+
+Redis Cluster places a key by the CRC16 of its hash tag, the part between the
+first "{" and the next "}", or of the whole key if it has none. Keys that share
+a hash tag share a slot, so building all of a character's keys around a tag of
+its id keeps them on one node: batch reads of a character go out as a single
+pipeline, and multi-key commands over them do not fail cross-slot.
+"""
+
+from typing import Optional
+
+from redis.crc import key_slot as _crc_key_slot
+
+
+def hash_tag(value: str) -> str:
+    """Wrap a value in braces so it becomes the key's hash tag.
+
+    Args:
+        value: Identifier to group keys by, e.g. a character id
+
+    Returns:
+        The value as a hash tag, e.g. "{123}"
+    """
+    value = str(value)
+    if not value or "{" in value or "}" in value:
+        raise ValueError(f"Invalid hash tag value: {value!r}")
+    return f"{{{value}}}"
+
+
+def make_key(
+    service: str,
+    keyspace: str,
+    identifier: str,
+    *parts: str,
+    group: Optional[str] = None,
+) -> str:
+    """Build a cache key in service:keyspace:identifier format.
+
+    Args:
+        service: Owning service
+        keyspace: Keyspace within the service
+        identifier: Entry identifier
+        *parts: Further key components
+        group: Value whose keys should share a slot; the identifier is used
+            as the hash tag when it is the same as the group
+
+    Returns:
+        Cache key, e.g. "character:sheets:{123}:abilities"
+    """
+    if group is not None and str(identifier) == str(group):
+        identifier = hash_tag(identifier)
+    elif group is not None:
+        parts = (identifier, *parts)
+        identifier = hash_tag(group)
+    return ":".join([service, keyspace, str(identifier), *(str(part) for part in parts)])
+
+
+def character_key(keyspace: str, character_id: str, *parts: str) -> str:
+    """Build a character service key in the character's slot.
+
+    Args:
+        keyspace: Character keyspace, e.g. "sheets" or "inventory"
+        character_id: Character the entry belongs to
+        *parts: Further key components
+
+    Returns:
+        Cache key, e.g. "character:inventory:{123}:weapons"
+    """
+    return make_key("character", keyspace, character_id, *parts, group=character_id)
+
+
+def key_hash_tag(key: str) -> Optional[str]:
+    """Get the hash tag Redis Cluster uses to place a key.
+
+    Returns:
+        The tag without braces, or None if the whole key is hashed
+    """
+    start = key.find("{")
+    if start == -1:
+        return None
+    end = key.find("}", start + 1)
+    if end == -1 or end == start + 1:
+        return None
+    return key[start + 1:end]
+
+
+def key_slot(key: str) -> int:
+    """Get the cluster hash slot of a key."""
+    return _crc_key_slot(key.encode("utf-8"))
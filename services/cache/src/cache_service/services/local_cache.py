@@ -9,45 +9,106 @@ logger = structlog.get_logger()
 
 
 class LocalCache:
-    """Local in-memory cache with TTL support."""
+    """Local in-memory cache with TTL support.
 
-    def __init__(self, maxsize: int = 1000, ttl: int = 60):
+    Writes and invalidations advance a local version sequence. A fill from
+    Redis carries the version current when its read started and is rejected
+    if the key was written or invalidated since, so a slow read can never
+    put back a value that an invalidation already removed.
+
+    Hot keys can be promoted into a separate segment with a longer TTL, where
+    a burst of cold reads cannot evict them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        ttl: int = 60,
+        fill_window: int = 30,
+        hot_maxsize: int = 0,
+        hot_ttl: Optional[int] = None,
+    ):
         """Initialize local cache.
-        
+
         Args:
             maxsize: Maximum number of items in cache
             ttl: Default time-to-live in seconds
+            fill_window: Seconds key versions are remembered for rejecting
+                fills; must exceed the longest Redis read
+            hot_maxsize: Maximum number of promoted items; 0 disables promotion
+            hot_ttl: Time-to-live of promoted items in seconds
         """
         self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
         self.default_ttl = ttl
+        self.hot_ttl = hot_ttl or ttl
+        self.hot = TTLCache(maxsize=hot_maxsize, ttl=self.hot_ttl) if hot_maxsize else None
+        self._version = 0
+        self._cleared_version = 0
+        self._key_versions = TTLCache(maxsize=maxsize * 2, ttl=fill_window)
         self.stats = {
             "hits": 0,
             "misses": 0,
             "sets": 0,
             "deletes": 0,
             "evictions": 0,
+            "invalidations": 0,
+            "rejected_fills": 0,
+            "promotions": 0,
         }
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from local cache."""
         try:
-            value = self.cache.get(key)
-            if value is not None:
+            segment = self._segment_of(key)
+            entry: Optional[Tuple[Any, Optional[float]]] = segment.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                # Entry outlived the TTL it was written with
+                segment.pop(key, None)
+                self.stats["evictions"] += 1
+                entry = None
+
+            if entry is not None:
                 self.stats["hits"] += 1
                 logger.debug("Local cache hit", key=key)
-            else:
-                self.stats["misses"] += 1
-                logger.debug("Local cache miss", key=key)
-            return value
+                return entry[0]
+
+            self.stats["misses"] += 1
+            logger.debug("Local cache miss", key=key)
+            return None
         except Exception as e:
             logger.warning("Local cache get error", key=key, error=str(e))
             return None
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set value in local cache."""
+    def fill_version(self) -> int:
+        """Get the version to pass to ``set`` for a value about to be read from Redis."""
+        return self._version
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Set value in local cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds the value is valid for, capped at the cache's TTL
+            version: Version from ``fill_version`` when the value was read from
+                Redis; omitted for values this process wrote itself
+
+        Returns:
+            True if the value was cached
+        """
         try:
-            # TTLCache handles TTL automatically based on initialization
-            self.cache[key] = value
+            if not self._accept(key, version):
+                return False
+
+            # A promoted key stays promoted when it is written
+            segment = self._segment_of(key)
+            self._store(segment, key, value, ttl)
             self.stats["sets"] += 1
             logger.debug("Local cache set", key=key)
             return True
@@ -55,11 +116,78 @@ class LocalCache:
             logger.warning("Local cache set error", key=key, error=str(e))
             return False
 
+    def promote(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Move a hot key into the promoted segment.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds the value is valid for, capped at the promoted TTL
+            version: Version from ``fill_version``, as for ``set``
+
+        Returns:
+            True if the value was promoted
+        """
+        if self.hot is None:
+            return self.set(key, value, ttl, version)
+
+        try:
+            if not self._accept(key, version):
+                return False
+
+            self.cache.pop(key, None)
+            self._store(self.hot, key, value, ttl)
+            self.stats["promotions"] += 1
+            logger.debug("Local cache promote", key=key)
+            return True
+        except Exception as e:
+            logger.warning("Local cache promote error", key=key, error=str(e))
+            return False
+
+    def is_promoted(self, key: str) -> bool:
+        """Check whether a key is held in the promoted segment."""
+        return self.hot is not None and key in self.hot
+
+    def _segment_of(self, key: str) -> TTLCache:
+        """Get the segment holding, or due to hold, a key."""
+        if self.hot is not None and key in self.hot:
+            return self.hot
+        return self.cache
+
+    def _accept(self, key: str, version: Optional[int]) -> bool:
+        """Check a fill against newer writes and bump the key for local writes."""
+        if version is not None and (
+            self._cleared_version > version or self._key_versions.get(key, -1) > version
+        ):
+            self.stats["rejected_fills"] += 1
+            logger.debug("Local cache fill rejected", key=key)
+            return False
+
+        if version is None:
+            self._bump(key)
+        return True
+
+    def _store(self, segment: TTLCache, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store an entry, expiring it early if its TTL is below the segment's."""
+        expires_at = None
+        if ttl is not None and ttl < segment.ttl:
+            expires_at = time.monotonic() + ttl
+
+        segment[key] = (value, expires_at)
+
     def delete(self, key: str) -> bool:
         """Delete key from local cache."""
         try:
-            if key in self.cache:
-                del self.cache[key]
+            self._bump(key)
+            segment = self._segment_of(key)
+            if key in segment:
+                del segment[key]
                 self.stats["deletes"] += 1
                 logger.debug("Local cache delete", key=key)
                 return True
@@ -68,32 +196,53 @@ class LocalCache:
             logger.warning("Local cache delete error", key=key, error=str(e))
             return False
 
+    def invalidate(self, key: str) -> bool:
+        """Drop a key changed by another replica."""
+        self.stats["invalidations"] += 1
+        return self.delete(key)
+
     def clear(self) -> None:
         """Clear all items from local cache."""
         try:
+            self._version += 1
+            self._cleared_version = self._version
+            self._key_versions.clear()
             self.cache.clear()
+            if self.hot is not None:
+                self.hot.clear()
             logger.info("Local cache cleared")
         except Exception as e:
             logger.error("Local cache clear error", error=str(e))
 
+    def _bump(self, key: str) -> None:
+        """Advance the version of a key so in-flight fills of it are rejected."""
+        self._version += 1
+        self._key_versions[key] = self._version
+
     def exists(self, key: str) -> bool:
         """Check if key exists in local cache."""
-        return key in self.cache
+        return self.get(key) is not None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
-        
+
         return {
-            "size": len(self.cache),
+            "size": len(self),
             "maxsize": self.cache.maxsize,
             "ttl": self.default_ttl,
+            "promoted": len(self.hot) if self.hot is not None else 0,
+            "promoted_maxsize": self.hot.maxsize if self.hot is not None else 0,
+            "promoted_ttl": self.hot_ttl,
+            "promotions": self.stats["promotions"],
             "hits": self.stats["hits"],
             "misses": self.stats["misses"],
             "sets": self.stats["sets"],
             "deletes": self.stats["deletes"],
             "evictions": self.stats["evictions"],
+            "invalidations": self.stats["invalidations"],
+            "rejected_fills": self.stats["rejected_fills"],
             "hit_rate": hit_rate,
         }
 
@@ -112,8 +261,8 @@ class LocalCache:
 
     def __len__(self) -> int:
         """Get number of items in cache."""
-        return len(self.cache)
+        return len(self.cache) + (len(self.hot) if self.hot is not None else 0)
 
     def __contains__(self, key: str) -> bool:
         """Check if key is in cache."""
-        return key in self.cache
+        return self.exists(key)
@@ -1,10 +1,8 @@
 """Redis client implementation for cache service."""
 
 import asyncio
-import json
-import pickle
-import zlib
-from typing import Any, Dict, List, Optional, Tuple, Set
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Set
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
@@ -18,11 +16,31 @@ from ..core.exceptions import (
     CacheConnectionError,
     CacheOperationError,
     CacheKeyError,
+    CacheSerializationError,
 )
 from ..core.monitoring import metrics_collector
+from .codec import Codec, UnknownDictionaryError, namespace_of
 
 logger = structlog.get_logger()
 
+# Deletes a lock only if it still holds the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _decode_keys(keys: List[Any]) -> List[str]:
+    """Decode key names returned by Redis."""
+    return [key.decode("utf-8") if isinstance(key, bytes) else key for key in keys]
+
 
 class RedisClient:
     """Redis client with cluster and sentinel support."""
@@ -32,11 +50,11 @@ class RedisClient:
         self.replica_client: Optional[redis.Redis] = None
         self.cluster_client: Optional[RedisCluster] = None
         self.sentinel: Optional[Sentinel] = None
+        self.pubsub_client: Optional[redis.Redis] = None
         self.is_connected = False
         self.use_cluster = settings.REDIS_CLUSTER_ENABLED
         self.use_sentinel = settings.REDIS_SENTINEL_ENABLED
-        self.compression_enabled = settings.COMPRESSION_ENABLED
-        self.compression_threshold = settings.COMPRESSION_THRESHOLD
+        self.codec = Codec()
 
     async def connect(self) -> None:
         """Connect to Redis based on configuration."""
@@ -49,6 +67,7 @@ class RedisClient:
                 await self._connect_standalone()
             
             self.is_connected = True
+            await self.load_codec_dictionaries()
             logger.info("Redis connection established", 
                        mode=self._get_connection_mode())
         except Exception as e:
@@ -170,6 +189,8 @@ class RedisClient:
                 await self.primary_client.close()
             if self.replica_client:
                 await self.replica_client.close()
+            if self.pubsub_client:
+                await self.pubsub_client.close()
             
             self.is_connected = False
             logger.info("Disconnected from Redis")
@@ -186,6 +207,79 @@ class RedisClient:
         
         return self.primary_client
 
+    def get_pubsub_client(self) -> redis.Redis:
+        """Get a client for pub/sub traffic.
+        
+        Cluster mode propagates PUBLISH to every node, so a plain connection to
+        any one node is enough; the cluster client itself has no pub/sub.
+        """
+        if not self.cluster_client:
+            return self.primary_client
+        
+        if self.pubsub_client is None:
+            host, port = settings.REDIS_CLUSTER_NODES[0].split(":")
+            self.pubsub_client = redis.Redis(
+                host=host,
+                port=int(port),
+                password=settings.REDIS_PASSWORD.get_secret_value() if settings.REDIS_PASSWORD else None,
+                decode_responses=False,
+                socket_connect_timeout=settings.REDIS_CONNECTION_TIMEOUT,
+                socket_keepalive=settings.REDIS_SOCKET_KEEPALIVE,
+            )
+        return self.pubsub_client
+
+    def pipeline(self) -> Any:
+        """Get a non-transactional pipeline on the primary.
+        
+        Commands are queued on the returned pipeline and sent in one round trip
+        by awaiting its execute(); values it returns are raw and are decoded
+        with deserialize_value().
+        """
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        return self._get_client(read_only=False).pipeline(transaction=False)
+
+    def deserialize_value(self, data: bytes) -> Any:
+        """Decode a raw stored value; undecodable values are treated as misses."""
+        return self._deserialize_value(data)
+
+    async def list_push(self, key: str, *values: Any) -> int:
+        """Append values to the tail of a list.
+        
+        Returns:
+            Length of the list after the push
+        """
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        try:
+            return await self._get_client(read_only=False).rpush(key, *values)
+        except RedisError as e:
+            logger.error("Redis list_push error", key=key, error=str(e))
+            raise CacheOperationError(operation="list_push", key=key, error=str(e))
+
+    async def list_pop(self, key: str) -> Optional[bytes]:
+        """Remove and return the head of a list, or None if it is empty."""
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        try:
+            return await self._get_client(read_only=False).lpop(key)
+        except RedisError as e:
+            logger.error("Redis list_pop error", key=key, error=str(e))
+            raise CacheOperationError(operation="list_pop", key=key, error=str(e))
+
+    async def set_pop(self, key: str, count: int) -> List[bytes]:
+        """Remove and return up to count random members of a set."""
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        try:
+            return await self._get_client(read_only=False).spop(key, count) or []
+        except RedisError as e:
+            logger.error("Redis set_pop error", key=key, error=str(e))
+            raise CacheOperationError(operation="set_pop", key=key, error=str(e))
+
     def _get_connection_mode(self) -> str:
         """Get current connection mode."""
         if self.use_cluster:
@@ -195,57 +289,101 @@ class RedisClient:
         else:
             return "standalone"
 
-    def _serialize_value(self, value: Any) -> bytes:
+    def _serialize_value(self, value: Any, key: Optional[str] = None) -> bytes:
         """Serialize value for storage."""
-        # Try JSON first for simple types
-        try:
-            json_str = json.dumps(value)
-            data = json_str.encode('utf-8')
-            
-            # Compress if enabled and data is large enough
-            if self.compression_enabled and len(data) > self.compression_threshold:
-                compressed = zlib.compress(data, level=6)
-                # Only use compressed if it's actually smaller
-                if len(compressed) < len(data):
-                    return b'Z' + compressed  # Prefix with 'Z' to indicate compression
-            
-            return b'J' + data  # Prefix with 'J' to indicate JSON
-        except (TypeError, ValueError):
-            # Fall back to pickle for complex types
-            pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
-            
-            if self.compression_enabled and len(pickled) > self.compression_threshold:
-                compressed = zlib.compress(pickled, level=6)
-                if len(compressed) < len(pickled):
-                    return b'z' + compressed  # Lowercase 'z' for compressed pickle
-            
-            return b'P' + pickled  # 'P' for pickle
+        return self.codec.encode(value, namespace_of(key) if key else None)
 
     def _deserialize_value(self, data: bytes) -> Any:
-        """Deserialize value from storage."""
+        """Deserialize value from storage.
+        
+        Values that cannot be decoded are logged and treated as misses.
+        """
         if not data:
             return None
         
-        prefix = data[0:1]
-        content = data[1:]
-        
         try:
-            if prefix == b'Z':  # Compressed JSON
-                decompressed = zlib.decompress(content)
-                return json.loads(decompressed.decode('utf-8'))
-            elif prefix == b'J':  # Plain JSON
-                return json.loads(content.decode('utf-8'))
-            elif prefix == b'z':  # Compressed pickle
-                decompressed = zlib.decompress(content)
-                return pickle.loads(decompressed)
-            elif prefix == b'P':  # Plain pickle
-                return pickle.loads(content)
-            else:
-                # Try to decode as string for backward compatibility
-                return data.decode('utf-8')
+            return self.codec.decode(data)
+        except UnknownDictionaryError as e:
+            logger.warning("Value compressed with unknown dictionary",
+                          dictionary_id=e.dictionary_id)
+            return None
         except Exception as e:
             logger.warning("Failed to deserialize value", error=str(e))
-            return data
+            return None
+
+    async def _decode(self, data: bytes) -> Any:
+        """Deserialize value, loading dictionaries trained by other replicas if needed."""
+        try:
+            return self.codec.decode(data)
+        except UnknownDictionaryError:
+            await self.load_codec_dictionaries()
+        except Exception:
+            pass
+        return self._deserialize_value(data)
+
+    @property
+    def _dictionaries_key(self) -> str:
+        """Redis hash of every codec dictionary, by id."""
+        return f"{settings.CACHE_KEY_PREFIX}codec:dictionaries"
+
+    @property
+    def _dictionary_namespaces_key(self) -> str:
+        """Redis hash of the current dictionary id of each namespace."""
+        return f"{settings.CACHE_KEY_PREFIX}codec:namespaces"
+
+    async def load_codec_dictionaries(self) -> int:
+        """Load the codec dictionaries stored in Redis.
+        
+        Returns:
+            Number of dictionaries loaded
+        """
+        try:
+            client = self._get_client(read_only=False)
+            dictionaries = await client.hgetall(self._dictionaries_key)
+            namespaces = await client.hgetall(self._dictionary_namespaces_key)
+        except RedisError as e:
+            logger.error("Failed to load codec dictionaries", error=str(e))
+            return 0
+        
+        by_id = {int(dictionary_id): data for dictionary_id, data in dictionaries.items()}
+        try:
+            for data in by_id.values():
+                self.codec.add_decoding_dictionary(data)
+            for namespace, dictionary_id in namespaces.items():
+                namespace = namespace.decode("utf-8") if isinstance(namespace, bytes) else namespace
+                data = by_id.get(int(dictionary_id))
+                if data is not None:
+                    self.codec.add_dictionary(namespace, data)
+        except CacheSerializationError as e:
+            logger.error("Failed to load codec dictionaries", error=e.message)
+            return 0
+        
+        return len(by_id)
+
+    async def store_codec_dictionary(self, namespace: str, dictionary: bytes) -> int:
+        """Store a trained dictionary in Redis and start using it for a namespace.
+        
+        Returns:
+            Dictionary id
+        """
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        dictionary_id = self.codec.add_dictionary(namespace, dictionary)
+        try:
+            client = self._get_client(read_only=False)
+            # Dictionaries are stored before the namespace switches to them so
+            # other replicas can always decode what this one writes
+            await client.hset(self._dictionaries_key, str(dictionary_id), dictionary)
+            await client.hset(self._dictionary_namespaces_key, namespace, str(dictionary_id))
+        except RedisError as e:
+            logger.error("Failed to store codec dictionary", namespace=namespace, error=str(e))
+            raise CacheOperationError(
+                operation="store_codec_dictionary",
+                key=namespace,
+                error=str(e)
+            )
+        return dictionary_id
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -259,7 +397,7 @@ class RedisClient:
             if data is None:
                 return None
             
-            return self._deserialize_value(data)
+            return await self._decode(data)
         except TimeoutError:
             raise CacheOperationError(
                 operation="get",
@@ -286,7 +424,7 @@ class RedisClient:
         
         try:
             client = self._get_client(read_only=False)
-            serialized = self._serialize_value(value)
+            serialized = self._serialize_value(value, key)
             
             if ttl:
                 result = await client.setex(key, ttl, serialized)
@@ -379,20 +517,7 @@ class RedisClient:
             return {}
         
         try:
-            client = self._get_client(read_only=True)
-            
-            # Use pipeline for efficiency
-            pipe = client.pipeline()
-            for key in keys:
-                pipe.get(key)
-            
-            results = await pipe.execute()
-            
-            # Deserialize and build result dict
-            return {
-                key: self._deserialize_value(data) if data else None
-                for key, data in zip(keys, results)
-            }
+            return await self._get_values(self._get_client(read_only=True), keys)
         except RedisError as e:
             logger.error("Redis get_many error", error=str(e))
             raise CacheOperationError(
@@ -413,19 +538,18 @@ class RedisClient:
         if not items:
             return 0
         
+        # Encode everything first so a bad value fails the batch before any write
+        serialized = {key: self._serialize_value(value, key) for key, value in items.items()}
+        
+        def queue(pipe: Any, key: str) -> None:
+            if ttl:
+                pipe.setex(key, ttl, serialized[key])
+            else:
+                pipe.set(key, serialized[key])
+        
         try:
             client = self._get_client(read_only=False)
-            
-            # Use pipeline for efficiency
-            pipe = client.pipeline()
-            for key, value in items.items():
-                serialized = self._serialize_value(value)
-                if ttl:
-                    pipe.setex(key, ttl, serialized)
-                else:
-                    pipe.set(key, serialized)
-            
-            results = await pipe.execute()
+            results = await self._pipeline_per_node(client, list(serialized), queue)
             
             # Count successful operations
             return sum(1 for r in results if r)
@@ -445,10 +569,21 @@ class RedisClient:
         if not keys:
             return 0
         
+        client = self._get_client(read_only=False)
+        
+        async def delete_on_node(slots: Dict[int, List[int]]) -> int:
+            # Keys of one slot can share an UNLINK even in cluster mode
+            pipe = client.pipeline(transaction=False)
+            for positions in slots.values():
+                for chunk in _chunks(positions, settings.BULK_CHUNK_SIZE):
+                    pipe.unlink(*(keys[i] for i in chunk))
+            return sum(await pipe.execute())
+        
         try:
-            client = self._get_client(read_only=False)
-            result = await client.delete(*keys)
-            return result
+            deleted = await asyncio.gather(
+                *(delete_on_node(slots) for slots in self._group_by_node(keys))
+            )
+            return sum(deleted)
         except RedisError as e:
             logger.error("Redis delete_many error", error=str(e))
             raise CacheOperationError(
@@ -457,28 +592,288 @@ class RedisClient:
                 error=str(e)
             )
 
-    async def scan_keys(
+    def _group_by_node(self, keys: List[str]) -> List[Dict[int, List[int]]]:
+        """Group key positions by the node serving them, then by hash slot.
+        
+        Without a cluster every key is on the one server and they form a
+        single group.
+        """
+        if not self.cluster_client:
+            return [{0: list(range(len(keys)))}]
+        
+        nodes: Dict[str, Dict[int, List[int]]] = {}
+        for index, key in enumerate(keys):
+            slot = self.cluster_client.keyslot(key)
+            node = self.cluster_client.nodes_manager.get_node_from_slot(slot)
+            nodes.setdefault(node.name, {}).setdefault(slot, []).append(index)
+        return list(nodes.values())
+
+    async def _pipeline_per_node(
+        self,
+        client: Any,
+        keys: List[str],
+        queue: Callable[[Any, str], Any]
+    ) -> List[Any]:
+        """Run one command per key, pipelined per node.
+        
+        The nodes' pipelines run concurrently, each sending its keys in
+        chunks of BULK_CHUNK_SIZE so replies stay bounded. In cluster mode
+        every pipeline only holds keys of one node, so nothing is redirected
+        or rejected as cross-slot.
+        
+        Args:
+            client: Client to pipeline on
+            keys: Keys to run the command for
+            queue: Adds the command for a key to a pipeline
+            
+        Returns:
+            Command results in the order of keys
+        """
+        results: List[Any] = [None] * len(keys)
+        
+        async def run_on_node(slots: Dict[int, List[int]]) -> None:
+            positions = [index for group in slots.values() for index in group]
+            for chunk in _chunks(positions, settings.BULK_CHUNK_SIZE):
+                pipe = client.pipeline(transaction=False)
+                for index in chunk:
+                    queue(pipe, keys[index])
+                for index, result in zip(chunk, await pipe.execute()):
+                    results[index] = result
+        
+        await asyncio.gather(*(run_on_node(slots) for slots in self._group_by_node(keys)))
+        return results
+
+    async def _get_values(self, client: Any, keys: List[str]) -> Dict[str, Any]:
+        """Get keys with per-node pipelines, in the order given."""
+        results = await self._pipeline_per_node(client, keys, lambda pipe, key: pipe.get(key))
+        
+        return {
+            key: await self._decode(data) if data else None
+            for key, data in zip(keys, results)
+        }
+
+    async def _scan_step(
+        self,
+        client: Any,
+        pattern: str,
+        cursor: str,
+        count: int
+    ) -> Tuple[str, List[str]]:
+        """Run a single SCAN call.
+        
+        In cluster mode every primary has its own keyspace and cursor, so the
+        cursor handed out is "<node index>:<node cursor>" and the scan moves
+        to the next primary when one is exhausted.
+        """
+        node_part, _, cursor_part = cursor.rpartition(":")
+        try:
+            node_index, node_cursor = int(node_part or 0), int(cursor_part)
+        except ValueError:
+            raise CacheKeyError("Invalid scan cursor", cursor)
+        
+        if not self.cluster_client:
+            next_cursor, keys = await client.scan(
+                cursor=node_cursor, match=pattern, count=count
+            )
+            return str(next_cursor), _decode_keys(keys)
+        
+        nodes = sorted(self.cluster_client.get_primaries(), key=lambda node: node.name)
+        if node_index >= len(nodes):
+            raise CacheKeyError("Invalid scan cursor", cursor)
+        
+        cursors, keys = await client.scan(
+            cursor=node_cursor, match=pattern, count=count, target_nodes=nodes[node_index]
+        )
+        node_cursor = next(iter(cursors.values()))
+        if node_cursor:
+            return f"{node_index}:{node_cursor}", _decode_keys(keys)
+        if node_index + 1 < len(nodes):
+            return f"{node_index + 1}:0", _decode_keys(keys)
+        return "0", _decode_keys(keys)
+
+    async def scan_page(
         self,
         pattern: str = "*",
-        count: int = 100
-    ) -> List[str]:
-        """Scan for keys matching pattern."""
+        cursor: str = "0",
+        count: int = 100,
+        max_calls: int = 10,
+        read_only: bool = True
+    ) -> Tuple[str, List[str]]:
+        """Scan one page of keys matching pattern.
+        
+        A single SCAN call can return few or no keys for a sparse pattern, so
+        up to max_calls calls are made to fill the page. A page may still
+        hold fewer than count keys, or none, before the scan is complete.
+        
+        Args:
+            pattern: Key pattern to match
+            cursor: Cursor returned with the previous page, "0" to start
+            count: Number of keys wanted
+            max_calls: Most SCAN calls to make for the page
+            read_only: Whether the scan may run against a replica
+            
+        Returns:
+            Cursor of the next page ("0" when the scan is complete) and the keys
+        """
         if not self.is_connected:
             raise CacheConnectionError(node="redis", error="Not connected")
         
         try:
-            client = self._get_client(read_only=True)
-            keys = []
+            client = self._get_client(read_only=read_only)
+            keys: List[str] = []
             
-            async for key in client.scan_iter(pattern, count=count):
-                keys.append(key.decode('utf-8') if isinstance(key, bytes) else key)
-                if len(keys) >= count:
+            for _ in range(max_calls):
+                cursor, found = await self._scan_step(client, pattern, cursor, count - len(keys))
+                keys.extend(found)
+                if cursor == "0" or len(keys) >= count:
                     break
             
-            return keys
+            return cursor, keys
         except RedisError as e:
-            logger.error("Redis scan_keys error", pattern=pattern, error=str(e))
+            logger.error("Redis scan error", pattern=pattern, cursor=cursor, error=str(e))
+            raise CacheOperationError(
+                operation="scan",
+                key=pattern,
+                error=str(e)
+            )
+
+    async def iter_keys(
+        self,
+        pattern: str = "*",
+        batch_size: int = settings.SCAN_BATCH_SIZE,
+        read_only: bool = True
+    ) -> AsyncIterator[List[str]]:
+        """Iterate over the keys matching pattern in chunks.
+        
+        Only one chunk is held at a time, so the whole keyspace can be walked
+        without collecting it in memory.
+        
+        Args:
+            pattern: Key pattern to match
+            batch_size: SCAN count hint and approximate chunk size
+            read_only: Whether the scan may run against a replica
+            
+        Yields:
+            Non-empty lists of keys
+        """
+        cursor = "0"
+        while True:
+            cursor, keys = await self.scan_page(
+                pattern, cursor, batch_size, max_calls=1, read_only=read_only
+            )
+            if keys:
+                yield keys
+            if cursor == "0":
+                return
+
+    async def iter_items(
+        self,
+        pattern: str = "*",
+        batch_size: int = settings.SCAN_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the keys matching pattern and their values in chunks.
+        
+        Each chunk of keys is read with one pipeline. Keys that expired
+        between the scan and the read are left out.
+        
+        Yields:
+            Non-empty mappings of key to value
+        """
+        async for keys in self.iter_keys(pattern, batch_size):
+            try:
+                values = await self._get_values(self._get_client(read_only=True), keys)
+            except RedisError as e:
+                logger.error("Redis iter_items error", pattern=pattern, error=str(e))
+                raise CacheOperationError(
+                    operation="iter_items",
+                    key=pattern,
+                    error=str(e)
+                )
+            
+            items = {key: value for key, value in values.items() if value is not None}
+            if items:
+                yield items
+
+    async def scan_keys(
+        self,
+        pattern: str = "*",
+        count: int = 100
+    ) -> List[str]:
+        """Scan for up to count keys matching pattern."""
+        keys: List[str] = []
+        try:
+            async for chunk in self.iter_keys(pattern, min(count, settings.SCAN_BATCH_SIZE)):
+                keys.extend(chunk[:count - len(keys)])
+                if len(keys) >= count:
+                    break
+        except CacheOperationError:
             return []
+        
+        return keys
+
+    async def delete_matching(
+        self,
+        pattern: str,
+        batch_size: int = settings.SCAN_BATCH_SIZE
+    ) -> int:
+        """Delete every key matching pattern.
+        
+        Walks the keyspace with SCAN and unlinks matches a chunk at a time,
+        so the server is never blocked for the whole keyspace.
+        """
+        deleted = 0
+        async for keys in self.iter_keys(pattern, batch_size, read_only=False):
+            try:
+                deleted += await self._get_client(read_only=False).unlink(*keys)
+            except RedisError as e:
+                logger.error("Redis delete_matching error", pattern=pattern, error=str(e))
+                raise CacheOperationError(
+                    operation="delete_matching",
+                    key=pattern,
+                    error=str(e)
+                )
+        
+        return deleted
+
+    async def acquire_lock(self, name: str, ttl: float) -> Optional[str]:
+        """Try to take a short-lived lock.
+        
+        Args:
+            name: Lock key
+            ttl: Seconds after which the lock is released even if its holder died
+            
+        Returns:
+            Token to release the lock with, or None if it is held elsewhere
+        """
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        token = uuid.uuid4().hex
+        try:
+            client = self._get_client(read_only=False)
+            acquired = await client.set(name, token, nx=True, px=int(ttl * 1000))
+            return token if acquired else None
+        except RedisError as e:
+            logger.error("Redis acquire_lock error", key=name, error=str(e))
+            raise CacheOperationError(
+                operation="acquire_lock",
+                key=name,
+                error=str(e)
+            )
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock if it is still held with the given token."""
+        if not self.is_connected:
+            raise CacheConnectionError(node="redis", error="Not connected")
+        
+        try:
+            client = self._get_client(read_only=False)
+            result = await client.eval(RELEASE_LOCK_SCRIPT, 1, name, token)
+            return bool(result)
+        except RedisError as e:
+            # The lock expires on its own
+            logger.warning("Redis release_lock error", key=name, error=str(e))
+            return False
 
     async def flush_db(self) -> bool:
         """Flush the entire database."""
@@ -0,0 +1,409 @@
+"""Tag and namespace invalidation for cache service.
+
+Every entry is written together with a snapshot of the generation counters of
+its tags (always including its namespace tag). Invalidating a tag increments
+its counter, which makes every entry holding an older snapshot stale at once,
+whatever the number of keys involved. Stale entries are removed later, a batch
+at a time, by a background sweep.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from .local_cache import LocalCache
+from .redis_client import RedisClient
+from ..core.config import settings
+
+logger = structlog.get_logger()
+
+# Reserved keys of the stored entry envelope
+TAG_ENVELOPE_KEY = "__cache_tags__"
+VALUE_ENVELOPE_KEY = "__cache_value__"
+EXPIRES_ENVELOPE_KEY = "__cache_expires__"
+
+# Deletes a key only if it still holds the bytes the sweep judged stale, so an
+# entry rewritten under a newer generation is never removed
+DELETE_IF_UNCHANGED_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def namespace_tag(key: str) -> str:
+    """Get the namespace tag for a cache key.
+
+    Args:
+        key: Cache key in service:keyspace:identifier format
+
+    Returns:
+        Tag shared by every key of the key's service
+    """
+    return f"ns:{key.split(':', 1)[0]}"
+
+
+def is_envelope(value: Any) -> bool:
+    """Check whether a stored value is a tagged entry envelope."""
+    return isinstance(value, dict) and TAG_ENVELOPE_KEY in value and VALUE_ENVELOPE_KEY in value
+
+
+def remaining_ttl(value: Any) -> Optional[float]:
+    """Get the seconds a stored entry has left, if it was written with a TTL."""
+    if not is_envelope(value) or value.get(EXPIRES_ENVELOPE_KEY) is None:
+        return None
+    return max(0.0, value[EXPIRES_ENVELOPE_KEY] - time.time())
+
+
+class TagInvalidator:
+    """Generation-counter based invalidation of tagged cache entries."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        local_cache: Optional[LocalCache] = None,
+        generation_ttl: float = settings.TAG_GENERATION_TTL,
+        cleanup_interval: float = settings.TAG_CLEANUP_INTERVAL,
+        cleanup_batch_size: int = settings.TAG_CLEANUP_BATCH_SIZE,
+        cleanup_max_batches: int = settings.TAG_CLEANUP_MAX_BATCHES,
+    ):
+        """Initialize tag invalidator.
+
+        Args:
+            redis_client: Redis client holding counters and tag indexes
+            local_cache: Optional local cache to purge swept keys from
+            generation_ttl: Seconds a fetched generation is trusted before
+                being read from Redis again
+            cleanup_interval: Seconds between background sweeps
+            cleanup_batch_size: Keys examined per sweep batch
+            cleanup_max_batches: Batches per sweep before yielding
+        """
+        self.redis_client = redis_client
+        self.local_cache = local_cache
+        self.generation_ttl = generation_ttl
+        self.cleanup_interval = cleanup_interval
+        self.cleanup_batch_size = cleanup_batch_size
+        self.cleanup_max_batches = cleanup_max_batches
+        self.prefix = f"{settings.CACHE_KEY_PREFIX}tag:"
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "invalidations": 0,
+            "stale_reads": 0,
+            "keys_swept": 0,
+            "keys_reclaimed": 0,
+        }
+
+    def _generation_key(self, tag: str) -> str:
+        """Redis key of a tag's generation counter."""
+        return f"{self.prefix}gen:{tag}"
+
+    def _members_key(self, tag: str, generation: int) -> str:
+        """Redis set of keys written under one generation of a tag."""
+        return f"{self.prefix}members:{tag}:{generation}"
+
+    @property
+    def _cleanup_queue(self) -> str:
+        """Redis list of member sets waiting to be swept."""
+        return f"{self.prefix}cleanup"
+
+    def start(self) -> None:
+        """Start the background sweep."""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop(self) -> None:
+        """Stop the background sweep."""
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+
+    def tags_for(self, key: str, tags: Optional[Iterable[str]] = None) -> List[str]:
+        """Get the full tag list of a key: its namespace tag plus explicit tags."""
+        result = [namespace_tag(key)]
+        for tag in tags or ():
+            if tag not in result:
+                result.append(tag)
+        return result
+
+    async def get_generations(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Get current generations of tags.
+
+        Generations fetched within the last ``generation_ttl`` seconds are
+        served from memory; the rest are read in one pipeline.
+
+        Args:
+            tags: Tags to look up
+
+        Returns:
+            Mapping of tag to generation (0 for never-invalidated tags)
+        """
+        now = time.monotonic()
+        result: Dict[str, int] = {}
+        missing: List[str] = []
+
+        for tag in tags:
+            if tag in result or tag in missing:
+                continue
+            cached = self._generations.get(tag)
+            if cached and now - cached[1] < self.generation_ttl:
+                result[tag] = cached[0]
+            else:
+                missing.append(tag)
+
+        if missing:
+            pipe = self.redis_client.pipeline()
+            for tag in missing:
+                pipe.get(self._generation_key(tag))
+            values = await pipe.execute()
+
+            for tag, value in zip(missing, values):
+                generation = int(value) if value is not None else 0
+                self._generations[tag] = (generation, now)
+                result[tag] = generation
+
+        return result
+
+    async def wrap_many(
+        self,
+        items: Dict[str, Any],
+        tags: Optional[Iterable[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wrap values in envelopes carrying their tag generations.
+
+        Args:
+            items: Key-value pairs to be written
+            tags: Explicit tags applied to every item
+            ttl: TTL the items are written with, recorded so copies held in
+                local caches expire with the Redis entry
+
+        Returns:
+            Mapping of key to envelope
+        """
+        tags = list(tags or ())
+        key_tags = {key: self.tags_for(key, tags) for key in items}
+        generations = await self.get_generations(
+            tag for entry_tags in key_tags.values() for tag in entry_tags
+        )
+        expires_at = time.time() + ttl if ttl else None
+
+        return {
+            key: {
+                TAG_ENVELOPE_KEY: {tag: generations[tag] for tag in key_tags[key]},
+                VALUE_ENVELOPE_KEY: value,
+                EXPIRES_ENVELOPE_KEY: expires_at,
+            }
+            for key, value in items.items()
+        }
+
+    async def wrap(
+        self,
+        key: str,
+        value: Any,
+        tags: Optional[Iterable[str]] = None,
+        ttl: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Wrap a single value in an envelope carrying its tag generations."""
+        envelopes = await self.wrap_many({key: value}, tags, ttl)
+        return envelopes[key]
+
+    async def track(self, envelopes: Dict[str, Dict[str, Any]], ttl: Optional[int]) -> None:
+        """Record written keys in the member sets of their tag generations.
+
+        The sets only drive physical cleanup, so a failure here is logged and
+        ignored: the entries are still invisible once invalidated and expire
+        on their own TTL.
+
+        Args:
+            envelopes: Written keys and their envelopes
+            ttl: TTL the entries were written with
+        """
+        members: Dict[str, List[str]] = defaultdict(list)
+        for key, envelope in envelopes.items():
+            for tag, generation in envelope[TAG_ENVELOPE_KEY].items():
+                members[self._members_key(tag, generation)].append(key)
+
+        if not members:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline()
+            for members_key, keys in members.items():
+                pipe.sadd(members_key, *keys)
+                if ttl:
+                    pipe.expire(members_key, ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to track tagged keys", count=len(envelopes), error=str(e))
+
+    async def resolve_many(self, entries: Dict[str, Any]) -> Dict[str, Any]:
+        """Unwrap stored entries, dropping those invalidated since they were written.
+
+        Values that are not envelopes are returned unchanged.
+
+        Args:
+            entries: Keys and their stored values
+
+        Returns:
+            Keys and unwrapped values of the entries that are still current
+        """
+        envelopes = {key: value for key, value in entries.items() if is_envelope(value)}
+        generations = await self.get_generations(
+            tag for envelope in envelopes.values() for tag in envelope[TAG_ENVELOPE_KEY]
+        )
+
+        result = {}
+        for key, value in entries.items():
+            if key not in envelopes:
+                result[key] = value
+            elif all(
+                generations[tag] == generation
+                for tag, generation in value[TAG_ENVELOPE_KEY].items()
+            ):
+                result[key] = value[VALUE_ENVELOPE_KEY]
+            else:
+                self.stats["stale_reads"] += 1
+        return result
+
+    async def resolve(self, key: str, value: Any) -> Optional[Any]:
+        """Unwrap a single stored entry, or return None if it is stale."""
+        return (await self.resolve_many({key: value})).get(key)
+
+    async def invalidate(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Invalidate every entry carrying any of the given tags.
+
+        Costs one counter increment per tag regardless of how many entries
+        carry it. The previous generation's member set is queued for the
+        background sweep.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Mapping of tag to its new generation
+        """
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return {}
+
+        pipe = self.redis_client.pipeline()
+        for tag in tags:
+            pipe.incr(self._generation_key(tag))
+        new_generations = dict(zip(tags, (int(g) for g in await pipe.execute())))
+
+        now = time.monotonic()
+        for tag, generation in new_generations.items():
+            self._generations[tag] = (generation, now)
+
+        await self.redis_client.list_push(
+            self._cleanup_queue,
+            *(self._members_key(tag, generation - 1) for tag, generation in new_generations.items()),
+        )
+
+        self.stats["invalidations"] += len(tags)
+        logger.info("Cache tags invalidated", tags=tags)
+        return new_generations
+
+    def observe(self, generations: Dict[str, int]) -> None:
+        """Record generations announced by another replica's invalidation.
+
+        Args:
+            generations: Mapping of tag to its new generation
+        """
+        now = time.monotonic()
+        for tag, generation in generations.items():
+            cached = self._generations.get(tag)
+            if cached is None or cached[0] < generation:
+                self._generations[tag] = (generation, now)
+
+    async def sweep(self) -> int:
+        """Delete stale entries of one queued member set, up to the batch budget.
+
+        A set that is not exhausted within the budget is queued again, so large
+        invalidations are reclaimed over several sweeps.
+
+        Returns:
+            Number of keys examined
+        """
+        members_key = await self.redis_client.list_pop(self._cleanup_queue)
+        if members_key is None:
+            return 0
+
+        swept = 0
+        exhausted = False
+        for _ in range(self.cleanup_max_batches):
+            keys = await self.redis_client.set_pop(members_key, self.cleanup_batch_size)
+            if not keys:
+                exhausted = True
+                break
+            swept += len(keys)
+            await self._reclaim(keys)
+            if len(keys) < self.cleanup_batch_size:
+                exhausted = True
+                break
+
+        if not exhausted:
+            await self.redis_client.list_push(self._cleanup_queue, members_key)
+
+        return swept
+
+    async def _reclaim(self, keys: List[Any]) -> int:
+        """Delete the stale entries among a batch of keys."""
+        keys = [key.decode("utf-8") if isinstance(key, bytes) else key for key in keys]
+        self.stats["keys_swept"] += len(keys)
+
+        pipe = self.redis_client.pipeline()
+        for key in keys:
+            pipe.get(key)
+        raw_values = await pipe.execute()
+
+        stored = {
+            key: (raw, self.redis_client.deserialize_value(raw))
+            for key, raw in zip(keys, raw_values)
+            if raw is not None
+        }
+        current = await self.resolve_many({key: value for key, (_, value) in stored.items()})
+        stale = [key for key in stored if key not in current]
+
+        if self.local_cache is not None:
+            for key in keys:
+                self.local_cache.delete(key)
+
+        if not stale:
+            return 0
+
+        pipe = self.redis_client.pipeline()
+        for key in stale:
+            pipe.eval(DELETE_IF_UNCHANGED_SCRIPT, 1, key, stored[key][0])
+        deleted = sum(int(r) for r in await pipe.execute())
+
+        self.stats["keys_reclaimed"] += deleted
+        return deleted
+
+    async def _cleanup_loop(self) -> None:
+        """Background task sweeping invalidated entries."""
+        while True:
+            try:
+                if not await self.sweep():
+                    await asyncio.sleep(self.cleanup_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Tag cleanup sweep failed", error=str(e))
+                await asyncio.sleep(self.cleanup_interval * 5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get invalidation statistics."""
+        return {
+            **self.stats,
+            "tracked_generations": len(self._generations),
+        }
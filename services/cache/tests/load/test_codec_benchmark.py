@@ -0,0 +1,139 @@
+"""Codec benchmark for cache service.
+
+Reports stored bytes and encode/decode time per payload class for the legacy
+prefix format and each codec configuration. Run with ``-s`` to see the table.
+"""
+
+import json
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from cache_service.services.codec import Codec
+
+ITERATIONS = 2000
+
+
+def catalog_entry(i: int) -> Dict[str, Any]:
+    """Small catalog entry, e.g. a spell."""
+    return {
+        "id": f"spell-{i}",
+        "name": f"Spell {i}",
+        "level": i % 10,
+        "school": ["evocation", "abjuration", "illusion"][i % 3],
+        "components": ["V", "S"],
+        "ritual": False,
+    }
+
+
+def character_sheet(i: int) -> Dict[str, Any]:
+    """Medium character sheet."""
+    return {
+        "id": f"character-{i}",
+        "name": f"Adventurer {i}",
+        "class": ["fighter", "wizard", "rogue", "cleric"][i % 4],
+        "level": i % 20 + 1,
+        "abilities": {"str": 10 + i % 8, "dex": 12, "con": 14, "int": 8, "wis": 13, "cha": 11},
+        "skills": {skill: i % 5 for skill in ("athletics", "arcana", "stealth", "insight")},
+        "inventory": [{"item": f"item-{n}", "qty": n % 3 + 1, "weight": 1.5} for n in range(15)],
+        "spells": [catalog_entry(i + n) for n in range(5)],
+    }
+
+
+def campaign_document(i: int) -> Dict[str, Any]:
+    """Large campaign document."""
+    return {
+        "id": f"campaign-{i}",
+        "title": f"Campaign {i}",
+        "chapters": [
+            {
+                "title": f"Chapter {n}",
+                "summary": "The party travels through the misty hills towards the keep. " * 5,
+                "npcs": [{"name": f"NPC {m}", "role": "merchant", "disposition": m % 3}
+                         for m in range(10)],
+            }
+            for n in range(20)
+        ],
+        "characters": [character_sheet(i + n) for n in range(4)],
+    }
+
+
+PAYLOAD_CLASSES = {
+    "catalog_entry": ("catalog:spells", catalog_entry),
+    "character_sheet": ("character:sheets", character_sheet),
+    "campaign_document": ("campaign:campaigns", campaign_document),
+}
+
+
+def legacy_encode(value: Any) -> bytes:
+    """The prefix format written before the codec, for comparison."""
+    data = json.dumps(value).encode("utf-8")
+    if len(data) > 1024:
+        compressed = zlib.compress(data, level=6)
+        if len(compressed) < len(data):
+            return b"Z" + compressed
+    return b"J" + data
+
+
+def measure(
+    encode: Callable[[Any], bytes],
+    decode: Callable[[bytes], Any],
+    values: List[Any],
+) -> Tuple[float, float, float]:
+    """Average stored size, encode and decode microseconds per value."""
+    start = time.perf_counter()
+    encoded = [encode(value) for value in values]
+    encode_us = (time.perf_counter() - start) / len(values) * 1e6
+
+    start = time.perf_counter()
+    for data in encoded:
+        decode(data)
+    decode_us = (time.perf_counter() - start) / len(values) * 1e6
+
+    return sum(len(data) for data in encoded) / len(values), encode_us, decode_us
+
+
+@pytest.mark.load
+class TestCodecBenchmark:
+    """Compare codec configurations on representative payloads."""
+
+    CONFIGURATIONS = [
+        ("msgpack+zstd", {"encoder": "msgpack", "compressor": "zstd", "write_format": "v1"}),
+        ("msgpack+lz4", {"encoder": "msgpack", "compressor": "lz4", "write_format": "v1"}),
+        ("orjson+zstd", {"encoder": "orjson", "compressor": "zstd", "write_format": "v1"}),
+        ("orjson+none", {"encoder": "orjson", "compressor": "none", "write_format": "v1"}),
+    ]
+
+    def test_codec_benchmark(self):
+        """Every configuration round-trips; dictionaries beat the legacy format."""
+        reader = Codec()
+        print(f"\n{'payload':<18}{'codec':<20}{'bytes':>9}{'saved':>8}"
+              f"{'enc us':>9}{'dec us':>9}")
+
+        for payload_class, (namespace, make) in PAYLOAD_CLASSES.items():
+            values = [make(i) for i in range(ITERATIONS)]
+            baseline, enc_us, dec_us = measure(legacy_encode, reader.decode, values)
+            print(f"{payload_class:<18}{'legacy json+zlib':<20}{baseline:>9.0f}{'':>8}"
+                  f"{enc_us:>9.1f}{dec_us:>9.1f}")
+
+            configurations = list(self.CONFIGURATIONS)
+            dictionary_codec = Codec(encoder="msgpack", compressor="zstd", write_format="v1")
+            dictionary_codec.add_dictionary(namespace, dictionary_codec.train_dictionary(
+                [dictionary_codec.encode_payload(make(-i)) for i in range(1, 1001)]
+            ))
+            configurations.append(("msgpack+zstd dict", dictionary_codec))
+
+            for name, codec in configurations:
+                if isinstance(codec, dict):
+                    codec = Codec(**codec)
+                size, enc_us, dec_us = measure(
+                    lambda value: codec.encode(value, namespace), codec.decode, values
+                )
+                saved = (1 - size / baseline) * 100
+                print(f"{'':<18}{name:<20}{size:>9.0f}{saved:>7.1f}%"
+                      f"{enc_us:>9.1f}{dec_us:>9.1f}")
+
+                assert codec.decode(codec.encode(values[0], namespace)) == values[0]
+                if codec is dictionary_codec:
+                    assert size < baseline
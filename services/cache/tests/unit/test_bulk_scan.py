@@ -0,0 +1,164 @@
+"""Unit tests for cursor-based scanning and chunked bulk operations."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from cache_service.core.exceptions import CacheKeyError
+from cache_service.services.redis_client import RedisClient
+
+
+class FakeScanRedis:
+    """Standalone Redis whose SCAN walks a fixed key list in pages."""
+
+    def __init__(self, keys, page_size=3):
+        self.keys = keys
+        self.page_size = page_size
+        self.scan_calls = 0
+        self.store = {}
+        self.pipelines = 0
+
+    async def scan(self, cursor=0, match=None, count=None):
+        self.scan_calls += 1
+        page = self.keys[cursor:cursor + self.page_size]
+        next_cursor = cursor + self.page_size
+        found = [key.encode() for key in page if match is None or key.startswith(match[:-1])]
+        return (next_cursor if next_cursor < len(self.keys) else 0), found
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        pipe = MagicMock()
+        queued = []
+        pipe.get.side_effect = queued.append
+        pipe.execute = AsyncMock(side_effect=lambda: [self.store.get(key) for key in queued])
+        return pipe
+
+    async def unlink(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+class FakeClusterRedis:
+    """Cluster whose primaries each hold their own keys."""
+
+    def __init__(self, keys_by_node):
+        self.keys_by_node = keys_by_node
+        self.nodes = {name: SimpleNamespace(name=name) for name in keys_by_node}
+
+    def get_primaries(self):
+        return list(self.nodes.values())
+
+    async def scan(self, cursor=0, match=None, count=None, target_nodes=None):
+        keys = self.keys_by_node[target_nodes.name]
+        page = keys[cursor:cursor + 2]
+        next_cursor = cursor + 2 if cursor + 2 < len(keys) else 0
+        return {target_nodes.name: next_cursor}, page
+
+
+def connected(client, cluster=False):
+    """Redis client connected to a fake server."""
+    redis_client = RedisClient()
+    redis_client.is_connected = True
+    if cluster:
+        redis_client.cluster_client = client
+    else:
+        redis_client.primary_client = client
+    return redis_client
+
+
+@pytest.mark.unit
+class TestScanPage:
+    """Test paging through the keyspace by cursor."""
+
+    async def test_pages_until_complete(self):
+        """Following next cursors visits every key once."""
+        keys = [f"character:sheets:{i}" for i in range(10)]
+        redis_client = connected(FakeScanRedis(keys))
+
+        seen, cursor = [], "0"
+        while True:
+            cursor, page = await redis_client.scan_page("*", cursor, count=4)
+            seen.extend(page)
+            if cursor == "0":
+                break
+
+        assert seen == keys
+
+    async def test_sparse_pattern_fills_page_with_several_calls(self):
+        """A page keeps scanning while SCAN calls return too few matches."""
+        keys = [f"campaign:plots:{i}" if i % 3 == 0 else f"character:sheets:{i}"
+                for i in range(30)]
+        fake = FakeScanRedis(keys)
+        redis_client = connected(fake)
+
+        cursor, page = await redis_client.scan_page("campaign:*", "0", count=3, max_calls=10)
+
+        assert page == ["campaign:plots:0", "campaign:plots:3", "campaign:plots:6"]
+        assert fake.scan_calls == 3
+        assert cursor != "0"
+
+    async def test_invalid_cursor(self):
+        """Cursors that were not handed out are rejected."""
+        redis_client = connected(FakeScanRedis([]))
+
+        with pytest.raises(CacheKeyError):
+            await redis_client.scan_page("*", "not-a-cursor")
+
+    async def test_cluster_cursor_walks_every_primary(self):
+        """In cluster mode the cursor moves on to the next primary."""
+        redis_client = connected(FakeClusterRedis({
+            "node-a": ["a1", "a2", "a3"],
+            "node-b": ["b1", "b2"],
+        }), cluster=True)
+
+        pages, cursor = [], "0"
+        while True:
+            cursor, page = await redis_client.scan_page("*", cursor, count=2, max_calls=1)
+            pages.append((cursor, page))
+            if cursor == "0":
+                break
+
+        assert pages == [("0:2", ["a1", "a2"]), ("1:0", ["a3"]), ("0", ["b1", "b2"])]
+
+
+@pytest.mark.unit
+class TestBulkOperations:
+    """Test streaming and chunked bulk operations."""
+
+    async def test_iter_items_streams_chunks(self):
+        """Entries are yielded a chunk at a time, skipping expired keys."""
+        keys = [f"character:sheets:{i}" for i in range(7)]
+        fake = FakeScanRedis(keys)
+        redis_client = connected(fake)
+        for key in keys[:-1]:
+            fake.store[key] = redis_client._serialize_value({"key": key}, key)
+
+        chunks = [chunk async for chunk in redis_client.iter_items("*", batch_size=3)]
+
+        assert [len(chunk) for chunk in chunks] == [3, 3]
+        assert chunks[1]["character:sheets:5"] == {"key": "character:sheets:5"}
+
+    async def test_get_many_pipelines_per_chunk(self):
+        """Bulk gets are split into one pipeline per chunk."""
+        keys = [f"character:sheets:{i}" for i in range(5)]
+        fake = FakeScanRedis(keys)
+        redis_client = connected(fake)
+        fake.store[keys[0]] = redis_client._serialize_value("value", keys[0])
+
+        with patch("cache_service.services.redis_client.settings.BULK_CHUNK_SIZE", 2):
+            result = await redis_client.get_many(keys)
+
+        assert fake.pipelines == 3
+        assert list(result) == keys
+        assert result[keys[0]] == "value"
+
+    async def test_delete_matching_unlinks_per_chunk(self):
+        """Pattern deletes unlink what each SCAN step found."""
+        keys = [f"character:sheets:{i}" for i in range(5)]
+        fake = FakeScanRedis(keys, page_size=2)
+        fake.store = {key: b"x" for key in keys}
+        redis_client = connected(fake)
+
+        deleted = await redis_client.delete_matching("character:*", batch_size=2)
+
+        assert deleted == 5
+        assert fake.store == {}
@@ -112,7 +112,12 @@ class TestCacheOperations:
         keys = [generate_test_key("test") for _ in range(3)]
         values = [{"value": f"test{i}"} for i in range(3)]
         
-        mock_redis_client.keys = AsyncMock(return_value=keys)
+        async def scan_iter(match=None, count=None):
+            for key in keys:
+                yield key
+
+        mock_redis_client.scan_iter = scan_iter
+        mock_redis_client.keys = AsyncMock()
         mock_redis_client.mget = AsyncMock(
             return_value=[json.dumps(v) for v in values]
         )
@@ -122,7 +127,7 @@ class TestCacheOperations:
 
         # Assert
         assert len(result) == 3
-        mock_redis_client.keys.assert_awaited_once_with(pattern)
+        mock_redis_client.keys.assert_not_awaited()
         mock_redis_client.mget.assert_awaited_once_with(keys)
         
         for key, value in zip(keys, values):
@@ -138,7 +143,13 @@ class TestCacheOperations:
         # Arrange
         pattern = "test:*"
         keys = [generate_test_key("test") for _ in range(3)]
-        mock_redis_client.keys = AsyncMock(return_value=keys)
+
+        async def scan_iter(match=None, count=None):
+            for key in keys:
+                yield key
+
+        mock_redis_client.scan_iter = scan_iter
+        mock_redis_client.keys = AsyncMock()
         mock_redis_client.delete = AsyncMock(return_value=len(keys))
 
         # Act
@@ -146,7 +157,7 @@ class TestCacheOperations:
 
         # Assert
         assert count == len(keys)
-        mock_redis_client.keys.assert_awaited_once_with(pattern)
+        mock_redis_client.keys.assert_not_awaited()
         mock_redis_client.delete.assert_awaited_once_with(*keys)
         mock_message_hub_client.publish_event.assert_awaited_once()
 
@@ -0,0 +1,155 @@
+"""Unit tests for cluster-aware batching and hash-tag key helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from cache_service.services.keys import (
+    character_key,
+    hash_tag,
+    key_hash_tag,
+    key_slot,
+    make_key,
+)
+from cache_service.services.redis_client import RedisClient
+
+
+class FakeCluster:
+    """Cluster of two primaries splitting the slots in half.
+
+    Every pipeline records the nodes its keys belong to, so tests can check
+    no pipeline spans nodes.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.nodes = [SimpleNamespace(name="node-a"), SimpleNamespace(name="node-b")]
+        self.nodes_manager = MagicMock()
+        self.nodes_manager.get_node_from_slot.side_effect = (
+            lambda slot: self.nodes[0] if slot < 8192 else self.nodes[1]
+        )
+        self.pipelines = []
+
+    def keyslot(self, key):
+        return key_slot(key)
+
+    def node_of(self, key):
+        return self.nodes_manager.get_node_from_slot(self.keyslot(key)).name
+
+    def pipeline(self, transaction=None):
+        commands = []
+        self.pipelines.append(commands)
+        cluster = self
+
+        class Pipeline:
+            def get(self, key):
+                commands.append(("get", (key,)))
+
+            def set(self, key, value):
+                commands.append(("set", (key, value)))
+
+            def setex(self, key, ttl, value):
+                commands.append(("set", (key, value)))
+
+            def unlink(self, *keys):
+                commands.append(("unlink", keys))
+
+            async def execute(self):
+                results = []
+                for name, args in commands:
+                    if name == "get":
+                        results.append(cluster.store.get(args[0]))
+                    elif name == "set":
+                        cluster.store[args[0]] = args[1]
+                        results.append(True)
+                    else:
+                        results.append(sum(cluster.store.pop(k, None) is not None for k in args))
+                return results
+
+        return Pipeline()
+
+
+@pytest.fixture
+def cluster():
+    """Fake two-node cluster."""
+    return FakeCluster()
+
+
+@pytest.fixture
+def redis_client(cluster):
+    """Redis client in cluster mode."""
+    client = RedisClient()
+    client.is_connected = True
+    client.cluster_client = cluster
+    return client
+
+
+def spread_keys(count):
+    """Keys landing on both nodes of the fake cluster."""
+    return [f"catalog:items:{i}" for i in range(count)]
+
+
+@pytest.mark.unit
+class TestClusterBatching:
+    """Test slot-grouped, per-node pipelining."""
+
+    async def test_set_and_get_many_pipeline_per_node(self, redis_client, cluster):
+        """Each pipeline only holds one node's keys and results keep request order."""
+        keys = spread_keys(20)
+        assert len({cluster.node_of(key) for key in keys}) == 2
+
+        assert await redis_client.set_many({key: i for i, key in enumerate(keys)}) == 20
+        result = await redis_client.get_many(list(reversed(keys)))
+
+        assert list(result) == list(reversed(keys))
+        assert result[keys[3]] == 3
+        for commands in cluster.pipelines:
+            assert len({cluster.node_of(args[0]) for _, args in commands}) == 1
+
+    async def test_delete_many_groups_keys_by_slot(self, redis_client, cluster):
+        """Multi-key UNLINKs only ever hold keys of one slot."""
+        keys = [character_key("sheets", "42"), character_key("inventory", "42")]
+        keys += spread_keys(10)
+        await redis_client.set_many({key: "value" for key in keys})
+
+        assert await redis_client.delete_many(keys) == len(keys)
+        unlinks = [args for commands in cluster.pipelines
+                   for name, args in commands if name == "unlink"]
+        assert all(len({key_slot(key) for key in args}) == 1 for args in unlinks)
+        assert (keys[0], keys[1]) in unlinks
+        assert cluster.store == {}
+
+
+@pytest.mark.unit
+class TestKeyHelpers:
+    """Test hash-tag key construction."""
+
+    def test_character_keys_share_a_slot(self):
+        """All keys of a character land in the same slot."""
+        keys = [
+            character_key("characters", "42"),
+            character_key("sheets", "42", "abilities"),
+            character_key("inventory", "42", "weapons"),
+            character_key("journal", "42", "2024"),
+        ]
+
+        assert keys[1] == "character:sheets:{42}:abilities"
+        assert len({key_slot(key) for key in keys}) == 1
+        assert key_hash_tag(keys[0]) == "42"
+
+    def test_make_key_with_separate_group(self):
+        """A group other than the identifier is inserted as the hash tag."""
+        key = make_key("campaign", "npcs", "npc-7", group="campaign-1")
+
+        assert key == "campaign:npcs:{campaign-1}:npc-7"
+        assert key_slot(key) == key_slot("{campaign-1}")
+
+    def test_keys_without_tag_hash_whole_key(self):
+        """Keys without a usable tag have none."""
+        assert key_hash_tag("character:sheets:42") is None
+        assert key_hash_tag("character:sheets:{}:42") is None
+
+    def test_invalid_tag_value(self):
+        """Braces inside a tag value would end the tag early."""
+        with pytest.raises(ValueError):
+            hash_tag("a}b")
@@ -0,0 +1,185 @@
+"""Unit tests for the cache value codec."""
+
+import json
+import pickle
+import zlib
+from datetime import datetime
+
+import pytest
+from cache_service.core.exceptions import CacheSerializationError
+from cache_service.services.codec import (
+    HEADER,
+    MAGIC,
+    Codec,
+    Compressor,
+    Encoder,
+    UnknownDictionaryError,
+    namespace_of,
+)
+
+CHARACTER = {
+    "name": "Thorin",
+    "class": "fighter",
+    "level": 5,
+    "abilities": {"str": 16, "dex": 12, "con": 15, "int": 8, "wis": 10, "cha": 13},
+    "inventory": [{"item": "longsword", "qty": 1}, {"item": "rations", "qty": 10}] * 20,
+}
+
+
+def sheet(i):
+    """Small character sheet sharing its structure with every other sheet."""
+    return {
+        "id": f"character-{i}",
+        "name": f"Adventurer {i}",
+        "class": ["fighter", "wizard", "rogue", "cleric"][i % 4],
+        "level": i % 20 + 1,
+        "abilities": {"str": 10 + i % 8, "dex": 12, "con": 14, "int": 8, "wis": 13, "cha": 11},
+        "proficiencies": ["athletics", "perception", "stealth"],
+    }
+
+
+@pytest.mark.unit
+class TestCodec:
+    """Test encoding, compression and decoding of cache values."""
+
+    @pytest.mark.parametrize("encoder", ["msgpack", "orjson", "json"])
+    @pytest.mark.parametrize("compressor", ["zstd", "lz4", "zlib", "none"])
+    def test_round_trip(self, encoder, compressor):
+        """Every encoder and compressor pair decodes what it encodes."""
+        codec = Codec(encoder=encoder, compressor=compressor, compression_threshold=64, write_format="v1")
+
+        data = codec.encode(CHARACTER)
+
+        assert data[0] == MAGIC
+        _, _, formats = HEADER.unpack_from(data)
+        assert Encoder(formats >> 4).name.lower() == encoder
+        if compressor != "none":
+            assert Compressor(formats & 0x0F).name.lower() == compressor
+        assert codec.decode(data) == CHARACTER
+
+    def test_small_values_are_not_compressed(self):
+        """Payloads under the threshold are stored as is."""
+        codec = Codec(compression_threshold=1024, write_format="v1")
+
+        data = codec.encode({"hp": 12})
+
+        assert HEADER.unpack_from(data)[2] & 0x0F == Compressor.NONE
+        assert codec.decode(data) == {"hp": 12}
+
+    def test_other_codec_settings_still_decode(self):
+        """Switching encoder or compressor keeps existing entries readable."""
+        data = Codec(
+            encoder="orjson", compressor="lz4", compression_threshold=64, write_format="v1"
+        ).encode(CHARACTER)
+
+        assert Codec(encoder="msgpack", compressor="zstd").decode(data) == CHARACTER
+
+    @pytest.mark.parametrize("data", [
+        b"J" + json.dumps(CHARACTER).encode("utf-8"),
+        b"Z" + zlib.compress(json.dumps(CHARACTER).encode("utf-8")),
+    ])
+    def test_legacy_json_entries_decode(self, data):
+        """Entries written before the header existed still decode."""
+        assert Codec().decode(data) == CHARACTER
+
+    def test_legacy_raw_string_decodes(self):
+        """Raw strings written by other clients are returned as text."""
+        assert Codec().decode(b"hello") == "hello"
+
+    def test_legacy_write_format_is_default(self):
+        """Until the write format is switched, values use the one-byte prefix."""
+        codec = Codec(compression_threshold=64)
+
+        small, large = codec.encode({"hp": 12}), codec.encode(CHARACTER)
+
+        assert small == b'J{"hp":12}'
+        assert large[:1] == b"Z"
+        assert Codec(write_format="v1").decode(large) == CHARACTER
+        assert codec.decode(Codec(write_format="v1").encode(CHARACTER)) == CHARACTER
+
+    def test_legacy_write_format_pickles_when_enabled(self):
+        """The legacy writer falls back to the prefixed pickle format."""
+        value = {"created": datetime(2024, 1, 1)}
+
+        data = Codec(allow_pickle=True).encode(value)
+
+        assert data[:1] == b"P"
+        assert Codec(allow_pickle=True).decode(data) == value
+
+    def test_unknown_write_format(self):
+        """Misconfigured write formats fail at startup."""
+        with pytest.raises(ValueError):
+            Codec(write_format="v2")
+
+    def test_pickle_refused_by_default(self):
+        """Values the encoder cannot handle are rejected rather than pickled."""
+        codec = Codec()
+
+        with pytest.raises(CacheSerializationError):
+            codec.encode({"created": datetime(2024, 1, 1)})
+        with pytest.raises(CacheSerializationError):
+            codec.decode(b"P" + pickle.dumps(CHARACTER))
+
+    def test_pickle_allowed_when_enabled(self):
+        """With pickle opted in, unsupported values round-trip through it."""
+        codec = Codec(allow_pickle=True, write_format="v1")
+        value = {"created": datetime(2024, 1, 1)}
+
+        data = codec.encode(value)
+
+        assert HEADER.unpack_from(data)[2] >> 4 == Encoder.PICKLE
+        assert codec.decode(data) == value
+        assert codec.decode(b"P" + pickle.dumps(value)) == value
+
+
+@pytest.mark.unit
+class TestCodecDictionaries:
+    """Test per-namespace dictionary compression."""
+
+    @pytest.fixture
+    def dictionary(self):
+        """Dictionary trained on character sheets."""
+        codec = Codec()
+        return codec.train_dictionary(
+            [codec.encode_payload(sheet(i)) for i in range(500)], size=4096
+        )
+
+    def test_namespace_of(self):
+        """Namespaces are the service and keyspace of a key."""
+        assert namespace_of("character:sheets:123:abilities") == "character:sheets"
+
+    def test_dictionary_compresses_small_values(self, dictionary):
+        """Small values of a namespace with a dictionary shrink and round-trip."""
+        codec = Codec(compression_threshold=1024, write_format="v1")
+        dictionary_id = codec.add_dictionary("character:sheets", dictionary)
+        value = sheet(1000)
+
+        plain = codec.encode(value)
+        compressed = codec.encode(value, "character:sheets")
+
+        assert HEADER.unpack_from(compressed)[2] & 0x0F == Compressor.ZSTD_DICTIONARY
+        assert len(compressed) < len(plain)
+        assert codec.decode(compressed) == value
+        assert codec.get_stats()["dictionaries"] == {"character:sheets": dictionary_id}
+
+    def test_other_namespaces_do_not_use_dictionary(self, dictionary):
+        """Only the namespace the dictionary was trained for uses it."""
+        codec = Codec(compression_threshold=1024, write_format="v1")
+        codec.add_dictionary("character:sheets", dictionary)
+
+        data = codec.encode(sheet(1), "campaign:npcs")
+
+        assert HEADER.unpack_from(data)[2] & 0x0F == Compressor.NONE
+
+    def test_unknown_dictionary(self, dictionary):
+        """Values compressed with a dictionary this codec lacks raise until it is loaded."""
+        writer = Codec(write_format="v1")
+        writer.add_dictionary("character:sheets", dictionary)
+        data = writer.encode(sheet(1), "character:sheets")
+        reader = Codec()
+
+        with pytest.raises(UnknownDictionaryError):
+            reader.decode(data)
+
+        reader.add_decoding_dictionary(dictionary)
+        assert reader.decode(data) == sheet(1)
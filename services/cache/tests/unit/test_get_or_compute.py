@@ -0,0 +1,125 @@
+"""Unit tests for request coalescing in CacheManager.get_or_compute."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cache_service.services.cache_manager import CacheManager
+from cache_service.services.coalescing import make_record, should_refresh_early
+
+
+class CountingLoader:
+    """Loader that records how often it runs."""
+
+    def __init__(self, value="computed", delay=0.05):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+@pytest.mark.unit
+class TestGetOrCompute:
+    """Test single-flight loading and stale-while-revalidate."""
+
+    @pytest.fixture
+    def store(self):
+        """Backing store standing in for both cache tiers."""
+        return {}
+
+    @pytest.fixture
+    def manager(self, store):
+        """Cache manager whose get/set and lock calls hit the in-memory store."""
+        manager = CacheManager()
+
+        async def get(key, service=None, use_local=True):
+            return store.get(key)
+
+        async def set(key, value, ttl=None, service=None, update_local=True, tags=None):
+            store[key] = value
+            return True
+
+        manager.get = get
+        manager.set = AsyncMock(side_effect=set)
+        manager.redis_client.acquire_lock = AsyncMock(return_value="token")
+        manager.redis_client.release_lock = AsyncMock(return_value=True)
+        return manager
+
+    async def test_concurrent_misses_share_one_load(self, manager):
+        """Callers missing at the same time wait on a single loader call."""
+        loader = CountingLoader()
+
+        results = await asyncio.gather(*(
+            manager.get_or_compute("catalog:spells:fireball", loader, ttl=60)
+            for _ in range(20)
+        ))
+
+        assert results == ["computed"] * 20
+        assert loader.calls == 1
+        assert manager.set.await_count == 1
+        manager.redis_client.release_lock.assert_awaited_once()
+
+    async def test_stale_value_served_while_refreshing(self, manager, store):
+        """A stale value is returned immediately and refreshed once in the background."""
+        store["llm:prompts:intro"] = make_record("old", ttl=-1, compute_time=0.01)
+        loader = CountingLoader(value="new")
+
+        first = await manager.get_or_compute("llm:prompts:intro", loader, ttl=60)
+        second = await manager.get_or_compute("llm:prompts:intro", loader, ttl=60)
+        await asyncio.gather(*manager._refresh_tasks)
+
+        assert (first, second) == ("old", "old")
+        assert loader.calls == 1
+        assert await manager.get_or_compute("llm:prompts:intro", loader, ttl=60) == "new"
+        assert manager.compute_stats["stale_served"] == 2
+
+    async def test_miss_waits_for_replica_holding_lock(self, manager, store):
+        """When another replica holds the lock, its result is used instead of loading."""
+        manager.redis_client.acquire_lock.return_value = None
+        loader = CountingLoader()
+
+        async def peer_finishes():
+            await asyncio.sleep(0.1)
+            store["catalog:spells:fireball"] = make_record("from peer", ttl=60, compute_time=0.1)
+
+        peer = asyncio.create_task(peer_finishes())
+        value = await manager.get_or_compute("catalog:spells:fireball", loader, ttl=60)
+        await peer
+
+        assert value == "from peer"
+        assert loader.calls == 0
+
+    async def test_loader_error_reaches_every_waiter(self, manager):
+        """A failed load raises to all coalesced callers and is not cached."""
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            *(manager.get_or_compute("catalog:items:1", loader) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        manager.set.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestEarlyRefresh:
+    """Test the probabilistic early refresh schedule."""
+
+    def test_disabled_with_zero_beta(self):
+        """Beta 0 never refreshes early."""
+        assert not should_refresh_early(time.time() + 0.001, 10.0, beta=0)
+
+    def test_refreshes_close_to_expiry(self):
+        """Slow-to-compute values close to expiry are refreshed early."""
+        now = time.time()
+        with patch("cache_service.services.coalescing.random.random", return_value=0.5):
+            assert should_refresh_early(now + 1, compute_time=5.0, beta=1.0, now=now)
+            assert not should_refresh_early(now + 600, compute_time=5.0, beta=1.0, now=now)
@@ -0,0 +1,145 @@
+"""Unit tests for hot key detection and local promotion."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from cache_service.services.cache_manager import CacheManager
+from cache_service.services.hot_keys import CountMinSketch, HotKeyTracker
+from cache_service.services.local_cache import LocalCache
+
+
+@pytest.mark.unit
+class TestCountMinSketch:
+    """Test frequency estimation."""
+
+    def test_estimates_never_undercount(self):
+        """Every key's estimate is at least its true count."""
+        sketch = CountMinSketch(width=256, depth=4)
+        counts = {f"catalog:spells:{i}": i % 7 + 1 for i in range(500)}
+        for key, count in counts.items():
+            for _ in range(count):
+                sketch.add(key)
+
+        assert all(sketch.estimate(key) >= count for key, count in counts.items())
+
+    def test_heavy_hitter_stands_out(self):
+        """A key read far more often than the rest is estimated closely."""
+        sketch = CountMinSketch(width=1024, depth=4)
+        for i in range(2000):
+            sketch.add(f"catalog:spells:{i}")
+        for _ in range(1000):
+            sketch.add("auth:sessions:current")
+
+        assert 1000 <= sketch.estimate("auth:sessions:current") < 1050
+
+    def test_decay_halves_counts(self):
+        """Decay halves every estimate."""
+        sketch = CountMinSketch(width=64, depth=2)
+        for _ in range(10):
+            sketch.add("catalog:spells:fireball")
+
+        sketch.decay()
+
+        assert sketch.estimate("catalog:spells:fireball") == 5
+
+
+@pytest.mark.unit
+class TestHotKeyTracker:
+    """Test hot key thresholds and per-service top keys."""
+
+    def test_key_becomes_hot_at_threshold(self):
+        """record reports a key as hot once it reaches the threshold."""
+        tracker = HotKeyTracker(width=256, depth=4, threshold=3, decay_interval=60)
+
+        assert [tracker.record("catalog:spells:fireball") for _ in range(4)] == [
+            False, False, True, True
+        ]
+        assert tracker.is_hot("catalog:spells:fireball")
+
+    def test_top_keys_per_service(self):
+        """The most read keys are reported per service, most read first."""
+        tracker = HotKeyTracker(width=1024, depth=4, top_k=2, threshold=50, decay_interval=60)
+        for key, reads in [
+            ("catalog:spells:fireball", 30),
+            ("catalog:spells:shield", 20),
+            ("catalog:spells:light", 5),
+            ("auth:sessions:abc", 60),
+        ]:
+            for _ in range(reads):
+                tracker.record(key)
+
+        top = tracker.top()
+
+        assert [entry["key"] for entry in top["catalog"]] == [
+            "catalog:spells:fireball", "catalog:spells:shield"
+        ]
+        assert top["auth"] == [{"key": "auth:sessions:abc", "count": 60, "hot": True}]
+        assert list(tracker.top("auth", limit=1)) == ["auth"]
+
+    def test_decay_cools_keys(self):
+        """Keys stop being hot once their reads age out."""
+        tracker = HotKeyTracker(width=256, depth=4, threshold=4, decay_interval=60)
+        for _ in range(4):
+            tracker.record("catalog:spells:fireball")
+
+        tracker.decay()
+
+        assert not tracker.is_hot("catalog:spells:fireball")
+        assert tracker.top()["catalog"][0]["count"] == 2
+
+
+@pytest.mark.unit
+class TestLocalPromotion:
+    """Test the promoted local cache segment."""
+
+    def test_promoted_entry_outlives_regular_ttl(self):
+        """Promoted entries use the longer TTL and survive cold churn."""
+        cache = LocalCache(maxsize=2, ttl=60, hot_maxsize=10, hot_ttl=3600)
+
+        cache.promote("catalog:spells:fireball", "value")
+        for i in range(10):
+            cache.set(f"catalog:spells:{i}", i)
+
+        assert cache.is_promoted("catalog:spells:fireball")
+        assert cache.get("catalog:spells:fireball") == "value"
+        assert cache.get_stats()["promotions"] == 1
+
+    def test_writes_and_invalidations_reach_promoted_entries(self):
+        """Promoted entries are updated and invalidated like any other."""
+        cache = LocalCache(maxsize=10, ttl=60, hot_maxsize=10, hot_ttl=3600)
+        cache.promote("catalog:spells:fireball", "old")
+
+        cache.set("catalog:spells:fireball", "new")
+        assert cache.is_promoted("catalog:spells:fireball")
+        assert cache.get("catalog:spells:fireball") == "new"
+
+        cache.invalidate("catalog:spells:fireball")
+        assert cache.get("catalog:spells:fireball") is None
+
+    def test_stale_fill_is_not_promoted(self):
+        """Promotion honours fill versions like set."""
+        cache = LocalCache(maxsize=10, ttl=60, hot_maxsize=10, hot_ttl=3600)
+        version = cache.fill_version()
+        cache.invalidate("catalog:spells:fireball")
+
+        assert cache.promote("catalog:spells:fireball", "old", version=version) is False
+
+
+@pytest.mark.unit
+class TestCacheManagerHotKeys:
+    """Test promotion driven by reads through the cache manager."""
+
+    async def test_hot_key_is_promoted_on_read(self):
+        """Once a key is hot, reads move it into the promoted segment."""
+        local_cache = LocalCache(maxsize=100, ttl=60, hot_maxsize=10, hot_ttl=3600)
+        manager = CacheManager(local_cache=local_cache)
+        manager.invalidation_bus = None
+        manager.hot_keys = HotKeyTracker(width=256, depth=4, threshold=3, decay_interval=60)
+        manager.redis_client.get = AsyncMock(return_value="spell data")
+
+        for _ in range(3):
+            assert await manager.get("catalog:spells:fireball", use_local=False) == "spell data"
+        assert await manager.get("catalog:spells:fireball") == "spell data"
+
+        assert local_cache.is_promoted("catalog:spells:fireball")
+        assert manager.get_hot_keys("catalog")["catalog"][0]["key"] == "catalog:spells:fireball"
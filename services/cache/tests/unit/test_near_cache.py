@@ -0,0 +1,130 @@
+"""Unit tests for the coherent local cache tier."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cache_service.services.cache_manager import CacheManager
+from cache_service.services.invalidation_bus import InvalidationBus
+from cache_service.services.local_cache import LocalCache
+from cache_service.services.tag_invalidation import TagInvalidator
+
+
+@pytest.mark.unit
+class TestLocalCacheVersions:
+    """Test fill versioning and per-entry expiry."""
+
+    def test_fill_started_before_invalidation_is_rejected(self):
+        """A Redis read that raced with an invalidation must not be cached."""
+        cache = LocalCache(maxsize=10, ttl=60)
+
+        version = cache.fill_version()
+        cache.invalidate("character:sheets:1")
+
+        assert cache.set("character:sheets:1", "old", version=version) is False
+        assert cache.get("character:sheets:1") is None
+        assert cache.get_stats()["rejected_fills"] == 1
+
+    def test_fill_of_untouched_key_is_accepted(self):
+        """Invalidations of other keys do not reject a fill."""
+        cache = LocalCache(maxsize=10, ttl=60)
+
+        version = cache.fill_version()
+        cache.invalidate("character:sheets:2")
+
+        assert cache.set("character:sheets:1", "value", version=version) is True
+        assert cache.get("character:sheets:1") == "value"
+
+    def test_clear_rejects_all_earlier_fills(self):
+        """Fills that started before a clear are rejected."""
+        cache = LocalCache(maxsize=10, ttl=60)
+
+        version = cache.fill_version()
+        cache.clear()
+
+        assert cache.set("character:sheets:1", "value", version=version) is False
+
+    def test_entry_expires_with_its_own_ttl(self):
+        """Entries written with a short TTL expire before the cache-wide TTL."""
+        cache = LocalCache(maxsize=10, ttl=60)
+
+        cache.set("character:sheets:1", "value", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("character:sheets:1") is None
+
+
+@pytest.mark.unit
+class TestInvalidationBus:
+    """Test publishing and applying invalidations."""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Redis client whose pub/sub connection records publishes."""
+        client = MagicMock()
+        client.get_pubsub_client.return_value.publish = AsyncMock(return_value=1)
+        return client
+
+    @pytest.fixture
+    def local_cache(self):
+        """Local cache with one entry."""
+        cache = LocalCache(maxsize=10, ttl=600)
+        cache.set("character:sheets:1", "value")
+        return cache
+
+    async def test_publish_keys(self, redis_client, local_cache):
+        """Published messages carry the keys and the publishing replica."""
+        bus = InvalidationBus(redis_client, local_cache, channel="invalidations")
+
+        await bus.publish_keys(["character:sheets:1"])
+
+        channel, payload = redis_client.get_pubsub_client.return_value.publish.await_args.args
+        assert channel.endswith("invalidations")
+        assert json.loads(payload) == {
+            "op": "keys",
+            "keys": ["character:sheets:1"],
+            "origin": bus.node_id,
+        }
+
+    async def test_publish_failure_does_not_raise(self, redis_client, local_cache):
+        """A failed publish is counted rather than failing the write."""
+        redis_client.get_pubsub_client.return_value.publish.side_effect = ConnectionError()
+        bus = InvalidationBus(redis_client, local_cache)
+
+        await bus.publish_keys(["character:sheets:1"])
+
+        assert bus.stats["publish_errors"] == 1
+
+    def test_remote_key_invalidation_drops_local_entry(self, redis_client, local_cache):
+        """Keys written on another replica are dropped locally."""
+        bus = InvalidationBus(redis_client, local_cache)
+
+        bus.apply({"op": "keys", "keys": ["character:sheets:1"], "origin": "other"})
+
+        assert local_cache.get("character:sheets:1") is None
+
+    def test_own_messages_are_ignored(self, redis_client, local_cache):
+        """A replica does not invalidate the entries it just wrote."""
+        bus = InvalidationBus(redis_client, local_cache)
+
+        bus.apply({"op": "keys", "keys": ["character:sheets:1"], "origin": bus.node_id})
+
+        assert local_cache.get("character:sheets:1") == "value"
+
+    async def test_remote_tag_generations_are_observed(self, redis_client, local_cache):
+        """Announced generations are used without another Redis read."""
+        tags = TagInvalidator(redis_client, local_cache, generation_ttl=60)
+        tags._generations["campaign:1"] = (3, time.monotonic())
+        bus = InvalidationBus(redis_client, local_cache, tags)
+
+        bus.apply({"op": "tags", "generations": {"campaign:1": 4}, "origin": "other"})
+
+        assert await tags.get_generations(["campaign:1"]) == {"campaign:1": 4}
+
+    def test_bus_is_created_for_empty_local_cache(self):
+        """An empty local cache is falsy, but still gets an invalidation bus."""
+        manager = CacheManager(LocalCache())
+
+        assert len(manager.local_cache) == 0
+        assert manager.invalidation_bus is not None
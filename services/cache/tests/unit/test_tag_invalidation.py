@@ -0,0 +1,221 @@
+"""Unit tests for tag and namespace invalidation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from cache_service.api.routes import api_router, get_cache_manager
+from cache_service.services.redis_client import RedisClient
+from cache_service.services.tag_invalidation import TagInvalidator, VALUE_ENVELOPE_KEY
+
+
+class FakePipeline:
+    """Queues commands against a FakeRedis and runs them on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(await getattr(self.redis, name)(*args, **kwargs))
+        self.commands = []
+        return results
+
+
+class FakeRedis:
+    """In-memory subset of the Redis commands used by TagInvalidator."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def spop(self, key, count):
+        members = self.data.get(key, set())
+        return [members.pop() for _ in range(min(count, len(members)))]
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    async def lpop(self, key):
+        values = self.data.get(key)
+        return values.pop(0) if values else None
+
+    async def eval(self, script, numkeys, key, expected):
+        if self.data.get(key) is expected:
+            del self.data[key]
+            return 1
+        return 0
+
+
+@pytest.mark.unit
+class TestTagInvalidator:
+    """Test generation-counter invalidation."""
+
+    @pytest.fixture
+    def redis(self):
+        """In-memory Redis."""
+        return FakeRedis()
+
+    @pytest.fixture
+    def invalidator(self, redis):
+        """Invalidator over the in-memory Redis with generation caching disabled."""
+        redis_client = MagicMock()
+        redis_client.pipeline.side_effect = lambda: redis.pipeline(transaction=False)
+        redis_client.deserialize_value = lambda value: value
+        redis_client.list_push = redis.rpush
+        redis_client.list_pop = redis.lpop
+        redis_client.set_pop = redis.spop
+        return TagInvalidator(
+            redis_client,
+            generation_ttl=0,
+            cleanup_batch_size=2,
+            cleanup_max_batches=1,
+        )
+
+    async def write(self, invalidator, redis, key, value, tags=None):
+        envelope = await invalidator.wrap(key, value, tags)
+        redis.data[key] = envelope
+        await invalidator.track({key: envelope}, ttl=60)
+        return envelope
+
+    async def test_invalidated_tag_hides_entries(self, invalidator, redis):
+        """Entries carrying an invalidated tag become stale; others stay visible."""
+        await self.write(invalidator, redis, "campaign:plots:1", "a", ["campaign:1"])
+        await self.write(invalidator, redis, "campaign:plots:2", "b", ["campaign:2"])
+
+        await invalidator.invalidate(["campaign:1"])
+
+        current = await invalidator.resolve_many({
+            key: redis.data[key] for key in ("campaign:plots:1", "campaign:plots:2")
+        })
+        assert current == {"campaign:plots:2": "b"}
+        assert invalidator.stats["stale_reads"] == 1
+
+    async def test_namespace_tag_covers_every_key_of_a_service(self, invalidator, redis):
+        """Invalidating a namespace hides all of its keys without touching other services."""
+        await self.write(invalidator, redis, "character:sheets:1", {"hp": 10})
+        await self.write(invalidator, redis, "character:journal:1", ["entry"])
+        await self.write(invalidator, redis, "catalog:spells:1", "fireball")
+
+        await invalidator.invalidate(["ns:character"])
+
+        current = await invalidator.resolve_many({
+            key: value for key, value in redis.data.items() if ":" in key and "tag:" not in key
+        })
+        assert current == {"catalog:spells:1": "fireball"}
+
+    async def test_rewritten_entry_is_current(self, invalidator, redis):
+        """Entries written after an invalidation use the new generation."""
+        await self.write(invalidator, redis, "campaign:plots:1", "old", ["campaign:1"])
+        await invalidator.invalidate(["campaign:1"])
+        envelope = await self.write(invalidator, redis, "campaign:plots:1", "new", ["campaign:1"])
+
+        assert await invalidator.resolve("campaign:plots:1", envelope) == "new"
+
+    async def test_sweep_reclaims_stale_entries_incrementally(self, invalidator, redis):
+        """The sweep deletes stale keys a batch at a time and spares rewritten ones."""
+        for i in range(3):
+            await self.write(invalidator, redis, f"campaign:plots:{i}", i, ["campaign:1"])
+        await invalidator.invalidate(["campaign:1"])
+        await self.write(invalidator, redis, "campaign:plots:0", "fresh", ["campaign:1"])
+
+        # One batch of two keys per sweep; the set is requeued until drained
+        assert await invalidator.sweep() == 2
+        assert await invalidator.sweep() == 1
+        assert await invalidator.sweep() == 0
+
+        remaining = [key for key in redis.data if key.startswith("campaign:plots:")]
+        assert remaining == ["campaign:plots:0"]
+        assert redis.data["campaign:plots:0"][VALUE_ENVELOPE_KEY] == "fresh"
+        assert invalidator.stats["keys_reclaimed"] == 2
+
+    async def test_sweep_through_redis_client(self, redis):
+        """The invalidator works against RedisClient's public API and codec."""
+        redis_client = RedisClient()
+        redis_client.is_connected = True
+        redis_client.primary_client = redis
+        invalidator = TagInvalidator(redis_client, generation_ttl=0)
+
+        envelope = await invalidator.wrap("campaign:plots:1", "old", ["campaign:1"])
+        redis.data["campaign:plots:1"] = redis_client._serialize_value(envelope, "campaign:plots:1")
+        await invalidator.track({"campaign:plots:1": envelope}, ttl=60)
+        await invalidator.invalidate(["campaign:1"])
+
+        assert await invalidator.sweep() == 1
+        assert "campaign:plots:1" not in redis.data
+        assert invalidator.stats["keys_reclaimed"] == 1
+
+
+@pytest.mark.unit
+class TestInvalidateRoute:
+    """Test the tag invalidation endpoint."""
+
+    @pytest.fixture
+    def cache_manager(self):
+        """Cache manager that reports a generation per tag."""
+        manager = MagicMock()
+        manager.invalidate_tags = AsyncMock(
+            side_effect=lambda tags: {tag: 2 for tag in tags}
+        )
+        return manager
+
+    @pytest.fixture
+    def client(self, cache_manager):
+        """Test client for the cache API."""
+        app = FastAPI()
+        app.include_router(api_router)
+        app.dependency_overrides[get_cache_manager] = lambda: cache_manager
+        return TestClient(app)
+
+    def test_own_namespace_and_plain_tags(self, client, cache_manager):
+        """A service may invalidate its own namespace and shared tags."""
+        response = client.post(
+            "/api/v2/cache/invalidate",
+            json={"tags": ["ns:character", "campaign:1"]},
+            headers={"X-Service-ID": "character"},
+        )
+
+        assert response.status_code == 200
+        cache_manager.invalidate_tags.assert_awaited_once_with(["ns:character", "campaign:1"])
+
+    def test_foreign_namespace_rejected(self, client, cache_manager):
+        """A service may not invalidate another service's namespace."""
+        response = client.post(
+            "/api/v2/cache/invalidate",
+            json={"tags": ["campaign:1", "ns:catalog"]},
+            headers={"X-Service-ID": "character"},
+        )
+
+        assert response.status_code == 403
+        assert "ns:catalog" in response.json()["detail"]
+        cache_manager.invalidate_tags.assert_not_awaited()
@@ -0,0 +1,47 @@
+"""Delta-encoded character versions migration.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 10:12:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store versions as patches between keyframes."""
+    # Existing versions hold their full state and become keyframes
+    op.add_column(
+        "character_versions",
+        sa.Column("patch", postgresql.JSONB, nullable=True),
+    )
+    op.add_column(
+        "character_versions",
+        sa.Column(
+            "keyframe_distance",
+            sa.Integer,
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.alter_column("character_versions", "state", nullable=True)
+
+
+def downgrade() -> None:
+    """Store full states only.
+
+    Delta versions must be materialized before downgrading, as their state
+    cannot be rebuilt in SQL.
+    """
+    op.alter_column("character_versions", "state", nullable=False)
+    op.drop_column("character_versions", "keyframe_distance")
+    op.drop_column("character_versions", "patch")
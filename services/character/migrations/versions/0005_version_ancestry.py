@@ -0,0 +1,80 @@
+"""Version ancestry index migration.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 14:03:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and populate the version ancestry closure table."""
+    op.create_table(
+        "character_version_ancestry",
+        sa.Column(
+            "ancestor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("character_versions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "descendant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("character_versions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "character_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("characters.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("depth", sa.Integer, nullable=False),
+    )
+
+    # Create indices
+    op.create_index(
+        "ix_character_version_ancestry_descendant_id",
+        "character_version_ancestry",
+        ["descendant_id", "depth"],
+    )
+    op.create_index(
+        "ix_character_version_ancestry_character_id",
+        "character_version_ancestry",
+        ["character_id"],
+    )
+
+    # Index existing versions by following their parent links
+    op.execute(
+        """
+        INSERT INTO character_version_ancestry
+            (ancestor_id, descendant_id, character_id, depth)
+        WITH RECURSIVE ancestry AS (
+            SELECT id AS ancestor_id, id AS descendant_id, character_id, 0 AS depth
+            FROM character_versions
+            UNION ALL
+            SELECT v.parent_version_id, a.descendant_id, a.character_id, a.depth + 1
+            FROM ancestry a
+            JOIN character_versions v ON v.id = a.ancestor_id
+            WHERE v.parent_version_id IS NOT NULL
+        )
+        SELECT ancestor_id, descendant_id, character_id, depth FROM ancestry
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove the version ancestry closure table."""
+    op.drop_index("ix_character_version_ancestry_character_id")
+    op.drop_index("ix_character_version_ancestry_descendant_id")
+    op.drop_table("character_version_ancestry")
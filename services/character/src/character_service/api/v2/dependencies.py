@@ -12,7 +12,9 @@ from character_service.domain.event_publisher import EventPublicationManager
 from character_service.domain.progress import ProgressTrackingService
 from character_service.domain.state_publisher import StatePublisher
 from character_service.storage.storage_adapter import StorageAdapter
+from character_service.api.v2 import lifecycle
 from character_service.api.v2.lifecycle import event_publisher
+from character_service.core.validation import ValidationExecutor
 
 
 def get_container() -> Container:
@@ -59,6 +61,13 @@ def get_event_publisher(
     return event_publisher
 
 
+def get_validation_executor() -> ValidationExecutor:
+    """Get the application-wide validation executor."""
+    if lifecycle.validation_executor is None:
+        raise RuntimeError("Validation executor not initialized")
+    return lifecycle.validation_executor
+
+
 def get_progress_service(
     container: Container = Depends(get_container)
 ) -> ProgressTrackingService:
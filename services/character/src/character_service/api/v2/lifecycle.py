@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from character_service.config import get_settings
+from character_service.core.validation import ValidationExecutor
 from character_service.domain.event import EventImpactService
 from character_service.domain.event_publisher import EventPublicationManager, PublicationConfig
 from character_service.domain.progress import ProgressTrackingService
@@ -16,6 +17,7 @@ from character_service.infrastructure.messaging.hub_client import MessageHubClie
 settings = get_settings()
 event_publisher: EventPublicationManager | None = None
 subscription_manager: SubscriptionManager | None = None
+validation_executor: ValidationExecutor | None = None
 
 
 @asynccontextmanager
@@ -58,9 +60,14 @@ async def lifespan(app: FastAPI):
     )
     await subscription_manager.start()
 
+    # Share one validation worker pool across requests
+    global validation_executor
+    validation_executor = ValidationExecutor()
+
     yield
 
     # Cleanup
+    validation_executor.shutdown()
     await event_publisher.stop()
     # No explicit stop needed for subscription manager currently
     await hub_client.disconnect()
@@ -64,7 +64,7 @@ class BulkValidateRequest(BaseModel):
     characters: List[Dict[str, Any]] = Field(
         ...,
         min_items=1,
-        max_items=100,
+        max_items=500,
         description="List of character data to validate",
     )
     campaign_id: Optional[UUID] = Field(
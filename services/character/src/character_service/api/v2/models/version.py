@@ -42,6 +42,17 @@ class VersionCompareResponse(BaseModel):
     diff: Dict[str, Any]
     changes: Dict[str, List[Dict[str, Any]]]
     metadata: Dict[str, Optional[Dict[str, Any]]]
+    common_ancestor_id: Optional[UUID] = None
+
+
+class CommonAncestorResponse(BaseModel):
+    """Response model for the common ancestor of two versions."""
+
+    version_a: UUID
+    version_b: UUID
+    ancestor_id: UUID
+    distance_a: int
+    distance_b: int
 
 
 class VersionTreeNode(BaseModel):
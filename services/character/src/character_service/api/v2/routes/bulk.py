@@ -11,10 +11,12 @@ from fastapi import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from character_service.core.validation import ValidationExecutor
 from character_service.services.bulk_operations import BulkOperationService
 from character_service.api.v2.dependencies import (
     get_db,
     get_current_user,
+    get_validation_executor,
 )
 from character_service.api.v2.models.bulk import (
     BulkCharacterCreate,
@@ -39,6 +41,7 @@ router = APIRouter(prefix="/api/v2/characters/bulk", tags=["bulk"])
 async def create_characters(
     request: BulkCharacterCreate,
     db: AsyncSession = Depends(get_db),
+    validation_executor: ValidationExecutor = Depends(get_validation_executor),
     current_user: str = Depends(get_current_user),
 ) -> BulkOperationResult:
     """Create multiple characters in bulk.
@@ -46,12 +49,13 @@ async def create_characters(
     Args:
         request: Bulk creation request
         db: Database session
+        validation_executor: Application-wide validation executor
         current_user: Current user ID
 
     Returns:
         Operation result details
     """
-    service = BulkOperationService(db)
+    service = BulkOperationService(db, validation_executor)
 
     # Start bulk creation
     batch_id, initial_status = await service.create_characters(
@@ -83,6 +87,7 @@ async def create_characters(
 async def get_operation_status(
     batch_id: UUID,
     db: AsyncSession = Depends(get_db),
+    validation_executor: ValidationExecutor = Depends(get_validation_executor),
     current_user: str = Depends(get_current_user),
 ) -> BulkOperationStatus:
     """Get bulk operation status.
@@ -90,6 +95,7 @@ async def get_operation_status(
     Args:
         batch_id: The batch ID to check
         db: Database session
+        validation_executor: Application-wide validation executor
         current_user: Current user ID
 
     Returns:
@@ -98,7 +104,7 @@ async def get_operation_status(
     Raises:
         HTTPException: If batch not found
     """
-    service = BulkOperationService(db)
+    service = BulkOperationService(db, validation_executor)
     operation_status = await service.get_operation_status(batch_id)
 
     if not operation_status:
@@ -121,6 +127,7 @@ async def get_operation_status(
 async def validate_characters(
     request: BulkValidateRequest = Body(...),
     db: AsyncSession = Depends(get_db),
+    validation_executor: ValidationExecutor = Depends(get_validation_executor),
     current_user: str = Depends(get_current_user),
 ) -> BulkValidationResponse:
     """Validate multiple characters.
@@ -128,12 +135,13 @@ async def validate_characters(
     Args:
         request: Validation request
         db: Database session
+        validation_executor: Application-wide validation executor
         current_user: Current user ID
 
     Returns:
         Validation results
     """
-    service = BulkOperationService(db)
+    service = BulkOperationService(db, validation_executor)
 
     # Run validation
     results = await service.validate_characters(
@@ -26,6 +26,7 @@ from character_service.api.v2.models.version import (
     VersionResponse,
     VersionListResponse,
     VersionCompareResponse,
+    CommonAncestorResponse,
     VersionTreeNode,
     VersionRestoreRequest,
     MilestoneRequest,
@@ -102,21 +103,21 @@ async def get_versions(
 
 
 @router.get(
-    "/{version_id}",
-    response_model=VersionResponse,
-    summary="Get version details",
-    description="Get details for a specific version",
-    response_description="Version details",
+    "/{version_id}/state",
+    response_model=Dict[str, Any],
+    summary="Get version state",
+    description="Get the complete character state at a specific version",
+    response_description="Character state",
     status_code=status.HTTP_200_OK,
 )
-async def get_version(
+async def get_version_state(
     character_id: UUID = Path(..., description="Character ID"),
     version_id: UUID = Path(..., description="Version ID"),
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
     _: None = Depends(require_character_access),
-) -> VersionResponse:
-    """Get version details.
+) -> Dict[str, Any]:
+    """Get character state at a specific version.
 
     Args:
         character_id: Character ID
@@ -126,7 +127,7 @@ async def get_version(
         _: Character access check
 
     Returns:
-        Version details response
+        Complete character state
 
     Raises:
         HTTPException: If version not found
@@ -143,36 +144,25 @@ async def get_version(
             detail="Version not found",
         )
 
-    metadata = await service.repository.get_version_metadata(version.id)
-    return VersionResponse(
-        id=version.id,
-        character_id=version.character_id,
-        parent_version_id=version.parent_version_id,
-        label=version.label,
-        description=version.description,
-        is_active=version.is_active,
-        created_at=version.created_at,
-        created_by=version.created_by,
-        metadata=metadata.metadata if metadata else None,
-    )
+    return await service.get_version_state(version)
 
 
 @router.get(
-    "/{version_id}/state",
-    response_model=Dict[str, Any],
-    summary="Get version state",
-    description="Get the complete character state at a specific version",
-    response_description="Character state",
+    "/{version_id}/branch",
+    response_model=List[VersionTreeNode],
+    summary="Get version branch",
+    description="Get the versions from the root down to a specific version",
+    response_description="Version lineage",
     status_code=status.HTTP_200_OK,
 )
-async def get_version_state(
+async def get_version_branch(
     character_id: UUID = Path(..., description="Character ID"),
     version_id: UUID = Path(..., description="Version ID"),
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
     _: None = Depends(require_character_access),
-) -> Dict[str, Any]:
-    """Get character state at a specific version.
+) -> List[VersionTreeNode]:
+    """Get the lineage of a version.
 
     Args:
         character_id: Character ID
@@ -182,24 +172,24 @@ async def get_version_state(
         _: Character access check
 
     Returns:
-        Complete character state
+        Versions from the root down to the version
 
     Raises:
         HTTPException: If version not found
     """
     service = VersionControlService(db)
-    version = await service.repository.get_version(
+    branch = await service.get_branch(
         version_id=version_id,
         character_id=character_id,
     )
 
-    if not version:
+    if not branch:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Version not found",
         )
 
-    return version.state
+    return branch
 
 
 @router.get(
@@ -247,6 +237,11 @@ async def compare_versions(
             diff=comparison["diff"],
             changes=comparison["changes"],
             metadata=comparison["metadata"],
+            common_ancestor_id=(
+                comparison["common_ancestor"]["ancestor_id"]
+                if comparison["common_ancestor"]
+                else None
+            ),
         )
     except ValueError as e:
         raise HTTPException(
@@ -289,6 +284,58 @@ async def get_version_tree(
     )
 
 
+@router.get(
+    "/common-ancestor",
+    response_model=CommonAncestorResponse,
+    summary="Get common ancestor",
+    description="Get the nearest common ancestor of two versions",
+    response_description="Common ancestor",
+    status_code=status.HTTP_200_OK,
+)
+async def get_common_ancestor(
+    character_id: UUID = Path(..., description="Character ID"),
+    version_a: UUID = Query(..., description="First version ID"),
+    version_b: UUID = Query(..., description="Second version ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user),
+    _: None = Depends(require_character_access),
+) -> CommonAncestorResponse:
+    """Get the common ancestor of two versions.
+
+    Args:
+        character_id: Character ID
+        version_a: First version ID
+        version_b: Second version ID
+        db: Database session
+        current_user: Current user ID
+        _: Character access check
+
+    Returns:
+        Common ancestor response
+
+    Raises:
+        HTTPException: If the versions share no ancestor
+    """
+    service = VersionControlService(db)
+    ancestor = await service.get_common_ancestor(
+        version_a_id=version_a,
+        version_b_id=version_b,
+        character_id=character_id,
+    )
+
+    if not ancestor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No common ancestor found",
+        )
+
+    return CommonAncestorResponse(
+        version_a=version_a,
+        version_b=version_b,
+        **ancestor,
+    )
+
+
 @router.get(
     "/milestones",
     response_model=List[MilestoneResponse],
@@ -331,6 +378,62 @@ async def get_milestones(
     ]
 
 
+@router.get(
+    "/{version_id}",
+    response_model=VersionResponse,
+    summary="Get version details",
+    description="Get details for a specific version",
+    response_description="Version details",
+    status_code=status.HTTP_200_OK,
+)
+async def get_version(
+    character_id: UUID = Path(..., description="Character ID"),
+    version_id: UUID = Path(..., description="Version ID"),
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user),
+    _: None = Depends(require_character_access),
+) -> VersionResponse:
+    """Get version details.
+
+    Args:
+        character_id: Character ID
+        version_id: Version ID
+        db: Database session
+        current_user: Current user ID
+        _: Character access check
+
+    Returns:
+        Version details response
+
+    Raises:
+        HTTPException: If version not found
+    """
+    service = VersionControlService(db)
+    version = await service.repository.get_version(
+        version_id=version_id,
+        character_id=character_id,
+    )
+
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Version not found",
+        )
+
+    metadata = await service.repository.get_version_metadata(version.id)
+    return VersionResponse(
+        id=version.id,
+        character_id=version.character_id,
+        parent_version_id=version.parent_version_id,
+        label=version.label,
+        description=version.description,
+        is_active=version.is_active,
+        created_at=version.created_at,
+        created_by=version.created_by,
+        metadata=metadata.metadata if metadata else None,
+    )
+
+
 @router.post(
     "/{version_id}/restore",
     response_model=VersionResponse,
@@ -378,7 +481,7 @@ async def restore_version(
     # Create new version from source state
     version = await service.create_version(
         character_id=character_id,
-        current_state=source_version.state,
+        current_state=await service.get_version_state(source_version),
         parent_version_id=version_id,
         label=request.label or f"Restored from {version_id}",
         description=request.description,
@@ -161,7 +161,7 @@ async def get_version_state(
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
 
-    return version.state
+    return await service.get_version_state(version)
 
 
 @router.get(
@@ -301,7 +301,7 @@ async def restore_version(
     # Create new version from source state
     version = await service.create_version(
         character_id=character_id,
-        current_state=source_version.state,
+        current_state=await service.get_version_state(source_version),
         parent_version_id=version_id,
         label=request.label or f"Restored from {version_id}",
         description=request.description,
@@ -0,0 +1,125 @@
+"""Request batching for Message Hub clients.
+
+A ``BatchLoader`` collects the requests of one message type issued during
+the same event loop tick and sends them as a single batch request. The
+responses are returned in request order and handed back to each caller.
+Identical requests that are queued or in flight share one result. A request
+the service could not answer comes back as ``{"error": message}`` and fails
+only its own callers.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from character_service.core.exceptions import StorageOperationError
+from character_service.domain.messages import MessagePublisher
+
+# Maximum number of requests sent in one batch message
+MAX_BATCH_SIZE = 100
+
+
+class BatchLoader:
+    """Coalesce single requests into batch requests."""
+
+    def __init__(
+        self,
+        publisher: MessagePublisher,
+        message_type: str,
+        target_service: str = "storage",
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize loader.
+
+        Args:
+            publisher: Message publisher
+            message_type: Type of the batch request message
+            target_service: Service to send batches to
+            max_batch_size: Maximum number of requests per batch
+        """
+        self.publisher = publisher
+        self.message_type = message_type
+        self.target_service = target_service
+        self.max_batch_size = max_batch_size
+        self._queue: Dict[str, Tuple[Dict[str, Any], asyncio.Future]] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+
+    async def load(self, request: Dict[str, Any]) -> Any:
+        """Load the result of one request.
+
+        Args:
+            request: Request data, as sent in a single request message
+
+        Returns:
+            Result for the request
+        """
+        key = json.dumps(request, sort_keys=True, default=str)
+        future = self._in_flight.get(key)
+        if future is None:
+            queued = self._queue.get(key)
+            if queued:
+                future = queued[1]
+            else:
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                self._queue[key] = (request, future)
+                if not self._dispatch_scheduled:
+                    self._dispatch_scheduled = True
+                    loop.call_soon(self._dispatch)
+
+        # Shield the shared future from cancellation of a single caller
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Send all queued requests."""
+        self._dispatch_scheduled = False
+        queued = list(self._queue.items())
+        self._queue.clear()
+
+        for start in range(0, len(queued), self.max_batch_size):
+            batch = queued[start:start + self.max_batch_size]
+            for key, (_, future) in batch:
+                self._in_flight[key] = future
+            asyncio.ensure_future(self._send(batch))
+
+    async def _send(self, batch: List[Tuple[str, Tuple[Dict[str, Any], asyncio.Future]]]) -> None:
+        """Send one batch and resolve its futures.
+
+        Args:
+            batch: Request keys with their requests and futures
+        """
+        event = {
+            "service": "character",
+            "type": self.message_type,
+            "data": {
+                "requests": [request for _, (request, _) in batch]
+            },
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        try:
+            response = await self.publisher.publish_request(self.target_service, event)
+            results: Optional[List[Any]] = response.get("results")
+            if results is None or len(results) != len(batch):
+                raise ValueError(
+                    f"Invalid response to {self.message_type}: "
+                    f"expected {len(batch)} results"
+                )
+        except Exception as e:
+            for key, (_, future) in batch:
+                self._in_flight.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (key, (_, future)), result in zip(batch, results):
+            self._in_flight.pop(key, None)
+            if future.done():
+                continue
+            if isinstance(result, dict) and set(result) == {"error"}:
+                future.set_exception(
+                    StorageOperationError(f"Storage operation failed: {result['error']}")
+                )
+            else:
+                future.set_result(result)
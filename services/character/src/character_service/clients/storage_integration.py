@@ -1,15 +1,30 @@
 """Integration with storage service for character data and asset management."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from character_service.core.config import settings
+from character_service.clients.batching import BatchLoader
 from character_service.domain.messages import MessagePublisher
 
 
+# Batch request message types of the entities read through batch loaders
+BATCH_MESSAGE_TYPES = {
+    "character": "storage.character.batch_get",
+    "character_sheet": "storage.character.sheet.batch_get",
+    "inventory_item": "storage.character.inventory_item.batch_get",
+    "journal_entry": "storage.character.journal_entry.batch_get",
+    "experience_entry": "storage.character.experience_entry.batch_get",
+    "quest": "storage.character.quest.batch_get",
+    "npc_relationship": "storage.character.npc_relationship.batch_get",
+    "campaign_event": "storage.character.campaign_event.batch_get",
+    "event_impact": "storage.character.event_impact.batch_get",
+    "character_progress": "storage.character.character_progress.batch_get",
+}
+
+
 class AssetMetadata(BaseModel):
     """Asset metadata for storage service."""
     content_type: str
@@ -20,23 +35,30 @@ class AssetMetadata(BaseModel):
 
 
 class StorageServiceClient:
-"""Client for interacting with storage service via Message Hub."""
-    
+    """Client for interacting with storage service via Message Hub.
+
+    Single-entity reads go through batch loaders, so reads issued together
+    (e.g. with ``asyncio.gather``) cost one round trip per entity type.
+    """
+
     def __init__(self, message_publisher: MessagePublisher) -> None:
         self.publisher = message_publisher
+        self._loaders = {
+            entity: BatchLoader(message_publisher, message_type)
+            for entity, message_type in BATCH_MESSAGE_TYPES.items()
+        }
 
     async def get_character(self, character_id: UUID) -> Optional[Dict]:
         """Get a character by ID."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_character",
-            "data": {
-                "id": str(character_id)
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("character")
+        return await self._loaders["character"].load({
+            "id": str(character_id)
+        })
+
+    async def get_character_sheet(self, character_id: UUID) -> Optional[Dict]:
+        """Get a character with its inventory, journal and progress."""
+        return await self._loaders["character_sheet"].load({
+            "id": str(character_id)
+        })
 
     async def list_characters(
         self,
@@ -112,17 +134,10 @@ class StorageServiceClient:
         character_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get an inventory item."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_inventory_item",
-            "data": {
-                "id": str(item_id),
-                "character_id": str(character_id) if character_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("item")
+        return await self._loaders["inventory_item"].load({
+            "id": str(item_id),
+            "character_id": str(character_id) if character_id else None
+        })
 
     async def list_inventory_items(
         self,
@@ -198,17 +213,10 @@ class StorageServiceClient:
         character_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get a journal entry."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_journal_entry",
-            "data": {
-                "id": str(entry_id),
-                "character_id": str(character_id) if character_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("entry")
+        return await self._loaders["journal_entry"].load({
+            "id": str(entry_id),
+            "character_id": str(character_id) if character_id else None
+        })
 
     async def list_journal_entries(
         self,
@@ -286,17 +294,10 @@ class StorageServiceClient:
         journal_entry_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get an experience entry."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_experience_entry",
-            "data": {
-                "id": str(entry_id),
-                "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("entry")
+        return await self._loaders["experience_entry"].load({
+            "id": str(entry_id),
+            "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
+        })
 
     async def list_experience_entries(
         self,
@@ -368,17 +369,10 @@ class StorageServiceClient:
         journal_entry_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get a quest."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_quest",
-            "data": {
-                "id": str(quest_id),
-                "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("quest")
+        return await self._loaders["quest"].load({
+            "id": str(quest_id),
+            "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
+        })
 
     async def list_quests(
         self,
@@ -454,17 +448,10 @@ class StorageServiceClient:
         journal_entry_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get an NPC relationship."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_npc_relationship",
-            "data": {
-                "id": str(relationship_id),
-                "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("relationship")
+        return await self._loaders["npc_relationship"].load({
+            "id": str(relationship_id),
+            "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
+        })
 
     async def list_npc_relationships(
         self,
@@ -539,18 +526,11 @@ class StorageServiceClient:
         journal_entry_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get a campaign event."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_campaign_event",
-            "data": {
-                "id": str(event_id),
-                "character_id": str(character_id) if character_id else None,
-                "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("event")
+        return await self._loaders["campaign_event"].load({
+            "id": str(event_id),
+            "character_id": str(character_id) if character_id else None,
+            "journal_entry_id": str(journal_entry_id) if journal_entry_id else None
+        })
 
     async def list_campaign_events(
         self,
@@ -629,18 +609,11 @@ class StorageServiceClient:
         character_id: Optional[UUID] = None
     ) -> Optional[Dict]:
         """Get an event impact."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_event_impact",
-            "data": {
-                "id": str(impact_id),
-                "event_id": str(event_id) if event_id else None,
-                "character_id": str(character_id) if character_id else None
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("impact")
+        return await self._loaders["event_impact"].load({
+            "id": str(impact_id),
+            "event_id": str(event_id) if event_id else None,
+            "character_id": str(character_id) if character_id else None
+        })
 
     async def list_event_impacts(
         self,
@@ -702,16 +675,9 @@ class StorageServiceClient:
         character_id: UUID
     ) -> Optional[Dict]:
         """Get character progress."""
-        event = {
-            "service": "character",
-            "type": "storage.character.get_character_progress",
-            "data": {
-                "character_id": str(character_id)
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        response = await self.publisher.publish_request("storage", event)
-        return response.get("progress")
+        return await self._loaders["character_progress"].load({
+            "character_id": str(character_id)
+        })
 
     async def update_character_progress(
         self,
@@ -1,7 +1,9 @@
 """Character validation package."""
 from character_service.core.validation.base import BaseValidationRule
+from character_service.core.validation.cache import ValidationResultCache
 from character_service.core.validation.chain import ValidationChain
 from character_service.core.validation.engine import DefaultValidationEngine
+from character_service.core.validation.executor import ValidationExecutor
 from character_service.core.validation.interfaces import (
     RuleCategory,
     ValidationEngine,
@@ -18,8 +20,10 @@ __all__ = [
     "RuleCategory",
     "ValidationChain",
     "ValidationEngine",
+    "ValidationExecutor",
     "ValidationIssue",
     "ValidationResult",
+    "ValidationResultCache",
     "ValidationRule",
     "ValidationSeverity",
     "ValidationSummary",
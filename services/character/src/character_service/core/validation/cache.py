@@ -0,0 +1,254 @@
+"""Validation result cache.
+
+Results are addressed by content: the key is a structural digest of the
+character together with the version of the rule set that produced them, so
+identical characters share an entry, any edit misses, and any process
+computes the same key for the same data. Entries live in a size-bounded LRU
+and, optionally, in Redis so replicas share results.
+
+The digest is built from one digest per top-level field. The cache keeps the
+last field digests seen for each character, which gives the engine a real
+field-level diff to decide which rules need to run again.
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from character_service.core.validation.interfaces import (
+    ValidationIssue,
+    ValidationResult,
+    ValidationRule,
+    ValidationSeverity,
+)
+from character_service.domain.models import Character
+
+logger = logging.getLogger(__name__)
+
+FieldDigests = Dict[str, str]
+CachedResults = Dict[str, ValidationResult]
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON has no type for, deterministically."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _digest(payload: bytes) -> str:
+    """Hash bytes into a short hex digest."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def field_digests(character: Character) -> FieldDigests:
+    """Digest every top-level field of a character.
+
+    Args:
+        character: Character to digest
+
+    Returns:
+        Mapping of field name to the digest of its value
+    """
+    fields = dict(character.character_data)
+    # Attributes outside character_data that rules read; the leading colon
+    # keeps them apart from character_data keys of the same name
+    fields[":theme"] = character.theme
+    fields[":campaign_id"] = character.campaign_id
+    return {
+        field: _digest(
+            json.dumps(value, sort_keys=True, separators=(",", ":"), default=_json_default)
+            .encode("utf-8")
+        )
+        for field, value in fields.items()
+    }
+
+
+def structural_digest(digests: FieldDigests) -> str:
+    """Combine field digests into a digest of the whole character."""
+    return _digest(
+        "\n".join(f"{field}={digests[field]}" for field in sorted(digests)).encode("utf-8")
+    )
+
+
+def changed_fields(previous: FieldDigests, current: FieldDigests) -> Set[str]:
+    """Get the fields added, removed or changed between two digest sets."""
+    return {
+        field for field in previous.keys() | current.keys()
+        if previous.get(field) != current.get(field)
+    }
+
+
+def ruleset_version(rules: Iterable[ValidationRule]) -> str:
+    """Digest a rule set, so results are only reused with the same rules."""
+    return _digest(
+        "\n".join(
+            f"{rule.rule_id}:{type(rule).__module__}.{type(rule).__qualname__}:"
+            f"{getattr(rule.category, 'value', rule.category)}:"
+            f"{','.join(sorted(rule.dependencies))}"
+            for rule in sorted(rules, key=lambda r: r.rule_id)
+        ).encode("utf-8")
+    )[:12]
+
+
+def _encode_results(results: CachedResults) -> str:
+    """Serialize results for Redis."""
+    return json.dumps(
+        {rule_id: asdict(result) for rule_id, result in results.items()},
+        default=_json_default,
+    )
+
+
+def _decode_results(payload: str) -> CachedResults:
+    """Deserialize results stored in Redis."""
+    return {
+        rule_id: ValidationResult(
+            rule_id=data["rule_id"],
+            passed=data["passed"],
+            issues=[
+                ValidationIssue(**{**issue, "severity": ValidationSeverity(issue["severity"])})
+                for issue in data["issues"]
+            ],
+            character_id=UUID(data["character_id"]),
+            fix_applied=data["fix_applied"],
+        )
+        for rule_id, data in json.loads(payload).items()
+    }
+
+
+class ValidationResultCache:
+    """Size-bounded, content-addressed cache of validation results."""
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        max_characters: int = 10000,
+        redis: Optional[Redis] = None,
+        ttl: int = 3600,
+        prefix: str = "character:validation:",
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            maxsize: Result sets kept in memory
+            max_characters: Characters whose last field digests are kept
+            redis: Optional Redis client for a shared second tier
+            ttl: Time in seconds results are kept in Redis
+            prefix: Redis key prefix
+        """
+        self._maxsize = maxsize
+        self._max_characters = max_characters
+        self._redis = redis
+        self._ttl = ttl
+        self._prefix = prefix
+        self._results: "OrderedDict[str, CachedResults]" = OrderedDict()
+        self._characters: "OrderedDict[UUID, Tuple[FieldDigests, str]]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    async def get(self, key: str, character_id: UUID) -> Optional[CachedResults]:
+        """Get cached results for a content key.
+
+        Args:
+            key: Content key from make_key
+            character_id: Character the results are for
+
+        Returns:
+            Results by rule ID, bound to the character, or None on a miss
+        """
+        results = self._results.get(key)
+        if results is not None:
+            self._results.move_to_end(key)
+            self.stats["hits"] += 1
+        elif (results := await self._redis_get(key)) is not None:
+            self._store(key, results)
+            self.stats["redis_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            return None
+
+        # Identical characters share entries; results carry the caller's ID
+        return {
+            rule_id: result if result.character_id == character_id
+            else replace(result, character_id=character_id)
+            for rule_id, result in results.items()
+        }
+
+    async def set(self, key: str, results: CachedResults) -> None:
+        """Cache results for a content key.
+
+        Args:
+            key: Content key from make_key
+            results: Results by rule ID
+        """
+        self._store(key, dict(results))
+        if self._redis is not None:
+            try:
+                await self._redis.setex(self._prefix + key, self._ttl, _encode_results(results))
+            except Exception as e:
+                logger.warning("Failed to store validation results in Redis: %s", e)
+
+    def make_key(self, version: str, scope: str, digest: str) -> str:
+        """Build the content key for a character digest.
+
+        Args:
+            version: Rule set version
+            scope: Which rules ran, e.g. the requested categories
+            digest: Structural digest of the character
+        """
+        return f"{version}:{scope}:{digest}"
+
+    def last_seen(self, character_id: UUID) -> Optional[Tuple[FieldDigests, str]]:
+        """Get the field digests and content key of a character's last validation."""
+        entry = self._characters.get(character_id)
+        if entry is not None:
+            self._characters.move_to_end(character_id)
+        return entry
+
+    def remember(self, character_id: UUID, digests: FieldDigests, key: str) -> None:
+        """Record the field digests and content key a character was validated with."""
+        self._characters[character_id] = (digests, key)
+        self._characters.move_to_end(character_id)
+        while len(self._characters) > self._max_characters:
+            self._characters.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries; Redis entries expire on their own."""
+        self._results.clear()
+        self._characters.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {
+            **self.stats,
+            "size": len(self._results),
+            "characters": len(self._characters),
+        }
+
+    def _store(self, key: str, results: CachedResults) -> None:
+        """Store results in the LRU, evicting the least recently used."""
+        self._results[key] = results
+        self._results.move_to_end(key)
+        while len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def _redis_get(self, key: str) -> Optional[CachedResults]:
+        """Get results from Redis, treating any failure as a miss."""
+        if self._redis is None:
+            return None
+        try:
+            payload = await self._redis.get(self._prefix + key)
+            return _decode_results(payload) if payload else None
+        except Exception as e:
+            logger.warning("Failed to read validation results from Redis: %s", e)
+            return None
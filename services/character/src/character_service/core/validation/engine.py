@@ -5,16 +5,68 @@ from collections import defaultdict
 from typing import DefaultDict, Dict, List, Optional, Set
 
 from character_service.core.exceptions import ValidationError
+from character_service.core.validation.cache import (
+    FieldDigests,
+    ValidationResultCache,
+    changed_fields,
+    field_digests,
+    ruleset_version,
+    structural_digest,
+)
 from character_service.core.validation.interfaces import (
     RuleCategory,
     ValidationEngine,
+    ValidationIssue,
     ValidationResult,
     ValidationRule,
+    ValidationSeverity,
 )
 from character_service.domain.models import Character
 
 logger = logging.getLogger(__name__)
 
+# Character fields each rule reads. Rules missing here and without a
+# ``fields`` attribute of their own are re-run on any change.
+RULE_FIELDS: Dict[str, Set[str]] = {
+    "core.ability_scores": {"ability_scores", "ability_score_method"},
+    "core.class_progression": {
+        "character_class", "level", "class_features", "subclass", "epic_boon",
+    },
+    "core.proficiencies": {"skills", "saving_throws", "character_class", "level"},
+    "core.feats": {"feats", "level", "character_class", "background", "ability_scores"},
+    "core.spell_system": {
+        "character_class", "level", "features", "spell_slots", "spells",
+        "prepared_spells", "active_spells", "ability_scores",
+    },
+    "core.multiclass": {"classes", "ability_scores", "features", "spell_slots", "epic_boon"},
+    "core.equipment": {
+        "equipment", "equipment_slots", "armor", "weapons", "proficiencies",
+        "ability_scores", "size", "character_class", "alignment",
+    },
+    "core.languages_tools": {
+        "languages", "tool_proficiencies", "tool_expertise", "character_class",
+        "level", "race", "ability_scores", "features", "culture", "background",
+    },
+    "core.custom_content": {
+        "character_class", "features", "level", "magic_system", "race", "spells",
+    },
+    "theme.compatibility": {
+        ":theme", "theme", "level", "ability_scores", "character_class", "subclass",
+        "alignment", "theme_features",
+    },
+    "theme.transition": {
+        ":theme", "theme", "theme_transition", "level", "milestones", "resources",
+        "features", "relationships",
+    },
+    "campaign.context": {
+        ":campaign_id", "campaign", "level", "character_class", "ability_scores",
+        "theme", "feats", "inventory",
+    },
+    "campaign.antitheticon": {
+        ":campaign_id", "campaign", "identity_network", "plot_impacts", "deceptions",
+    },
+}
+
 
 class DefaultValidationEngine(ValidationEngine):
     """Default implementation of the validation engine.
@@ -26,19 +78,21 @@ class DefaultValidationEngine(ValidationEngine):
     - Dependency-aware batching
     """
 
-    def __init__(self) -> None:
-        """Initialize engine."""
+    def __init__(self, result_cache: Optional[ValidationResultCache] = None) -> None:
+        """Initialize engine.
+
+        Args:
+            result_cache: Optional result cache, e.g. one with a Redis tier
+                shared between replicas
+        """
         self._rules: List[ValidationRule] = []
         self._rule_map: Dict[str, ValidationRule] = {}
         self._rule_deps: DefaultDict[str, Set[str]] = defaultdict(set)
         self._reverse_deps: DefaultDict[str, Set[str]] = defaultdict(set)
         
-        # Cache for validation results
-        self._result_cache: Dict[str, Dict[str, ValidationResult]] = {}
-        self._cache_version = 0  # Increments when rules change
-        
-        # Character state versioning
-        self._char_versions: Dict[str, int] = defaultdict(int)
+        # Cache for validation results, keyed by character content
+        self._result_cache = result_cache or ValidationResultCache()
+        self._ruleset_version = ruleset_version(self._rules)  # Changes with the rules
         
         # Parallel execution settings
         self._max_workers = 4  # Configurable based on system
@@ -72,8 +126,7 @@ class DefaultValidationEngine(ValidationEngine):
             self._reverse_deps[dep_id].add(rule.rule_id)
         
         # Invalidate caches when rules change
-        self._result_cache.clear()
-        self._cache_version += 1
+        self._ruleset_version = ruleset_version(self._rules)
 
     def _get_execution_order(
         self, categories: Optional[List[RuleCategory]] = None
@@ -140,45 +193,48 @@ class DefaultValidationEngine(ValidationEngine):
         Returns:
             List of validation results
         """
+        digests = field_digests(character)
+        scope = ",".join(sorted(c.value for c in categories)) if categories else "all"
+        cache_key = self._result_cache.make_key(
+            self._ruleset_version, scope, structural_digest(digests)
+        )
+
         # Check if we can use cached results
-        char_id = str(character.id)
-        char_version = hash(str(character.character_data))
-        cached_version = self._char_versions.get(char_id)
-
-        if (
-            incremental
-            and char_id in self._result_cache
-            and cached_version == char_version
-        ):
-            # Return cached results for unchanged character
-            return list(self._result_cache[char_id].values())
-
-        # Track fields that have changed since last validation
-        changed_fields = set()
-        if incremental and char_id in self._result_cache:
-            changed_fields = self._get_changed_fields(
-                character.character_data,
-                char_version,
-                cached_version,
-            )
+        if incremental:
+            cached = await self._result_cache.get(cache_key, character.id)
+            if cached is not None:
+                # Return cached results for unchanged character
+                self._result_cache.remember(character.id, digests, cache_key)
+                return list(cached.values())
 
         # Get rules in dependency order
         rules = self._get_execution_order(categories)
 
-        # Filter rules if doing incremental validation
-        if incremental and changed_fields:
-            rules = [r for r in rules if self._rule_needs_rerun(r, changed_fields)]
-
-        # Initialize results with cached values for unchanged rules
-        results = {}
-        if incremental and char_id in self._result_cache:
+        # Initialize results with cached values for rules unaffected by the
+        # fields that changed since the last validation under these rules
+        results: Dict[str, ValidationResult] = {}
+        last_seen = self._result_cache.last_seen(character.id) if incremental else None
+        if last_seen and last_seen[1].startswith(f"{self._ruleset_version}:"):
+            last_digests, last_key = last_seen
+            previous = await self._result_cache.get(last_key, character.id) or {}
+            changed = self._get_changed_fields(digests, last_digests)
+
+            rerun: Set[str] = set()
+            for rule in rules:
+                if (
+                    rule.rule_id not in previous
+                    or self._rule_needs_rerun(rule, changed)
+                    or rerun.intersection(rule.dependencies)
+                ):
+                    rerun.add(rule.rule_id)
             results.update(
                 {
-                    rule_id: result
-                    for rule_id, result in self._result_cache[char_id].items()
-                    if rule_id not in {r.rule_id for r in rules}
+                    rule.rule_id: previous[rule.rule_id]
+                    for rule in rules
+                    if rule.rule_id not in rerun
                 }
             )
+            rules = [r for r in rules if r.rule_id in rerun]
 
         # Execute rules in parallel batches
         rule_batches = self._create_rule_batches(rules)
@@ -194,10 +250,10 @@ class DefaultValidationEngine(ValidationEngine):
         # Auto-fix if requested
         if auto_fix:
             await self._apply_fixes(character, results)
-
-        # Cache results
-        self._result_cache[char_id] = results.copy()
-        self._char_versions[char_id] = char_version
+        else:
+            # Cache results; fixed characters no longer match their digests
+            await self._result_cache.set(cache_key, results)
+            self._result_cache.remember(character.id, digests, cache_key)
 
         return list(results.values())
 
@@ -283,34 +339,17 @@ class DefaultValidationEngine(ValidationEngine):
                 if fix_result := await rule.fix(character):
                     results[rule_id] = fix_result
 
-    def _get_changed_fields(self, current_data: Dict, current_version: int, cached_version: int) -> Set[str]:
+    def _get_changed_fields(self, current: FieldDigests, previous: FieldDigests) -> Set[str]:
         """Identify which fields have changed since last validation.
 
         Args:
-            current_data: Current character data
-            current_version: Current data version
-            cached_version: Previously cached version
+            current: Field digests of the character now
+            previous: Field digests at the last validation
 
         Returns:
-            Set of field paths that have changed
+            Set of top-level fields added, removed or changed
         """
-        if current_version == cached_version:
-            return set()
-
-        changed = set()
-        # Compare main sections
-        for section in [
-            "ability_scores",
-            "class_features",
-            "race_features",
-            "spells",
-            "equipment",
-            "background",
-        ]:
-            if section in current_data:
-                changed.add(section)
-
-        return changed
+        return changed_fields(previous, current)
 
     def _rule_needs_rerun(self, rule: ValidationRule, changed_fields: Set[str]) -> bool:
         """Check if a rule needs to be re-run based on changed fields.
@@ -322,27 +361,22 @@ class DefaultValidationEngine(ValidationEngine):
         Returns:
             Whether the rule should be re-run
         """
-        # For now, be conservative - if any relevant fields changed, re-run
         rule_fields = self._get_rule_affected_fields(rule)
+        if rule_fields is None:
+            # Unknown inputs - be conservative and re-run on any change
+            return bool(changed_fields)
         return bool(rule_fields & changed_fields)
 
-    def _get_rule_affected_fields(self, rule: ValidationRule) -> Set[str]:
+    def _get_rule_affected_fields(self, rule: ValidationRule) -> Optional[Set[str]]:
         """Get the set of fields that a rule validates.
 
         Args:
             rule: The rule to analyze
 
         Returns:
-            Set of field paths that the rule touches
+            Set of top-level fields the rule reads, or None if unknown
         """
-        # This could be enhanced with static analysis of rule implementations
-        # For now, use a basic mapping
-        RULE_FIELDS = {
-            "core.ability_scores": {"ability_scores"},
-            "core.class_progression": {"class_features", "level"},
-            "core.spell_system": {"spells", "class_features"},
-            "core.equipment": {"equipment"},
-            "core.languages_tools": {"languages", "tool_proficiencies"},
-            # Add more mappings as needed
-        }
-        return RULE_FIELDS.get(rule.rule_id, set())
+        fields = getattr(rule, "fields", None)
+        if fields is not None:
+            return set(fields)
+        return RULE_FIELDS.get(rule.rule_id)
@@ -0,0 +1,319 @@
+"""Process pool validation executor.
+
+Validation rules are pure CPU work, so running many characters through them
+on one event loop uses a single core however the rule batches are gathered.
+The executor ships character snapshots to worker processes in chunks; each
+worker builds its rule chain once and runs every character of a chunk through
+it, returning the same ValidationSummary a local chain would. Bulk imports
+and campaign rosters therefore scale with the number of cores.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+from character_service.core.exceptions import ValidationError
+from character_service.core.validation.chain import ValidationChain
+from character_service.core.validation.interfaces import (
+    RuleCategory,
+    ValidationIssue,
+    ValidationResult,
+    ValidationRule,
+    ValidationSeverity,
+    ValidationSummary,
+)
+from character_service.domain.models import Character
+
+logger = logging.getLogger(__name__)
+
+RuleFactory = Callable[[], List[ValidationRule]]
+_ChainKey = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def default_rules() -> List[ValidationRule]:
+    """Create the standard D&D, theme and campaign rule set.
+
+    Must stay importable at module level so worker processes can call it.
+    """
+    from character_service.core.validation.rules.campaign import (
+        AntithenticonRule,
+        CampaignContextRule,
+    )
+    from character_service.core.validation.rules.dnd5e import (
+        AbilityScoreRule,
+        ClassProgressionRule,
+        FeatsRule,
+        ProficiencyRule,
+    )
+    from character_service.core.validation.rules.theme import (
+        ThemeCompatibilityRule,
+        ThemeTransitionRule,
+    )
+
+    return [
+        AbilityScoreRule(),
+        ClassProgressionRule(),
+        FeatsRule(),
+        ProficiencyRule(),
+        ThemeCompatibilityRule(),
+        ThemeTransitionRule(),
+        CampaignContextRule(),
+        AntithenticonRule(),
+    ]
+
+
+def character_snapshot(
+    data: Dict[str, Any],
+    campaign_id: Optional[UUID] = None,
+    user_id: Optional[UUID] = None,
+) -> Character:
+    """Wrap raw character data, e.g. from an import, for validation.
+
+    Args:
+        data: Character data as submitted
+        campaign_id: Campaign the character is validated against
+        user_id: Owner of the character
+
+    Returns:
+        Unsaved character holding the data
+    """
+    return Character(
+        id=data.get("id") or uuid4(),
+        parent_id=None,
+        theme=data.get("theme") or "traditional",
+        name=data.get("name", ""),
+        user_id=user_id or uuid4(),
+        campaign_id=campaign_id or uuid4(),
+        character_data=data,
+    )
+
+
+def select_rules(
+    rules: List[ValidationRule],
+    categories: Optional[Iterable[RuleCategory]] = None,
+    rule_ids: Optional[Iterable[str]] = None,
+) -> List[ValidationRule]:
+    """Pick the rules to run along with every rule they depend on.
+
+    Args:
+        rules: Available rules
+        categories: Only run rules in these categories, or None for all
+        rule_ids: Only run these rules, or None for all
+
+    Returns:
+        Selected rules in their original order
+
+    Raises:
+        ValidationError: If a requested rule or a dependency does not exist
+    """
+    rule_map = {rule.rule_id: rule for rule in rules}
+    wanted = [
+        rule.rule_id for rule in rules
+        if (not categories or rule.category in categories)
+        and (not rule_ids or rule.rule_id in rule_ids)
+    ]
+    if rule_ids and (unknown := set(rule_ids) - set(rule_map)):
+        raise ValidationError(f"Unknown validation rules: {', '.join(sorted(unknown))}")
+
+    selected = set()
+    while wanted:
+        rule_id = wanted.pop()
+        if rule_id in selected:
+            continue
+        if rule_id not in rule_map:
+            raise ValidationError(f"Missing dependency rule {rule_id}")
+        selected.add(rule_id)
+        wanted.extend(rule_map[rule_id].dependencies)
+
+    return [rule for rule in rules if rule.rule_id in selected]
+
+
+def _failed_summary(character: Character, error: Exception) -> ValidationSummary:
+    """Summarize a character whose validation raised."""
+    issue = ValidationIssue(
+        rule_id="executor",
+        severity=ValidationSeverity.ERROR,
+        message=f"Validation failed: {error}",
+        field="",
+        fix_available=False,
+        metadata={"error": str(error)},
+    )
+    return ValidationSummary(
+        character_id=character.id,
+        passed=False,
+        results=[
+            ValidationResult(
+                rule_id="executor",
+                passed=False,
+                issues=[issue],
+                character_id=character.id,
+            )
+        ],
+        error_count=1,
+        warning_count=0,
+        info_count=0,
+        fixes_available=0,
+        fixes_applied=0,
+    )
+
+
+async def _execute_chain(
+    chain: ValidationChain, characters: Sequence[Character]
+) -> List[ValidationSummary]:
+    """Run every character through a chain, one at a time."""
+    summaries = []
+    for character in characters:
+        try:
+            summaries.append(await chain.execute(character))
+        except Exception as e:
+            summaries.append(_failed_summary(character, e))
+    return summaries
+
+
+# Worker process state, set up once per process by _init_worker
+_worker_rules: List[ValidationRule] = []
+_worker_chains: Dict[_ChainKey, ValidationChain] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(rule_factory: RuleFactory) -> None:
+    """Build a worker's rules and event loop."""
+    global _worker_rules, _worker_loop
+    _worker_rules = rule_factory()
+    _worker_chains.clear()
+    _worker_loop = asyncio.new_event_loop()
+
+
+def _validate_chunk(
+    characters: List[Character], key: _ChainKey, auto_fix: bool
+) -> List[ValidationSummary]:
+    """Validate a chunk of characters inside a worker process."""
+    if (chain := _worker_chains.get(key)) is None:
+        categories, rule_ids = key
+        chain = ValidationChain(
+            select_rules(_worker_rules, categories, rule_ids), auto_fix=auto_fix
+        )
+        _worker_chains[key] = chain
+    chain.auto_fix = auto_fix
+    return _worker_loop.run_until_complete(_execute_chain(chain, characters))
+
+
+class ValidationExecutor:
+    """Runs the validation rule chain over many characters in worker processes.
+
+    Batches smaller than one chunk are validated in-process, where starting
+    workers and pickling snapshots would cost more than they save.
+    """
+
+    def __init__(
+        self,
+        rule_factory: RuleFactory = default_rules,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 25,
+    ) -> None:
+        """Initialize executor.
+
+        Args:
+            rule_factory: Module-level function creating the rules to run;
+                called once in every worker process
+            max_workers: Worker processes, defaults to the number of cores
+            chunk_size: Characters shipped to a worker at a time
+        """
+        self._rule_factory = rule_factory
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._local_rules: Optional[List[ValidationRule]] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        if self._pool is None:
+            # Spawned workers do not inherit the parent's event loop or threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._rule_factory,),
+            )
+        return self._pool
+
+    async def validate_many(
+        self,
+        characters: Sequence[Character],
+        categories: Optional[List[RuleCategory]] = None,
+        rule_ids: Optional[List[str]] = None,
+        auto_fix: bool = False,
+    ) -> List[ValidationSummary]:
+        """Validate characters against the full rule chain.
+
+        Args:
+            characters: Characters to validate
+            categories: Optional list of rule categories to run, or None for all
+            rule_ids: Optional list of rules to run, or None for all; their
+                dependencies run as well
+            auto_fix: Whether to attempt automatic fixes for issues
+
+        Returns:
+            One validation summary per character, in the order given.
+            Fixes are applied to the worker's copy of a character only.
+
+        Raises:
+            ValidationError: If the rule selection is invalid or a worker died
+        """
+        key = (
+            tuple(sorted(c.value for c in categories or [])),
+            tuple(sorted(rule_ids or [])),
+        )
+        if len(characters) <= self._chunk_size:
+            return await self._validate_local(characters, key, auto_fix)
+
+        # Fail fast on a bad selection rather than once per worker
+        select_rules(self._get_local_rules(), *key)
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        chunks = [
+            list(characters[i:i + self._chunk_size])
+            for i in range(0, len(characters), self._chunk_size)
+        ]
+        try:
+            chunk_results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(pool, _validate_chunk, chunk, key, auto_fix)
+                    for chunk in chunks
+                ]
+            )
+        except BrokenProcessPool as e:
+            logger.error("Validation worker pool failed: %s", e)
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise ValidationError("Validation worker pool failed") from e
+
+        return [summary for summaries in chunk_results for summary in summaries]
+
+    def _get_local_rules(self) -> List[ValidationRule]:
+        """Create the in-process copy of the rules on first use."""
+        if self._local_rules is None:
+            self._local_rules = self._rule_factory()
+        return self._local_rules
+
+    async def _validate_local(
+        self, characters: Sequence[Character], key: _ChainKey, auto_fix: bool
+    ) -> List[ValidationSummary]:
+        """Validate a small batch on the event loop."""
+        chain = ValidationChain(select_rules(self._get_local_rules(), *key), auto_fix=auto_fix)
+        return await _execute_chain(chain, characters)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Whether to wait for running chunks to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._pool = None
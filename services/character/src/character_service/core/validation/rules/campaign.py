@@ -5,6 +5,7 @@ from character_service.core.exceptions import ValidationError
 from character_service.core.validation import (
     BaseValidationRule,
     RuleCategory,
+    ValidationIssue,
     ValidationResult,
     ValidationSeverity,
 )
@@ -1,13 +1,15 @@
 """D&D 5e (2024) validation rules."""
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from character_service.core.exceptions import ValidationError
 from character_service.core.validation import (
     BaseValidationRule,
     RuleCategory,
+    ValidationIssue,
     ValidationResult,
     ValidationSeverity,
 )
+from character_service.core.validation.rules import dnd5e_data as tables
 from character_service.domain.models import Character
 
 
@@ -33,8 +35,7 @@ class AbilityScoreRule(BaseValidationRule):
         issues = []
 
         # Check all abilities are present
-        required = {"strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"}
-        missing = required - set(scores.keys())
+        missing = set(tables.ABILITIES).difference(scores)
         if missing:
             issues.append(
                 self.create_issue(
@@ -72,8 +73,7 @@ class AbilityScoreRule(BaseValidationRule):
         # Validate generation method
         method = character.character_data.get("ability_score_method")
         if method == "standard_array":
-            standard_array = {16, 14, 13, 12, 11, 10}
-            if set(scores.values()) != standard_array:
+            if set(scores.values()) != tables.STANDARD_ARRAY:
                 issues.append(
                     self.create_issue(
                         severity=ValidationSeverity.ERROR,
@@ -104,16 +104,12 @@ class AbilityScoreRule(BaseValidationRule):
         Returns:
             Whether scores are valid under point buy
         """
-        POINT_COSTS = {
-            8: 0, 9: 1, 10: 2, 11: 3, 12: 4, 13: 5,
-            14: 7, 15: 9, 16: 11
-        }
         total_points = 0
         for score in scores:
-            if score < 8 or score > 16:
+            if (cost := tables.point_buy_cost(score)) is None:
                 return False
-            total_points += POINT_COSTS[score]
-        return total_points == 27
+            total_points += cost
+        return total_points == tables.POINT_BUY_BUDGET
 
 
 class ClassProgressionRule(BaseValidationRule):
@@ -166,7 +162,7 @@ class ClassProgressionRule(BaseValidationRule):
         # Validate class features
         features = data.get("class_features", [])
         expected_features = self._get_expected_features(char_class, level)
-        missing_features = expected_features - set(f["name"] for f in features)
+        missing_features = expected_features.difference(f["name"] for f in features)
         if missing_features:
             issues.append(
                 self.create_issue(
@@ -206,41 +202,9 @@ class ClassProgressionRule(BaseValidationRule):
 
         return self.create_result(character, passed=not issues, issues=issues)
 
-    def _get_expected_features(self, char_class: str, level: int) -> Set[str]:
+    def _get_expected_features(self, char_class: str, level: int) -> FrozenSet[str]:
         """Get expected class features for given class and level."""
-        # This would be expanded with all 2024 class features
-        FEATURES = {
-            "fighter": {
-                1: {"Fighting Style", "Second Wind"},
-                2: {"Action Surge"},
-                3: {"Subclass Feature"},
-                4: {"Martial Training"},
-                5: {"Extra Attack"},
-                6: {"Tactical Training"},
-                7: {"Subclass Feature"},
-                8: {"Ability Score Improvement"},
-                9: {"Indomitable"},
-                10: {"Subclass Feature"},
-                11: {"Extra Attack (2)"},
-                12: {"Ability Score Improvement"},
-                13: {"Indomitable (2)"},
-                14: {"Tactical Training Improvement"},
-                15: {"Subclass Feature"},
-                16: {"Ability Score Improvement"},
-                17: {"Action Surge (2)", "Indomitable (3)"},
-                18: {"Subclass Feature"},
-                19: {"Ability Score Improvement"},
-                20: {"Epic Boon"},
-            },
-            # Add other classes...
-        }
-        
-        features = set()
-        if char_class in FEATURES:
-            for l in range(1, level + 1):
-                if l in FEATURES[char_class]:
-                    features.update(FEATURES[char_class][l])
-        return features
+        return tables.class_features(char_class, level)
 
 
 class ProficiencyRule(BaseValidationRule):
@@ -267,16 +231,8 @@ class ProficiencyRule(BaseValidationRule):
 
         # Validate skill proficiencies
         skills = data.get("skills", {})
-        VALID_SKILLS = {
-            "acrobatics", "animal_handling", "arcana", "athletics",
-            "deception", "history", "insight", "intimidation",
-            "investigation", "medicine", "nature", "perception",
-            "performance", "persuasion", "religion", "sleight_of_hand",
-            "stealth", "survival",
-        }
-
         for skill, proficient in skills.items():
-            if skill not in VALID_SKILLS:
+            if skill not in tables.VALID_SKILLS:
                 issues.append(
                     self.create_issue(
                         severity=ValidationSeverity.ERROR,
@@ -329,46 +285,18 @@ class ProficiencyRule(BaseValidationRule):
         return self.create_result(character, passed=not issues, issues=issues)
 
     def _get_expected_skill_count(self, character: Character) -> int:
-        """Get expected number of skill proficiencies."""
-        # This would be based on class, background, etc.
-        data = character.character_data
-        count = 0
-        
-        # Class skills
-        class_skills = {
-            "fighter": 2,
-            "rogue": 4,
-            # Add other classes...
-        }
-        count += class_skills.get(data.get("character_class", ""), 0)
-
-        # Background skills
-        count += 2  # All backgrounds give 2 skills in 2024
-
-        return count
+        """Get expected number of skill proficiencies from class and background."""
+        char_class = character.character_data.get("character_class")
+        return tables.skill_choices(char_class) + tables.BACKGROUND_SKILLS
 
     def _get_expected_expertise_count(self, character: Character) -> int:
         """Get expected number of expertise."""
-        # Based on class features, etc.
         data = character.character_data
-        char_class = data.get("character_class")
-        level = data.get("level", 1)
+        return tables.skill_expertise(data.get("character_class"), data.get("level", 1))
 
-        if char_class == "rogue":
-            if level >= 1:
-                return 2
-            if level >= 6:
-                return 4
-        return 0
-
-    def _get_class_saving_throws(self, char_class: str) -> Set[str]:
+    def _get_class_saving_throws(self, char_class: str) -> FrozenSet[str]:
         """Get saving throw proficiencies for a class."""
-        SAVES = {
-            "fighter": {"strength", "constitution"},
-            "rogue": {"dexterity", "intelligence"},
-            # Add other classes...
-        }
-        return SAVES.get(char_class, set())
+        return tables.saving_throws(char_class)
 
 
 class FeatsRule(BaseValidationRule):
@@ -408,8 +336,7 @@ class FeatsRule(BaseValidationRule):
             )
 
         # Check ASI/feat levels
-        asi_levels = self._get_asi_levels(data.get("character_class"))
-        expected_count = sum(1 for l in asi_levels if l <= level)
+        expected_count = tables.asi_count(data.get("character_class"), level)
         actual_count = sum(1 for f in feats if f.get("source") == "asi")
         if actual_count > expected_count:
             issues.append(
@@ -447,14 +374,24 @@ class FeatsRule(BaseValidationRule):
 
         return self.create_result(character, passed=not issues, issues=issues)
 
-    def _get_asi_levels(self, char_class: str) -> List[int]:
+    def _get_asi_levels(self, char_class: str) -> Tuple[int, ...]:
         """Get levels where ASI/feats are gained."""
-        ASI_LEVELS = {
-            "fighter": [4, 6, 8, 12, 14, 16, 19],
-            "rogue": [4, 8, 10, 12, 16, 19],
-            # Add other classes...
-        }
-        return ASI_LEVELS.get(char_class, [])
+        return tables.asi_levels(char_class)
+
+    def _check_feat_prerequisites(self, feat: Dict, character: Character) -> bool:
+        """Check whether a character meets a feat's prerequisites."""
+        prerequisites = feat.get("prerequisites") or {}
+        data = character.character_data
+
+        if data.get("level", 1) < prerequisites.get("level", 0):
+            return False
+        if (char_class := prerequisites.get("class")) and char_class != data.get("character_class"):
+            return False
+        scores = data.get("ability_scores", {})
+        return all(
+            scores.get(ability, 0) >= minimum
+            for ability, minimum in prerequisites.get("ability_scores", {}).items()
+        )
 
 
 class SpellSystemRule(BaseValidationRule):
@@ -505,12 +442,7 @@ class SpellSystemRule(BaseValidationRule):
     def _has_spellcasting(self, data: Dict) -> bool:
         """Check if character has spellcasting ability."""
         # Check class-based spellcasting
-        char_class = data.get("character_class")
-        SPELLCASTING_CLASSES = {
-            "bard", "cleric", "druid", "sorcerer", "wizard",
-            "artificer", "paladin", "ranger", "warlock"
-        }
-        if char_class in SPELLCASTING_CLASSES:
+        if data.get("character_class") in tables.SPELLCASTING_CLASSES:
             return True
 
         # Check features granting spellcasting
@@ -534,7 +466,7 @@ class SpellSystemRule(BaseValidationRule):
         # Check each spell level
         for slot_level, count in slots.items():
             # Validate slot level exists
-            if slot_level not in expected_slots:
+            if (index := self._slot_index(slot_level)) is None:
                 issues.append(
                     self.create_issue(
                         severity=ValidationSeverity.ERROR,
@@ -546,7 +478,7 @@ class SpellSystemRule(BaseValidationRule):
                 continue
 
             # Check slot count
-            if count > expected_slots[slot_level]:
+            if count > expected_slots[index]:
                 issues.append(
                     self.create_issue(
                         severity=ValidationSeverity.ERROR,
@@ -554,7 +486,7 @@ class SpellSystemRule(BaseValidationRule):
                         field=f"spell_slots.{slot_level}",
                         fix_available=True,
                         metadata={
-                            "expected": expected_slots[slot_level],
+                            "expected": expected_slots[index],
                             "current": count,
                         },
                     )
@@ -613,7 +545,7 @@ class SpellSystemRule(BaseValidationRule):
         char_class = data.get("character_class")
 
         # Skip for classes that don't prepare spells
-        if char_class in {"bard", "ranger", "sorcerer", "warlock"}:
+        if char_class in tables.KNOWN_CASTER_CLASSES:
             return issues
 
         # Calculate max prepared spells
@@ -656,20 +588,17 @@ class SpellSystemRule(BaseValidationRule):
 
         return issues
 
-    def _get_expected_slots(self, char_class: str, level: int) -> Dict[int, int]:
-        """Get expected spell slots for class and level."""
-        # This would be expanded with full 2024 spell slot tables
-        if char_class == "wizard":
-            return {
-                1: min(4, level + 1),
-                2: 2 if level >= 3 else 0,
-                3: 2 if level >= 5 else 0,
-                4: 1 if level >= 7 else 0,
-                5: 1 if level >= 9 else 0,
-                # Add higher levels...
-            }
-        # Add other classes...
-        return {}
+    def _get_expected_slots(self, char_class: str, level: int) -> Tuple[int, ...]:
+        """Get expected spell slots for class and level, indexed by spell level."""
+        return tables.spell_slots(char_class, level)
+
+    def _slot_index(self, slot_level) -> Optional[int]:
+        """Get the spell level of a slot key, or None if it is not one."""
+        try:
+            index = int(slot_level)
+        except (TypeError, ValueError):
+            return None
+        return index if 1 <= index <= tables.MAX_SPELL_LEVEL else None
 
     def _get_max_prepared_spells(self, data: Dict) -> int:
         """Calculate maximum number of prepared spells."""
@@ -768,8 +697,7 @@ class MulticlassRule(BaseValidationRule):
         features = data.get("features", [])
 
         # Check for duplicate features that don't stack
-        NON_STACKING_FEATURES = {"unarmored_defense", "fighting_style"}
-        for feature_name in NON_STACKING_FEATURES:
+        for feature_name in tables.NON_STACKING_FEATURES:
             count = sum(1 for f in features if f["name"] == feature_name)
             if count > 1:
                 issues.append(
@@ -794,7 +722,9 @@ class MulticlassRule(BaseValidationRule):
 
         # Check against combined spell slot table
         expected_slots = self._get_multiclass_slots(caster_level)
-        for level, expected in expected_slots.items():
+        for level in range(1, tables.MAX_SPELL_LEVEL + 1):
+            if not (expected := expected_slots[level]):
+                continue
             current = slots.get(str(level), 0)
             if current > expected:
                 issues.append(
@@ -841,73 +771,24 @@ class MulticlassRule(BaseValidationRule):
 
     def _meets_prerequisites(self, char_class: str, scores: Dict) -> bool:
         """Check if ability scores meet multiclass prerequisites."""
-        PREREQUISITES = {
-            "artificer": {"intelligence": 13},
-            "barbarian": {"strength": 13},
-            "bard": {"charisma": 13},
-            "cleric": {"wisdom": 13},
-            "druid": {"wisdom": 13},
-            "fighter": {"strength": 13, "dexterity": 13},
-            "monk": {"dexterity": 13, "wisdom": 13},
-            "paladin": {"strength": 13, "charisma": 13},
-            "ranger": {"dexterity": 13, "wisdom": 13},
-            "rogue": {"dexterity": 13},
-            "sorcerer": {"charisma": 13},
-            "warlock": {"charisma": 13},
-            "wizard": {"intelligence": 13},
-        }
-
-        reqs = PREREQUISITES.get(char_class, {})
-        return all(scores.get(ability, 0) >= score for ability, score in reqs.items())
+        return all(
+            scores.get(ability, 0) >= score
+            for ability, score in tables.multiclass_prerequisites(char_class)
+        )
 
     def _get_total_caster_level(self, classes: List[Dict]) -> int:
-        """Calculate total caster level for multiclassing."""
-        total = 0
-        for class_info in classes:
-            char_class = class_info["class"]
-            level = class_info["level"]
-
-            # Full casters
-            if char_class in {"bard", "cleric", "druid", "sorcerer", "wizard"}:
-                total += level
-            # Half casters
-            elif char_class in {"paladin", "ranger"}:
-                total += level // 2
-            # Third casters
-            elif char_class in {"fighter", "rogue"}:  # Eldritch Knight/Arcane Trickster
-                total += level // 3
-            # Special cases
-            elif char_class == "artificer":
-                total += (level + 1) // 2
-            # Warlocks are handled separately
-
-        return total
-
-    def _get_multiclass_slots(self, caster_level: int) -> Dict[int, int]:
-        """Get multiclass spell slots for total caster level."""
-        MULTICLASS_SLOTS = {
-            1: {1: 2},
-            2: {1: 3},
-            3: {1: 4, 2: 2},
-            4: {1: 4, 2: 3},
-            5: {1: 4, 2: 3, 3: 2},
-            6: {1: 4, 2: 3, 3: 3},
-            7: {1: 4, 2: 3, 3: 3, 4: 1},
-            8: {1: 4, 2: 3, 3: 3, 4: 2},
-            9: {1: 4, 2: 3, 3: 3, 4: 3, 5: 1},
-            10: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2},
-            11: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1},
-            12: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1},
-            13: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1},
-            14: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1},
-            15: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1, 8: 1},
-            16: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1, 8: 1},
-            17: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1, 8: 1, 9: 1},
-            18: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 1, 7: 1, 8: 1, 9: 1},
-            19: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 2, 7: 1, 8: 1, 9: 1},
-            20: {1: 4, 2: 3, 3: 3, 4: 3, 5: 2, 6: 2, 7: 2, 8: 1, 9: 1},
-        }
-        return MULTICLASS_SLOTS.get(caster_level, {})
+        """Calculate total caster level for multiclassing.
+
+        Warlock levels add nothing; Pact Magic slots are tracked separately.
+        """
+        return sum(
+            tables.caster_level(class_info["class"], class_info["level"])
+            for class_info in classes
+        )
+
+    def _get_multiclass_slots(self, caster_level: int) -> Tuple[int, ...]:
+        """Get multiclass spell slots for total caster level, indexed by spell level."""
+        return tables.multiclass_slots(caster_level)
 
 
 class EquipmentRule(BaseValidationRule):
@@ -962,14 +843,9 @@ class EquipmentRule(BaseValidationRule):
         items = data.get("equipment", [])
 
         # Check for items without valid slots
-        VALID_SLOTS = {
-            "head", "neck", "shoulders", "chest", "back", "arms",
-            "hands", "waist", "legs", "feet", "ring1", "ring2",
-        }
-
         for item in items:
             if slot := item.get("slot"):
-                if slot not in VALID_SLOTS:
+                if slot not in tables.EQUIPMENT_SLOTS:
                     issues.append(
                         self.create_issue(
                             severity=ValidationSeverity.ERROR,
@@ -1066,14 +942,14 @@ class EquipmentRule(BaseValidationRule):
         attuned_items = [i for i in data.get("equipment", []) if i.get("attuned")]
 
         # Check attunement limit (usually 3)
-        if len(attuned_items) > 3:
+        if len(attuned_items) > tables.MAX_ATTUNED_ITEMS:
             issues.append(
                 self.create_issue(
                     severity=ValidationSeverity.ERROR,
                     message="Too many attuned items",
                     field="equipment",
                     fix_available=True,
-                    metadata={"max_attunement": 3},
+                    metadata={"max_attunement": tables.MAX_ATTUNED_ITEMS},
                 )
             )
 
@@ -1280,24 +1156,8 @@ class LanguageAndToolsRule(BaseValidationRule):
             )
 
         # Validate tool types
-        VALID_TOOLS = {
-            # Artisan's tools
-            "alchemist", "brewer", "calligrapher", "carpenter", "cartographer",
-            "cobbler", "cook", "glassblower", "jeweler", "leatherworker",
-            "mason", "painter", "potter", "smith", "tinker", "weaver",
-            "woodcarver",
-            # Gaming sets
-            "dice", "dragonchess", "playing_cards", "three_dragon_ante",
-            # Musical instruments
-            "bagpipes", "drum", "dulcimer", "flute", "lute", "lyre",
-            "horn", "pan_flute", "shawm", "viol",
-            # Other tools
-            "disguise", "forgery", "herbalism", "navigator", "poisoner",
-            "thieves", "vehicles_land", "vehicles_water", "vehicles_air",
-        }
-
         for tool in tools:
-            if tool not in VALID_TOOLS:
+            if tool not in tables.VALID_TOOLS:
                 issues.append(
                     self.create_issue(
                         severity=ValidationSeverity.ERROR,
@@ -1371,7 +1231,7 @@ class LanguageAndToolsRule(BaseValidationRule):
 
         # Racial languages
         race = data.get("race")
-        if race in {"elf", "dwarf", "gnome"}:
+        if race in tables.BONUS_LANGUAGE_RACES:
             count += 1
 
         # Intelligence bonus languages
@@ -1394,11 +1254,7 @@ class LanguageAndToolsRule(BaseValidationRule):
         count += 1  # All backgrounds give at least one tool
 
         # Class tools
-        char_class = data.get("character_class")
-        if char_class == "artificer":
-            count += 2
-        elif char_class == "rogue":
-            count += 1
+        count += tables.class_tools(data.get("character_class"))
 
         # Features granting tools
         features = data.get("features", [])
@@ -1410,15 +1266,8 @@ class LanguageAndToolsRule(BaseValidationRule):
 
     def _get_expected_tool_expertise(self, data: Dict) -> int:
         """Calculate expected number of tool expertise."""
-        count = 0
-        char_class = data.get("character_class")
-        level = data.get("level", 1)
-
         # Class-based expertise
-        if char_class == "artificer" and level >= 6:
-            count += 2
-        elif char_class == "rogue" and level >= 6:
-            count += 1
+        count = tables.tool_expertise(data.get("character_class"), data.get("level", 1))
 
         # Features granting expertise
         features = data.get("features", [])
@@ -1428,16 +1277,10 @@ class LanguageAndToolsRule(BaseValidationRule):
 
         return count
 
-    def _get_cultural_languages(self, culture: str) -> Set[str]:
+    def _get_cultural_languages(self, culture: str) -> FrozenSet[str]:
         """Get required languages for a culture."""
         # This would be expanded with actual culture/language mappings
-        CULTURE_LANGUAGES = {
-            "high_elf": {"elvish"},
-            "mountain_dwarf": {"dwarvish"},
-            "forest_gnome": {"gnomish", "sylvan"},
-            # Add other cultures...
-        }
-        return CULTURE_LANGUAGES.get(culture, set())
+        return tables.CULTURE_LANGUAGES.get(culture, frozenset())
 
 
 class CustomContentRule(BaseValidationRule):
@@ -1634,14 +1477,7 @@ class CustomContentRule(BaseValidationRule):
         issues = []
 
         # Maximum spell level by caster type
-        MAX_SPELL_LEVEL = {
-            "full": 9,
-            "half": 5,
-            "third": 4,
-            "custom": 9  # Allow custom progressions up to 9th level
-        }
-
-        max_level = MAX_SPELL_LEVEL.get(caster_type, 9)
+        max_level = tables.CUSTOM_MAX_SPELL_LEVEL.get(caster_type, 9)
         for level, level_slots in slots.items():
             try:
                 spell_level = int(level)
@@ -1664,15 +1500,8 @@ class CustomContentRule(BaseValidationRule):
         issues = []
 
         # Baseline spells known at max level
-        BASELINE_KNOWN = {
-            "full": 15,  # Like Sorcerer
-            "half": 11,  # Like Ranger
-            "third": 8,  # Like Arcane Trickster
-            "custom": 20  # Allow some flexibility
-        }
-
         max_known = spells.get("max_known", 0)
-        baseline = BASELINE_KNOWN.get(caster_type, 15)
+        baseline = tables.CUSTOM_BASELINE_KNOWN.get(caster_type, 15)
         if max_known > baseline * 1.5:  # Allow 50% more than baseline
             issues.append(
                 self.create_issue(
@@ -1692,17 +1521,8 @@ class CustomContentRule(BaseValidationRule):
         power_score = 0
 
         # Score special features for power level
-        FEATURE_SCORES = {
-            "ritual_casting": 0.5,
-            "bonus_cantrips": 0.3,
-            "spell_flexibility": 0.5,  # Ability to swap spells more often
-            "enhanced_slots": 1.0,  # Any feature that enhances slot usage
-            "unique_resource": 0.8,  # Like Sorcery Points or Pact Magic
-            "focus_benefits": 0.4,  # Special focus abilities
-        }
-
         for feature in special_features:
-            power_score += FEATURE_SCORES.get(feature, 0.5)
+            power_score += tables.CUSTOM_CASTING_FEATURE_SCORES.get(feature, 0.5)
 
         # Warn if too many powerful features
         if power_score > 2.0:  # Allow 2-3 significant features
@@ -1833,18 +1653,8 @@ class CustomContentRule(BaseValidationRule):
         damage = spell.get("damage", {})
 
         # Base damage guidelines by spell level
-        BASE_DAMAGE = {
-            0: 5,   # Cantrip
-            1: 12,  # 3d8
-            2: 20,  # 5d8
-            3: 28,  # 7d8
-            4: 36,  # 9d8
-            5: 44,  # 11d8
-            # Scale appropriately for higher levels
-        }
-
         if average_damage := damage.get("average", 0):
-            base = BASE_DAMAGE.get(level, 44 + (level - 5) * 8)
+            base = tables.BASE_SPELL_DAMAGE.get(level, 44 + (level - 5) * 8)
             if average_damage > base * 1.5:  # Allow 50% variance
                 issues.append(
                     self.create_issue(
@@ -1864,10 +1674,5 @@ class CustomContentRule(BaseValidationRule):
     def _get_equivalent_spell_points(self, data: Dict) -> int:
         """Calculate equivalent spell points for level/class."""
         # Standard spell point values by level
-        SPELL_POINTS = {
-            1: 4, 2: 6, 3: 14, 4: 17, 5: 27,
-            6: 32, 7: 38, 8: 44, 9: 57, 10: 64,
-            # Scale appropriately for higher levels
-        }
         level = data.get("level", 1)
-        return SPELL_POINTS.get(level, 64 + (level - 10) * 7)
+        return tables.SPELL_POINTS.get(level, 64 + (level - 10) * 7)
@@ -0,0 +1,598 @@
+"""Compiled D&D 5e (2024) rules tables.
+
+Class tables are written out once below in readable form and compiled at
+import into tuples indexed by class and level, so rules look values up in
+constant time instead of rebuilding literals and walking levels on every
+validation. Everything exported is immutable: tuples, frozensets and
+read-only mappings.
+"""
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+MAX_LEVEL = 20
+MAX_SPELL_LEVEL = 9
+
+ABILITIES: Tuple[str, ...] = (
+    "strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma",
+)
+
+CLASSES: Tuple[str, ...] = (
+    "artificer", "barbarian", "bard", "cleric", "druid", "fighter", "monk",
+    "paladin", "ranger", "rogue", "sorcerer", "warlock", "wizard",
+)
+CLASS_INDEX: Mapping[str, int] = MappingProxyType(
+    {name: index for index, name in enumerate(CLASSES)}
+)
+
+# Ability scores
+STANDARD_ARRAY: FrozenSet[int] = frozenset({16, 14, 13, 12, 11, 10})
+POINT_BUY_BUDGET = 27
+POINT_BUY_MIN = 8
+POINT_BUY_MAX = 16
+# Cost of each score from POINT_BUY_MIN to POINT_BUY_MAX
+POINT_BUY_COSTS: Tuple[int, ...] = (0, 1, 2, 3, 4, 5, 7, 9, 11)
+
+# Proficiencies
+VALID_SKILLS: FrozenSet[str] = frozenset({
+    "acrobatics", "animal_handling", "arcana", "athletics",
+    "deception", "history", "insight", "intimidation",
+    "investigation", "medicine", "nature", "perception",
+    "performance", "persuasion", "religion", "sleight_of_hand",
+    "stealth", "survival",
+})
+BACKGROUND_SKILLS = 2  # All backgrounds give 2 skills in 2024
+
+VALID_TOOLS: FrozenSet[str] = frozenset({
+    # Artisan's tools
+    "alchemist", "brewer", "calligrapher", "carpenter", "cartographer",
+    "cobbler", "cook", "glassblower", "jeweler", "leatherworker",
+    "mason", "painter", "potter", "smith", "tinker", "weaver",
+    "woodcarver",
+    # Gaming sets
+    "dice", "dragonchess", "playing_cards", "three_dragon_ante",
+    # Musical instruments
+    "bagpipes", "drum", "dulcimer", "flute", "lute", "lyre",
+    "horn", "pan_flute", "shawm", "viol",
+    # Other tools
+    "disguise", "forgery", "herbalism", "navigator", "poisoner",
+    "thieves", "vehicles_land", "vehicles_water", "vehicles_air",
+})
+
+# Languages
+BONUS_LANGUAGE_RACES: FrozenSet[str] = frozenset({"elf", "dwarf", "gnome"})
+CULTURE_LANGUAGES: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    "high_elf": frozenset({"elvish"}),
+    "mountain_dwarf": frozenset({"dwarvish"}),
+    "forest_gnome": frozenset({"gnomish", "sylvan"}),
+})
+
+# Equipment
+EQUIPMENT_SLOTS: FrozenSet[str] = frozenset({
+    "head", "neck", "shoulders", "chest", "back", "arms",
+    "hands", "waist", "legs", "feet", "ring1", "ring2",
+})
+MAX_ATTUNED_ITEMS = 3
+
+# Spellcasting
+SPELLCASTING_CLASSES: FrozenSet[str] = frozenset({
+    "bard", "cleric", "druid", "sorcerer", "wizard",
+    "artificer", "paladin", "ranger", "warlock",
+})
+# Classes that know their spells rather than preparing them each day
+KNOWN_CASTER_CLASSES: FrozenSet[str] = frozenset({"bard", "ranger", "sorcerer", "warlock"})
+NON_STACKING_FEATURES: FrozenSet[str] = frozenset({"unarmored_defense", "fighting_style"})
+
+# Custom content baselines
+CUSTOM_MAX_SPELL_LEVEL: Mapping[str, int] = MappingProxyType({
+    "full": 9,
+    "half": 5,
+    "third": 4,
+    "custom": 9,  # Allow custom progressions up to 9th level
+})
+CUSTOM_BASELINE_KNOWN: Mapping[str, int] = MappingProxyType({
+    "full": 15,  # Like Sorcerer
+    "half": 11,  # Like Ranger
+    "third": 8,  # Like Arcane Trickster
+    "custom": 20,  # Allow some flexibility
+})
+CUSTOM_CASTING_FEATURE_SCORES: Mapping[str, float] = MappingProxyType({
+    "ritual_casting": 0.5,
+    "bonus_cantrips": 0.3,
+    "spell_flexibility": 0.5,  # Ability to swap spells more often
+    "enhanced_slots": 1.0,  # Any feature that enhances slot usage
+    "unique_resource": 0.8,  # Like Sorcery Points or Pact Magic
+    "focus_benefits": 0.4,  # Special focus abilities
+})
+# Expected average damage by spell level
+BASE_SPELL_DAMAGE: Mapping[int, int] = MappingProxyType({
+    0: 5,  # Cantrip
+    1: 12,  # 3d8
+    2: 20,  # 5d8
+    3: 28,  # 7d8
+    4: 36,  # 9d8
+    5: 44,  # 11d8
+})
+# Spell point equivalents by character level
+SPELL_POINTS: Mapping[int, int] = MappingProxyType({
+    1: 4, 2: 6, 3: 14, 4: 17, 5: 27,
+    6: 32, 7: 38, 8: 44, 9: 57, 10: 64,
+})
+
+# Source tables, one entry per class. Only the levels where something is
+# gained are listed; compilation fills in the levels in between.
+
+_ASI = "Ability Score Improvement"
+_SUBCLASS = "Subclass Feature"
+
+_CLASS_FEATURES: Dict[str, Dict[int, Tuple[str, ...]]] = {
+    "artificer": {
+        1: ("Magical Tinkering", "Spellcasting"),
+        2: ("Infuse Item",),
+        3: (_SUBCLASS, "The Right Tool for the Job"),
+        4: (_ASI,),
+        5: (_SUBCLASS,),
+        6: ("Tool Expertise",),
+        7: ("Flash of Genius",),
+        10: ("Magic Item Adept",),
+        11: ("Spell-Storing Item",),
+        14: ("Magic Item Savant",),
+        18: ("Magic Item Master",),
+        20: ("Soul of Artifice",),
+    },
+    "barbarian": {
+        1: ("Rage", "Unarmored Defense", "Weapon Mastery"),
+        2: ("Danger Sense", "Reckless Attack"),
+        3: (_SUBCLASS, "Primal Knowledge"),
+        4: (_ASI,),
+        5: ("Extra Attack", "Fast Movement"),
+        6: (_SUBCLASS,),
+        7: ("Feral Instinct", "Instinctive Pounce"),
+        9: ("Brutal Strike",),
+        11: ("Relentless Rage",),
+        13: ("Improved Brutal Strike",),
+        15: ("Persistent Rage",),
+        18: ("Indomitable Might",),
+        19: ("Epic Boon",),
+        20: ("Primal Champion",),
+    },
+    "bard": {
+        1: ("Bardic Inspiration", "Spellcasting"),
+        2: ("Expertise", "Jack of All Trades"),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Font of Inspiration",),
+        7: ("Countercharm",),
+        10: ("Magical Secrets",),
+        18: ("Superior Inspiration",),
+        19: ("Epic Boon",),
+        20: ("Words of Creation",),
+    },
+    "cleric": {
+        1: ("Spellcasting", "Divine Order"),
+        2: ("Channel Divinity",),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Sear Undead",),
+        7: ("Blessed Strikes",),
+        10: ("Divine Intervention",),
+        14: ("Improved Blessed Strikes",),
+        19: ("Epic Boon",),
+        20: ("Greater Divine Intervention",),
+    },
+    "druid": {
+        1: ("Spellcasting", "Druidic", "Primal Order"),
+        2: ("Wild Shape", "Wild Companion"),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Wild Resurgence",),
+        7: ("Elemental Fury",),
+        15: ("Improved Elemental Fury",),
+        18: ("Beast Spells",),
+        19: ("Epic Boon",),
+        20: ("Archdruid",),
+    },
+    "fighter": {
+        1: ("Fighting Style", "Second Wind"),
+        2: ("Action Surge",),
+        3: (_SUBCLASS,),
+        4: ("Martial Training",),
+        5: ("Extra Attack",),
+        6: ("Tactical Training",),
+        8: (_ASI,),
+        9: ("Indomitable",),
+        11: ("Extra Attack (2)",),
+        13: ("Indomitable (2)",),
+        14: ("Tactical Training Improvement",),
+        17: ("Action Surge (2)", "Indomitable (3)"),
+        20: ("Epic Boon",),
+    },
+    "monk": {
+        1: ("Martial Arts", "Unarmored Defense"),
+        2: ("Monk's Focus", "Unarmored Movement", "Uncanny Metabolism"),
+        3: (_SUBCLASS, "Deflect Attacks"),
+        4: (_ASI, "Slow Fall"),
+        5: ("Extra Attack", "Stunning Strike"),
+        6: ("Empowered Strikes",),
+        7: ("Evasion",),
+        9: ("Acrobatic Movement",),
+        10: ("Heightened Focus", "Self-Restoration"),
+        13: ("Deflect Energy",),
+        14: ("Disciplined Survivor",),
+        15: ("Perfect Focus",),
+        18: ("Superior Defense",),
+        19: ("Epic Boon",),
+        20: ("Body and Mind",),
+    },
+    "paladin": {
+        1: ("Lay On Hands", "Spellcasting", "Weapon Mastery"),
+        2: ("Fighting Style", "Paladin's Smite"),
+        3: (_SUBCLASS, "Channel Divinity"),
+        4: (_ASI,),
+        5: ("Extra Attack", "Faithful Steed"),
+        6: ("Aura of Protection",),
+        9: ("Abjure Foes",),
+        10: ("Aura of Courage",),
+        11: ("Radiant Strikes",),
+        14: ("Restoring Touch",),
+        18: ("Aura Expansion",),
+        19: ("Epic Boon",),
+    },
+    "ranger": {
+        1: ("Spellcasting", "Favored Enemy", "Weapon Mastery"),
+        2: ("Deft Explorer", "Fighting Style"),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Extra Attack",),
+        6: ("Roving",),
+        9: ("Expertise",),
+        10: ("Tireless",),
+        13: ("Relentless Hunter",),
+        14: ("Nature's Veil",),
+        17: ("Precise Hunter",),
+        18: ("Feral Senses",),
+        19: ("Epic Boon",),
+        20: ("Foe Slayer",),
+    },
+    "rogue": {
+        1: ("Expertise", "Sneak Attack", "Thieves' Cant", "Weapon Mastery"),
+        2: ("Cunning Action",),
+        3: (_SUBCLASS, "Steady Aim"),
+        4: (_ASI,),
+        5: ("Cunning Strike", "Uncanny Dodge"),
+        7: ("Evasion", "Reliable Talent"),
+        11: ("Improved Cunning Strike",),
+        14: ("Devious Strikes",),
+        15: ("Slippery Mind",),
+        18: ("Elusive",),
+        19: ("Epic Boon",),
+        20: ("Stroke of Luck",),
+    },
+    "sorcerer": {
+        1: ("Spellcasting", "Innate Sorcery"),
+        2: ("Font of Magic", "Metamagic"),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Sorcerous Restoration",),
+        7: ("Sorcery Incarnate",),
+        19: ("Epic Boon",),
+        20: ("Arcane Apotheosis",),
+    },
+    "warlock": {
+        1: ("Eldritch Invocations", "Pact Magic"),
+        2: ("Magical Cunning",),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        9: ("Contact Patron",),
+        11: ("Mystic Arcanum",),
+        19: ("Epic Boon",),
+        20: ("Eldritch Master",),
+    },
+    "wizard": {
+        1: ("Spellcasting", "Ritual Adept", "Arcane Recovery"),
+        2: ("Scholar",),
+        3: (_SUBCLASS,),
+        4: (_ASI,),
+        5: ("Memorize Spell",),
+        18: ("Spell Mastery",),
+        19: ("Epic Boon",),
+        20: ("Signature Spells",),
+    },
+}
+
+# Levels where an ASI or feat is chosen; level 19 is the Epic Boon feat
+_DEFAULT_ASI_LEVELS = (4, 8, 12, 16, 19)
+_ASI_LEVELS: Dict[str, Tuple[int, ...]] = {
+    "fighter": (4, 6, 8, 12, 14, 16, 19),
+    "rogue": (4, 8, 10, 12, 16, 19),
+}
+
+_SAVING_THROWS: Dict[str, Tuple[str, str]] = {
+    "artificer": ("constitution", "intelligence"),
+    "barbarian": ("strength", "constitution"),
+    "bard": ("dexterity", "charisma"),
+    "cleric": ("wisdom", "charisma"),
+    "druid": ("intelligence", "wisdom"),
+    "fighter": ("strength", "constitution"),
+    "monk": ("strength", "dexterity"),
+    "paladin": ("wisdom", "charisma"),
+    "ranger": ("strength", "dexterity"),
+    "rogue": ("dexterity", "intelligence"),
+    "sorcerer": ("constitution", "charisma"),
+    "warlock": ("wisdom", "charisma"),
+    "wizard": ("intelligence", "wisdom"),
+}
+
+_SKILL_CHOICES: Dict[str, int] = {
+    "artificer": 2, "barbarian": 2, "bard": 3, "cleric": 2, "druid": 2,
+    "fighter": 2, "monk": 2, "paladin": 2, "ranger": 3, "rogue": 4,
+    "sorcerer": 2, "warlock": 2, "wizard": 2,
+}
+
+# Total skill expertise gained by each level
+_SKILL_EXPERTISE: Dict[str, Dict[int, int]] = {
+    "bard": {2: 2, 9: 4},
+    "ranger": {2: 1, 9: 3},
+    "rogue": {1: 2, 6: 4},
+}
+
+_CLASS_TOOLS: Dict[str, int] = {"artificer": 2, "bard": 3, "druid": 1, "monk": 1, "rogue": 1}
+
+# Total tool expertise gained by each level
+_TOOL_EXPERTISE: Dict[str, Dict[int, int]] = {
+    "artificer": {6: 2},
+    "rogue": {6: 1},
+}
+
+_MULTICLASS_PREREQUISITES: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    "artificer": (("intelligence", 13),),
+    "barbarian": (("strength", 13),),
+    "bard": (("charisma", 13),),
+    "cleric": (("wisdom", 13),),
+    "druid": (("wisdom", 13),),
+    "fighter": (("strength", 13), ("dexterity", 13)),
+    "monk": (("dexterity", 13), ("wisdom", 13)),
+    "paladin": (("strength", 13), ("charisma", 13)),
+    "ranger": (("dexterity", 13), ("wisdom", 13)),
+    "rogue": (("dexterity", 13),),
+    "sorcerer": (("charisma", 13),),
+    "warlock": (("charisma", 13),),
+    "wizard": (("intelligence", 13),),
+}
+
+# Spell slots of a full caster by caster level, spell levels 1-9
+_FULL_CASTER_SLOTS: Tuple[Tuple[int, ...], ...] = (
+    (2,),
+    (3,),
+    (4, 2),
+    (4, 3),
+    (4, 3, 2),
+    (4, 3, 3),
+    (4, 3, 3, 1),
+    (4, 3, 3, 2),
+    (4, 3, 3, 3, 1),
+    (4, 3, 3, 3, 2),
+    (4, 3, 3, 3, 2, 1),
+    (4, 3, 3, 3, 2, 1),
+    (4, 3, 3, 3, 2, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1, 1, 1),
+    (4, 3, 3, 3, 2, 2, 1, 1, 1),
+    (4, 3, 3, 3, 2, 2, 2, 1, 1),
+)
+
+# Pact Magic slots by warlock level: (slot count, slot level)
+_PACT_SLOTS: Tuple[Tuple[int, int], ...] = (
+    (1, 1), (2, 1), (2, 2), (2, 2), (2, 3), (2, 3), (2, 4), (2, 4), (2, 5), (2, 5),
+    (3, 5), (3, 5), (3, 5), (3, 5), (3, 5), (3, 5), (4, 5), (4, 5), (4, 5), (4, 5),
+)
+
+
+def _single_class_caster_level(char_class: str, level: int) -> int:
+    """Get the row of the full caster slot table a single-classed caster uses."""
+    if char_class in {"bard", "cleric", "druid", "sorcerer", "wizard"}:
+        return level
+    if char_class in {"artificer", "paladin", "ranger"}:
+        return (level + 1) // 2
+    if char_class in {"fighter", "rogue"}:  # Eldritch Knight/Arcane Trickster
+        return (level + 2) // 3 if level >= 3 else 0
+    return 0
+
+
+def _multiclass_caster_level(char_class: str, level: int) -> int:
+    """Get what levels in a class add to the multiclass caster level."""
+    # Full casters
+    if char_class in {"bard", "cleric", "druid", "sorcerer", "wizard"}:
+        return level
+    # Half casters
+    if char_class in {"paladin", "ranger"}:
+        return level // 2
+    # Third casters
+    if char_class in {"fighter", "rogue"}:  # Eldritch Knight/Arcane Trickster
+        return level // 3
+    # Special cases
+    if char_class == "artificer":
+        return (level + 1) // 2
+    # Warlocks are handled separately
+    return 0
+
+
+def _slot_row(slots: Iterable[int]) -> Tuple[int, ...]:
+    """Pad a slot list to one entry per spell level 0-9; cantrips are 0."""
+    row = (0, *slots)
+    return row + (0,) * (MAX_SPELL_LEVEL + 1 - len(row))
+
+
+def _by_level(gains: Mapping[int, int]) -> Tuple[int, ...]:
+    """Expand totals gained at some levels into a total for every level 0-20."""
+    totals, current = [], 0
+    for level in range(MAX_LEVEL + 1):
+        current = gains.get(level, current)
+        totals.append(current)
+    return tuple(totals)
+
+
+def _compile_features(table: Mapping[int, Tuple[str, ...]]) -> Tuple[FrozenSet[str], ...]:
+    """Accumulate the features gained up to every level 0-20."""
+    compiled, current = [], frozenset()
+    for level in range(MAX_LEVEL + 1):
+        current = current.union(table.get(level, ()))
+        compiled.append(current)
+    return tuple(compiled)
+
+
+def _compile_slots(char_class: str) -> Tuple[Tuple[int, ...], ...]:
+    """Build the slot rows of a class for every level 0-20."""
+    rows = [_slot_row(())]
+    for level in range(1, MAX_LEVEL + 1):
+        if char_class == "warlock":
+            count, slot_level = _PACT_SLOTS[level - 1]
+            slots = [0] * (slot_level - 1) + [count]
+        elif caster_level := _single_class_caster_level(char_class, level):
+            slots = _FULL_CASTER_SLOTS[caster_level - 1]
+        else:
+            slots = ()
+        rows.append(_slot_row(slots))
+    return tuple(rows)
+
+
+# Compiled tables, indexed by CLASS_INDEX and then level. Index 0 of level
+# tables holds the values before the first level.
+FEATURES: Tuple[Tuple[FrozenSet[str], ...], ...] = tuple(
+    _compile_features(_CLASS_FEATURES[name]) for name in CLASSES
+)
+ASI_LEVELS: Tuple[Tuple[int, ...], ...] = tuple(
+    _ASI_LEVELS.get(name, _DEFAULT_ASI_LEVELS) for name in CLASSES
+)
+ASI_COUNTS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sum(1 for asi in levels if asi <= level) for level in range(MAX_LEVEL + 1))
+    for levels in ASI_LEVELS
+)
+SAVING_THROWS: Tuple[FrozenSet[str], ...] = tuple(
+    frozenset(_SAVING_THROWS[name]) for name in CLASSES
+)
+SKILL_CHOICES: Tuple[int, ...] = tuple(_SKILL_CHOICES[name] for name in CLASSES)
+SKILL_EXPERTISE: Tuple[Tuple[int, ...], ...] = tuple(
+    _by_level(_SKILL_EXPERTISE.get(name, {})) for name in CLASSES
+)
+CLASS_TOOLS: Tuple[int, ...] = tuple(_CLASS_TOOLS.get(name, 0) for name in CLASSES)
+TOOL_EXPERTISE: Tuple[Tuple[int, ...], ...] = tuple(
+    _by_level(_TOOL_EXPERTISE.get(name, {})) for name in CLASSES
+)
+MULTICLASS_PREREQUISITES: Tuple[Tuple[Tuple[str, int], ...], ...] = tuple(
+    _MULTICLASS_PREREQUISITES[name] for name in CLASSES
+)
+SPELL_SLOTS: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    _compile_slots(name) for name in CLASSES
+)
+CASTER_LEVELS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_multiclass_caster_level(name, level) for level in range(MAX_LEVEL + 1))
+    for name in CLASSES
+)
+MULTICLASS_SLOTS: Tuple[Tuple[int, ...], ...] = (
+    _slot_row(()),
+    *(_slot_row(slots) for slots in _FULL_CASTER_SLOTS),
+)
+
+_EMPTY: FrozenSet[str] = frozenset()
+_NO_SLOTS = MULTICLASS_SLOTS[0]
+
+
+def class_index(char_class: Optional[str]) -> Optional[int]:
+    """Get the table index of a class, or None if it is not a core class."""
+    return CLASS_INDEX.get(char_class) if isinstance(char_class, str) else None
+
+
+def level_index(level: int) -> int:
+    """Clamp a level into the 0-20 range the level tables cover."""
+    if not isinstance(level, int):
+        return 0
+    return 0 if level < 0 else MAX_LEVEL if level > MAX_LEVEL else level
+
+
+def point_buy_cost(score: int) -> Optional[int]:
+    """Get the point buy cost of a score, or None if it cannot be bought."""
+    if not isinstance(score, int) or not POINT_BUY_MIN <= score <= POINT_BUY_MAX:
+        return None
+    return POINT_BUY_COSTS[score - POINT_BUY_MIN]
+
+
+def class_features(char_class: str, level: int) -> FrozenSet[str]:
+    """Get every class feature a class has gained by a level."""
+    index = class_index(char_class)
+    return _EMPTY if index is None else FEATURES[index][level_index(level)]
+
+
+def asi_levels(char_class: str) -> Tuple[int, ...]:
+    """Get the levels where a class gains an ASI or feat."""
+    index = class_index(char_class)
+    return () if index is None else ASI_LEVELS[index]
+
+
+def asi_count(char_class: str, level: int) -> int:
+    """Get the number of ASIs or feats a class has gained by a level."""
+    index = class_index(char_class)
+    return 0 if index is None else ASI_COUNTS[index][level_index(level)]
+
+
+def saving_throws(char_class: str) -> FrozenSet[str]:
+    """Get the saving throw proficiencies of a class."""
+    index = class_index(char_class)
+    return _EMPTY if index is None else SAVING_THROWS[index]
+
+
+def skill_choices(char_class: str) -> int:
+    """Get the number of skill proficiencies a class chooses."""
+    index = class_index(char_class)
+    return 0 if index is None else SKILL_CHOICES[index]
+
+
+def skill_expertise(char_class: str, level: int) -> int:
+    """Get the number of skill expertise a class has gained by a level."""
+    index = class_index(char_class)
+    return 0 if index is None else SKILL_EXPERTISE[index][level_index(level)]
+
+
+def class_tools(char_class: str) -> int:
+    """Get the number of tool proficiencies a class grants."""
+    index = class_index(char_class)
+    return 0 if index is None else CLASS_TOOLS[index]
+
+
+def tool_expertise(char_class: str, level: int) -> int:
+    """Get the number of tool expertise a class has gained by a level."""
+    index = class_index(char_class)
+    return 0 if index is None else TOOL_EXPERTISE[index][level_index(level)]
+
+
+def multiclass_prerequisites(char_class: str) -> Tuple[Tuple[str, int], ...]:
+    """Get the minimum ability scores to multiclass into a class."""
+    index = class_index(char_class)
+    return () if index is None else MULTICLASS_PREREQUISITES[index]
+
+
+def spell_slots(char_class: str, level: int) -> Tuple[int, ...]:
+    """Get the spell slots of a single-classed character.
+
+    Returns:
+        Slot count per spell level, indexed 0-9 with 0 for cantrips
+    """
+    index = class_index(char_class)
+    return _NO_SLOTS if index is None else SPELL_SLOTS[index][level_index(level)]
+
+
+def caster_level(char_class: str, level: int) -> int:
+    """Get what levels in a class add to the multiclass caster level."""
+    index = class_index(char_class)
+    return 0 if index is None else CASTER_LEVELS[index][level_index(level)]
+
+
+def multiclass_slots(caster_level: int) -> Tuple[int, ...]:
+    """Get the spell slots of a multiclass caster level.
+
+    Returns:
+        Slot count per spell level, indexed 0-9 with 0 for cantrips
+    """
+    return MULTICLASS_SLOTS[level_index(caster_level)]
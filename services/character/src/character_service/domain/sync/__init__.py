@@ -25,6 +25,7 @@ from character_service.domain.sync.models import (
     SyncSubscription,
 )
 from character_service.domain.sync.repositories import (
+    CharacterStateRepository,
     StateVersionRepository,
     SyncConflictRepository,
     SyncErrorRepository,
@@ -47,6 +48,7 @@ __all__ = [
     "SyncState",
     "SyncSubscription",
     # Repositories
+    "CharacterStateRepository",
     "StateVersionRepository",
     "SyncConflictRepository",
     "SyncErrorRepository",
@@ -0,0 +1,158 @@
+"""Subscription field pattern index.
+
+Subscriptions select fields with dotted patterns: ``*`` for everything,
+``inventory.*`` for a field and everything below it, ``spells.*.level`` for
+one segment of any name, or an exact path. Rather than testing every change
+against every pattern of every subscription, the patterns of all
+subscriptions are compiled into one prefix trie over path segments, so a
+single walk down a change's path finds every subscription interested in it.
+"""
+from functools import lru_cache
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from character_service.domain.sync.models import StateChange, SyncSubscription
+
+K = TypeVar("K", bound=Hashable)
+
+WILDCARD = "*"
+
+
+class _PatternNode(Generic[K]):
+    """Node of the pattern trie, one per path segment."""
+
+    __slots__ = ("children", "any_child", "exact", "subtree")
+
+    def __init__(self) -> None:
+        """Initialize node."""
+        self.children: Dict[str, "_PatternNode[K]"] = {}
+        self.any_child: Optional["_PatternNode[K]"] = None  # Mid-path ``*``
+        self.exact: Set[K] = set()  # Patterns ending at this node
+        self.subtree: Set[K] = set()  # Patterns ending in ``.*`` here
+
+
+class FieldPatternIndex(Generic[K]):
+    """Routes field paths to the subscribers whose patterns match them."""
+
+    def __init__(self) -> None:
+        """Initialize index."""
+        self._root: _PatternNode[K] = _PatternNode()
+        self._patterns: Dict[K, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Number of subscribers in the index."""
+        return len(self._patterns)
+
+    def add(self, key: K, patterns: Iterable[str]) -> None:
+        """Add a subscriber's patterns.
+
+        Args:
+            key: Subscriber key, e.g. a campaign ID
+            patterns: Field patterns of the subscriber
+        """
+        self.remove(key)
+        self._patterns[key] = tuple(patterns)
+        for pattern in self._patterns[key]:
+            node, segments = self._root, pattern.split(".")
+            for i, segment in enumerate(segments):
+                if segment == WILDCARD and i == len(segments) - 1:
+                    node.subtree.add(key)
+                    break
+                if segment == WILDCARD:
+                    if node.any_child is None:
+                        node.any_child = _PatternNode()
+                    node = node.any_child
+                else:
+                    node = node.children.setdefault(segment, _PatternNode())
+            else:
+                node.exact.add(key)
+
+    def remove(self, key: K) -> None:
+        """Remove a subscriber's patterns.
+
+        Args:
+            key: Subscriber key
+        """
+        if self._patterns.pop(key, None) is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            node.exact.discard(key)
+            node.subtree.discard(key)
+            stack.extend(node.children.values())
+            if node.any_child is not None:
+                stack.append(node.any_child)
+
+    def match(self, field_path: str) -> Set[K]:
+        """Get the subscribers interested in a field.
+
+        Args:
+            field_path: Dotted path of the changed field
+
+        Returns:
+            Keys of all subscribers with a matching pattern
+        """
+        matched: Set[K] = set()
+        frontier = [self._root]
+        for segment in field_path.split("."):
+            advanced = []
+            for node in frontier:
+                # ``prefix.*`` covers the prefix itself and all below it
+                matched |= node.subtree
+                if (child := node.children.get(segment)) is not None:
+                    advanced.append(child)
+                if node.any_child is not None:
+                    advanced.append(node.any_child)
+            if not advanced:
+                return matched
+            frontier = advanced
+        for node in frontier:
+            matched |= node.subtree
+            matched |= node.exact
+        return matched
+
+    def route(self, changes: Iterable[StateChange]) -> Dict[K, List[StateChange]]:
+        """Group changes by the subscribers interested in them.
+
+        Args:
+            changes: Changes to route
+
+        Returns:
+            Changes for each subscriber with at least one, in the given order
+        """
+        routed: Dict[K, List[StateChange]] = {}
+        for change in changes:
+            for key in self.match(change.field_path):
+                routed.setdefault(key, []).append(change)
+        return routed
+
+
+@lru_cache(maxsize=1024)
+def _compile(entries: Tuple[Tuple[Hashable, Tuple[str, ...]], ...]) -> FieldPatternIndex:
+    """Build an index for a set of subscribers, memoised by their patterns."""
+    index: FieldPatternIndex = FieldPatternIndex()
+    for key, patterns in entries:
+        index.add(key, patterns)
+    return index
+
+
+def compile_subscriptions(subscriptions: Iterable[SyncSubscription]) -> FieldPatternIndex:
+    """Get the pattern index of subscriptions, keyed by campaign ID.
+
+    Indexes are shared between callers with the same subscriptions and must
+    not be modified.
+
+    Args:
+        subscriptions: Subscriptions to index
+
+    Returns:
+        Index routing field paths to campaign IDs
+    """
+    return _compile(
+        tuple(
+            sorted(
+                ((s.campaign_id, tuple(s.fields)) for s in subscriptions),
+                key=lambda entry: str(entry[0]),
+            )
+        )
+    )
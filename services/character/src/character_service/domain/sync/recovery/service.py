@@ -24,11 +24,13 @@ from character_service.domain.sync.models import (
     SyncSubscription,
 )
 from character_service.domain.sync.repositories import (
+    CharacterStateRepository,
     StateVersionRepository,
     SyncErrorRepository,
     SyncMetadataRepository,
     SyncSubscriptionRepository,
 )
+from character_service.domain.sync.service import SynchronizationService
 from character_service.domain.sync.utils import (
     detect_changes,
     diff_values,
@@ -38,7 +40,6 @@ from character_service.domain.sync.utils import (
     with_timeout,
 )
 from character_service.infrastructure.messaging.hub_client import MessageHubClient
-from character_service.infrastructure.repositories.character import CharacterRepository
 
 logger = logging.getLogger(__name__)
 
@@ -49,13 +50,14 @@ class SyncRecoveryService:
     def __init__(
         self,
         db: AsyncSession,
-        char_repository: CharacterRepository,
+        char_repository: CharacterStateRepository,
         state_repository: StateVersionRepository,
         metadata_repository: SyncMetadataRepository,
         error_repository: SyncErrorRepository,
         subscription_repository: SyncSubscriptionRepository,
         message_hub: MessageHubClient,
         cache: StateCache,
+        sync_service: SynchronizationService,
         retry_interval: int = 60,  # 1 minute between retries
         max_retries: int = 5,  # Maximum retry attempts
         recovery_batch_size: int = 10,  # Number of errors to process per batch
@@ -71,6 +73,7 @@ class SyncRecoveryService:
             subscription_repository: Subscription repository
             message_hub: Message hub client
             cache: State cache
+            sync_service: Synchronization service told about recovered writes
             retry_interval: Seconds between retry attempts
             max_retries: Maximum retry attempts
             recovery_batch_size: Errors to process per batch
@@ -83,6 +86,7 @@ class SyncRecoveryService:
         self._subscription_repo = subscription_repository
         self._message_hub = message_hub
         self._cache = cache
+        self._sync_service = sync_service
         self._retry_interval = retry_interval
         self._max_retries = max_retries
         self._batch_size = recovery_batch_size
@@ -424,6 +428,7 @@ class SyncRecoveryService:
                 ],
             )
             await self._state_repo.create(version)
+            self._sync_service.mark_dirty(character.id)
 
         except Exception as e:
             logger.error(
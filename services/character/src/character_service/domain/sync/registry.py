@@ -1,5 +1,6 @@
 """Message registry for sync handlers."""
 import logging
+from functools import partial
 from typing import Dict, List
 
 from character_service.domain.sync.handlers import (
@@ -9,9 +10,14 @@ from character_service.domain.sync.handlers import (
     VersionQueryHandler,
 )
 from character_service.domain.sync.service import SynchronizationService
+from character_service.infrastructure.hooks import mark_character_for_sync
 from character_service.infrastructure.messaging.handlers import MessageHandler
 from character_service.infrastructure.messaging.hub_client import MessageHubClient
 from character_service.infrastructure.messaging.registry import HandlerRegistry
+from character_service.repositories.character_storage_repository import (
+    CharacterStorageRepository,
+    WriteHook,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,3 +45,17 @@ def register_sync_handlers(
     # Register handlers
     for handler in handlers:
         registry.register(handler)
+
+
+def register_sync_hooks(sync_service: SynchronizationService) -> WriteHook:
+    """Queue a campaign sync after every character write.
+
+    Args:
+        sync_service: Synchronization service
+
+    Returns:
+        The registered hook, to pass to remove_write_hook on shutdown
+    """
+    hook = partial(mark_character_for_sync, sync_service)
+    CharacterStorageRepository.add_write_hook(hook)
+    return hook
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Protocol, runtime_checkable
 from uuid import UUID
 
+from character_service.domain.models import Character
 from character_service.domain.sync.models import (
     StateVersion,
     SyncConflict,
@@ -14,6 +15,19 @@ from character_service.domain.sync.models import (
 )
 
 
+@runtime_checkable
+class CharacterStateRepository(Protocol):
+    """Repository for the character state being synchronized."""
+
+    async def get(self, character_id: UUID) -> Optional[Character]:
+        """Get character by ID."""
+        ...
+
+    async def update(self, character_id: UUID, character: Character) -> Optional[Character]:
+        """Update character."""
+        ...
+
+
 @runtime_checkable
 class StateVersionRepository(Protocol):
     """Repository for managing state versions."""
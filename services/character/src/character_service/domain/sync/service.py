@@ -1,8 +1,20 @@
-"""State synchronization service."""
+"""State synchronization service.
+
+Sync is driven by changes rather than by polling. Every write to a character
+marks it dirty; a pool of workers drains dirty characters and sends each
+change to all of the character's matching subscriptions at once. A character
+marked again while queued or syncing is synced once more, not once per write,
+so bursts coalesce and idle subscriptions cost nothing. A character whose
+changes could not all be published is marked dirty again after a backoff.
+
+Every repository shares the service's database session, which supports one
+operation at a time, so repository calls are serialized; only publishing to
+the message hub overlaps between workers.
+"""
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,7 +39,9 @@ from character_service.domain.sync.models import (
     SyncState,
     SyncSubscription,
 )
+from character_service.domain.sync.patterns import compile_subscriptions
 from character_service.domain.sync.repositories import (
+    CharacterStateRepository,
     StateVersionRepository,
     SyncConflictRepository,
     SyncErrorRepository,
@@ -39,7 +53,6 @@ from character_service.domain.sync.utils import (
     detect_changes,
     diff_values,
     extract_value,
-    group_changes,
     merge_values,
     reconcile_changes,
     set_value,
@@ -47,7 +60,6 @@ from character_service.domain.sync.utils import (
     with_timeout,
 )
 from character_service.infrastructure.messaging.hub_client import MessageHubClient
-from character_service.infrastructure.repositories.character import CharacterRepository
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +70,7 @@ class SynchronizationService:
     def __init__(
         self,
         db: AsyncSession,
-        char_repository: CharacterRepository,
+        char_repository: CharacterStateRepository,
         state_repository: StateVersionRepository,
         metadata_repository: SyncMetadataRepository,
         message_repository: SyncMessageRepository,
@@ -66,8 +78,11 @@ class SynchronizationService:
         error_repository: SyncErrorRepository,
         subscription_repository: SyncSubscriptionRepository,
         message_hub: MessageHubClient,
-        sync_interval: int = 5,  # 5 seconds
+        sync_workers: int = 4,
+        coalesce_delay: float = 0.01,  # 10 milliseconds
         message_timeout: int = 10,  # 10 seconds
+        retry_delay: float = 1.0,  # 1 second
+        max_retry_delay: float = 60.0,  # 1 minute
     ) -> None:
         """Initialize service.
 
@@ -81,8 +96,13 @@ class SynchronizationService:
             error_repository: Sync error repository
             subscription_repository: Sync subscription repository
             message_hub: Message hub client
-            sync_interval: Sync interval in seconds
+            sync_workers: Number of workers syncing dirty characters
+            coalesce_delay: Seconds a dirty character waits for further
+                writes before it is synced
             message_timeout: Message timeout in seconds
+            retry_delay: Seconds before a character that failed to publish
+                is synced again; doubles with each consecutive failure
+            max_retry_delay: Upper bound for the retry delay in seconds
         """
         self._db = db
         self._char_repo = char_repository
@@ -93,25 +113,64 @@ class SynchronizationService:
         self._error_repo = error_repository
         self._subscription_repo = subscription_repository
         self._message_hub = message_hub
-        self._sync_interval = sync_interval
+        self._sync_workers = sync_workers
+        self._coalesce_delay = coalesce_delay
         self._message_timeout = message_timeout
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
         self._active_tasks: Set[asyncio.Task] = set()
+        self._session_lock = asyncio.Lock()
+
+        # Change feed: queued characters, and those being synced right now
+        self._dirty_queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self._dirty: Set[UUID] = set()
+        self._syncing: Set[UUID] = set()
+        # Consecutive failed publishes by character, for the retry backoff
+        self._publish_failures: Dict[UUID, int] = {}
 
     async def start(self) -> None:
         """Start synchronization service."""
-        # Start background sync task
-        sync_task = asyncio.create_task(self._sync_loop())
-        self._active_tasks.add(sync_task)
-        sync_task.add_done_callback(self._active_tasks.remove)
+        # Start sync workers
+        for _ in range(self._sync_workers):
+            sync_task = asyncio.create_task(self._sync_worker())
+            self._active_tasks.add(sync_task)
+            sync_task.add_done_callback(self._active_tasks.discard)
+
+        # Catch up on writes made while the service was down
+        try:
+            async with self._session_lock:
+                subscriptions = await self._subscription_repo.list_active()
+            for subscription in subscriptions:
+                self.mark_dirty(subscription.character_id)
+        except Exception as e:
+            logger.error("Error queueing initial sync: %s", str(e), exc_info=True)
 
     async def stop(self) -> None:
         """Stop synchronization service."""
         # Cancel all active tasks
-        for task in self._active_tasks:
+        tasks = list(self._active_tasks)
+        for task in tasks:
             task.cancel()
         # Wait for tasks to finish
-        if self._active_tasks:
-            await asyncio.gather(*self._active_tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def mark_dirty(self, character_id: UUID) -> None:
+        """Queue a character for sync after a write.
+
+        Args:
+            character_id: ID of the written character
+        """
+        if character_id in self._dirty:
+            return  # Already queued, the pending sync covers this write
+        self._dirty.add(character_id)
+        if character_id not in self._syncing:
+            # Characters syncing now are requeued by their worker
+            self._dirty_queue.put_nowait(character_id)
+
+    async def wait_idle(self) -> None:
+        """Wait until all queued characters have been synced."""
+        await self._dirty_queue.join()
 
     async def subscribe_to_campaign(
         self,
@@ -131,31 +190,32 @@ class SynchronizationService:
         Returns:
             New subscription
         """
-        # Verify character exists
-        character = await self._char_repo.get(character_id)
-        if not character:
-            raise CharacterNotFoundError(f"Character {character_id} not found")
-
-        # Create subscription
-        subscription = SyncSubscription(
-            character_id=character_id,
-            campaign_id=campaign_id,
-            fields=fields or ["*"],
-            sync_mode=sync_mode,
-            active=True,
-            created_at=datetime.utcnow(),
-        )
-        subscription = await self._subscription_repo.create(subscription)
-
-        # Initialize sync metadata
-        metadata = SyncMetadata(
-            character_id=character_id,
-            campaign_id=campaign_id,
-            character_version=0,
-            campaign_version=0,
-            last_sync=datetime.utcnow(),
-        )
-        await self._metadata_repo.create(metadata)
+        async with self._session_lock:
+            # Verify character exists
+            character = await self._char_repo.get(character_id)
+            if not character:
+                raise CharacterNotFoundError(f"Character {character_id} not found")
+
+            # Create subscription
+            subscription = SyncSubscription(
+                character_id=character_id,
+                campaign_id=campaign_id,
+                fields=fields or ["*"],
+                sync_mode=sync_mode,
+                active=True,
+                created_at=datetime.utcnow(),
+            )
+            subscription = await self._subscription_repo.create(subscription)
+
+            # Initialize sync metadata
+            metadata = SyncMetadata(
+                character_id=character_id,
+                campaign_id=campaign_id,
+                character_version=0,
+                campaign_version=0,
+                last_sync=datetime.utcnow(),
+            )
+            await self._metadata_repo.create(metadata)
 
         return subscription
 
@@ -171,8 +231,9 @@ class SynchronizationService:
             campaign_id: Campaign ID
         """
         # Delete subscription and metadata
-        await self._subscription_repo.delete(character_id, campaign_id)
-        await self._metadata_repo.delete(character_id, campaign_id)
+        async with self._session_lock:
+            await self._subscription_repo.delete(character_id, campaign_id)
+            await self._metadata_repo.delete(character_id, campaign_id)
 
     async def push_changes(
         self,
@@ -185,31 +246,26 @@ class SynchronizationService:
             character_id: Character ID
             changes: List of state changes
         """
+        # Versions written alongside these changes follow through the feed
+        self.mark_dirty(character_id)
+
         # Get active subscriptions
-        subscriptions = await self._subscription_repo.list_for_character(character_id)
-        if not subscriptions:
-            return  # No active subscriptions
+        async with self._session_lock:
+            subscriptions = await self._subscription_repo.list_for_character(character_id)
+            subscriptions = [s for s in subscriptions if s.active]
+            if not subscriptions:
+                return  # No active subscriptions
+            metadata_by_campaign = await self._get_metadata(character_id)
 
-        # Group changes by field
-        grouped = group_changes(changes)
+        # Route changes to the subscriptions whose fields they touch
+        routed = compile_subscriptions(subscriptions).route(changes)
 
         # Create messages for each subscription
         messages: List[SyncMessage] = []
         for subscription in subscriptions:
-            # Filter changes by subscription fields
-            sub_changes = []
-            for field, field_changes in grouped.items():
-                if any(self._field_matches_pattern(field, p) for p in subscription.fields):
-                    sub_changes.extend(field_changes)
-
-            if sub_changes:
-                # Get latest versions
-                metadata = await self._metadata_repo.get(
-                    character_id, subscription.campaign_id
-                )
-                if not metadata:
-                    continue
-
+            sub_changes = routed.get(subscription.campaign_id)
+            metadata = metadata_by_campaign.get(subscription.campaign_id)
+            if sub_changes and metadata:
                 # Create message
                 message = SyncMessage(
                     message_id=uuid4(),
@@ -223,9 +279,9 @@ class SynchronizationService:
                 messages.append(message)
 
         # Store and publish messages
-        for message in messages:
-            await self._message_repo.create(message)
-            await self._publish_message(message)
+        for error in await self._send_messages(messages):
+            if error is not None:
+                raise error
 
     async def handle_campaign_message(
         self,
@@ -236,147 +292,226 @@ class SynchronizationService:
         Args:
             message: Incoming sync message
         """
-        try:
-            # Get character and metadata
-            character = await self._char_repo.get(message.character_id)
-            if not character:
-                raise CharacterNotFoundError(
-                    f"Character {message.character_id} not found"
-                )
+        metadata: Optional[SyncMetadata] = None
+        async with self._session_lock:
+            try:
+                # Get character and metadata
+                character = await self._char_repo.get(message.character_id)
+                if not character:
+                    raise CharacterNotFoundError(
+                        f"Character {message.character_id} not found"
+                    )
 
-            metadata = await self._metadata_repo.get(
-                message.character_id, message.campaign_id
-            )
-            if not metadata:
-                logger.warning(
-                    "No sync metadata for character %s campaign %s",
-                    message.character_id,
-                    message.campaign_id,
+                metadata = await self._metadata_repo.get(
+                    message.character_id, message.campaign_id
                 )
-                return
+                if not metadata:
+                    logger.warning(
+                        "No sync metadata for character %s campaign %s",
+                        message.character_id,
+                        message.campaign_id,
+                    )
+                    return
 
-            # Apply changes
-            await self._apply_changes(character, message.changes)
+                # Apply changes
+                await self._apply_changes(character, message.changes)
 
-            # Update metadata
-            metadata.campaign_version = message.campaign_version
-            metadata.last_sync = datetime.utcnow()
-            await self._metadata_repo.update(
-                message.character_id, message.campaign_id, metadata
-            )
+                # Update metadata
+                metadata.campaign_version = message.campaign_version
+                metadata.last_sync = datetime.utcnow()
+                await self._metadata_repo.update(
+                    message.character_id, message.campaign_id, metadata
+                )
 
-        except Exception as e:
-            logger.error(
-                "Error handling campaign message: %s",
-                str(e),
-                exc_info=True,
-            )
-            # Store error
-            error = SyncError(
-                character_id=message.character_id,
-                campaign_id=message.campaign_id,
-                error_type="message_handling",
-                error_message=str(e),
-                state_version=metadata.character_version if metadata else 0,
-                campaign_version=message.campaign_version,
-            )
-            await self._error_repo.create(error)
+            except Exception as e:
+                logger.error(
+                    "Error handling campaign message: %s",
+                    str(e),
+                    exc_info=True,
+                )
+                # Store error
+                error = SyncError(
+                    character_id=message.character_id,
+                    campaign_id=message.campaign_id,
+                    error_type="message_handling",
+                    error_message=str(e),
+                    state_version=metadata.character_version if metadata else 0,
+                    campaign_version=message.campaign_version,
+                )
+                await self._error_repo.create(error)
 
-    async def _sync_loop(self) -> None:
-        """Background sync loop."""
+    async def _sync_worker(self) -> None:
+        """Drain dirty characters from the change feed."""
         while True:
+            character_id = await self._dirty_queue.get()
+            self._syncing.add(character_id)
             try:
-                # Get active subscriptions
-                subscriptions = await self._subscription_repo.list_active()
-                for subscription in subscriptions:
-                    try:
-                        await self._sync_subscription(subscription)
-                    except Exception as e:
-                        logger.error(
-                            "Error syncing subscription %s: %s",
-                            subscription.character_id,
-                            str(e),
-                            exc_info=True,
-                        )
-
+                # Let a burst of writes settle into a single sync
+                if self._coalesce_delay:
+                    await asyncio.sleep(self._coalesce_delay)
+                self._dirty.discard(character_id)
+                await self._sync_character(character_id)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error("Sync loop error: %s", str(e), exc_info=True)
-
-            await asyncio.sleep(self._sync_interval)
+                logger.error(
+                    "Error syncing character %s: %s",
+                    character_id,
+                    str(e),
+                    exc_info=True,
+                )
+            finally:
+                self._syncing.discard(character_id)
+                # Written again while syncing
+                if character_id in self._dirty:
+                    self._dirty_queue.put_nowait(character_id)
+                self._dirty_queue.task_done()
 
     @with_retry()
-    async def _sync_subscription(
-        self,
-        subscription: SyncSubscription,
-    ) -> None:
-        """Sync single subscription.
+    async def _sync_character(self, character_id: UUID) -> None:
+        """Send a character's unsynced versions to all of its subscriptions.
 
         Args:
-            subscription: Subscription to sync
+            character_id: Character to sync
         """
-        # Get character and metadata
-        character = await self._char_repo.get(subscription.character_id)
-        if not character:
-            logger.warning(
-                "Character %s not found for subscription",
-                subscription.character_id,
-            )
-            return
+        failures = self._publish_failures.pop(character_id, 0)
+        async with self._session_lock:
+            subscriptions = await self._subscription_repo.list_for_character(character_id)
+            subscriptions = [s for s in subscriptions if s.active]
+            if not subscriptions:
+                return  # No active subscriptions
+
+            latest_version = await self._state_repo.get_latest(character_id)
+            if not latest_version:
+                return
 
-        metadata = await self._metadata_repo.get(
-            subscription.character_id, subscription.campaign_id
-        )
-        if not metadata:
-            logger.warning(
-                "No sync metadata for character %s campaign %s",
-                subscription.character_id,
-                subscription.campaign_id,
-            )
-            return
+            # Find subscriptions behind the latest version
+            metadata_by_campaign = await self._get_metadata(character_id)
+            behind: List[Tuple[SyncSubscription, SyncMetadata]] = []
+            for subscription in subscriptions:
+                metadata = metadata_by_campaign.get(subscription.campaign_id)
+                if not metadata:
+                    logger.warning(
+                        "No sync metadata for character %s campaign %s",
+                        character_id,
+                        subscription.campaign_id,
+                    )
+                elif latest_version.version > metadata.character_version:
+                    behind.append((subscription, metadata))
+            if not behind:
+                return
 
-        # Check for changes since last sync
-        latest_version = await self._state_repo.get_latest(subscription.character_id)
-        if latest_version and latest_version.version > metadata.character_version:
-            # Extract changes
-            changes = []
+            # Load every version any of them is missing in one query
+            start_version = min(metadata.character_version for _, metadata in behind) + 1
             versions = await self._state_repo.list_versions(
-                subscription.character_id,
-                start_version=metadata.character_version + 1,
+                character_id,
+                start_version=start_version,
+                end_version=latest_version.version,
+                limit=latest_version.version - start_version + 1,
             )
-            for version in versions:
-                changes.extend(version.changes)
-
-            # Filter changes by subscription fields
-            filtered_changes = [
-                c
-                for c in changes
-                if any(
-                    self._field_matches_pattern(c.field_path, p)
-                    for p in subscription.fields
-                )
-            ]
 
-            if filtered_changes:
-                # Create and send message
-                message = SyncMessage(
+        # Route each change once to every subscription lacking its version
+        index = compile_subscriptions(subscription for subscription, _ in behind)
+        routed: Dict[UUID, List[StateChange]] = {}
+        for version in versions:
+            for change in version.changes:
+                for campaign_id in index.match(change.field_path):
+                    if version.version > metadata_by_campaign[campaign_id].character_version:
+                        routed.setdefault(campaign_id, []).append(change)
+
+        pending: List[Tuple[SyncMetadata, SyncMessage]] = [
+            (
+                metadata,
+                SyncMessage(
                     message_id=uuid4(),
                     character_id=subscription.character_id,
                     campaign_id=subscription.campaign_id,
                     character_version=latest_version.version,
                     campaign_version=metadata.campaign_version,
-                    changes=filtered_changes,
+                    changes=routed[subscription.campaign_id],
                     timestamp=datetime.utcnow(),
-                )
-                await self._message_repo.create(message)
-                await self._publish_message(message)
-
-                # Update metadata
-                metadata.character_version = latest_version.version
+                ),
+            )
+            for subscription, metadata in behind
+            if routed.get(subscription.campaign_id)
+        ]
+        errors = await self._send_messages([message for _, message in pending])
+
+        # Record progress of the subscriptions that were sent their changes
+        async with self._session_lock:
+            for (metadata, message), error in zip(pending, errors):
+                if error is not None:
+                    logger.error(
+                        "Error syncing subscription %s campaign %s: %s",
+                        message.character_id,
+                        message.campaign_id,
+                        str(error),
+                        exc_info=error,
+                    )
+                    continue
+                metadata.character_version = message.character_version
                 metadata.last_sync = datetime.utcnow()
                 await self._metadata_repo.update(
-                    subscription.character_id, subscription.campaign_id, metadata
+                    message.character_id, message.campaign_id, metadata
                 )
 
+        if any(error is not None for error in errors):
+            self._retry_later(character_id, failures)
+
+    def _retry_later(self, character_id: UUID, failures: int) -> None:
+        """Mark a character dirty again after a backoff delay.
+
+        Args:
+            character_id: Character whose changes failed to publish
+            failures: Consecutive failed syncs before this one
+        """
+        self._publish_failures[character_id] = failures + 1
+        delay = min(self._retry_delay * 2**failures, self._max_retry_delay)
+
+        async def retry() -> None:
+            await asyncio.sleep(delay)
+            self.mark_dirty(character_id)
+
+        retry_task = asyncio.create_task(retry())
+        self._active_tasks.add(retry_task)
+        retry_task.add_done_callback(self._active_tasks.discard)
+
+    async def _get_metadata(self, character_id: UUID) -> Dict[UUID, SyncMetadata]:
+        """Get sync metadata of a character by campaign.
+
+        Args:
+            character_id: Character ID
+
+        Returns:
+            Sync metadata keyed by campaign ID
+        """
+        return {
+            metadata.campaign_id: metadata
+            for metadata in await self._metadata_repo.list_for_character(character_id)
+        }
+
+    async def _send_messages(
+        self, messages: Sequence[SyncMessage]
+    ) -> List[Optional[BaseException]]:
+        """Store sync messages one at a time, then publish them concurrently.
+
+        Args:
+            messages: Messages to send
+
+        Returns:
+            For each message, None if it was published or the error that
+            prevented it
+        """
+        async with self._session_lock:
+            for message in messages:
+                await self._message_repo.create(message)
+
+        results = await asyncio.gather(
+            *[self._publish_message(message) for message in messages],
+            return_exceptions=True,
+        )
+        return [result if isinstance(result, BaseException) else None for result in results]
+
     async def _apply_changes(
         self,
         character: Character,
@@ -411,6 +546,7 @@ class SynchronizationService:
                     changes=applied,
                 )
                 await self._state_repo.create(version)
+                self.mark_dirty(character.id)
 
         except Exception as e:
             logger.error(
@@ -421,49 +557,35 @@ class SynchronizationService:
             )
             raise SyncError(f"Failed to apply changes: {str(e)}")
 
-    @with_timeout(timeout=10)
     async def _publish_message(self, message: SyncMessage) -> None:
         """Publish sync message.
 
         Args:
             message: Message to publish
         """
-        await self._message_hub.publish(
-            "character.state.sync",
-            {
-                "message_id": str(message.message_id),
-                "character_id": str(message.character_id),
-                "campaign_id": str(message.campaign_id),
-                "character_version": message.character_version,
-                "campaign_version": message.campaign_version,
-                "changes": [
-                    {
-                        "field_path": c.field_path,
-                        "old_value": c.old_value,
-                        "new_value": c.new_value,
-                        "timestamp": c.timestamp.isoformat(),
-                        "source": c.source,
-                        "sync_mode": c.sync_mode.value,
-                    }
-                    for c in message.changes
-                ],
-                "timestamp": message.timestamp.isoformat(),
-                "metadata": message.metadata,
-            },
+        await with_timeout(
+            self._message_hub.publish(
+                "character.state.sync",
+                {
+                    "message_id": str(message.message_id),
+                    "character_id": str(message.character_id),
+                    "campaign_id": str(message.campaign_id),
+                    "character_version": message.character_version,
+                    "campaign_version": message.campaign_version,
+                    "changes": [
+                        {
+                            "field_path": c.field_path,
+                            "old_value": c.old_value,
+                            "new_value": c.new_value,
+                            "timestamp": c.timestamp.isoformat(),
+                            "source": c.source,
+                            "sync_mode": c.sync_mode.value,
+                        }
+                        for c in message.changes
+                    ],
+                    "timestamp": message.timestamp.isoformat(),
+                    "metadata": message.metadata,
+                },
+            ),
+            timeout=self._message_timeout,
         )
-
-    def _field_matches_pattern(self, field: str, pattern: str) -> bool:
-        """Check if field matches subscription pattern.
-
-        Args:
-            field: Field path to check
-            pattern: Pattern to match against
-
-        Returns:
-            Whether field matches pattern
-        """
-        if pattern == "*":
-            return True
-        if pattern.endswith(".*"):
-            return field.startswith(pattern[:-2])
-        return field == pattern
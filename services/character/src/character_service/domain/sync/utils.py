@@ -3,11 +3,11 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Union
 from uuid import UUID
 
-from jsonpath_ng import parse
+from jsonpath_ng import JSONPath, parse
 
 from character_service.domain.sync.exceptions import (
     SyncConflictError,
@@ -25,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Distinct field paths whose parsed JSONPath expressions are kept
+PATH_CACHE_SIZE = 4096
+
 
 def with_retry(
     max_retries: int = 3,
@@ -68,9 +71,15 @@ async def with_timeout(
         raise SyncTimeoutError(message or "Operation timed out")
 
 
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def parse_path(field_path: str) -> JSONPath:
+    """Parse a field path, reusing the expression for paths seen before."""
+    return parse(field_path)
+
+
 def extract_value(data: Dict, field_path: str) -> Any:
     """Extract value from data using field path."""
-    jsonpath_expr = parse(field_path)
+    jsonpath_expr = parse_path(field_path)
     matches = jsonpath_expr.find(data)
     if matches:
         return matches[0].value
@@ -1,5 +1,4 @@
 """Character validation service."""
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple
@@ -11,6 +10,7 @@ from character_service.core.exceptions import ValidationError
 from character_service.core.validation import (
     RuleCategory,
     ValidationEngine,
+    ValidationExecutor,
     ValidationResult,
     ValidationRule,
     ValidationSummary,
@@ -46,6 +46,7 @@ class ValidationService:
         db: AsyncSession,
         char_repository: CharacterRepository,
         validation_repository: ValidationStateRepository,
+        validation_executor: ValidationExecutor,
         validation_engine: Optional[ValidationEngine] = None,
         cache_ttl: int = 300,  # 5 minutes
     ) -> None:
@@ -55,6 +56,8 @@ class ValidationService:
             db: Database session
             char_repository: Character repository
             validation_repository: Validation state repository
+            validation_executor: Application-wide executor for validating many
+                characters; owned and shut down by the application lifespan
             validation_engine: Optional validation engine to use
             cache_ttl: Time in seconds to cache validation results
         """
@@ -62,6 +65,7 @@ class ValidationService:
         self._char_repo = char_repository
         self._validation_repo = validation_repository
         self._engine = validation_engine or self._create_default_engine()
+        self._executor = validation_executor
         self._cache_ttl = timedelta(seconds=cache_ttl)
         self._result_cache: Dict[Tuple[UUID, str], Tuple[datetime, ValidationSummary]] = {}
 
@@ -147,6 +151,9 @@ class ValidationService:
     ) -> Dict[UUID, ValidationSummary]:
         """Validate multiple characters in parallel.
 
+        Characters without a cached result are validated together by the
+        validation executor, which spreads them over worker processes.
+
         Args:
             character_ids: Characters to validate
             categories: Optional list of rule categories to check
@@ -155,24 +162,58 @@ class ValidationService:
         Returns:
             Dict mapping character IDs to validation results
         """
-        results = await asyncio.gather(
-            *[
-                self.validate_character(
-                    char_id,
-                    categories=categories,
-                    auto_fix=auto_fix,
-                    force_revalidate=False,
-                )
-                for char_id in character_ids
-            ],
-            return_exceptions=True,
+        results: Dict[UUID, ValidationSummary] = {}
+        characters: List[Character] = []
+        for char_id in character_ids:
+            cache_key = (char_id, self._get_executor_cache_key(categories))
+            if cached := self._get_cached_result(cache_key):
+                results[char_id] = cached
+            elif character := await self._char_repo.get(char_id):
+                characters.append(character)
+
+        results.update(await self._validate_many(characters, categories, auto_fix))
+        return {char_id: results[char_id] for char_id in character_ids if char_id in results}
+
+    async def validate_campaign(
+        self,
+        campaign_id: UUID,
+        categories: Optional[List[RuleCategory]] = None,
+        auto_fix: bool = False,
+    ) -> Dict[UUID, ValidationSummary]:
+        """Validate every character in a campaign, ignoring cached results.
+
+        Args:
+            campaign_id: Campaign whose roster to validate
+            categories: Optional list of rule categories to check
+            auto_fix: Whether to attempt automatic fixes
+
+        Returns:
+            Dict mapping character IDs to validation results
+        """
+        characters = await self._char_repo.get_by_campaign_id(campaign_id)
+        return await self._validate_many(characters, categories, auto_fix)
+
+    async def _validate_many(
+        self,
+        characters: List[Character],
+        categories: Optional[List[RuleCategory]],
+        auto_fix: bool,
+    ) -> Dict[UUID, ValidationSummary]:
+        """Validate characters with the executor, caching and storing results."""
+        if not characters:
+            return {}
+
+        summaries = await self._executor.validate_many(
+            characters, categories=categories, auto_fix=auto_fix
         )
 
-        return {
-            char_id: result
-            for char_id, result in zip(character_ids, results)
-            if not isinstance(result, Exception)
-        }
+        results = {}
+        category_key = self._get_executor_cache_key(categories)
+        for character, summary in zip(characters, summaries):
+            self._cache_result((character.id, category_key), summary)
+            await self._store_validation_state(character, summary)
+            results[character.id] = summary
+        return results
 
     async def get_validation_state(
         self,
@@ -194,6 +235,14 @@ class ValidationService:
             return "all"
         return ",".join(sorted(c.value for c in categories))
 
+    def _get_executor_cache_key(self, categories: Optional[List[RuleCategory]]) -> str:
+        """Get cache key for results of the executor's rule set.
+
+        The executor runs its own rules, not those added to the engine with
+        add_rule, so its results are cached apart from the engine's.
+        """
+        return f"executor:{self._get_cache_key(categories)}"
+
     def _get_cached_result(
         self, cache_key: Tuple[UUID, str]
     ) -> Optional[ValidationSummary]:
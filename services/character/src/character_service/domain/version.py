@@ -8,6 +8,7 @@ from sqlalchemy import (
     String,
     DateTime,
     Boolean,
+    Integer,
     JSON,
     ForeignKey,
     Index,
@@ -48,6 +49,10 @@ class CharacterVersion(Base):
     A version represents a snapshot of a character's state at a point in time.
     Versions form a tree structure, with each version potentially having a parent
     version and multiple child versions.
+
+    Keyframe versions store the full state. Other versions store only a JSON
+    patch from their parent and are reconstructed from the nearest keyframe
+    ancestor, ``keyframe_distance`` versions up the tree.
     """
 
     __tablename__ = "character_versions"
@@ -84,9 +89,21 @@ class CharacterVersion(Base):
         nullable=True,
     )
 
-    state: Mapped[Dict[str, Any]] = mapped_column(
+    state: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+
+    patch: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
         JSON,
+        nullable=True,
+    )
+
+    keyframe_distance: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
+        default=0,
+        server_default="0",
     )
 
     changes: Mapped[List[Dict[str, Any]]] = mapped_column(
@@ -120,6 +137,45 @@ class CharacterVersion(Base):
     )
 
 
+class CharacterVersionAncestry(Base):
+    """Character version ancestry model.
+
+    Closure table of the version tree: one row for every version and each of
+    its ancestors, including the version itself at depth 0. Lineages, subtrees
+    and common ancestors are read with a single indexed query instead of
+    walking parent links.
+    """
+
+    __tablename__ = "character_version_ancestry"
+    __table_args__ = (
+        Index("ix_character_version_ancestry_descendant_id", "descendant_id", "depth"),
+        Index("ix_character_version_ancestry_character_id", "character_id"),
+    )
+
+    ancestor_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("character_versions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    descendant_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("character_versions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    character_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("characters.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    depth: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+
 class CharacterChange(Base):
     """Character change model.
 
@@ -1,10 +1,12 @@
 """Event hooks for automatic event publication."""
 from typing import Optional
+from uuid import UUID
 
 from character_service.domain.event import EventImpactService
 from character_service.domain.event_publisher import EventPublicationManager
 from character_service.domain.models import Character, CharacterProgress
 from character_service.domain.progress import ProgressTrackingService
+from character_service.domain.sync.service import SynchronizationService
 
 
 async def publish_event_impact(
@@ -32,6 +34,16 @@ async def publish_character_update(
     )
 
 
+async def mark_character_for_sync(
+    sync_service: SynchronizationService,
+    character_id: UUID,
+    *args,
+    **kwargs,
+) -> None:
+    """Hook to queue campaign sync of character state updates."""
+    sync_service.mark_dirty(character_id)
+
+
 async def publish_progress_update(
     progress_service: ProgressTrackingService,
     event_publisher: EventPublicationManager,
@@ -1,7 +1,7 @@
 """Character repository using message-based storage service."""
 
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, ClassVar, Dict, Any, Optional, List
 from uuid import UUID, uuid4
 
 from character_service.clients.storage_port import (
@@ -12,12 +12,33 @@ from character_service.clients.storage_port import (
 from character_service.schemas.schemas import CharacterCreate, CharacterUpdate
 from character_service.storage.storage_adapter import StorageAdapter
 
+WriteHook = Callable[[UUID], Awaitable[None]]
+
+
 class CharacterStorageRepository:
     """Character repository using the storage service."""
 
+    # Called with the character ID after every character write
+    _write_hooks: ClassVar[List[WriteHook]] = []
+
     def __init__(self, storage: StorageAdapter):
         self.storage = storage
 
+    @classmethod
+    def add_write_hook(cls, hook: WriteHook) -> None:
+        """Run a hook after every character write through any repository."""
+        cls._write_hooks.append(hook)
+
+    @classmethod
+    def remove_write_hook(cls, hook: WriteHook) -> None:
+        """Stop running a write hook."""
+        cls._write_hooks.remove(hook)
+
+    async def _written(self, character_id: UUID) -> None:
+        """Run the write hooks for a character."""
+        for hook in list(self._write_hooks):
+            await hook(character_id)
+
     def _get_safe_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Get only the fields that are valid for character data."""
         valid_fields = {
@@ -58,7 +79,9 @@ class CharacterStorageRepository:
             updated_at=datetime.utcnow(),
             **payload
         )
-        return await self.storage.create_character(char_data)
+        created = await self.storage.create_character(char_data)
+        await self._written(created.character_id)
+        return created
 
     async def update(self, character_id: UUID, character: CharacterUpdate) -> Optional[CharacterData]:
         """Update a character."""
@@ -74,14 +97,20 @@ class CharacterStorageRepository:
                 current.update(updates["character_data"])
                 updates["character_data"] = current
 
-        return await self.storage.update_character(
+        updated = await self.storage.update_character(
             character_id=character_id,
             data=updates
         )
+        if updated:
+            await self._written(character_id)
+        return updated
 
     async def delete(self, character_id: UUID) -> bool:
         """Soft delete a character by marking it as inactive."""
-        return await self.storage.delete_character(character_id)
+        deleted = await self.storage.delete_character(character_id)
+        if deleted:
+            await self._written(character_id)
+        return deleted
 
     async def update_evolution(self, character_id: UUID, evolution_data: dict) -> Optional[CharacterData]:
         """Update a character's evolution data."""
@@ -94,10 +123,13 @@ class CharacterStorageRepository:
         current = dict(character.data or {})
         current.update(evolution_data)
 
-        return await self.storage.update_character(
+        updated = await self.storage.update_character(
             character_id=character_id,
             data={"character_data": current}
         )
+        if updated:
+            await self._written(character_id)
+        return updated
 
     # Inventory operations
 
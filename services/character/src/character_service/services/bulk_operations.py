@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from character_service.core.exceptions import ValidationError
+from character_service.core.validation import ValidationExecutor, ValidationSummary
+from character_service.core.validation.executor import character_snapshot
 from character_service.domain.character import Character
 from character_service.domain.theme import Theme
 from character_service.services.character import CharacterService
@@ -27,6 +29,7 @@ class BulkOperationService:
     def __init__(
         self,
         session: AsyncSession,
+        validation_executor: ValidationExecutor,
         character_service: Optional[CharacterService] = None,
         theme_service: Optional[ThemeTransitionService] = None,
         validation_service: Optional[ValidationService] = None,
@@ -35,6 +38,8 @@ class BulkOperationService:
 
         Args:
             session: Database session
+            validation_executor: Application-wide executor for validating many
+                characters; owned and shut down by the application lifespan
             character_service: Optional character service
             theme_service: Optional theme service
             validation_service: Optional validation service
@@ -43,6 +48,7 @@ class BulkOperationService:
         self.character_service = character_service or CharacterService(session)
         self.theme_service = theme_service or ThemeTransitionService(session)
         self.validation_service = validation_service or ValidationService(session)
+        self.validation_executor = validation_executor
         self._max_parallel = 5  # Maximum parallel operations
         self._active_batches: Dict[UUID, BulkOperationStatus] = {}
 
@@ -103,6 +109,9 @@ class BulkOperationService:
     ) -> List[ValidationResult]:
         """Validate multiple characters in parallel.
 
+        Snapshots of the characters are validated in chunks by the
+        validation executor's worker processes.
+
         Args:
             characters: List of character data
             campaign_id: Optional campaign ID
@@ -112,47 +121,39 @@ class BulkOperationService:
         Returns:
             List of validation results
         """
-        results: List[ValidationResult] = []
-        
-        # Create validation tasks
-        tasks = []
-        semaphore = asyncio.Semaphore(self._max_parallel)
-
-        for idx, char_data in enumerate(characters):
-            task = self._validate_character(
-                index=idx,
-                data=char_data,
-                campaign_id=campaign_id,
-                theme_id=theme_id,
-                validation_rules=validation_rules or [],
-                semaphore=semaphore,
-            )
-            tasks.append(task)
-
-        # Run validations in parallel
-        validation_results = await asyncio.gather(*tasks, return_exceptions=True)
+        snapshots = []
+        for char_data in characters:
+            # Add campaign and theme context if provided
+            if campaign_id:
+                char_data["campaign_id"] = campaign_id
+            if theme_id:
+                char_data["theme_id"] = theme_id
+            snapshots.append(character_snapshot(char_data, campaign_id=campaign_id))
 
-        # Process results
-        for idx, result in enumerate(validation_results):
-            if isinstance(result, Exception):
-                # Handle validation errors
-                results.append(
-                    ValidationResult(
-                        index=idx,
-                        is_valid=False,
-                        errors=[
-                            {
-                                "error_type": "validation_error",
-                                "message": str(result),
-                            }
-                        ],
-                        warnings=[],
-                    )
+        try:
+            summaries = await self.validation_executor.validate_many(
+                snapshots, rule_ids=validation_rules
+            )
+        except ValidationError as e:
+            return [
+                ValidationResult(
+                    index=idx,
+                    is_valid=False,
+                    errors=[
+                        {
+                            "error_type": "validation_error",
+                            "message": str(e),
+                        }
+                    ],
+                    warnings=[],
                 )
-            else:
-                results.append(result)
+                for idx in range(len(characters))
+            ]
 
-        return results
+        return [
+            self._to_validation_result(idx, summary)
+            for idx, summary in enumerate(summaries)
+        ]
 
     async def get_operation_status(
         self,
@@ -255,98 +256,40 @@ class BulkOperationService:
                 )
             )
 
-    async def _validate_character(
-        self,
-        index: int,
-        data: Dict[str, Any],
-        campaign_id: Optional[UUID] = None,
-        theme_id: Optional[UUID] = None,
-        validation_rules: List[str] = None,
-        semaphore: asyncio.Semaphore = None,
-    ) -> ValidationResult:
-        """Validate a single character.
-
-        Args:
-            index: Character index in batch
-            data: Character data
-            campaign_id: Optional campaign ID
-            theme_id: Optional theme ID
-            validation_rules: Optional specific rules to validate
-            semaphore: Semaphore for parallel processing
-
-        Returns:
-            Validation result
-        """
-        if semaphore:
-            async with semaphore:
-                return await self._do_validate_character(
-                    index=index,
-                    data=data,
-                    campaign_id=campaign_id,
-                    theme_id=theme_id,
-                    validation_rules=validation_rules,
-                )
-        else:
-            return await self._do_validate_character(
-                index=index,
-                data=data,
-                campaign_id=campaign_id,
-                theme_id=theme_id,
-                validation_rules=validation_rules,
-            )
-
-    async def _do_validate_character(
+    def _to_validation_result(
         self,
         index: int,
-        data: Dict[str, Any],
-        campaign_id: Optional[UUID] = None,
-        theme_id: Optional[UUID] = None,
-        validation_rules: Optional[List[str]] = None,
+        summary: ValidationSummary,
     ) -> ValidationResult:
-        """Perform character validation.
+        """Convert a validation summary into a bulk validation result.
 
         Args:
             index: Character index in batch
-            data: Character data
-            campaign_id: Optional campaign ID
-            theme_id: Optional theme ID
-            validation_rules: Optional specific rules to validate
+            summary: Validation summary from the executor
 
         Returns:
             Validation result
         """
-        try:
-            # Add campaign and theme context if provided
-            if campaign_id:
-                data["campaign_id"] = campaign_id
-            if theme_id:
-                data["theme_id"] = theme_id
-
-            # Validate character data
-            validation_result = await self.validation_service.validate_character(
-                data=data,
-                rules=validation_rules,
-            )
-
-            return ValidationResult(
-                index=index,
-                is_valid=validation_result.is_valid,
-                errors=validation_result.errors,
-                warnings=validation_result.warnings,
-            )
-
-        except Exception as e:
-            return ValidationResult(
-                index=index,
-                is_valid=False,
-                errors=[
-                    {
-                        "error_type": "validation_error",
-                        "message": str(e),
-                    }
-                ],
-                warnings=[],
-            )
+        errors = []
+        warnings = []
+        for result in summary.results:
+            for issue in result.issues:
+                entry = {
+                    "error_type": issue.rule_id,
+                    "message": issue.message,
+                    "field": issue.field,
+                }
+                if issue.severity == "error":
+                    errors.append(entry)
+                elif issue.severity == "warning":
+                    warnings.append(entry)
+
+        return ValidationResult(
+            index=index,
+            is_valid=summary.passed,
+            errors=errors,
+            warnings=warnings,
+        )
 
     async def _create_character(
         self,
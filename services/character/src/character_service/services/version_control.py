@@ -1,32 +1,69 @@
-"""Version control service for managing character versions."""
+"""Version control service for managing character versions.
+
+Versions are delta-encoded: every ``keyframe_interval``-th version along a
+branch stores the full character state, the others store a JSON patch from
+their parent. Any version is reconstructed from its nearest keyframe plus at
+most ``keyframe_interval - 1`` patches.
+"""
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID
 
 from deepdiff import DeepDiff
+from sqlalchemy import insert, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from character_service.repositories.version_repository import VersionRepository
+from character_service.utils import json_patch
 from character_service.domain.version import (
     CharacterVersion,
+    CharacterVersionAncestry,
     CharacterChange,
     VersionMetadata,
     ChangeType,
     ChangeSource,
 )
 
+# Versions between full-state keyframes along a branch
+KEYFRAME_INTERVAL = 20
+
+# Version columns needed to draw the tree, without states or patches
+NODE_COLUMNS = (
+    CharacterVersion.id,
+    CharacterVersion.character_id,
+    CharacterVersion.parent_version_id,
+    CharacterVersion.label,
+    CharacterVersion.description,
+    CharacterVersion.is_active,
+    CharacterVersion.created_at,
+    CharacterVersion.created_by,
+)
+
 
 class VersionControlService:
     """Service for managing character versions."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        repository: Optional[Any] = None,
+    ):
         """Initialize the service.
 
         Args:
             session: Database session
+            keyframe_interval: Store the full state every this many versions
+            repository: Version repository, by default one on the session
         """
+        if repository is None:
+            from character_service.repositories.version_repository import VersionRepository
+            repository = VersionRepository(session)
+
         self.session = session
-        self.repository = VersionRepository(session)
+        self.repository = repository
+        self.keyframe_interval = keyframe_interval
 
     async def create_version(
         self,
@@ -54,24 +91,31 @@ class VersionControlService:
         """
         # Get parent version state if any
         parent_state = None
+        keyframe_distance = 0
         if parent_version_id:
-            parent_version = await self.repository.get_version(parent_version_id)
-            if parent_version:
-                parent_state = parent_version.state
+            chain = await self._load_chain(parent_version_id)
+            if chain:
+                parent_state = self._replay(chain)
+                keyframe_distance = chain[0].keyframe_distance + 1
 
         # Calculate changes from parent
-        changes = self._calculate_changes(parent_state, current_state) if parent_state else []
+        patch = json_patch.diff(parent_state, current_state) if parent_state else []
+        changes = self._calculate_changes(parent_state, patch) if parent_state else []
 
-        # Create version
+        # Store the full state on keyframes, a patch from the parent otherwise
+        is_keyframe = not parent_state or keyframe_distance >= self.keyframe_interval
         version = await self.repository.create_version(
             character_id=character_id,
-            state=current_state,
+            state=current_state if is_keyframe else None,
+            patch=None if is_keyframe else patch,
+            keyframe_distance=0 if is_keyframe else keyframe_distance,
             changes=changes,
             parent_version_id=parent_version_id,
             label=label,
             description=description,
             created_by=created_by,
         )
+        await self._index_ancestry(version)
 
         # Record detailed changes
         if changes:
@@ -88,6 +132,26 @@ class VersionControlService:
 
         return version
 
+    async def get_version_state(self, version: CharacterVersion) -> Dict[str, Any]:
+        """Reconstruct the character state of a version.
+
+        Args:
+            version: The version
+
+        Returns:
+            The complete character state
+
+        Raises:
+            ValueError: If an ancestor needed to rebuild the state is missing
+        """
+        if version.keyframe_distance == 0:
+            chain = [version]
+        else:
+            chain = await self._load_chain(version.id)
+        if not chain:
+            raise ValueError(f"Cannot reconstruct version {version.id}: missing ancestor")
+        return self._replay(chain)
+
     async def get_version_history(
         self,
         character_id: UUID,
@@ -117,6 +181,8 @@ class VersionControlService:
     ) -> List[Dict[str, Any]]:
         """Get the version tree for a character.
 
+        Only node metadata is loaded, never version states.
+
         Args:
             character_id: The character ID
             root_version_id: Optional root version ID
@@ -124,11 +190,15 @@ class VersionControlService:
         Returns:
             List of version nodes with tree structure
         """
-        # Get versions
-        versions = await self.repository.get_version_tree(
-            character_id=character_id,
-            root_version_id=root_version_id,
-        )
+        # Get versions, limited to the subtree of the root if given
+        query = select(*NODE_COLUMNS).where(CharacterVersion.character_id == character_id)
+        if root_version_id:
+            query = query.join(
+                CharacterVersionAncestry,
+                CharacterVersionAncestry.descendant_id == CharacterVersion.id,
+            ).where(CharacterVersionAncestry.ancestor_id == root_version_id)
+        result = await self.session.execute(query.order_by(CharacterVersion.created_at))
+        versions = result.all()
 
         # Build tree structure
         tree = []
@@ -136,17 +206,85 @@ class VersionControlService:
 
         for version in versions:
             version_dict = version_map[version.id]
-            if version.parent_version_id:
-                parent = version_map.get(version.parent_version_id)
-                if parent:
-                    if "children" not in parent:
-                        parent["children"] = []
-                    parent["children"].append(version_dict)
+            parent = version_map.get(version.parent_version_id)
+            if parent:
+                parent.setdefault("children", []).append(version_dict)
             else:
                 tree.append(version_dict)
 
         return tree
 
+    async def get_branch(
+        self,
+        version_id: UUID,
+        character_id: Optional[UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the lineage of a version.
+
+        Args:
+            version_id: The version ID
+            character_id: Optional character ID for validation
+
+        Returns:
+            Version nodes from the root down to the version
+        """
+        query = (
+            select(*NODE_COLUMNS)
+            .join(
+                CharacterVersionAncestry,
+                CharacterVersionAncestry.ancestor_id == CharacterVersion.id,
+            )
+            .where(CharacterVersionAncestry.descendant_id == version_id)
+            .order_by(CharacterVersionAncestry.depth.desc())
+        )
+        if character_id:
+            query = query.where(CharacterVersionAncestry.character_id == character_id)
+        result = await self.session.execute(query)
+        return [self._version_to_dict(v) for v in result.all()]
+
+    async def get_common_ancestor(
+        self,
+        version_a_id: UUID,
+        version_b_id: UUID,
+        character_id: Optional[UUID] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the lowest common ancestor of two versions.
+
+        Args:
+            version_a_id: First version ID
+            version_b_id: Second version ID
+            character_id: Optional character ID for validation
+
+        Returns:
+            The ancestor ID and its distance from each version, if any
+        """
+        ancestry_a = aliased(CharacterVersionAncestry)
+        ancestry_b = aliased(CharacterVersionAncestry)
+        query = (
+            select(
+                ancestry_a.ancestor_id,
+                ancestry_a.depth.label("distance_a"),
+                ancestry_b.depth.label("distance_b"),
+            )
+            .join(ancestry_b, ancestry_b.ancestor_id == ancestry_a.ancestor_id)
+            .where(
+                ancestry_a.descendant_id == version_a_id,
+                ancestry_b.descendant_id == version_b_id,
+            )
+            .order_by(ancestry_a.depth + ancestry_b.depth)
+            .limit(1)
+        )
+        if character_id:
+            query = query.where(ancestry_a.character_id == character_id)
+        row = (await self.session.execute(query)).first()
+        if not row:
+            return None
+        return {
+            "ancestor_id": row.ancestor_id,
+            "distance_a": row.distance_a,
+            "distance_b": row.distance_b,
+        }
+
     async def compare_versions(
         self,
         version_a_id: UUID,
@@ -171,7 +309,10 @@ class VersionControlService:
             raise ValueError("One or both versions not found")
 
         # Calculate differences
-        diff = DeepDiff(version_a.state, version_b.state)
+        diff = DeepDiff(
+            await self.get_version_state(version_a),
+            await self.get_version_state(version_b),
+        )
 
         # Get changes between versions
         changes_a = await self.repository.get_version_changes(version_a_id, character_id)
@@ -179,6 +320,9 @@ class VersionControlService:
 
         return {
             "diff": diff,
+            "common_ancestor": await self.get_common_ancestor(
+                version_a_id, version_b_id, character_id
+            ),
             "changes": {
                 "version_a": [self._change_to_dict(c) for c in changes_a],
                 "version_b": [self._change_to_dict(c) for c in changes_b],
@@ -238,64 +382,119 @@ class VersionControlService:
     def _calculate_changes(
         self,
         old_state: Dict[str, Any],
-        new_state: Dict[str, Any],
+        patch: json_patch.Patch,
     ) -> List[Dict[str, Any]]:
         """Calculate changes between states.
 
         Args:
             old_state: Previous state
-            new_state: Current state
+            patch: Patch from the previous to the current state
 
         Returns:
             List of changes
         """
-        diff = DeepDiff(old_state, new_state, ignore_order=True)
-        changes = []
-
-        # Handle value changes
-        for path, change in diff.get("values_changed", {}).items():
-            changes.append({
-                "type": self._determine_change_type(path),
-                "path": path,
-                "old_value": change["old_value"],
-                "new_value": change["new_value"],
-            })
+        return [
+            {
+                "type": self._determine_change_type(operation["path"]),
+                "path": operation["path"],
+                "old_value": (
+                    json_patch.resolve(old_state, operation["path"])
+                    if operation["op"] != "add"
+                    else None
+                ),
+                "new_value": operation.get("value"),
+            }
+            for operation in patch
+        ]
+
+    async def _load_chain(self, version_id: UUID) -> List[CharacterVersion]:
+        """Load a version and its ancestors up to the nearest keyframe.
+
+        The keyframe is ``keyframe_distance`` levels up, so the whole chain
+        comes from one query on the ancestry index.
 
-        # Handle dictionary changes
-        for path, change in diff.get("dictionary_item_added", {}).items():
-            changes.append({
-                "type": self._determine_change_type(path),
-                "path": path,
-                "old_value": None,
-                "new_value": change,
-            })
+        Args:
+            version_id: The version ID
 
-        for path, change in diff.get("dictionary_item_removed", {}).items():
-            changes.append({
-                "type": self._determine_change_type(path),
-                "path": path,
-                "old_value": change,
-                "new_value": None,
-            })
+        Returns:
+            The versions from the version up to the keyframe, empty if the
+            version does not exist
 
-        # Handle list changes
-        for path, change in diff.get("iterable_item_added", {}).items():
-            changes.append({
-                "type": self._determine_change_type(path),
-                "path": path,
-                "old_value": None,
-                "new_value": change,
-            })
+        Raises:
+            ValueError: If an ancestor needed to rebuild the state is missing
+        """
+        keyframe_depth = (
+            select(CharacterVersion.keyframe_distance)
+            .where(CharacterVersion.id == version_id)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(CharacterVersion)
+            .join(
+                CharacterVersionAncestry,
+                CharacterVersionAncestry.ancestor_id == CharacterVersion.id,
+            )
+            .where(
+                CharacterVersionAncestry.descendant_id == version_id,
+                CharacterVersionAncestry.depth <= keyframe_depth,
+            )
+            .order_by(CharacterVersionAncestry.depth)
+        )
 
-        for path, change in diff.get("iterable_item_removed", {}).items():
-            changes.append({
-                "type": self._determine_change_type(path),
-                "path": path,
-                "old_value": change,
-                "new_value": None,
-            })
+        chain = []
+        for version in result.scalars():
+            chain.append(version)
+            if version.keyframe_distance == 0:
+                break
+        if chain and len(chain) != chain[0].keyframe_distance + 1:
+            raise ValueError(f"Cannot reconstruct version {version_id}: missing ancestor")
+        return chain
 
-        return changes
+    @staticmethod
+    def _replay(chain: List[CharacterVersion]) -> Dict[str, Any]:
+        """Rebuild the state of the first version of a chain.
+
+        Args:
+            chain: The version and its ancestors up to the nearest keyframe
+
+        Returns:
+            The complete character state
+        """
+        return json_patch.apply_patch(
+            chain[-1].state,
+            [operation for v in reversed(chain[:-1]) for operation in v.patch or []],
+        )
+
+    async def _index_ancestry(self, version: CharacterVersion) -> None:
+        """Add a new version to the ancestry index.
+
+        Args:
+            version: The new version
+        """
+        # The version is its own ancestor at depth 0 ...
+        self.session.add(
+            CharacterVersionAncestry(
+                ancestor_id=version.id,
+                descendant_id=version.id,
+                character_id=version.character_id,
+                depth=0,
+            )
+        )
+        if not version.parent_version_id:
+            return
+
+        # ... and inherits every ancestor of its parent, one level further down
+        await self.session.execute(
+            insert(CharacterVersionAncestry).from_select(
+                ["ancestor_id", "descendant_id", "character_id", "depth"],
+                select(
+                    CharacterVersionAncestry.ancestor_id,
+                    literal(version.id, PGUUID),
+                    literal(version.character_id, PGUUID),
+                    CharacterVersionAncestry.depth + 1,
+                ).where(CharacterVersionAncestry.descendant_id == version.parent_version_id),
+            )
+        )
 
     def _determine_change_type(self, path: str) -> ChangeType:
         """Determine change type from path.
@@ -0,0 +1,170 @@
+"""JSON patches (RFC 6902) between character states.
+
+The differ walks both documents once in order: objects key by key, lists by
+trimming their common prefix and suffix and pairing what is left, so its cost
+is linear in the size of the documents rather than quadratic like an
+order-insensitive comparison. Only ``add``, ``remove`` and ``replace``
+operations are produced and applied.
+"""
+from copy import deepcopy
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: Any) -> str:
+    """Escape a key for use in a JSON pointer."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """Unescape a JSON pointer reference token."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _tokens(pointer: str) -> List[str]:
+    """Split a JSON pointer into reference tokens."""
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def _child(container: Any, token: str) -> Any:
+    """Get the child of a container by reference token."""
+    if isinstance(container, list):
+        return container[int(token)]
+    return container[token]
+
+
+def diff(old: Any, new: Any) -> Patch:
+    """Create a patch turning one document into another.
+
+    Args:
+        old: Source document
+        new: Target document
+
+    Returns:
+        Patch operations, in the order they must be applied
+    """
+    patch: Patch = []
+    _diff(old, new, "", patch)
+    return patch
+
+
+def _diff(old: Any, new: Any, path: str, patch: Patch) -> None:
+    """Append the operations turning old into new at path."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, f"{path}/{_escape(key)}", patch)
+            else:
+                patch.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, patch)
+    elif type(old) is not type(new) or old != new:
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def _diff_list(old: List[Any], new: List[Any], path: str, patch: Patch) -> None:
+    """Append the operations turning one list into another."""
+    # Trim the unchanged prefix and suffix; an insertion or removal anywhere
+    # in the list becomes a single operation
+    start, old_end, new_end = 0, len(old), len(new)
+    while start < old_end and start < new_end and old[start] == new[start]:
+        start += 1
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    # Diff the remaining items pairwise, then drop or insert the rest
+    paired = min(old_end, new_end) - start
+    for index in range(start, start + paired):
+        _diff(old[index], new[index], f"{path}/{index}", patch)
+    for index in reversed(range(start + paired, old_end)):
+        patch.append({"op": "remove", "path": f"{path}/{index}"})
+    for index in range(start + paired, new_end):
+        patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+
+
+def resolve(document: Any, pointer: str) -> Any:
+    """Get the value a JSON pointer refers to.
+
+    Args:
+        document: Document to search
+        pointer: JSON pointer
+
+    Returns:
+        Referenced value, or None if it does not exist
+    """
+    value = document
+    try:
+        for token in _tokens(pointer):
+            value = _child(value, token)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    return value
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """Apply a patch to a copy of a document.
+
+    Args:
+        document: Document to patch; left unchanged
+        patch: Patch operations
+
+    Returns:
+        Patched document
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist
+    """
+    result = deepcopy(document)
+    for operation in patch:
+        result = _apply_operation(result, operation)
+    return result
+
+
+def _apply_operation(document: Any, operation: Dict[str, Any]) -> Any:
+    """Apply one operation in place, returning the (possibly new) root."""
+    op, path = operation.get("op"), operation.get("path", "")
+    tokens = _tokens(path)
+    if op not in ("add", "remove", "replace"):
+        raise ValueError(f"Unsupported patch operation: {op}")
+    if not tokens:
+        if op == "remove":
+            raise ValueError("Cannot remove the document root")
+        return deepcopy(operation["value"])
+
+    try:
+        parent = document
+        for token in tokens[:-1]:
+            parent = _child(parent, token)
+        key = tokens[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if key == "-" else int(key)
+            if op == "add":
+                if index > len(parent):
+                    raise IndexError(index)
+                parent.insert(index, deepcopy(operation["value"]))
+            elif op == "remove":
+                del parent[index]
+            else:
+                parent[index] = deepcopy(operation["value"])
+        elif op == "add":
+            parent[key] = deepcopy(operation["value"])
+        elif op == "remove":
+            del parent[key]
+        else:
+            if key not in parent:
+                raise KeyError(key)
+            parent[key] = deepcopy(operation["value"])
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise ValueError(f"Cannot apply {op} at {path}: {e}") from e
+
+    return document
@@ -0,0 +1,125 @@
+"""Test batching of storage service requests."""
+
+import asyncio
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pytest
+
+from character_service.clients.batching import BatchLoader
+from character_service.clients.storage_integration import StorageServiceClient
+from character_service.core.exceptions import StorageOperationError
+
+
+class BatchStoragePublisher:
+    """Publisher answering batch requests from a dict of characters."""
+
+    def __init__(self, characters: Dict[str, Dict[str, Any]]) -> None:
+        self.characters = characters
+        self.events: List[Dict[str, Any]] = []
+
+    async def publish_request(self, target_service: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        self.events.append(event)
+        await asyncio.sleep(0)
+        if event["type"] == "storage.fail.batch_get":
+            raise ConnectionError("storage unavailable")
+        return {"results": [
+            {"error": "invalid id"} if request["id"] == "broken"
+            else self.characters.get(request["id"])
+            for request in event["data"]["requests"]
+        ]}
+
+    async def publish_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        pass
+
+
+@pytest.fixture
+def characters() -> Dict[str, Dict[str, Any]]:
+    ids = [str(uuid4()) for _ in range(3)]
+    return {id: {"id": id, "name": f"Character {i}"} for i, id in enumerate(ids)}
+
+
+@pytest.fixture
+def publisher(characters) -> BatchStoragePublisher:
+    return BatchStoragePublisher(characters)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_request(publisher, characters):
+    """Gets issued together are sent as one batch and demultiplexed."""
+    client = StorageServiceClient(publisher)
+    ids = list(characters)
+    missing = uuid4()
+
+    results = await asyncio.gather(
+        *(client.get_character(id) for id in ids),
+        client.get_character(missing),
+    )
+
+    assert results == [characters[id] for id in ids] + [None]
+    assert len(publisher.events) == 1
+    assert publisher.events[0]["type"] == "storage.character.batch_get"
+    assert [r["id"] for r in publisher.events[0]["data"]["requests"]] == ids + [str(missing)]
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_deduplicated(publisher, characters):
+    """Identical queued and in-flight requests are sent once."""
+    loader = BatchLoader(publisher, "storage.character.batch_get")
+    id = next(iter(characters))
+
+    first = asyncio.ensure_future(loader.load({"id": id}))
+    await asyncio.sleep(0)
+    # The first request is in flight now
+    results = await asyncio.gather(first, loader.load({"id": id}), loader.load({"id": id}))
+
+    assert results == [characters[id]] * 3
+    assert len(publisher.events) == 1
+    assert len(publisher.events[0]["data"]["requests"]) == 1
+
+    # Completed requests are not cached
+    await loader.load({"id": id})
+    assert len(publisher.events) == 2
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_size(publisher, characters):
+    """Batches larger than the maximum size are sent in several messages."""
+    loader = BatchLoader(publisher, "storage.character.batch_get", max_batch_size=2)
+
+    await asyncio.gather(*(loader.load({"id": id}) for id in characters))
+
+    assert [len(e["data"]["requests"]) for e in publisher.events] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_every_request(publisher):
+    """An error sending a batch is raised to each of its callers."""
+    loader = BatchLoader(publisher, "storage.fail.batch_get")
+
+    results = await asyncio.gather(
+        loader.load({"id": "a"}),
+        loader.load({"id": "b"}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert not loader._in_flight
+
+
+@pytest.mark.asyncio
+async def test_failed_item_fails_only_its_request(publisher, characters):
+    """An error answering one request is raised to its callers alone."""
+    loader = BatchLoader(publisher, "storage.character.batch_get")
+    id = next(iter(characters))
+
+    results = await asyncio.gather(
+        loader.load({"id": "broken"}),
+        loader.load({"id": id}),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], StorageOperationError)
+    assert "invalid id" in str(results[0])
+    assert results[1] == characters[id]
+    assert len(publisher.events) == 1
@@ -0,0 +1,59 @@
+"""Tests for the compiled D&D 5e (2024) rules tables."""
+import pytest
+
+from character_service.core.validation.rules import dnd5e_data as tables
+
+
+def test_every_class_has_a_row_in_every_table():
+    """Compiled tables cover all classes at all levels."""
+    count = len(tables.CLASSES)
+    for table in (tables.FEATURES, tables.SPELL_SLOTS, tables.ASI_COUNTS,
+                  tables.SKILL_EXPERTISE, tables.TOOL_EXPERTISE, tables.CASTER_LEVELS):
+        assert len(table) == count
+        assert all(len(row) == tables.MAX_LEVEL + 1 for row in table)
+    assert len(tables.SAVING_THROWS) == len(tables.SKILL_CHOICES) == count
+
+
+def test_features_accumulate_by_level():
+    """Features gained at earlier levels are kept at later ones."""
+    assert tables.class_features("fighter", 1) == {"Fighting Style", "Second Wind"}
+    assert tables.class_features("fighter", 2) > tables.class_features("fighter", 1)
+    assert "Epic Boon" in tables.class_features("fighter", 20)
+    assert tables.class_features("homebrew", 5) == frozenset()
+
+
+@pytest.mark.parametrize("char_class,level,expected", [
+    ("wizard", 1, (0, 2, 0, 0, 0, 0, 0, 0, 0, 0)),
+    ("wizard", 5, (0, 4, 3, 2, 0, 0, 0, 0, 0, 0)),
+    ("paladin", 5, (0, 4, 2, 0, 0, 0, 0, 0, 0, 0)),
+    ("fighter", 2, (0,) * 10),
+    ("rogue", 7, (0, 4, 2, 0, 0, 0, 0, 0, 0, 0)),
+    ("warlock", 11, (0, 0, 0, 0, 0, 3, 0, 0, 0, 0)),
+])
+def test_spell_slots(char_class, level, expected):
+    """Slot tables follow each class's caster progression."""
+    assert tables.spell_slots(char_class, level) == expected
+
+
+def test_level_lookups_clamp():
+    """Levels outside 0-20 read the nearest row rather than failing."""
+    assert tables.asi_count("fighter", 25) == tables.asi_count("fighter", 20) == 7
+    assert tables.asi_count("rogue", 10) == 3
+    assert tables.skill_expertise("rogue", -1) == 0
+    assert tables.skill_expertise("rogue", 6) == 4
+
+
+def test_point_buy_costs():
+    """Only scores from 8 to 16 can be bought."""
+    assert tables.point_buy_cost(8) == 0
+    assert tables.point_buy_cost(16) == 11
+    assert tables.point_buy_cost(17) is None
+    assert tables.point_buy_cost("15") is None
+
+
+def test_tables_are_immutable():
+    """Compiled tables cannot be changed by callers."""
+    with pytest.raises(TypeError):
+        tables.CLASS_INDEX["homebrew"] = 0
+    with pytest.raises(AttributeError):
+        tables.saving_throws("fighter").add("wisdom")
@@ -0,0 +1,129 @@
+"""Tests for the process pool validation executor."""
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from character_service.core.exceptions import ValidationError
+from character_service.core.validation import RuleCategory, ValidationRule
+from character_service.core.validation.executor import (
+    ValidationExecutor,
+    character_snapshot,
+    default_rules,
+    select_rules,
+)
+from character_service.core.validation.rules.dnd5e import (
+    AbilityScoreRule,
+    ClassProgressionRule,
+    ProficiencyRule,
+)
+
+
+def core_rules() -> List[ValidationRule]:
+    """Rules for worker processes; must be a module-level function."""
+    return [AbilityScoreRule(), ClassProgressionRule(), ProficiencyRule()]
+
+
+def fighter(name: str, strength: int = 16) -> dict:
+    """Character data for a valid level 1 fighter."""
+    return {
+        "name": name,
+        "character_class": "fighter",
+        "level": 1,
+        "ability_scores": {
+            "strength": strength,
+            "dexterity": 14,
+            "constitution": 13,
+            "intelligence": 12,
+            "wisdom": 11,
+            "charisma": 10,
+        },
+        "ability_score_method": "standard_array",
+        "class_features": [{"name": "Fighting Style"}, {"name": "Second Wind"}],
+        "skills": {"athletics": {"proficient": True}},
+        "saving_throws": {"strength": True, "constitution": True},
+    }
+
+
+@pytest.fixture
+def executor():
+    """Executor with two workers and small chunks."""
+    executor = ValidationExecutor(rule_factory=core_rules, max_workers=2, chunk_size=5)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_validate_many_in_worker_processes(executor: ValidationExecutor):
+    """Chunks are validated in workers and summaries keep the input order."""
+    characters = [character_snapshot(fighter(f"Fighter {i}")) for i in range(23)]
+    characters[7].character_data["ability_scores"]["strength"] = 25
+
+    summaries = await executor.validate_many(characters)
+
+    assert executor._pool is not None
+    assert [s.character_id for s in summaries] == [c.id for c in characters]
+    assert [s.passed for s in summaries] == [i != 7 for i in range(23)]
+    assert {r.rule_id for r in summaries[0].results} == {
+        "core.ability_scores", "core.class_progression", "core.proficiencies"
+    }
+    assert any(
+        issue.field == "ability_scores.strength"
+        for result in summaries[7].results for issue in result.issues
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_batches_run_in_process(executor: ValidationExecutor):
+    """Batches of up to one chunk do not start workers."""
+    summaries = await executor.validate_many([character_snapshot(fighter("Solo"))])
+
+    assert summaries[0].passed
+    assert executor._pool is None
+
+
+@pytest.mark.asyncio
+async def test_rule_ids_run_with_dependencies(executor: ValidationExecutor):
+    """Selecting a rule also runs the rules it depends on."""
+    summaries = await executor.validate_many(
+        [character_snapshot(fighter("Solo"))], rule_ids=["core.class_progression"]
+    )
+
+    assert {r.rule_id for r in summaries[0].results} == {
+        "core.ability_scores", "core.class_progression"
+    }
+
+
+@pytest.mark.asyncio
+async def test_default_rules_run():
+    """The default factory builds every standard rule and validates with them."""
+    executor = ValidationExecutor()
+    try:
+        summaries = await executor.validate_many([character_snapshot(fighter("Solo"))])
+    finally:
+        executor.shutdown()
+
+    assert {r.rule_id for r in summaries[0].results} == {
+        rule.rule_id for rule in default_rules()
+    }
+    assert all(r.rule_id != "executor" for r in summaries[0].results)
+
+
+def test_select_rules():
+    """Rules are selected by category and id; unknown ids are rejected."""
+    rules = core_rules()
+
+    assert select_rules(rules, categories=[RuleCategory.THEME]) == []
+    assert len(select_rules(rules, categories=[RuleCategory.BASE])) == 3
+    with pytest.raises(ValidationError):
+        select_rules(rules, rule_ids=["core.unknown"])
+
+
+def test_character_snapshot_keeps_data():
+    """Snapshots wrap the submitted data as an unsaved character."""
+    campaign_id = uuid4()
+    snapshot = character_snapshot(fighter("Imported"), campaign_id=campaign_id)
+
+    assert snapshot.name == "Imported"
+    assert snapshot.campaign_id == campaign_id
+    assert snapshot.character_data["character_class"] == "fighter"
@@ -0,0 +1,179 @@
+"""Tests for the validation result cache."""
+import json
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from character_service.core.validation import (
+    BaseValidationRule,
+    RuleCategory,
+    ValidationResult,
+    ValidationResultCache,
+    ValidationSeverity,
+)
+from character_service.core.validation.cache import (
+    changed_fields,
+    field_digests,
+    structural_digest,
+)
+from character_service.core.validation.engine import DefaultValidationEngine
+from character_service.domain.models import Character
+
+
+class FieldRule(BaseValidationRule):
+    """Rule reading one field, counting its runs."""
+
+    def __init__(self, rule_id: str, field: str, dependencies: List[str] = None) -> None:
+        """Initialize rule."""
+        super().__init__(rule_id, RuleCategory.BASE, dependencies)
+        self.fields = {field}
+        self.runs = 0
+
+    async def validate(self, character: Character) -> ValidationResult:
+        """Fail when the field is missing."""
+        self.runs += 1
+        field = next(iter(self.fields))
+        if field in character.character_data:
+            return self.create_result(character, passed=True)
+        return self.create_result(
+            character,
+            passed=False,
+            issues=[
+                self.create_issue(
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Missing {field}",
+                    field=field,
+                )
+            ],
+        )
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self) -> None:
+        """Initialize store."""
+        self.data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value."""
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        """Set a value."""
+        self.data[key] = value
+
+
+def make_character(**data) -> Character:
+    """Create a character holding the given data."""
+    return Character(
+        id=uuid4(),
+        parent_id=None,
+        theme="traditional",
+        name="Test",
+        user_id=uuid4(),
+        campaign_id=uuid4(),
+        character_data=data,
+    )
+
+
+def test_digests_ignore_key_order():
+    """Equal content gives equal digests; edits change only their field."""
+    first = make_character(level=1, ability_scores={"strength": 16, "dexterity": 14})
+    second = make_character(ability_scores={"dexterity": 14, "strength": 16}, level=1)
+    second.campaign_id = first.campaign_id
+
+    assert field_digests(first) == field_digests(second)
+    assert structural_digest(field_digests(first)) == structural_digest(field_digests(second))
+
+    second.character_data["level"] = 2
+    assert changed_fields(field_digests(first), field_digests(second)) == {"level"}
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    """The least recently used result set is evicted first."""
+    cache = ValidationResultCache(maxsize=2)
+    character_id = uuid4()
+    for key in ("a", "b"):
+        await cache.set(key, {})
+    await cache.get("a", character_id)
+    await cache.set("c", {})
+
+    assert await cache.get("b", character_id) is None
+    assert await cache.get("a", character_id) == {}
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_shares_results():
+    """Results stored by one cache are read back by another through Redis."""
+    redis = FakeRedis()
+    rule = FieldRule("test.level", "level")
+    character = make_character(name="Test")
+    result = await rule.validate(character)
+
+    await ValidationResultCache(redis=redis).set("key", {rule.rule_id: result})
+    other = ValidationResultCache(redis=redis)
+    cached = await other.get("key", character.id)
+
+    assert json.loads(redis.data["character:validation:key"])
+    assert cached == {rule.rule_id: result}
+    assert other.get_stats()["redis_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_characters_share_results():
+    """A character with the same content reuses results under its own ID."""
+    engine = DefaultValidationEngine()
+    rule = FieldRule("test.level", "level")
+    await engine.add_rule(rule)
+
+    first = make_character(level=1)
+    second = make_character(level=1)
+    second.campaign_id = first.campaign_id
+    await engine.validate(first)
+    results = await engine.validate(second)
+
+    assert rule.runs == 1
+    assert results[0].character_id == second.id
+
+
+@pytest.mark.asyncio
+async def test_only_affected_rules_rerun():
+    """Editing a field re-runs the rules reading it and their dependents."""
+    engine = DefaultValidationEngine()
+    level = FieldRule("test.level", "level")
+    scores = FieldRule("test.scores", "ability_scores")
+    derived = FieldRule("test.derived", "name", dependencies=["test.level"])
+    for rule in (level, scores, derived):
+        await engine.add_rule(rule)
+
+    character = make_character(level=1, ability_scores={"strength": 16}, name="Test")
+    await engine.validate(character)
+    character.character_data["level"] = 2
+    results = await engine.validate(character)
+
+    assert (level.runs, scores.runs, derived.runs) == (2, 1, 2)
+    assert all(result.passed for result in results)
+
+    # Without incremental validation every rule runs
+    await engine.validate(character, incremental=False)
+    assert (level.runs, scores.runs, derived.runs) == (3, 2, 3)
+
+
+@pytest.mark.asyncio
+async def test_rule_changes_invalidate_results():
+    """Adding a rule changes the key, so cached results are not reused."""
+    engine = DefaultValidationEngine()
+    level = FieldRule("test.level", "level")
+    await engine.add_rule(level)
+    character = make_character(level=1)
+    await engine.validate(character)
+
+    await engine.add_rule(FieldRule("test.name", "name"))
+    results = await engine.validate(character)
+
+    assert level.runs == 2
+    assert {r.rule_id: r.passed for r in results} == {"test.level": True, "test.name": False}
@@ -0,0 +1,93 @@
+"""Micro-benchmark for the D&D 5e (2024) rules."""
+import random
+import time
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from character_service.core.validation.rules import dnd5e_data as tables
+from character_service.core.validation.rules.dnd5e import (
+    AbilityScoreRule,
+    ClassProgressionRule,
+    EquipmentRule,
+    FeatsRule,
+    LanguageAndToolsRule,
+    MulticlassRule,
+    ProficiencyRule,
+    SpellSystemRule,
+)
+from character_service.domain.models import Character
+
+CHARACTER_COUNT = 10_000
+TARGET_PER_SECOND = 10_000
+
+
+def synthetic_characters(count: int, seed: int = 2024) -> List[Character]:
+    """Create characters of every class and level with table-consistent data."""
+    rng = random.Random(seed)
+    characters = []
+    for _ in range(count):
+        char_class = rng.choice(tables.CLASSES)
+        level = rng.randint(1, tables.MAX_LEVEL)
+        slots = tables.spell_slots(char_class, level)
+        skills = rng.sample(sorted(tables.VALID_SKILLS), tables.skill_choices(char_class))
+        characters.append(Character(
+            id=uuid4(),
+            parent_id=None,
+            theme="traditional",
+            name=f"{char_class} {level}",
+            user_id=uuid4(),
+            campaign_id=uuid4(),
+            character_data={
+                "character_class": char_class,
+                "level": level,
+                "subclass": "test" if level >= 3 else None,
+                "epic_boon": "boon_of_fate" if level == 20 else None,
+                "ability_scores": dict(zip(tables.ABILITIES, (16, 14, 13, 12, 11, 10))),
+                "ability_score_method": "standard_array",
+                "class_features": [
+                    {"name": name} for name in tables.class_features(char_class, level)
+                ],
+                "skills": {skill: {"proficient": True} for skill in skills},
+                "saving_throws": dict.fromkeys(tables.saving_throws(char_class), True),
+                "feats": [{"name": "Skilled", "source": "background"}],
+                "spell_slots": {
+                    str(spell_level): count
+                    for spell_level, count in enumerate(slots) if count
+                },
+                "languages": ["common"],
+                "equipment": [{"name": "Backpack", "weight": 5}],
+            },
+        ))
+    return characters
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_rules_validate_ten_thousand_characters_per_second():
+    """All core rules run over 10k synthetic characters in a second on one core."""
+    rules = [
+        AbilityScoreRule(),
+        ClassProgressionRule(),
+        ProficiencyRule(),
+        FeatsRule(),
+        SpellSystemRule(),
+        MulticlassRule(),
+        EquipmentRule(),
+        LanguageAndToolsRule(),
+    ]
+    characters = synthetic_characters(CHARACTER_COUNT)
+
+    start = time.perf_counter()
+    failed = 0
+    for character in characters:
+        for rule in rules:
+            result = await rule.validate(character)
+            failed += not result.passed
+    duration = time.perf_counter() - start
+
+    rate = CHARACTER_COUNT / duration
+    print(f"\n{rate:,.0f} characters/sec ({duration * 1e6 / CHARACTER_COUNT:.1f} µs each)")
+    assert failed == 0
+    assert rate >= TARGET_PER_SECOND
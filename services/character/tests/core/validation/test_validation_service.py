@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from character_service.core.validation import (
     BaseValidationRule,
     RuleCategory,
+    ValidationExecutor,
     ValidationResult,
     ValidationSeverity,
 )
@@ -80,17 +81,27 @@ def validation_repo() -> ValidationStateRepository:
     return MagicMock(spec=ValidationStateRepository)
 
 
+@pytest.fixture
+def validation_executor() -> ValidationExecutor:
+    """Create validation executor shared by the services under test."""
+    executor = ValidationExecutor()
+    yield executor
+    executor.shutdown()
+
+
 @pytest.fixture
 def validation_service(
     db: AsyncSession,
     char_repo: CharacterRepository,
     validation_repo: ValidationStateRepository,
+    validation_executor: ValidationExecutor,
 ) -> ValidationService:
     """Create validation service."""
     return ValidationService(
         db=db,
         char_repository=char_repo,
         validation_repository=validation_repo,
+        validation_executor=validation_executor,
         cache_ttl=1,  # Short TTL for testing
     )
 
@@ -218,3 +229,22 @@ async def test_validation_state_tracking(
     assert state.error_count == 1
     assert len(state.details) == 1
     assert state.details[0]["rule_id"] == "test.rule"
+
+
+@pytest.mark.asyncio
+async def test_bulk_results_cached_apart_from_engine_results(
+    validation_service: ValidationService,
+    character: Character,
+):
+    """Executor results never stand in for the engine's, whose rules differ."""
+    rule = MockRule("test.rule", should_pass=False)
+    await validation_service.add_rule(rule)
+
+    single = await validation_service.validate_character(character.id)
+    bulk = (await validation_service.bulk_validate([character.id]))[character.id]
+
+    assert bulk is not single
+    assert "test.rule" not in {result.rule_id for result in bulk.results}
+    rule.validate_called = False
+    assert await validation_service.validate_character(character.id) is single
+    assert (await validation_service.bulk_validate([character.id]))[character.id] is bulk
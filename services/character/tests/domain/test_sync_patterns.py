@@ -0,0 +1,83 @@
+"""Tests for the subscription field pattern index."""
+from uuid import uuid4
+
+import pytest
+
+from character_service.domain.sync.models import StateChange, SyncDirection, SyncSubscription
+from character_service.domain.sync.patterns import FieldPatternIndex, compile_subscriptions
+from character_service.domain.sync.utils import extract_value, parse_path
+
+
+@pytest.fixture
+def index():
+    """Create an index with one subscriber per kind of pattern."""
+    index = FieldPatternIndex()
+    index.add("all", ["*"])
+    index.add("inventory", ["inventory.*"])
+    index.add("hp", ["hit_points.current", "hit_points.max"])
+    index.add("spell_levels", ["spells.*.level"])
+    return index
+
+
+@pytest.mark.parametrize("field_path,expected", [
+    ("name", {"all"}),
+    ("inventory", {"all", "inventory"}),
+    ("inventory.items.0", {"all", "inventory"}),
+    ("inventory_weight", {"all"}),
+    ("hit_points.current", {"all", "hp"}),
+    ("hit_points", {"all"}),
+    ("spells.fireball.level", {"all", "spell_levels"}),
+    ("spells.fireball.school", {"all"}),
+])
+def test_match(index, field_path, expected):
+    """Each path matches exactly the subscribers with a matching pattern."""
+    assert index.match(field_path) == expected
+
+
+def test_remove(index):
+    """Removed subscribers are no longer matched."""
+    index.remove("all")
+    index.remove("missing")
+
+    assert index.match("name") == set()
+    assert index.match("inventory.gold") == {"inventory"}
+    assert len(index) == 3
+
+
+def test_route_keeps_change_order(index):
+    """Changes are grouped per subscriber in the order given."""
+    changes = [
+        StateChange(character_id=uuid4(), campaign_id=None, field_path=path)
+        for path in ("hit_points.current", "inventory.gold", "hit_points.max")
+    ]
+
+    routed = index.route(changes)
+
+    assert [c.field_path for c in routed["hp"]] == ["hit_points.current", "hit_points.max"]
+    assert routed["all"] == changes
+    assert "spell_levels" not in routed
+
+
+def test_compiled_indexes_are_shared():
+    """Subscriptions with the same fields share one compiled index."""
+    character_id, campaign_id = uuid4(), uuid4()
+
+    def subscriptions():
+        return [
+            SyncSubscription(
+                character_id=character_id,
+                campaign_id=campaign_id,
+                fields=["inventory.*"],
+                sync_mode=SyncDirection.BIDIRECTIONAL,
+            )
+        ]
+
+    index = compile_subscriptions(subscriptions())
+    assert compile_subscriptions(subscriptions()) is index
+    assert index.match("inventory.gold") == {campaign_id}
+
+
+def test_parsed_paths_are_memoised():
+    """Field paths are parsed once and still extract values."""
+    assert parse_path("ability_scores.strength") is parse_path("ability_scores.strength")
+    assert extract_value({"ability_scores": {"strength": 16}}, "ability_scores.strength") == 16
@@ -0,0 +1,213 @@
+"""Tests for change-driven state synchronization."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from character_service.domain.sync.models import (
+    StateChange,
+    StateVersion,
+    SyncDirection,
+    SyncMetadata,
+    SyncSubscription,
+)
+from character_service.domain.sync.service import SynchronizationService
+
+
+@pytest.fixture
+def character_id():
+    """Create test character ID."""
+    return uuid4()
+
+
+@pytest.fixture
+def campaign_ids():
+    """Create test campaign IDs."""
+    return [uuid4(), uuid4()]
+
+
+@pytest.fixture
+def repositories(character_id, campaign_ids):
+    """Create mock repositories for a character with two subscriptions."""
+    subscription_repo = AsyncMock()
+    subscription_repo.list_for_character.return_value = [
+        SyncSubscription(
+            character_id=character_id,
+            campaign_id=campaign_ids[0],
+            fields=["*"],
+            sync_mode=SyncDirection.BIDIRECTIONAL,
+        ),
+        SyncSubscription(
+            character_id=character_id,
+            campaign_id=campaign_ids[1],
+            fields=["hit_points"],
+            sync_mode=SyncDirection.BIDIRECTIONAL,
+        ),
+    ]
+    subscription_repo.list_active.return_value = []
+
+    metadata_repo = AsyncMock()
+    metadata_repo.list_for_character.return_value = [
+        SyncMetadata(
+            character_id=character_id,
+            campaign_id=campaign_id,
+            character_version=version,
+            campaign_version=0,
+            last_sync=datetime.utcnow(),
+        )
+        for campaign_id, version in zip(campaign_ids, (1, 0))
+    ]
+
+    versions = [
+        StateVersion(
+            version=number,
+            timestamp=datetime.utcnow(),
+            changes=[
+                StateChange(
+                    character_id=character_id,
+                    campaign_id=None,
+                    field_path=field_path,
+                    new_value={"value": number},
+                )
+            ],
+        )
+        for number, field_path in ((1, "hit_points"), (2, "inventory"))
+    ]
+    state_repo = AsyncMock()
+    state_repo.get_latest.return_value = versions[-1]
+    state_repo.list_versions.return_value = versions
+
+    return {
+        "subscription_repository": subscription_repo,
+        "metadata_repository": metadata_repo,
+        "state_repository": state_repo,
+    }
+
+
+@pytest_asyncio.fixture
+async def sync_service(repositories):
+    """Create a started synchronization service."""
+    service = SynchronizationService(
+        db=AsyncMock(),
+        char_repository=AsyncMock(),
+        message_repository=AsyncMock(),
+        conflict_repository=AsyncMock(),
+        error_repository=AsyncMock(),
+        message_hub=AsyncMock(),
+        **repositories,
+    )
+    await service.start()
+    yield service
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_write_syncs_all_subscriptions(sync_service, repositories, character_id):
+    """A write is fanned out to every matching subscription in one pass."""
+    sync_service.mark_dirty(character_id)
+    await asyncio.wait_for(sync_service.wait_idle(), timeout=1)
+
+    repositories["state_repository"].list_versions.assert_awaited_once_with(
+        character_id, start_version=1, end_version=2, limit=2
+    )
+    messages = [
+        call.args[1]
+        for call in sync_service._message_hub.publish.await_args_list
+    ]
+    assert sorted(
+        [c["field_path"] for c in message["changes"]] for message in messages
+    ) == [["hit_points"], ["inventory"]]
+    assert repositories["metadata_repository"].update.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_burst_of_writes_coalesces(sync_service, repositories, character_id):
+    """Writes made while a character is queued result in a single sync."""
+    for _ in range(10):
+        sync_service.mark_dirty(character_id)
+    await asyncio.wait_for(sync_service.wait_idle(), timeout=1)
+
+    assert repositories["state_repository"].get_latest.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_subscriptions_are_not_polled(sync_service, repositories):
+    """Without writes, no subscription is loaded after start."""
+    await asyncio.sleep(0.05)
+
+    repositories["subscription_repository"].list_for_character.assert_not_awaited()
+    repositories["state_repository"].get_latest.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_workers_use_the_session_one_call_at_a_time(sync_service, repositories, campaign_ids):
+    """Workers syncing different characters never overlap repository calls."""
+    repositories["metadata_repository"].list_for_character.side_effect = lambda character_id: [
+        SyncMetadata(
+            character_id=character_id,
+            campaign_id=campaign_id,
+            character_version=0,
+            campaign_version=0,
+            last_sync=datetime.utcnow(),
+        )
+        for campaign_id in campaign_ids
+    ]
+    active = 0
+    overlapped = False
+
+    async def slow_call(*args, **kwargs):
+        nonlocal active, overlapped
+        active += 1
+        overlapped = overlapped or active > 1
+        await asyncio.sleep(0.001)
+        active -= 1
+
+    repositories["metadata_repository"].update.side_effect = slow_call
+    sync_service._message_repo.create.side_effect = slow_call
+
+    for _ in range(8):
+        sync_service.mark_dirty(uuid4())
+    await asyncio.wait_for(sync_service.wait_idle(), timeout=1)
+
+    assert repositories["metadata_repository"].update.await_count == 16
+    assert not overlapped
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_keeps_subscription_behind(sync_service, repositories, character_id):
+    """A subscription whose message was not published stays behind."""
+    sync_service._message_hub.publish.side_effect = [None, ConnectionError("hub down")]
+
+    sync_service.mark_dirty(character_id)
+    await asyncio.wait_for(sync_service.wait_idle(), timeout=1)
+
+    assert repositories["metadata_repository"].update.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_is_retried_after_backoff(sync_service, repositories, character_id):
+    """A character whose changes failed to publish is synced again without a new write."""
+    sync_service._retry_delay = 0.05
+    sync_service._message_hub.publish.side_effect = [
+        ConnectionError("hub down"),
+        ConnectionError("hub down"),
+        None,
+        None,
+    ]
+
+    sync_service.mark_dirty(character_id)
+    await asyncio.wait_for(sync_service.wait_idle(), timeout=1)
+    assert repositories["metadata_repository"].update.await_count == 0
+    assert sync_service._publish_failures[character_id] == 1
+
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if repositories["metadata_repository"].update.await_count == 2:
+            break
+
+    assert sync_service._message_hub.publish.await_count == 4
+    assert repositories["metadata_repository"].update.await_count == 2
+    assert character_id not in sync_service._publish_failures
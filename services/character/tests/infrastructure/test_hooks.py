@@ -10,6 +10,7 @@ from character_service.domain.models import (
     EventImpact,
 )
 from character_service.infrastructure.hooks import (
+    mark_character_for_sync,
     publish_event_impact,
     publish_character_update,
     publish_progress_update,
@@ -215,3 +216,13 @@ async def test_publish_progress_update_hook_default_type(
         test_progress,
         "other",
     )
+
+
+@pytest.mark.asyncio
+async def test_mark_character_for_sync_hook(test_character):
+    """Test sync hook queues the written character."""
+    sync_service = Mock()
+
+    await mark_character_for_sync(sync_service, test_character.id)
+
+    sync_service.mark_dirty.assert_called_once_with(test_character.id)
@@ -0,0 +1,58 @@
+"""Benchmark for routing sync changes to subscriptions."""
+import random
+import time
+from uuid import uuid4
+
+import pytest
+
+from character_service.domain.sync.models import StateChange
+from character_service.domain.sync.patterns import FieldPatternIndex
+
+SUBSCRIPTION_COUNT = 1_000
+PATTERNS_PER_SUBSCRIPTION = 50
+CHANGE_COUNT = 20_000
+TARGET_PER_SECOND = 20_000
+
+FIELDS = [f"field_{i}" for i in range(200)]
+SUBFIELDS = [f"sub_{i}" for i in range(20)]
+
+
+def random_pattern(rng: random.Random) -> str:
+    """Create an exact, subtree or single-segment wildcard pattern."""
+    kind = rng.random()
+    if kind < 0.5:
+        return f"{rng.choice(FIELDS)}.{rng.choice(SUBFIELDS)}"
+    if kind < 0.8:
+        return f"{rng.choice(FIELDS)}.*"
+    return f"{rng.choice(FIELDS)}.*.{rng.choice(SUBFIELDS)}"
+
+
+@pytest.mark.performance
+def test_route_changes_with_thousand_subscriptions():
+    """Changes are routed across 1k subscriptions of 50 patterns each."""
+    rng = random.Random(2024)
+    index = FieldPatternIndex()
+    for subscription in range(SUBSCRIPTION_COUNT):
+        index.add(subscription, [random_pattern(rng) for _ in range(PATTERNS_PER_SUBSCRIPTION)])
+
+    character_id = uuid4()
+    changes = [
+        StateChange(
+            character_id=character_id,
+            campaign_id=None,
+            field_path=".".join(
+                [rng.choice(FIELDS)] + rng.sample(SUBFIELDS, rng.randint(0, 2))
+            ),
+        )
+        for _ in range(CHANGE_COUNT)
+    ]
+
+    start = time.perf_counter()
+    routed = index.route(changes)
+    duration = time.perf_counter() - start
+
+    rate = CHANGE_COUNT / duration
+    deliveries = sum(len(subscription_changes) for subscription_changes in routed.values())
+    print(f"\n{rate:,.0f} changes/sec, {deliveries / CHANGE_COUNT:.1f} subscriptions per change")
+    assert deliveries > 0
+    assert rate >= TARGET_PER_SECOND
@@ -0,0 +1,104 @@
+"""Benchmark for delta-encoded version writes and checkouts."""
+import json
+import time
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Column, Table, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from character_service.domain.base import Base
+from character_service.domain.version import CharacterVersion
+from character_service.services.version_control import VersionControlService
+
+DEPTHS = (10, 100, 500)
+INVENTORY_SIZE = 300
+
+
+class SessionVersionRepository:
+    """Version repository storing versions on the session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository."""
+        self.session = session
+        self.record_changes = AsyncMock()
+        self.update_version_metadata = AsyncMock()
+
+    async def create_version(self, **fields: Any) -> CharacterVersion:
+        """Store a version."""
+        version = CharacterVersion(id=uuid4(), **fields)
+        self.session.add(version)
+        await self.session.flush()
+        return version
+
+
+def evolve(state: Dict[str, Any], step: int) -> Dict[str, Any]:
+    """Create the next state: a few counters change and an item is added."""
+    state = json.loads(json.dumps(state))
+    state["hit_points"]["current"] = step % 50
+    state["experience"] += 100
+    state["inventory"].insert(step % len(state["inventory"]), {"name": f"Loot {step}"})
+    return state
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_write_and_checkout_latency_by_depth():
+    """Write and checkout cost is bounded by the keyframe interval, not the depth."""
+    # Characters live in another metadata; the versions only need the key
+    if "characters" not in Base.metadata.tables:
+        Table("characters", Base.metadata, Column("id", PGUUID, primary_key=True))
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                Base.metadata.tables[name]
+                for name in ("characters", "character_versions", "character_version_ancestry")
+            ],
+        )
+    session = async_sessionmaker(engine)()
+    service = VersionControlService(session, repository=SessionVersionRepository(session))
+    character_id = uuid4()
+    state = {
+        "level": 5,
+        "experience": 0,
+        "hit_points": {"max": 50, "current": 50},
+        "inventory": [
+            {"name": f"Item {i}", "weight": i % 7, "tags": ["gear"]}
+            for i in range(INVENTORY_SIZE)
+        ],
+    }
+
+    results: List[str] = []
+    version, parent_id, depth = None, None, 0
+    for target in DEPTHS:
+        write_start = time.perf_counter()
+        writes = 0
+        while depth < target:
+            state = evolve(state, depth)
+            version = await service.create_version(
+                character_id, state, parent_version_id=parent_id
+            )
+            parent_id, depth, writes = version.id, depth + 1, writes + 1
+        write_ms = (time.perf_counter() - write_start) * 1000 / writes
+
+        checkout_start = time.perf_counter()
+        checked_out = await service.get_version_state(version)
+        checkout_ms = (time.perf_counter() - checkout_start) * 1000
+
+        assert checked_out == state
+        results.append(f"depth {depth}: write {write_ms:.2f} ms, checkout {checkout_ms:.2f} ms")
+
+    versions = (await session.execute(select(CharacterVersion))).scalars()
+    stored = sum(
+        len(json.dumps(v.state if v.keyframe_distance == 0 else v.patch)) for v in versions
+    )
+    await session.close()
+    await engine.dispose()
+    full = len(json.dumps(state)) * depth
+    print("\n" + "\n".join(results) + f"\nstorage {stored / full:.1%} of full snapshots")
+    assert stored < full / 5
@@ -283,4 +283,36 @@ async def test_update_evolution(repository: CharacterStorageRepository, storage:
     # Assert
     assert result is not None
     assert result.data["level"] == 2
-    assert result.data["experience"] == 300
\ No newline at end of file
+    assert result.data["experience"] == 300
+@pytest.mark.asyncio
+async def test_write_hooks(repository: CharacterStorageRepository, storage: MockStoragePort):
+    # Arrange
+    char_id = uuid4()
+    storage.characters[char_id] = CharacterData(
+        character_id=char_id,
+        name="Test Character",
+        user_id=uuid4(),
+        campaign_id=uuid4(),
+        theme="traditional",
+        data={"level": 1},
+        is_active=True,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    written = []
+
+    async def hook(character_id: UUID) -> None:
+        written.append(character_id)
+
+    CharacterStorageRepository.add_write_hook(hook)
+    try:
+        # Act
+        await repository.get(char_id)
+        await repository.update(char_id, CharacterUpdate(name="Renamed"))
+        await repository.delete(char_id)
+        await repository.delete(uuid4())
+    finally:
+        CharacterStorageRepository.remove_write_hook(hook)
+
+    # Assert
+    assert written == [char_id, char_id]
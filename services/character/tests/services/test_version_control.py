@@ -0,0 +1,223 @@
+"""Tests for delta-encoded character versions and the version tree."""
+from typing import Any, AsyncGenerator, Dict, Optional
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, Table, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from character_service.domain.base import Base
+from character_service.domain.version import CharacterVersion, CharacterVersionAncestry
+from character_service.services.version_control import VersionControlService
+
+
+class SessionVersionRepository:
+    """Version repository storing versions on the session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository."""
+        self.session = session
+        self.record_changes = AsyncMock()
+        self.update_version_metadata = AsyncMock()
+
+    async def create_version(self, **fields: Any) -> CharacterVersion:
+        """Store a version."""
+        version = CharacterVersion(id=uuid4(), **fields)
+        self.session.add(version)
+        await self.session.flush()
+        return version
+
+    async def get_version(
+        self, version_id: UUID, character_id: Optional[UUID] = None
+    ) -> Optional[CharacterVersion]:
+        """Get a version by ID."""
+        return await self.session.get(CharacterVersion, version_id)
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncGenerator[AsyncSession, None]:
+    """Create a session on an in-memory database with the version tables."""
+    # Characters live in another metadata; the versions only need the key
+    if "characters" not in Base.metadata.tables:
+        Table("characters", Base.metadata, Column("id", PGUUID, primary_key=True))
+    tables = [
+        Base.metadata.tables[name]
+        for name in ("characters", "character_versions", "character_version_ancestry")
+    ]
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    async with async_sessionmaker(engine)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def service(session: AsyncSession) -> VersionControlService:
+    """Create a service storing a keyframe every 4 versions."""
+    return VersionControlService(
+        session, keyframe_interval=4, repository=SessionVersionRepository(session)
+    )
+
+
+def character_state(level: int) -> Dict[str, Any]:
+    """Create the state of a character at a level."""
+    return {
+        "level": level,
+        "hit_points": {"max": 10 * level, "current": 10 * level},
+        "inventory": [{"name": f"Item {i}"} for i in range(level)],
+    }
+
+
+@pytest.mark.asyncio
+async def test_versions_store_patches_between_keyframes(service):
+    """Only every fourth version along a branch stores the full state."""
+    character_id = uuid4()
+    versions = []
+    parent_id = None
+    for level in range(1, 11):
+        version = await service.create_version(
+            character_id, character_state(level), parent_version_id=parent_id
+        )
+        versions.append(version)
+        parent_id = version.id
+
+    assert [v.keyframe_distance for v in versions] == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+    assert [v.state is not None for v in versions] == [
+        d == 0 for d in (0, 1, 2, 3, 0, 1, 2, 3, 0, 1)
+    ]
+    assert versions[1].patch == [
+        {"op": "replace", "path": "/level", "value": 2},
+        {"op": "replace", "path": "/hit_points/max", "value": 20},
+        {"op": "replace", "path": "/hit_points/current", "value": 20},
+        {"op": "add", "path": "/inventory/1", "value": {"name": "Item 1"}},
+    ]
+    for level, version in enumerate(versions, start=1):
+        assert await service.get_version_state(version) == character_state(level)
+
+
+@pytest.mark.asyncio
+async def test_changes_carry_old_values(service):
+    """Recorded changes are derived from the patch with the parent's values."""
+    character_id = uuid4()
+    parent = await service.create_version(character_id, character_state(1))
+    child = await service.create_version(
+        character_id, character_state(2), parent_version_id=parent.id
+    )
+
+    assert child.changes[0] == {
+        "type": service._determine_change_type("/level"),
+        "path": "/level",
+        "old_value": 1,
+        "new_value": 2,
+    }
+    assert child.changes[-1]["old_value"] is None
+
+
+@pytest.mark.asyncio
+async def test_state_is_loaded_in_one_query(service):
+    """A delta version and its ancestors up to the keyframe come from one query."""
+    character_id = uuid4()
+    parent_id = None
+    for level in range(1, 8):
+        version = await service.create_version(
+            character_id, character_state(level), parent_version_id=parent_id
+        )
+        parent_id = version.id
+    service.session.expunge_all()
+    version = await service.repository.get_version(parent_id)
+
+    with patch.object(service.session, "execute", wraps=service.session.execute) as execute:
+        assert await service.get_version_state(version) == character_state(7)
+
+    execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_ancestor_raises(service):
+    """A delta version cannot be read without its ancestors."""
+    character_id = uuid4()
+    parent = await service.create_version(character_id, character_state(1))
+    child = await service.create_version(
+        character_id, character_state(2), parent_version_id=parent.id
+    )
+    await service.session.delete(parent)
+    await service.session.flush()
+
+    with pytest.raises(ValueError):
+        await service.get_version_state(child)
+
+
+@pytest.mark.asyncio
+async def test_new_versions_are_indexed(service):
+    """Each version is its own ancestor and inherits its parent's ancestors."""
+    character_id = uuid4()
+    parent = await service.create_version(character_id, character_state(1))
+    child = await service.create_version(
+        character_id, character_state(2), parent_version_id=parent.id
+    )
+
+    result = await service.session.execute(
+        select(
+            CharacterVersionAncestry.ancestor_id,
+            CharacterVersionAncestry.descendant_id,
+            CharacterVersionAncestry.depth,
+        )
+    )
+    assert set(result.all()) == {
+        (parent.id, parent.id, 0),
+        (child.id, child.id, 0),
+        (parent.id, child.id, 1),
+    }
+
+
+@pytest.mark.asyncio
+async def test_version_tree_nests_children(service):
+    """Nodes hang under their parents; nodes without a loaded parent are roots."""
+    character_id = uuid4()
+    root = await service.create_version(character_id, character_state(1))
+    branch = await service.create_version(
+        character_id, character_state(2), parent_version_id=root.id
+    )
+    leaves = [
+        await service.create_version(
+            character_id, character_state(level), parent_version_id=branch.id
+        )
+        for level in (3, 4)
+    ]
+
+    tree = await service.get_version_tree(character_id, root_version_id=branch.id)
+
+    assert [node["id"] for node in tree] == [str(branch.id)]
+    assert [node["id"] for node in tree[0]["children"]] == [str(leaf.id) for leaf in leaves]
+    assert "children" not in tree[0]["children"][0]
+
+
+@pytest.mark.asyncio
+async def test_common_ancestor(service):
+    """The nearest shared ancestor is returned with its distance from each version."""
+    character_id = uuid4()
+    root = await service.create_version(character_id, character_state(1))
+    fork = await service.create_version(
+        character_id, character_state(2), parent_version_id=root.id
+    )
+    branch_a = await service.create_version(
+        character_id, character_state(3), parent_version_id=fork.id
+    )
+    branch_b = fork
+    for level in (4, 5, 6):
+        branch_b = await service.create_version(
+            character_id, character_state(level), parent_version_id=branch_b.id
+        )
+
+    assert await service.get_common_ancestor(branch_a.id, branch_b.id) == {
+        "ancestor_id": fork.id,
+        "distance_a": 1,
+        "distance_b": 3,
+    }
+
+    other = await service.create_version(uuid4(), character_state(1))
+    assert await service.get_common_ancestor(branch_a.id, other.id) is None
@@ -0,0 +1,87 @@
+"""Tests for JSON patches between character states."""
+import pytest
+
+from character_service.utils import json_patch
+
+
+@pytest.fixture
+def state():
+    """Create a character state."""
+    return {
+        "level": 3,
+        "ability_scores": {"strength": 16, "dexterity": 14},
+        "inventory": [
+            {"name": "Longsword", "quantity": 1},
+            {"name": "Rations", "quantity": 5},
+            {"name": "Rope", "quantity": 1},
+        ],
+        "notes/misc": "a~b",
+    }
+
+
+def test_diff_is_minimal_and_path_aware(state):
+    """Edits produce one operation each, addressed by JSON pointer."""
+    new = {
+        **state,
+        "level": 4,
+        "ability_scores": {"strength": 17, "dexterity": 14},
+        "inventory": [
+            {"name": "Shield", "quantity": 1},
+            state["inventory"][0],
+            {"name": "Rations", "quantity": 4},
+        ],
+        "notes/misc": "a~c",
+    }
+
+    assert json_patch.diff(state, new) == [
+        {"op": "replace", "path": "/level", "value": 4},
+        {"op": "replace", "path": "/ability_scores/strength", "value": 17},
+        {"op": "replace", "path": "/inventory/0/name", "value": "Shield"},
+        {"op": "replace", "path": "/inventory/1/name", "value": "Longsword"},
+        {"op": "replace", "path": "/inventory/1/quantity", "value": 1},
+        {"op": "replace", "path": "/inventory/2/name", "value": "Rations"},
+        {"op": "replace", "path": "/inventory/2/quantity", "value": 4},
+        {"op": "replace", "path": "/notes~1misc", "value": "a~c"},
+    ]
+
+
+def test_list_insertions_and_removals_are_single_operations(state):
+    """Inserting or removing one item does not touch the items after it."""
+    inserted = {**state, "inventory": [{"name": "Torch"}] + state["inventory"]}
+    removed = {**state, "inventory": [state["inventory"][0], state["inventory"][2]]}
+
+    assert json_patch.diff(state, inserted) == [
+        {"op": "add", "path": "/inventory/0", "value": {"name": "Torch"}},
+    ]
+    assert json_patch.diff(state, removed) == [{"op": "remove", "path": "/inventory/1"}]
+
+
+@pytest.mark.parametrize("new", [
+    {"level": 5},
+    {"level": 3, "inventory": [], "ability_scores": None},
+    {"level": "3", "inventory": [[1, 2], {"nested": [True]}], "spells": {"1": ["shield"]}},
+    [],
+])
+def test_apply_round_trips(state, new):
+    """Applying the diff of two documents turns one into the other."""
+    patch = json_patch.diff(state, new)
+
+    assert json_patch.apply_patch(state, patch) == new
+    assert state["inventory"][0] == {"name": "Longsword", "quantity": 1}
+
+
+def test_resolve(state):
+    """Pointers resolve to values, or None if missing."""
+    assert json_patch.resolve(state, "/inventory/1/quantity") == 5
+    assert json_patch.resolve(state, "/notes~1misc") == "a~b"
+    assert json_patch.resolve(state, "/inventory/9") is None
+
+
+def test_invalid_operations_raise(state):
+    """Unknown operations and missing paths are rejected."""
+    with pytest.raises(ValueError):
+        json_patch.apply_patch(state, [{"op": "move", "path": "/level", "from": "/x"}])
+    with pytest.raises(ValueError):
+        json_patch.apply_patch(state, [{"op": "replace", "path": "/missing", "value": 1}])
+    with pytest.raises(ValueError):
+        json_patch.apply_patch(state, [{"op": "remove", "path": "/inventory/7"}])
@@ -55,6 +55,9 @@ class Settings(BaseSettings):
     WS_HEARTBEAT_INTERVAL: int = 30
     WS_CONNECTION_TIMEOUT: int = 60
     WS_MAX_MESSAGE_SIZE: int = 65536  # 64KB
+    WS_SEND_QUEUE_SIZE: int = 256  # outbound events buffered per connection
+    WS_SEND_TIMEOUT: float = 5.0  # seconds before a stalled send drops the connection
+    WS_SLOW_CONSUMER_POLICY: str = "drop_oldest"  # drop_oldest, drop_newest or disconnect
 
     # Rate Limiting
     RATE_LIMIT_WS_CONNECTIONS: str = "10/minute"
@@ -11,8 +11,16 @@ from uuid import UUID
 import asyncio
 from fastapi import WebSocket, WebSocketDisconnect
 from structlog import get_logger
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge
 
+from game_session.core.broadcast import (
+    BroadcastEngine,
+    SlowConsumerPolicy,
+    CRITICAL_LANE,
+    HIGH_LANE,
+    NORMAL_LANE,
+    LOW_LANE,
+)
 from game_session.core.config import Settings
 from game_session.core.redis import RedisClient
 from game_session.models.websocket import (
@@ -25,7 +33,7 @@ from game_session.models.websocket import (
 logger = get_logger(__name__)
 
 # Metrics
-WS_CONNECTIONS_ACTIVE = Counter(
+WS_CONNECTIONS_ACTIVE = Gauge(
     "game_session_websocket_connections_active",
     "Number of active WebSocket connections",
 )
@@ -44,6 +52,33 @@ WS_MESSAGES_RECEIVED = Counter(
     ["event_type"],
 )
 
+# Outbound queue lane per event type; combat goes first, chatter last
+EVENT_LANES = {
+    WebSocketEventType.INITIATIVE_ROLL: CRITICAL_LANE,
+    WebSocketEventType.TURN_CHANGE: CRITICAL_LANE,
+    WebSocketEventType.ACTION_DECLARE: CRITICAL_LANE,
+    WebSocketEventType.ACTION_RESOLVE: CRITICAL_LANE,
+    WebSocketEventType.CONNECTION_ESTABLISHED: HIGH_LANE,
+    WebSocketEventType.CONNECTION_ERROR: HIGH_LANE,
+    WebSocketEventType.STATE_UPDATE: HIGH_LANE,
+    WebSocketEventType.SYNC_RESPONSE: HIGH_LANE,
+    WebSocketEventType.HEARTBEAT: LOW_LANE,
+}
+
+
+def _event_type(event: Any) -> str:
+    """Get the type of a model or dict event."""
+    event_type = event.get("type") if isinstance(event, dict) else getattr(event, "type", None)
+    return str(getattr(event_type, "value", event_type))
+
+
+def _event_lane(event_type: str) -> int:
+    """Get the outbound queue lane for an event type."""
+    try:
+        return EVENT_LANES.get(WebSocketEventType(event_type), NORMAL_LANE)
+    except ValueError:
+        return LOW_LANE if event_type.startswith("chat") else NORMAL_LANE
+
 
 class WebSocketManager:
     """Manages WebSocket connections for game sessions."""
@@ -59,6 +94,12 @@ class WebSocketManager:
         self.redis = redis_client
         self.active_connections: Dict[UUID, Dict[UUID, WebSocket]] = defaultdict(dict)
         self.heartbeat_tasks: Dict[UUID, Dict[UUID, asyncio.Task]] = defaultdict(dict)
+        self.engine = BroadcastEngine(
+            max_queue=settings.WS_SEND_QUEUE_SIZE,
+            policy=SlowConsumerPolicy(settings.WS_SLOW_CONSUMER_POLICY),
+            send_timeout=settings.WS_SEND_TIMEOUT,
+            on_disconnect=self._handle_dropped_connection,
+        )
 
     async def connect(
         self,
@@ -77,6 +118,7 @@ class WebSocketManager:
         
         # Store connection locally
         self.active_connections[session_id][player_id] = websocket
+        self.engine.add(session_id, player_id, websocket)
         WS_CONNECTIONS_ACTIVE.inc()
         WS_CONNECTIONS_TOTAL.inc()
 
@@ -140,6 +182,9 @@ class WebSocketManager:
             except asyncio.CancelledError:
                 pass
 
+        # Stop the connection's writer
+        await self.engine.remove(session_id, player_id)
+
         # Remove connection from local state
         if player_id in self.active_connections[session_id]:
             del self.active_connections[session_id][player_id]
@@ -188,22 +233,9 @@ class WebSocketManager:
             player_id: Player ID.
             event: Event to send.
         """
-        if (
-            session_id in self.active_connections
-            and player_id in self.active_connections[session_id]
-        ):
-            websocket = self.active_connections[session_id][player_id]
-            try:
-                await websocket.send_json(event.model_dump())
-                WS_MESSAGES_SENT.labels(event_type=event.type).inc()
-            except Exception as e:
-                logger.error(
-                    "Error sending WebSocket message",
-                    session_id=str(session_id),
-                    player_id=str(player_id),
-                    error=str(e),
-                )
-                await self.disconnect(session_id, player_id)
+        event_type = _event_type(event)
+        if self.engine.send(session_id, player_id, event, lane=_event_lane(event_type)):
+            WS_MESSAGES_SENT.labels(event_type=event_type).inc()
 
     async def broadcast_event(
         self,
@@ -218,11 +250,36 @@ class WebSocketManager:
             event: Event to broadcast.
             exclude: Set of player IDs to exclude from broadcast.
         """
-        if session_id in self.active_connections:
-            exclude = exclude or set()
-            for player_id, websocket in self.active_connections[session_id].items():
-                if player_id not in exclude:
-                    await self.send_event(session_id, player_id, event)
+        event_type = _event_type(event)
+        queued = self.engine.broadcast(
+            session_id,
+            event,
+            lane=_event_lane(event_type),
+            exclude=exclude,
+        )
+        if queued:
+            WS_MESSAGES_SENT.labels(event_type=event_type).inc(queued)
+
+    async def _handle_dropped_connection(
+        self,
+        session_id: UUID,
+        player_id: UUID,
+        reason: str,
+    ) -> None:
+        """Clean up a connection the broadcast engine gave up on.
+
+        Args:
+            session_id: Game session ID.
+            player_id: Player ID.
+            reason: Why the connection was dropped.
+        """
+        logger.warning(
+            "Dropping WebSocket connection",
+            session_id=str(session_id),
+            player_id=str(player_id),
+            reason=reason,
+        )
+        await self.disconnect(session_id, player_id)
 
     async def _heartbeat_loop(
         self,
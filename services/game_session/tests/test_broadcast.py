@@ -0,0 +1,177 @@
+"""Tests for the broadcast engine."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from game_session.core.broadcast import (
+    CRITICAL_LANE,
+    LOW_LANE,
+    SLOW_CONSUMER_CLOSE_CODE,
+    BroadcastEngine,
+    SlowConsumerPolicy,
+    encode_message,
+)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that can be paused to simulate a slow client."""
+
+    def __init__(self) -> None:
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.accept = AsyncMock()
+        self.close = AsyncMock()
+
+    async def send_text(self, frame: str) -> None:
+        await self.gate.wait()
+        self.frames.append(frame)
+
+
+async def settle() -> None:
+    """Let writer tasks run."""
+    await asyncio.sleep(0.01)
+
+
+def test_encode_message() -> None:
+    """Dicts are encoded compactly and strings pass through unchanged."""
+    assert encode_message({"type": "turn_change", "round": 2}) == '{"type":"turn_change","round":2}'
+    assert encode_message("already-encoded") == "already-encoded"
+
+
+async def test_broadcast_encodes_once_per_event() -> None:
+    """Every recipient gets the same frame and excluded players get nothing."""
+    engine = BroadcastEngine()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for i, ws in enumerate(sockets):
+        engine.add("session-1", i, ws)
+
+    queued = engine.broadcast("session-1", {"type": "state_update", "hp": 7}, exclude={2})
+    await settle()
+
+    assert queued == 2
+    assert sockets[0].frames == sockets[1].frames == ['{"type":"state_update","hp":7}']
+    assert sockets[2].frames == []
+    assert engine.get_stats() == {
+        "events_broadcast": 1,
+        "frames_queued": 2,
+        "frames_dropped": 0,
+        "connections_dropped": 0,
+        "connections": 3,
+        "frames_pending": 0,
+    }
+    await engine.close()
+
+
+async def test_slow_player_does_not_block_others() -> None:
+    """A stalled socket does not delay delivery to the rest of the session."""
+    engine = BroadcastEngine(max_queue=10)
+    slow, fast = FakeWebSocket(), FakeWebSocket()
+    slow.gate.clear()
+    engine.add("session-1", "slow", slow)
+    engine.add("session-1", "fast", fast)
+
+    for i in range(5):
+        engine.broadcast("session-1", {"n": i})
+    await settle()
+
+    assert len(fast.frames) == 5
+    assert slow.frames == []
+    assert engine.get_stats()["frames_pending"] == 4
+    await engine.close()
+
+
+async def test_combat_frames_sent_before_chat() -> None:
+    """Queued critical frames overtake queued low priority frames."""
+    engine = BroadcastEngine()
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    engine.add("session-1", "player", ws)
+
+    engine.broadcast("session-1", "chat-1", lane=LOW_LANE)
+    await settle()  # writer is now blocked sending chat-1
+    engine.broadcast("session-1", "chat-2", lane=LOW_LANE)
+    engine.broadcast("session-1", "attack", lane=CRITICAL_LANE)
+    ws.gate.set()
+    await settle()
+
+    assert ws.frames == ["chat-1", "attack", "chat-2"]
+    await engine.close()
+
+
+async def fill_queue(policy: SlowConsumerPolicy) -> tuple:
+    """Block a player's writer and fill their two-frame queue with chat."""
+    engine = BroadcastEngine(max_queue=2, policy=policy)
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    engine.add("session-1", "player", ws)
+    engine.broadcast("session-1", "in-flight")
+    await settle()
+    for name in ("a", "b"):
+        engine.broadcast("session-1", name, lane=LOW_LANE)
+    return engine, ws
+
+
+async def test_drop_oldest() -> None:
+    """The oldest frame in the lane is evicted."""
+    engine, ws = await fill_queue(SlowConsumerPolicy.DROP_OLDEST)
+
+    engine.broadcast("session-1", "c", lane=LOW_LANE)
+    ws.gate.set()
+    await settle()
+
+    assert ws.frames == ["in-flight", "b", "c"]
+    assert engine.get_stats()["frames_dropped"] == 1
+    await engine.close()
+
+
+async def test_drop_newest_still_admits_urgent_frames() -> None:
+    """Incoming frames are dropped unless something less urgent can be evicted."""
+    engine, ws = await fill_queue(SlowConsumerPolicy.DROP_NEWEST)
+
+    assert engine.broadcast("session-1", "c", lane=LOW_LANE) == 0
+    assert engine.broadcast("session-1", "attack", lane=CRITICAL_LANE) == 1
+    ws.gate.set()
+    await settle()
+
+    assert ws.frames == ["in-flight", "attack", "b"]
+    await engine.close()
+
+
+async def test_disconnect_policy_closes_connection() -> None:
+    """A full queue closes the socket and notifies the owner."""
+    on_disconnect = AsyncMock()
+    engine = BroadcastEngine(
+        max_queue=1,
+        policy=SlowConsumerPolicy.DISCONNECT,
+        on_disconnect=on_disconnect,
+    )
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    engine.add("session-1", "player", ws)
+
+    engine.broadcast("session-1", "in-flight")
+    await settle()
+    engine.broadcast("session-1", "queued")
+    engine.broadcast("session-1", "overflow")
+    await settle()
+
+    ws.close.assert_awaited_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+    on_disconnect.assert_awaited_once_with("session-1", "player", "slow_consumer")
+    assert engine.connection_count() == 0
+    assert engine.get_stats()["connections_dropped"] == 1
+
+
+async def test_send_failure_drops_connection() -> None:
+    """A socket error unregisters the connection."""
+    on_disconnect = AsyncMock()
+    engine = BroadcastEngine(on_disconnect=on_disconnect)
+    ws = FakeWebSocket()
+    ws.send_text = AsyncMock(side_effect=RuntimeError("connection reset"))
+    engine.add("session-1", "player", ws)
+
+    engine.broadcast("session-1", {"n": 1})
+    await settle()
+
+    on_disconnect.assert_awaited_once_with("session-1", "player", "send_failed")
+    assert engine.connection_count("session-1") == 0
@@ -0,0 +1,99 @@
+"""Tests for the game session WebSocket manager."""
+
+import json
+from uuid import uuid4
+
+from game_session.core.broadcast import SLOW_CONSUMER_CLOSE_CODE
+from game_session.core.config import Settings
+from game_session.core.websocket import WebSocketManager
+from game_session.models.websocket import HeartbeatEvent, WebSocketEventType
+
+from test_broadcast import FakeWebSocket, settle
+
+
+def make_manager(**overrides) -> WebSocketManager:
+    """Create a manager without Redis."""
+    return WebSocketManager(Settings(JWT_SECRET_KEY="test", **overrides))
+
+
+def frame_types(ws: FakeWebSocket) -> list:
+    """Get the event types of the frames a socket received."""
+    return [json.loads(frame)["type"] for frame in ws.frames]
+
+
+async def test_connect_queues_connection_established() -> None:
+    """Connecting accepts the socket and greets the player through the engine."""
+    manager = make_manager()
+    session_id, player_id = uuid4(), uuid4()
+    ws = FakeWebSocket()
+
+    await manager.connect(ws, session_id, player_id)
+    await settle()
+
+    ws.accept.assert_awaited_once()
+    assert frame_types(ws) == [WebSocketEventType.CONNECTION_ESTABLISHED.value]
+    assert manager.engine.connection_count(session_id) == 1
+
+    await manager.disconnect(session_id, player_id)
+    assert manager.engine.connection_count() == 0
+    assert session_id not in manager.active_connections
+
+
+async def test_broadcast_event_excludes_players() -> None:
+    """Broadcasts reach every player in the session except excluded ones."""
+    manager = make_manager()
+    session_id = uuid4()
+    players = {uuid4(): FakeWebSocket() for _ in range(3)}
+    for player_id, ws in players.items():
+        await manager.connect(ws, session_id, player_id)
+    await settle()
+    excluded = next(iter(players))
+
+    await manager.broadcast_event(
+        session_id,
+        {"type": WebSocketEventType.TURN_CHANGE.value, "round": 2},
+        exclude={excluded},
+    )
+    await settle()
+
+    for player_id, ws in players.items():
+        received = frame_types(ws)[1:]
+        assert received == ([] if player_id == excluded else ["turn_change"])
+
+    await manager.engine.close()
+
+
+async def test_combat_overtakes_heartbeat() -> None:
+    """Combat events are sent before heartbeats already queued for a slow player."""
+    manager = make_manager()
+    session_id, player_id = uuid4(), uuid4()
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    await manager.connect(ws, session_id, player_id)
+    await settle()  # writer is blocked sending connection_established
+
+    await manager.send_event(session_id, player_id, HeartbeatEvent(type=WebSocketEventType.HEARTBEAT))
+    await manager.send_event(session_id, player_id, {"type": "action_resolve"})
+    ws.gate.set()
+    await settle()
+
+    assert frame_types(ws) == ["connection_established", "action_resolve", "heartbeat"]
+    await manager.engine.close()
+
+
+async def test_slow_consumer_is_disconnected() -> None:
+    """A player the engine gives up on goes through the normal disconnect cleanup."""
+    manager = make_manager(WS_SEND_QUEUE_SIZE=1, WS_SLOW_CONSUMER_POLICY="disconnect")
+    session_id, player_id = uuid4(), uuid4()
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    await manager.connect(ws, session_id, player_id)
+    await settle()
+
+    for round_number in range(2):
+        await manager.broadcast_event(session_id, {"type": "state_update", "round": round_number})
+    await settle()
+
+    ws.close.assert_awaited_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+    assert session_id not in manager.active_connections
+    assert player_id not in manager.heartbeat_tasks[session_id]
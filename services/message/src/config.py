@@ -26,6 +26,15 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379"
     message_timeout: int = 30
     
+    # Delivery Settings
+    delivery_max_connections: int = 100  # per destination service
+    delivery_max_keepalive: int = 20  # idle connections kept per destination
+    delivery_keepalive_expiry: float = 30.0  # seconds
+    delivery_http2: bool = False  # requires httpx[http2]
+    registry_cache_ttl: float = 5.0  # seconds
+    event_flush_interval: float = 0.05  # seconds
+    event_max_pending: int = 10000  # events buffered before routing blocks
+    
     # Service Discovery
     service_check_interval: int = 30
     service_timeout: int = 10
@@ -67,6 +76,10 @@ class Settings(BaseSettings):
     wal_enabled: bool = True
     wal_flush_interval: int = 1  # seconds
     snapshot_interval: int = 1000  # events
+    snapshot_bytes_threshold: int = 1048576  # payload bytes since last snapshot
+    snapshot_check_interval: int = 30  # seconds
+    compaction_chunk_size: int = 1000  # events deleted per transaction
+    event_sequence_block_size: int = 1000  # sequence numbers reserved per DB round trip
     compaction_threshold: float = 0.5  # 50% deleted events
     
     # Monitoring
@@ -7,13 +7,14 @@ Provides advanced service discovery, health monitoring, and load balancing.
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 import structlog
 import httpx
 from collections import defaultdict
 import random
+from itertools import accumulate
 
 from .config import Settings
 from .models import ServiceType, ServiceRegistration, ServiceStatus, MessageType
@@ -36,6 +37,8 @@ class LoadBalancingStrategy(str, Enum):
     WEIGHTED = "weighted"
     RANDOM = "random"
     HEALTH_AWARE = "health_aware"
+    POWER_OF_TWO_CHOICES = "power_of_two_choices"
+    LEAST_OUTSTANDING_REQUESTS = "least_outstanding_requests"
 
 
 @dataclass
@@ -55,6 +58,12 @@ class ServiceInstance:
     health_status: ServiceHealthStatus = ServiceHealthStatus.UNKNOWN
     last_health_check: Optional[datetime] = None
     metadata: Dict[str, any] = field(default_factory=dict)
+    cached_health_score: float = 0.0  # Refreshed by the registry after each health check
+    
+    @property
+    def load(self) -> float:
+        """Outstanding requests relative to weight."""
+        return self.active_connections / max(1, self.weight)
     
     @property
     def health_score(self) -> float:
@@ -77,6 +86,39 @@ class ServiceInstance:
         return min(1.0, max(0.0, base_score))
 
 
+@dataclass
+class CandidateSet:
+    """
+    Precomputed routing candidates for one service and request shape.
+    
+    Built when the service's instances or their health change, so that
+    selection does not filter or score instances per request.
+    """
+    instances: Tuple[ServiceInstance, ...]
+    preferred: Tuple[ServiceInstance, ...]  # Health score above 0.5
+    cumulative_weights: Tuple[float, ...]
+    healthiest: Optional[ServiceInstance]
+    
+    @classmethod
+    def build(cls, instances: Sequence[ServiceInstance]) -> "CandidateSet":
+        """Build a candidate set from an ordered list of eligible instances."""
+        instances = tuple(instances)
+        return cls(
+            instances=instances,
+            preferred=tuple(inst for inst in instances if inst.cached_health_score > 0.5),
+            cumulative_weights=tuple(accumulate(inst.weight for inst in instances)),
+            healthiest=max(instances, key=lambda x: x.cached_health_score, default=None)
+        )
+
+
+@dataclass
+class _ServiceCandidates:
+    """Candidate sets of one service, keyed by (message_type, prefer_version)."""
+    source: List[ServiceInstance]
+    size: int
+    sets: Dict[Tuple[Optional[MessageType], Optional[str]], CandidateSet] = field(default_factory=dict)
+
+
 @dataclass
 class ServiceDependency:
     """Represents a service dependency."""
@@ -108,12 +150,15 @@ class EnhancedServiceRegistry:
         self.dependencies: List[ServiceDependency] = []
         self.load_balancing_strategy = LoadBalancingStrategy.HEALTH_AWARE
         self.round_robin_counters: Dict[ServiceType, int] = defaultdict(int)
+        self._candidates: Dict[ServiceType, _ServiceCandidates] = {}
         
         # Health check configuration
         self.health_check_interval = settings.service_check_interval
         self.health_check_timeout = settings.service_timeout
         self.unhealthy_threshold = 3  # Consecutive failures before marking unhealthy
         self.healthy_threshold = 2    # Consecutive successes before marking healthy
+        self.health_check_concurrency = 20  # Probes in flight at once
+        self.health_check_jitter = 0.2      # Fraction of the interval probes are spread over
         
         # Tracking
         self.health_check_history: Dict[str, List[bool]] = defaultdict(list)
@@ -203,6 +248,7 @@ class EnhancedServiceRegistry:
         else:
             # Add new instance
             self.instances[service_type].append(instance)
+        self._invalidate_candidates(service_type)
         
         # Perform initial health check
         await self._check_instance_health(instance)
@@ -236,6 +282,7 @@ class EnhancedServiceRegistry:
         ]
         
         if len(self.instances[service_type]) < original_count:
+            self._invalidate_candidates(service_type)
             logger.info("service_instance_deregistered",
                        service=service_type.value,
                        instance_id=instance_id)
@@ -258,18 +305,14 @@ class EnhancedServiceRegistry:
         Returns:
             Selected service instance or None
         """
-        # Get eligible instances
-        instances = await self._get_eligible_instances(
-            service_type,
-            message_type,
-            prefer_version
-        )
+        # Get precomputed candidates
+        candidates = self._get_candidates(service_type, message_type, prefer_version)
         
-        if not instances:
+        if not candidates.instances:
             return None
         
         # Select instance based on load balancing strategy
-        return await self._select_instance(instances, service_type)
+        return await self._select_instance(candidates.instances, service_type, candidates)
     
     async def get_all_instances(self,
                                service_type: ServiceType,
@@ -379,12 +422,47 @@ class EnhancedServiceRegistry:
                 return instance
         return None
     
+    def _get_candidates(self,
+                        service_type: ServiceType,
+                        message_type: Optional[MessageType],
+                        prefer_version: Optional[str]) -> CandidateSet:
+        """Get the candidate set for a request, building it on first use."""
+        instances = self.instances.get(service_type, [])
+        entry = self._candidates.get(service_type)
+        
+        # Instance lists replaced or resized outside the registry API count as a change
+        if entry is None or entry.source is not instances or entry.size != len(instances):
+            entry = _ServiceCandidates(source=instances, size=len(instances))
+            self._candidates[service_type] = entry
+        
+        key = (message_type, prefer_version)
+        candidates = entry.sets.get(key)
+        if candidates is None:
+            candidates = CandidateSet.build(
+                self._filter_eligible(instances, message_type, prefer_version)
+            )
+            entry.sets[key] = candidates
+        
+        return candidates
+    
+    def _invalidate_candidates(self, service_type: ServiceType):
+        """Drop a service's candidate sets after its instances or health changed."""
+        self._candidates.pop(service_type, None)
+    
     async def _get_eligible_instances(self,
                                      service_type: ServiceType,
                                      message_type: Optional[MessageType],
                                      prefer_version: Optional[str]) -> List[ServiceInstance]:
         """Get eligible instances for a request."""
-        instances = self.instances.get(service_type, [])
+        return list(self._get_candidates(service_type, message_type, prefer_version).instances)
+    
+    def _filter_eligible(self,
+                         instances: List[ServiceInstance],
+                         message_type: Optional[MessageType],
+                         prefer_version: Optional[str]) -> List[ServiceInstance]:
+        """Filter and order instances eligible for a request."""
+        for inst in instances:
+            inst.cached_health_score = inst.health_score
         
         # Filter by health
         eligible = [
@@ -408,12 +486,19 @@ class EnhancedServiceRegistry:
         return eligible
     
     async def _select_instance(self,
-                              instances: List[ServiceInstance],
-                              service_type: ServiceType) -> Optional[ServiceInstance]:
+                              instances: Sequence[ServiceInstance],
+                              service_type: ServiceType,
+                              candidates: Optional[CandidateSet] = None) -> Optional[ServiceInstance]:
         """Select an instance based on load balancing strategy."""
         if not instances:
             return None
         
+        if candidates is None:
+            for inst in instances:
+                inst.cached_health_score = inst.health_score
+            candidates = CandidateSet.build(instances)
+        instances = candidates.instances
+        
         if self.load_balancing_strategy == LoadBalancingStrategy.ROUND_ROBIN:
             index = self.round_robin_counters[service_type] % len(instances)
             self.round_robin_counters[service_type] += 1
@@ -424,25 +509,29 @@ class EnhancedServiceRegistry:
         
         elif self.load_balancing_strategy == LoadBalancingStrategy.WEIGHTED:
             # Weighted random selection
-            weights = [inst.weight for inst in instances]
-            selected = random.choices(instances, weights=weights)[0]
+            selected = random.choices(instances, cum_weights=candidates.cumulative_weights)[0]
         
         elif self.load_balancing_strategy == LoadBalancingStrategy.RANDOM:
             selected = random.choice(instances)
         
         elif self.load_balancing_strategy == LoadBalancingStrategy.HEALTH_AWARE:
-            # Select based on health score
-            healthy_instances = [
-                inst for inst in instances
-                if inst.health_score > 0.5
-            ]
-            
-            if healthy_instances:
-                # Among healthy, choose least loaded
-                selected = min(healthy_instances, key=lambda x: x.active_connections / max(1, x.weight))
+            if candidates.preferred:
+                # Among healthy, the less loaded of two random picks
+                selected = self._two_choices(candidates.preferred, lambda x: x.load)
             else:
                 # Fall back to least degraded
-                selected = max(instances, key=lambda x: x.health_score)
+                selected = candidates.healthiest
+        
+        elif self.load_balancing_strategy == LoadBalancingStrategy.POWER_OF_TWO_CHOICES:
+            # Two random picks from the healthy pool, keep the less loaded
+            pool = candidates.preferred or instances
+            selected = self._two_choices(pool, lambda x: x.load)
+        
+        elif self.load_balancing_strategy == LoadBalancingStrategy.LEAST_OUTSTANDING_REQUESTS:
+            # Fewer in-flight requests per unit of weight, sampled like Envoy's
+            # least-request balancer; ties go to the healthier instance
+            pool = candidates.preferred or instances
+            selected = self._two_choices(pool, lambda x: (x.load, -x.cached_health_score))
         
         else:
             selected = instances[0]
@@ -453,13 +542,42 @@ class EnhancedServiceRegistry:
         
         return selected
     
+    @staticmethod
+    def _two_choices(pool: Sequence[ServiceInstance],
+                     key: Callable[[ServiceInstance], Any]) -> ServiceInstance:
+        """
+        Pick two instances at random and keep the one with the lower key.
+        
+        Constant time regardless of pool size ("power of two choices"); the
+        most loaded instance is never picked while another is available.
+        """
+        if len(pool) == 1:
+            return pool[0]
+        first, second = random.sample(pool, 2)
+        return first if key(first) <= key(second) else second
+    
     async def release_instance(self, instance: ServiceInstance):
         """Release an instance after use."""
         if instance.active_connections > 0:
             instance.active_connections -= 1
     
     async def _check_instance_health(self, instance: ServiceInstance) -> bool:
-        """Check health of a specific instance."""
+        """Check health of a specific instance and refresh its routing state."""
+        previous_status = instance.health_status
+        was_preferred = instance.cached_health_score > 0.5
+        
+        healthy = await self._probe_instance(instance)
+        
+        # Only membership changes invalidate candidate sets; score drift alone does not
+        instance.cached_health_score = instance.health_score
+        if (instance.health_status != previous_status
+                or (instance.cached_health_score > 0.5) != was_preferred):
+            self._invalidate_candidates(instance.service_type)
+        
+        return healthy
+    
+    async def _probe_instance(self, instance: ServiceInstance) -> bool:
+        """Probe an instance's health endpoint and update its status."""
         start_time = time.time()
         
         try:
@@ -517,12 +635,11 @@ class EnhancedServiceRegistry:
         
         while True:
             try:
-                # Check all instances
-                for service_type, instances in self.instances.items():
-                    for instance in instances:
-                        await self._check_instance_health(instance)
+                await self._run_health_checks()
                 
-                await asyncio.sleep(self.health_check_interval)
+                # Jitter the period so replicas don't probe in lockstep
+                jitter = self.health_check_interval * self.health_check_jitter
+                await asyncio.sleep(self.health_check_interval + random.uniform(-jitter, jitter))
                 
             except asyncio.CancelledError:
                 break
@@ -532,6 +649,31 @@ class EnhancedServiceRegistry:
         
         logger.info("health_check_loop_stopped")
     
+    async def _run_health_checks(self):
+        """Probe all instances concurrently, spread over the jitter window."""
+        instances = [
+            instance
+            for service_instances in list(self.instances.values())
+            for instance in list(service_instances)
+        ]
+        if not instances:
+            return
+        
+        semaphore = asyncio.Semaphore(self.health_check_concurrency)
+        spread = self.health_check_interval * self.health_check_jitter
+        
+        async def probe(instance: ServiceInstance):
+            await asyncio.sleep(random.uniform(0, spread))
+            async with semaphore:
+                try:
+                    await self._check_instance_health(instance)
+                except Exception as e:
+                    logger.error("health_check_failed",
+                               instance_id=instance.instance_id,
+                               error=str(e))
+        
+        await asyncio.gather(*(probe(instance) for instance in instances))
+    
     async def _dependency_check_loop(self):
         """Background task to check service dependencies."""
         logger.info("dependency_check_loop_started")
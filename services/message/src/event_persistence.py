@@ -6,18 +6,31 @@ Provides durable event storage with replay capabilities.
 
 import uuid
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, AsyncGenerator, Callable
+from typing import Dict, List, NamedTuple, Optional, Any, AsyncGenerator, Awaitable, Callable
 from enum import Enum
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select, and_, or_, desc, update, delete
+from sqlalchemy import (
+    select, and_, or_, desc, update, delete, text, exists, inspect, literal,
+    literal_column, nulls_last, true, tuple_, BigInteger, Sequence
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import func
 import json
 
-from .event_store.models import Event, EventStream, EventSubscription, EventType
-from .models import ServiceType
+from .event_store.models import (
+    Event,
+    EventStream,
+    EventSubscription,
+    EventType,
+    ReplayCheckpoint,
+    CompactionProgress
+)
+from .message_hub.core.models import ServiceType
 from .config import Settings
 
 logger = structlog.get_logger()
@@ -31,15 +44,133 @@ class EventReplayMode(str, Enum):
     LAST_N_EVENTS = "last_n_events"
 
 
+class ReplayPosition(NamedTuple):
+    """
+    A point in commit order: the appending transaction, then the sequence.
+    
+    Sequence numbers come from per-process blocks, so a lower number can
+    commit after a higher one. Postgres transaction IDs are compared against
+    the oldest running transaction instead, which no later commit can
+    precede. Without Postgres every event has transaction ID 0 and positions
+    fall back to plain sequence order.
+    """
+    transaction_id: int
+    sequence_number: int
+
+
+REPLAY_START = ReplayPosition(0, 0)
+
+# Postgres: ID of the current transaction, and of the oldest still running
+CURRENT_TRANSACTION_ID = text("SELECT pg_current_xact_id()::text::bigint")
+OLDEST_RUNNING_TRANSACTION_ID = literal_column(
+    "pg_snapshot_xmin(pg_current_snapshot())::text::bigint", BigInteger
+)
+
+
+@dataclass
+class EventAppend:
+    """An event to be appended as part of a group commit."""
+    event_type: EventType
+    source_service: ServiceType
+    data: Dict[str, Any]
+    metadata: Optional[Dict[str, Any]] = None
+    correlation_id: Optional[str] = None
+    causation_id: Optional[str] = None
+    stream_id: Optional[str] = None
+
+
+class SequenceBlockAllocator:
+    """
+    Hands out event sequence numbers from blocks reserved on a DB sequence.
+    
+    Each ``nextval`` on the sequence (created with ``INCREMENT BY block_size``)
+    reserves ``block_size`` numbers for this process, so appends only touch
+    the sequence once per block instead of locking ``max(sequence_number)``.
+    Numbers are unique across processes but only monotonic within one; gaps
+    appear after restarts.
+    
+    Dialects without sequences (SQLite in tests) fall back to a process-local
+    counter seeded from ``max(sequence_number)``.
+    """
+    
+    def __init__(self,
+                 block_size: int = 1000,
+                 sequence_name: str = "event_sequence_number_seq"):
+        """Initialize allocator."""
+        self.block_size = block_size
+        self.sequence = Sequence(sequence_name, start=1, increment=block_size)
+        self._use_db_sequence = False
+        self._next = 0
+        self._limit = 0
+        self._fallback_next: Optional[int] = None
+        self._lock = asyncio.Lock()
+    
+    async def initialize(self, engine: AsyncEngine):
+        """Create the DB sequence if needed and move it past existing events."""
+        self._use_db_sequence = engine.dialect.name == "postgresql"
+        if not self._use_db_sequence:
+            return
+        
+        name = self.sequence.name
+        async with engine.begin() as conn:
+            await conn.run_sync(self.sequence.create, checkfirst=True)
+            
+            # Never hand out numbers already used before the sequence existed
+            await conn.execute(text(
+                f"SELECT setval('{name}', GREATEST("
+                f"(SELECT COALESCE(MAX(sequence_number), 0) FROM events), "
+                f"(SELECT last_value FROM {name})))"
+            ))
+            
+            # An existing sequence decides the block size, not local config
+            increment = await conn.scalar(
+                text("SELECT increment_by FROM pg_sequences WHERE sequencename = :name"),
+                {"name": name}
+            )
+            if increment and increment != self.block_size:
+                logger.warning("event_sequence_block_size_mismatch",
+                             configured=self.block_size,
+                             actual=increment)
+                self.block_size = increment
+    
+    async def allocate(self, session: AsyncSession, count: int) -> List[int]:
+        """Allocate ``count`` sequence numbers, reserving new blocks as needed."""
+        async with self._lock:
+            numbers: List[int] = []
+            while len(numbers) < count:
+                if self._next >= self._limit:
+                    self._next = await self._reserve_block(session)
+                    self._limit = self._next + self.block_size
+                
+                take = min(count - len(numbers), self._limit - self._next)
+                numbers.extend(range(self._next, self._next + take))
+                self._next += take
+            
+            return numbers
+    
+    async def _reserve_block(self, session: AsyncSession) -> int:
+        """Reserve the next block and return its first number."""
+        if self._use_db_sequence:
+            return await session.scalar(select(self.sequence.next_value()))
+        
+        if self._fallback_next is None:
+            max_seq = await session.scalar(select(func.max(Event.sequence_number)))
+            self._fallback_next = (max_seq or 0) + 1
+        
+        start = self._fallback_next
+        self._fallback_next += self.block_size
+        return start
+
+
 class EnhancedEventStore:
     """
     Enhanced event store with durability guarantees and replay capabilities.
     
     Features:
-    - Write-ahead logging for durability
+    - Group-committed appends in a single durable transaction
     - Event replay from any point
     - Event compaction and archival
-    - Snapshot support for state reconstruction
+    - Automatic incremental snapshots and chunked, resumable compaction
     - Concurrent write protection
     - Optimistic concurrency control
     """
@@ -50,20 +181,26 @@ class EnhancedEventStore:
         self.engine: Optional[AsyncEngine] = None
         self.session_factory: Optional[sessionmaker] = None
         
-        # Write-ahead log settings
-        self.wal_enabled = True
-        self.wal_flush_interval = 1  # seconds
-        self.wal_buffer: List[Event] = []
-        self.wal_lock = asyncio.Lock()
+        # Sequence numbers are reserved in blocks rather than via max() FOR UPDATE
+        self.sequence_allocator = SequenceBlockAllocator(
+            block_size=settings.event_sequence_block_size
+        )
+        
+        # Snapshot settings
+        self.snapshot_enabled = True
+        self.snapshot_every_events = settings.snapshot_interval
+        self.snapshot_every_bytes = settings.snapshot_bytes_threshold
+        self.snapshot_check_interval = settings.snapshot_check_interval
         
         # Compaction settings
         self.compaction_enabled = True
         self.compaction_interval = 3600  # 1 hour
+        self.compaction_chunk_size = settings.compaction_chunk_size
         self.retention_days = settings.event_retention_days
         
         # Background tasks
-        self._wal_flusher_task = None
         self._compactor_task = None
+        self._snapshotter_task = None
     
     async def initialize(self):
         """Initialize database connection and background tasks."""
@@ -90,30 +227,26 @@ class EnhancedEventStore:
             expire_on_commit=False
         )
         
-        # Create tables if they don't exist
+        # Create tables if they don't exist and add columns newer than them
         async with self.engine.begin() as conn:
             from .event_store.models import Base
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(self._upgrade_schema)
         
-        # Start background tasks
-        if self.wal_enabled:
-            self._wal_flusher_task = asyncio.create_task(self._wal_flush_loop())
+        await self.sequence_allocator.initialize(self.engine)
         
+        # Start background tasks
         if self.compaction_enabled:
             self._compactor_task = asyncio.create_task(self._compaction_loop())
         
+        if self.snapshot_enabled:
+            self._snapshotter_task = asyncio.create_task(self._snapshot_loop())
+        
         logger.info("enhanced_event_store_initialized")
     
     async def shutdown(self):
         """Shutdown event store."""
         # Cancel background tasks
-        if self._wal_flusher_task:
-            self._wal_flusher_task.cancel()
-            try:
-                await self._wal_flusher_task
-            except asyncio.CancelledError:
-                pass
-        
         if self._compactor_task:
             self._compactor_task.cancel()
             try:
@@ -121,8 +254,12 @@ class EnhancedEventStore:
             except asyncio.CancelledError:
                 pass
         
-        # Flush any remaining WAL entries
-        await self._flush_wal()
+        if self._snapshotter_task:
+            self._snapshotter_task.cancel()
+            try:
+                await self._snapshotter_task
+            except asyncio.CancelledError:
+                pass
         
         # Close database connection
         if self.engine:
@@ -130,6 +267,83 @@ class EnhancedEventStore:
         
         logger.info("enhanced_event_store_shutdown")
     
+    @staticmethod
+    def _upgrade_schema(connection):
+        """
+        Bring tables created by older releases up to the current models.
+        
+        ``create_all`` only creates missing tables, so columns and indexes
+        added since are created here. Stream versions are backfilled from the
+        stored events the first time ``event_streams.version`` is added,
+        including streams that never had an ``event_streams`` row; snapshot
+        bookkeeping starts from the backfilled version. Likewise, existing
+        events are numbered within their stream in sequence order (the order
+        they were committed in before sequence blocks) when
+        ``events.stream_version`` is added.
+        """
+        from .event_store.models import Base
+        
+        inspector = inspect(connection)
+        ddl = connection.dialect.ddl_compiler(connection.dialect, None)
+        added = set()
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    connection.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN "
+                        f"{ddl.get_column_specification(column)}"
+                    ))
+                    added.add((table.name, column.name))
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        
+        if (EventStream.__tablename__, "version") in added:
+            counts = select(
+                Event.stream_id, func.count(Event.id).label("events")
+            ).filter(
+                Event.stream_id.is_not(None),
+                Event.event_type != EventType.SYSTEM_SNAPSHOT
+            ).group_by(Event.stream_id).subquery()
+            
+            connection.execute(
+                update(EventStream)
+                .where(EventStream.stream_id == counts.c.stream_id)
+                .values(version=counts.c.events, snapshot_version=counts.c.events)
+            )
+            connection.execute(
+                EventStream.__table__.insert().from_select(
+                    ["stream_id", "stream_type", "version", "snapshot_version", "created_at"],
+                    select(
+                        counts.c.stream_id,
+                        literal("event_stream"),
+                        counts.c.events,
+                        counts.c.events,
+                        func.now()
+                    ).where(~exists().where(EventStream.stream_id == counts.c.stream_id))
+                )
+            )
+            logger.info("event_stream_versions_backfilled")
+        
+        if (Event.__tablename__, "stream_version") in added:
+            numbered = select(
+                Event.id,
+                func.row_number().over(
+                    partition_by=Event.stream_id,
+                    order_by=Event.sequence_number
+                ).label("stream_version")
+            ).filter(
+                Event.stream_id.is_not(None),
+                Event.event_type != EventType.SYSTEM_SNAPSHOT
+            ).subquery()
+            
+            connection.execute(
+                update(Event)
+                .where(Event.id == numbered.c.id)
+                .values(stream_version=numbered.c.stream_version)
+            )
+            logger.info("event_stream_positions_backfilled")
+    
     async def append_event_durable(self,
                                   event_type: EventType,
                                   source_service: ServiceType,
@@ -157,67 +371,114 @@ class EnhancedEventStore:
             The created event
         
         Raises:
-            ConcurrencyError: If expected version doesn't match
+            ValueError: If expected version doesn't match
         """
-        async with self.wal_lock:
-            async with self.session_factory() as session:
-                async with session.begin():
-                    # Check expected version if provided
-                    if stream_id and expected_version is not None:
-                        current_version = await self._get_stream_version(
-                            session, stream_id
-                        )
-                        if current_version != expected_version:
-                            raise ValueError(
-                                f"Concurrency conflict: expected version {expected_version}, "
-                                f"but current version is {current_version}"
-                            )
-                    
-                    # Get next sequence number atomically
-                    seq_result = await session.execute(
-                        select(func.max(Event.sequence_number)).with_for_update()
-                    )
-                    max_seq = seq_result.scalar() or 0
-                    next_seq = max_seq + 1
-                    
-                    # Create event
-                    event = Event(
-                        event_type=event_type,
+        expected_versions = None
+        if stream_id and expected_version is not None:
+            expected_versions = {stream_id: expected_version}
+        
+        events = await self.append_events_durable(
+            [
+                EventAppend(
+                    event_type=event_type,
+                    source_service=source_service,
+                    data=data,
+                    metadata=metadata,
+                    correlation_id=correlation_id,
+                    causation_id=causation_id,
+                    stream_id=stream_id
+                )
+            ],
+            expected_versions=expected_versions
+        )
+        return events[0]
+    
+    async def append_events_durable(self,
+                                   events: List[EventAppend],
+                                   *,
+                                   expected_versions: Optional[Dict[str, int]] = None) -> List[Event]:
+        """
+        Append a batch of events in a single transaction (group commit).
+        
+        Sequence numbers come from the block allocator and stream versions are
+        advanced with one upsert per stream, so concurrent batches
+        only contend on the streams they actually share.
+        
+        Args:
+            events: Events to append, in order
+            expected_versions: Optional expected version per stream ID for
+                optimistic concurrency control
+        
+        Returns:
+            The created events, in the order given
+        
+        Raises:
+            ValueError: If a stream's expected version doesn't match
+        """
+        if not events:
+            return []
+        
+        expected_versions = expected_versions or {}
+        now = datetime.utcnow()
+        
+        stream_counts: Dict[str, int] = {}
+        stream_bytes: Dict[str, int] = {}
+        for pending in events:
+            if pending.stream_id:
+                stream_counts[pending.stream_id] = stream_counts.get(pending.stream_id, 0) + 1
+                stream_bytes[pending.stream_id] = stream_bytes.get(pending.stream_id, 0) + \
+                    len(json.dumps(pending.data, default=str))
+        
+        async with self.session_factory() as session:
+            async with session.begin():
+                versions = await self._advance_stream_versions(
+                    session, stream_counts, stream_bytes, expected_versions, now
+                )
+                # Number each stream's events up to its new version, in order
+                next_versions = {
+                    stream_id: versions[stream_id] - count + 1
+                    for stream_id, count in stream_counts.items()
+                }
+                
+                sequence_numbers = await self.sequence_allocator.allocate(
+                    session, len(events)
+                )
+                transaction_id = await self._current_transaction_id(session)
+                
+                created = [
+                    Event(
+                        event_type=pending.event_type,
                         event_id=str(uuid.uuid4()),
-                        source_service=source_service.value,
-                        data=data,
-                        event_metadata=metadata or {},
-                        correlation_id=correlation_id,
-                        causation_id=causation_id,
-                        sequence_number=next_seq,
-                        stream_id=stream_id,
-                        timestamp=datetime.utcnow()
+                        source_service=pending.source_service.value,
+                        data=pending.data,
+                        event_metadata=pending.metadata or {},
+                        correlation_id=pending.correlation_id,
+                        causation_id=pending.causation_id,
+                        sequence_number=sequence_number,
+                        transaction_id=transaction_id,
+                        stream_id=pending.stream_id,
+                        stream_version=self._take_version(next_versions, pending.stream_id),
+                        timestamp=now
                     )
-                    
-                    # Add to WAL buffer for immediate durability
-                    if self.wal_enabled:
-                        self.wal_buffer.append(event)
-                    
-                    # Persist to database
-                    session.add(event)
-                    
-                    # Force flush for critical events
-                    await session.flush()
-                    
-                    # Update stream version
-                    if stream_id:
-                        await self._increment_stream_version(
-                            session, stream_id, event.timestamp
-                        )
-                    
-                    await session.commit()
-                    
-                    logger.info("event_appended_durable",
-                              event_id=event.event_id,
-                              type=event_type.value if hasattr(event_type, 'value') else event_type,
-                              sequence=next_seq)
-                    
-                    return event
+                    for pending, sequence_number in zip(events, sequence_numbers)
+                ]
+                session.add_all(created)
+        
+        logger.info("events_appended_durable",
+                  count=len(created),
+                  first_sequence=sequence_numbers[0],
+                  last_sequence=sequence_numbers[-1])
+        
+        return created
+    
+    @staticmethod
+    def _take_version(next_versions: Dict[str, int], stream_id: Optional[str]) -> Optional[int]:
+        """Hand out the next stream version of a batch (None outside streams)."""
+        if not stream_id:
+            return None
+        version = next_versions[stream_id]
+        next_versions[stream_id] += 1
+        return version
     
     async def replay_events(self,
                            mode: EventReplayMode,
@@ -228,79 +489,320 @@ class EnhancedEventStore:
                            event_types: Optional[List[EventType]] = None,
                            stream_id: Optional[str] = None,
                            callback: Optional[Callable] = None,
-                           batch_size: int = 100) -> AsyncGenerator[List[Event], None]:
+                           batch_size: int = 100,
+                           checkpoint_id: Optional[str] = None,
+                           stream_results: bool = False) -> AsyncGenerator[List[Event], None]:
         """
         Replay events based on specified mode.
         
+        Snapshots are internal to the store and never replayed. Events are
+        always yielded in commit order (LAST_N_EVENTS yields the
+        last N oldest-first), see ``ReplayPosition``. Each page stops before
+        the oldest transaction still running, so an append that commits late
+        is replayed by a later page or call instead of falling behind the
+        checkpoint. Pages are fetched by keyset on the position with a
+        short-lived session per page, or from one server-side cursor when
+        ``stream_results`` is set.
+        
         Args:
             mode: Replay mode
             from_timestamp: Start timestamp for FROM_TIMESTAMP mode
-            from_sequence: Start sequence for FROM_SEQUENCE mode
+            from_sequence: Replay the events committed after the event with
+                this sequence number (FROM_SEQUENCE mode)
             last_n: Number of events for LAST_N_EVENTS mode
             event_types: Filter by event types
             stream_id: Filter by stream ID
             callback: Optional callback for each event
             batch_size: Batch size for processing
+            checkpoint_id: Persist the position of each batch the consumer
+                finished under this ID, and resume from it on the next call
+            stream_results: Stream from a server-side cursor (``yield_per``)
+                instead of issuing one keyset query per batch
         
         Yields:
             Batches of events
         """
-        async with self.session_factory() as session:
-            # Build base query
-            query = select(Event)
+        position = await self._resolve_replay_start(
+            mode,
+            from_timestamp=from_timestamp,
+            from_sequence=from_sequence,
+            last_n=last_n,
+            event_types=event_types,
+            stream_id=stream_id
+        )
+        
+        if checkpoint_id:
+            saved = await self.get_replay_checkpoint(checkpoint_id)
+            if saved is not None and saved > position:
+                logger.info("event_replay_resumed",
+                           checkpoint_id=checkpoint_id,
+                           position=saved)
+                position = saved
+        
+        # Build filter query; ordering and the keyset predicate are added per page
+        query = select(Event).filter(Event.event_type != EventType.SYSTEM_SNAPSHOT)
+        if mode == EventReplayMode.FROM_TIMESTAMP:
+            query = query.filter(Event.timestamp >= from_timestamp)
+        if event_types:
+            query = query.filter(Event.event_type.in_(event_types))
+        if stream_id:
+            query = query.filter(Event.stream_id == stream_id)
+        
+        if stream_results:
+            pages = self._stream_pages(query, position, batch_size)
+        else:
+            pages = self._keyset_pages(query, position, batch_size)
+        
+        replayed = 0
+        async for events in pages:
+            # Apply callback if provided
+            if callback:
+                for event in events:
+                    await callback(event)
             
-            # Apply mode-specific filters
-            if mode == EventReplayMode.FROM_BEGINNING:
-                query = query.order_by(Event.sequence_number)
+            yield events
             
-            elif mode == EventReplayMode.FROM_TIMESTAMP:
-                if not from_timestamp:
-                    raise ValueError("from_timestamp required for FROM_TIMESTAMP mode")
-                query = query.filter(
-                    Event.timestamp >= from_timestamp
-                ).order_by(Event.sequence_number)
+            # The consumer asked for more, so this batch is done
+            replayed += len(events)
+            if checkpoint_id:
+                await self.save_replay_checkpoint(checkpoint_id, self._position(events[-1]))
             
-            elif mode == EventReplayMode.FROM_SEQUENCE:
-                if from_sequence is None:
-                    raise ValueError("from_sequence required for FROM_SEQUENCE mode")
-                query = query.filter(
-                    Event.sequence_number > from_sequence
-                ).order_by(Event.sequence_number)
+            logger.debug("events_replayed",
+                       count=len(events),
+                       total=replayed,
+                       sequence=events[-1].sequence_number)
+    
+    async def replay_partitioned(self,
+                                handler: Callable[[List[Event]], Awaitable[None]],
+                                *,
+                                partitions: int = 4,
+                                event_types: Optional[List[EventType]] = None,
+                                batch_size: int = 500,
+                                checkpoint_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Replay every stream, running up to ``partitions`` streams concurrently.
+        
+        Events within a stream reach ``handler`` in order; different streams
+        are replayed in parallel. Events without a stream ID are not included.
+        With a checkpoint ID, each stream keeps its own checkpoint
+        (``<checkpoint_id>:<stream_id>``), so an interrupted rebuild resumes
+        per stream.
+        
+        Args:
+            handler: Awaited with each batch of a stream's events
+            partitions: Number of streams replayed concurrently
+            event_types: Filter by event types
+            batch_size: Batch size per stream page
+            checkpoint_id: Optional checkpoint prefix
+        
+        Returns:
+            Number of streams and events replayed
+        """
+        stream_ids: asyncio.Queue = asyncio.Queue(maxsize=partitions * 4)
+        stats = {"streams": 0, "events": 0}
+        
+        async def produce():
+            async for stream_id in self._iter_stream_ids(batch_size):
+                await stream_ids.put(stream_id)
+            for _ in range(partitions):
+                await stream_ids.put(None)
+        
+        async def worker():
+            while (stream_id := await stream_ids.get()) is not None:
+                async for events in self.replay_events(
+                    EventReplayMode.FROM_BEGINNING,
+                    event_types=event_types,
+                    stream_id=stream_id,
+                    batch_size=batch_size,
+                    checkpoint_id=f"{checkpoint_id}:{stream_id}" if checkpoint_id else None
+                ):
+                    await handler(events)
+                    stats["events"] += len(events)
+                stats["streams"] += 1
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(worker()) for _ in range(partitions)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failing worker must not leave the others (or the producer) running
+            for task in tasks:
+                task.cancel()
+        
+        logger.info("partitioned_replay_completed",
+                   partitions=partitions,
+                   **stats)
+        return stats
+    
+    async def get_replay_checkpoint(self, checkpoint_id: str) -> Optional[ReplayPosition]:
+        """Get the last position recorded for a replay checkpoint."""
+        async with self.session_factory() as session:
+            row = (await session.execute(
+                select(ReplayCheckpoint.last_transaction_id, ReplayCheckpoint.last_sequence)
+                .filter_by(checkpoint_id=checkpoint_id)
+            )).first()
+            return ReplayPosition(*row) if row else None
+    
+    async def save_replay_checkpoint(self, checkpoint_id: str, position: ReplayPosition):
+        """Record replay progress for a checkpoint."""
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            async with session.begin():
+                insert = self._insert_for(session)
+                await session.execute(
+                    insert(ReplayCheckpoint).values(
+                        checkpoint_id=checkpoint_id,
+                        last_transaction_id=position.transaction_id,
+                        last_sequence=position.sequence_number,
+                        updated_at=now
+                    ).on_conflict_do_update(
+                        index_elements=[ReplayCheckpoint.checkpoint_id],
+                        set_={
+                            "last_transaction_id": position.transaction_id,
+                            "last_sequence": position.sequence_number,
+                            "updated_at": now
+                        }
+                    )
+                )
+    
+    async def clear_replay_checkpoint(self, checkpoint_id: str):
+        """Forget a checkpoint so the next replay starts from its mode's origin."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(ReplayCheckpoint).where(ReplayCheckpoint.checkpoint_id == checkpoint_id)
+                )
+    
+    async def _resolve_replay_start(self,
+                                   mode: EventReplayMode,
+                                   *,
+                                   from_timestamp: Optional[datetime],
+                                   from_sequence: Optional[int],
+                                   last_n: Optional[int],
+                                   event_types: Optional[List[EventType]],
+                                   stream_id: Optional[str]) -> ReplayPosition:
+        """Translate a replay mode into the position to page after."""
+        if mode == EventReplayMode.FROM_TIMESTAMP:
+            if not from_timestamp:
+                raise ValueError("from_timestamp required for FROM_TIMESTAMP mode")
+            return REPLAY_START
+        
+        if mode == EventReplayMode.FROM_SEQUENCE:
+            if from_sequence is None:
+                raise ValueError("from_sequence required for FROM_SEQUENCE mode")
+            if from_sequence == 0:
+                return REPLAY_START
             
-            elif mode == EventReplayMode.LAST_N_EVENTS:
-                if not last_n:
-                    raise ValueError("last_n required for LAST_N_EVENTS mode")
-                query = query.order_by(desc(Event.sequence_number)).limit(last_n)
+            async with self.session_factory() as session:
+                transaction_id = await session.scalar(
+                    select(Event.transaction_id).filter(
+                        Event.sequence_number == from_sequence,
+                        Event.event_type != EventType.SYSTEM_SNAPSHOT
+                    )
+                )
+            if transaction_id is None:
+                raise ValueError(f"No event with sequence number {from_sequence}")
+            return ReplayPosition(transaction_id, from_sequence)
+        
+        if mode == EventReplayMode.LAST_N_EVENTS:
+            if not last_n:
+                raise ValueError("last_n required for LAST_N_EVENTS mode")
             
-            # Apply additional filters
+            # Start just after the (N+1)th most recent matching event
+            query = select(Event.transaction_id, Event.sequence_number).filter(
+                Event.event_type != EventType.SYSTEM_SNAPSHOT
+            )
             if event_types:
                 query = query.filter(Event.event_type.in_(event_types))
-            
             if stream_id:
                 query = query.filter(Event.stream_id == stream_id)
+            query = query.order_by(
+                desc(Event.transaction_id), desc(Event.sequence_number)
+            ).offset(last_n).limit(1)
             
-            # Process in batches
-            offset = 0
-            while True:
-                batch_query = query.limit(batch_size).offset(offset)
-                result = await session.execute(batch_query)
+            async with self.session_factory() as session:
+                row = (await session.execute(query)).first()
+                return ReplayPosition(*row) if row else REPLAY_START
+        
+        return REPLAY_START
+    
+    async def _keyset_pages(self,
+                           query,
+                           position: ReplayPosition,
+                           batch_size: int) -> AsyncGenerator[List[Event], None]:
+        """Page through a replay query by keyset, one short session per page."""
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    self._after_position(session, query, position).limit(batch_size)
+                )
                 events = list(result.scalars().all())
-                
-                if not events:
-                    break
-                
-                # Apply callback if provided
-                if callback:
-                    for event in events:
-                        await callback(event)
-                
-                yield events
-                
-                offset += batch_size
-                
-                logger.debug("events_replayed",
-                           count=len(events),
-                           offset=offset)
+            
+            if not events:
+                return
+            
+            yield events
+            
+            if len(events) < batch_size:
+                return
+            position = self._position(events[-1])
+    
+    async def _stream_pages(self,
+                           query,
+                           position: ReplayPosition,
+                           batch_size: int) -> AsyncGenerator[List[Event], None]:
+        """Stream a replay query from a server-side cursor in batches."""
+        async with self.session_factory() as session:
+            result = await session.stream_scalars(
+                self._after_position(session, query, position)
+                .execution_options(yield_per=batch_size)
+            )
+            async for partition in result.partitions(batch_size):
+                yield list(partition)
+    
+    @staticmethod
+    def _after_position(session: AsyncSession, query, position: ReplayPosition):
+        """
+        Order a replay query by position and keep it after ``position``.
+        
+        On Postgres the query also stops before the oldest running
+        transaction: every event below that has committed (or never will),
+        and anything committing later gets a higher position.
+        """
+        horizon = true()
+        if session.bind.dialect.name == "postgresql":
+            horizon = Event.transaction_id < OLDEST_RUNNING_TRANSACTION_ID
+        
+        return query.filter(
+            tuple_(Event.transaction_id, Event.sequence_number) > tuple(position),
+            horizon
+        ).order_by(Event.transaction_id, Event.sequence_number)
+    
+    @staticmethod
+    def _position(event: Event) -> ReplayPosition:
+        """Replay position of a stored event."""
+        return ReplayPosition(event.transaction_id, event.sequence_number)
+    
+    async def _iter_stream_ids(self, page_size: int) -> AsyncGenerator[str, None]:
+        """Iterate distinct stream IDs by keyset."""
+        last_stream_id = ""
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(Event.stream_id)
+                    .filter(Event.stream_id > last_stream_id)
+                    .distinct()
+                    .order_by(Event.stream_id)
+                    .limit(page_size)
+                )
+                stream_ids = [row[0] for row in result]
+            
+            for stream_id in stream_ids:
+                yield stream_id
+            
+            if len(stream_ids) < page_size:
+                return
+            last_stream_id = stream_ids[-1]
     
     async def create_snapshot(self,
                             stream_id: str,
@@ -312,142 +814,398 @@ class EnhancedEventStore:
         Args:
             stream_id: Stream ID
             state: Current state
-            version: Version number
+            version: Stream version the state includes
         
         Returns:
             Snapshot ID
         """
-        snapshot_id = str(uuid.uuid4())
+        async with self.session_factory() as session:
+            async with session.begin():
+                return await self._write_snapshot(session, stream_id, state, version)
+    
+    async def get_latest_snapshot(self, stream_id: str) -> Optional[Event]:
+        """Get the latest snapshot for a stream."""
+        async with self.session_factory() as session:
+            return await self._get_latest_snapshot(session, stream_id)
+    
+    async def snapshot_stream(self,
+                             stream_id: str,
+                             up_to_version: Optional[int] = None) -> Optional[str]:
+        """
+        Snapshot a stream in its own short transaction.
+        
+        State is rebuilt from the latest snapshot plus the events after it, so
+        the cost is bounded by the snapshot interval rather than stream length.
+        The stream row is locked for the duration, so every append up to
+        ``EventStream.version`` has committed and new ones wait instead of
+        slipping between rebuild and bookkeeping.
+        
+        Args:
+            stream_id: Stream ID
+            up_to_version: Only cover events up to this stream version (used
+                by compaction); None snapshots the current state
         
+        Returns:
+            Snapshot ID, or None if the latest snapshot already covers the range
+        """
         async with self.session_factory() as session:
             async with session.begin():
-                # Store snapshot as special event
-                snapshot_event = Event(
-                    event_type="system.snapshot",
-                    event_id=snapshot_id,
-                    source_service="message-hub",
-                    data=state,
-                    event_metadata={
-                        "snapshot": True,
-                        "version": version,
-                        "stream_id": stream_id
-                    },
-                    stream_id=stream_id,
-                    sequence_number=await self._get_next_sequence(session),
-                    timestamp=datetime.utcnow()
+                stream = await session.scalar(
+                    select(EventStream).filter_by(stream_id=stream_id).with_for_update()
                 )
+                if stream is None:
+                    return None
                 
-                session.add(snapshot_event)
-                await session.commit()
+                version = stream.version
+                if up_to_version is not None:
+                    version = min(version, up_to_version)
                 
-                logger.info("snapshot_created",
-                          snapshot_id=snapshot_id,
-                          stream_id=stream_id,
-                          version=version)
+                snapshot = await self._get_latest_snapshot(session, stream_id)
+                if version == 0 or (snapshot and snapshot.stream_version >= version):
+                    return None
+                
+                state = await self._reconstruct_state(
+                    session, stream_id, up_to_version=version
+                )
+                snapshot_id = await self._write_snapshot(session, stream_id, state, version)
+                
+                if up_to_version is None:
+                    stream.snapshot_version = version
+                    stream.bytes_since_snapshot = 0
                 
                 return snapshot_id
     
-    async def get_latest_snapshot(self, stream_id: str) -> Optional[Event]:
-        """Get the latest snapshot for a stream."""
+    async def snapshot_due_streams(self, limit: int = 100) -> int:
+        """
+        Snapshot streams that crossed the event-count or byte threshold.
+        
+        Args:
+            limit: Maximum streams to snapshot in this pass
+        
+        Returns:
+            Number of snapshots written
+        """
         async with self.session_factory() as session:
-            query = select(Event).filter(
-                and_(
-                    Event.stream_id == stream_id,
-                    Event.event_type == "system.snapshot"
-                )
-            ).order_by(desc(Event.timestamp)).limit(1)
-            
-            result = await session.execute(query)
-            return result.scalar_one_or_none()
+            result = await session.execute(
+                select(EventStream.stream_id).filter(
+                    or_(
+                        EventStream.version - EventStream.snapshot_version >= self.snapshot_every_events,
+                        EventStream.bytes_since_snapshot >= self.snapshot_every_bytes
+                    )
+                ).limit(limit)
+            )
+            stream_ids = [row[0] for row in result]
+        
+        written = 0
+        for stream_id in stream_ids:
+            if await self.snapshot_stream(stream_id):
+                written += 1
+        
+        if written:
+            logger.info("automatic_snapshots_written", count=written)
+        return written
     
-    async def compact_events(self, before_date: Optional[datetime] = None):
+    async def compact_events(self, before_date: Optional[datetime] = None) -> Dict[str, int]:
         """
         Compact old events to save space.
         
+        Streams are compacted one at a time: a snapshot covering the stream's
+        old events is written in its own transaction, then the old events and
+        superseded snapshots are deleted in chunks of ``compaction_chunk_size``.
+        Progress is recorded after every stream, and an unfinished run is
+        resumed (with its original cutoff) by the next call.
+        
         Args:
-            before_date: Compact events before this date
+            before_date: Compact events before this date (new runs only)
+        
+        Returns:
+            Streams processed and events deleted by this call
         """
-        if not before_date:
-            before_date = datetime.utcnow() - timedelta(days=self.retention_days)
+        progress = await self._start_or_resume_compaction(before_date)
+        cutoff = progress.before_date
+        cursor = progress.last_stream_id
+        stats = {"streams_processed": 0, "events_deleted": 0}
+        
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(Event.stream_id).filter(
+                        Event.stream_id > cursor,
+                        Event.timestamp < cutoff,
+                        Event.event_type != EventType.SYSTEM_SNAPSHOT
+                    ).distinct().order_by(Event.stream_id).limit(self.compaction_chunk_size)
+                )
+                stream_ids = [row[0] for row in result]
+            
+            for stream_id in stream_ids:
+                deleted = await self._compact_stream(stream_id, cutoff)
+                cursor = stream_id
+                stats["streams_processed"] += 1
+                stats["events_deleted"] += deleted
+                await self._record_compaction_progress(progress.id, stream_id, deleted)
+            
+            if len(stream_ids) < self.compaction_chunk_size:
+                break
+        
+        # Events outside any stream carry no state worth snapshotting
+        deleted = await self._delete_events_in_chunks(
+            Event.stream_id.is_(None),
+            Event.timestamp < cutoff
+        )
+        stats["events_deleted"] += deleted
         
         async with self.session_factory() as session:
             async with session.begin():
-                # Get streams with old events
-                stream_query = select(Event.stream_id).filter(
-                    Event.timestamp < before_date
-                ).distinct()
-                
-                result = await session.execute(stream_query)
-                stream_ids = [row[0] for row in result if row[0]]
-                
-                for stream_id in stream_ids:
-                    # Create snapshot for stream
-                    latest_event = await self._get_latest_event_for_stream(
-                        session, stream_id
+                await session.execute(
+                    update(CompactionProgress)
+                    .where(CompactionProgress.id == progress.id)
+                    .values(
+                        events_deleted=CompactionProgress.events_deleted + deleted,
+                        completed_at=datetime.utcnow(),
+                        updated_at=datetime.utcnow()
                     )
-                    
-                    if latest_event:
-                        # Reconstruct state from events
-                        state = await self._reconstruct_state(session, stream_id)
-                        
-                        # Create snapshot
-                        await self.create_snapshot(
-                            stream_id,
-                            state,
-                            latest_event.sequence_number
-                        )
-                
-                # Delete old events (except snapshots)
-                delete_query = delete(Event).filter(
-                    and_(
-                        Event.timestamp < before_date,
-                        Event.event_type != "system.snapshot"
+                )
+        
+        logger.info("events_compacted",
+                  before_date=cutoff.isoformat(),
+                  **stats)
+        return stats
+    
+    async def _compact_stream(self, stream_id: str, cutoff: datetime) -> int:
+        """Snapshot and delete the oldest run of a stream's events before ``cutoff``."""
+        stream_events = and_(
+            Event.stream_id == stream_id,
+            Event.event_type != EventType.SYSTEM_SNAPSHOT
+        )
+        async with self.session_factory() as session:
+            # Versions are taken in commit order, so an event can be older than
+            # one with a lower version; stop before the first event to keep
+            newest_kept = select(func.min(Event.stream_version)).filter(
+                stream_events, Event.timestamp >= cutoff
+            ).scalar_subquery()
+            cut_version = await session.scalar(
+                select(func.max(Event.stream_version)).filter(
+                    stream_events,
+                    Event.timestamp < cutoff,
+                    or_(newest_kept.is_(None), Event.stream_version < newest_kept)
+                )
+            )
+        if cut_version is None:
+            return 0
+        
+        # The snapshot must be durable before the events it replaces go away
+        await self.snapshot_stream(stream_id, up_to_version=cut_version)
+        
+        async with self.session_factory() as session:
+            latest_snapshot = await self._get_latest_snapshot(session, stream_id)
+        
+        deleted = await self._delete_events_in_chunks(
+            stream_events,
+            Event.stream_version <= cut_version,
+            Event.timestamp < cutoff
+        )
+        if latest_snapshot:
+            deleted += await self._delete_events_in_chunks(
+                Event.stream_id == stream_id,
+                Event.event_type == EventType.SYSTEM_SNAPSHOT,
+                Event.stream_version < latest_snapshot.stream_version
+            )
+        return deleted
+    
+    async def _delete_events_in_chunks(self, *conditions) -> int:
+        """Delete matching events, ``compaction_chunk_size`` rows per transaction."""
+        total = 0
+        while True:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    chunk = select(Event.id).filter(*conditions).limit(self.compaction_chunk_size)
+                    result = await session.execute(
+                        delete(Event).where(Event.id.in_(chunk))
                     )
+                    deleted = result.rowcount or 0
+            
+            total += deleted
+            if deleted < self.compaction_chunk_size:
+                return total
+            
+            # Let live traffic in between chunks
+            await asyncio.sleep(0)
+    
+    async def _start_or_resume_compaction(self,
+                                         before_date: Optional[datetime]) -> CompactionProgress:
+        """Load the unfinished compaction run, or start a new one."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                progress = await session.scalar(
+                    select(CompactionProgress)
+                    .filter(CompactionProgress.completed_at.is_(None))
+                    .order_by(desc(CompactionProgress.id))
+                    .limit(1)
                 )
+                if progress:
+                    logger.info("compaction_resumed",
+                              before_date=progress.before_date.isoformat(),
+                              last_stream_id=progress.last_stream_id)
+                    return progress
                 
-                result = await session.execute(delete_query)
-                deleted_count = result.rowcount
-                
-                await session.commit()
-                
-                logger.info("events_compacted",
-                          before_date=before_date.isoformat(),
-                          deleted_count=deleted_count,
-                          streams_processed=len(stream_ids))
+                progress = CompactionProgress(
+                    before_date=before_date or datetime.utcnow() - timedelta(days=self.retention_days),
+                    last_stream_id=""
+                )
+                session.add(progress)
+                await session.flush()
+                return progress
+    
+    async def _record_compaction_progress(self, progress_id: int, stream_id: str, deleted: int):
+        """Persist the compaction cursor after a stream is done."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    update(CompactionProgress)
+                    .where(CompactionProgress.id == progress_id)
+                    .values(
+                        last_stream_id=stream_id,
+                        streams_processed=CompactionProgress.streams_processed + 1,
+                        events_deleted=CompactionProgress.events_deleted + deleted,
+                        updated_at=datetime.utcnow()
+                    )
+                )
+    
+    async def _write_snapshot(self,
+                             session: AsyncSession,
+                             stream_id: str,
+                             state: Dict[str, Any],
+                             version: int) -> str:
+        """
+        Store a snapshot event covering the stream up to ``version``.
+        
+        Snapshots carry the covered version as their ``stream_version`` and
+        take no number from the event sequence (they are stored with 0).
+        """
+        snapshot_id = str(uuid.uuid4())
+        
+        session.add(Event(
+            event_type=EventType.SYSTEM_SNAPSHOT,
+            event_id=snapshot_id,
+            source_service="message-hub",
+            data=state,
+            event_metadata={
+                "snapshot": True,
+                "version": version,
+                "stream_id": stream_id
+            },
+            stream_id=stream_id,
+            stream_version=version,
+            sequence_number=0,
+            transaction_id=await self._current_transaction_id(session),
+            timestamp=datetime.utcnow()
+        ))
+        
+        logger.info("snapshot_created",
+                  snapshot_id=snapshot_id,
+                  stream_id=stream_id,
+                  version=version)
+        
+        return snapshot_id
+    
+    async def _get_latest_snapshot(self,
+                                  session: AsyncSession,
+                                  stream_id: str) -> Optional[Event]:
+        """Get the snapshot covering the highest version of a stream."""
+        query = select(Event).filter(
+            and_(
+                Event.stream_id == stream_id,
+                Event.event_type == EventType.SYSTEM_SNAPSHOT
+            )
+        ).order_by(nulls_last(desc(Event.stream_version)), desc(Event.id)).limit(1)
+        
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
     
     async def _get_stream_version(self,
                                  session: AsyncSession,
                                  stream_id: str) -> int:
         """Get current version of a stream."""
-        query = select(func.count(Event.id)).filter(
-            Event.stream_id == stream_id
-        )
+        query = select(EventStream.version).filter_by(stream_id=stream_id)
         result = await session.execute(query)
         return result.scalar() or 0
     
-    async def _increment_stream_version(self,
-                                       session: AsyncSession,
-                                       stream_id: str,
-                                       event_time: datetime):
-        """Increment stream version."""
-        # Update stream metadata if exists
-        from .event_store.models import EventStream
+    async def _advance_stream_versions(self,
+                                      session: AsyncSession,
+                                      stream_counts: Dict[str, int],
+                                      stream_bytes: Dict[str, int],
+                                      expected_versions: Dict[str, int],
+                                      event_time: datetime) -> Dict[str, int]:
+        """
+        Advance stream versions by the number of events appended to each.
         
-        query = select(EventStream).filter_by(stream_id=stream_id)
-        result = await session.execute(query)
-        stream = result.scalar_one_or_none()
+        Each stream gets one ``INSERT ... ON CONFLICT DO UPDATE``, so the first
+        appends to a new stream from concurrent batches serialize on the row
+        instead of failing. Streams are upserted in sorted order so batches
+        that touch several streams cannot deadlock.
+        
+        Returns:
+            The new version of each stream
+        
+        Raises:
+            ValueError: If a stream's expected version doesn't match
+        """
+        insert = self._insert_for(session)
+        
+        versions: Dict[str, int] = {}
+        for stream_id in sorted(stream_counts):
+            count = stream_counts[stream_id]
+            expected = expected_versions.get(stream_id)
+            
+            stmt = insert(EventStream).values(
+                stream_id=stream_id,
+                stream_type="event_stream",
+                version=count,
+                bytes_since_snapshot=stream_bytes[stream_id],
+                last_event_at=event_time
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[EventStream.stream_id],
+                set_={
+                    "version": EventStream.version + count,
+                    "bytes_since_snapshot": EventStream.bytes_since_snapshot + stream_bytes[stream_id],
+                    "last_event_at": event_time
+                },
+                where=(EventStream.version == expected) if expected is not None else None
+            ).returning(EventStream.version)
+            
+            version = await session.scalar(stmt)
+            if expected is not None and version != expected + count:
+                # No row back means the guarded update was skipped; a new row
+                # means the stream did not exist yet (the caller's transaction
+                # rolls that insert back)
+                current = 0
+                if version is None:
+                    current = await self._get_stream_version(session, stream_id)
+                raise ValueError(
+                    f"Concurrency conflict: expected version {expected}, "
+                    f"but current version is {current}"
+                )
+            versions[stream_id] = version
         
-        if stream:
-            stream.last_event_at = event_time
-            stream.version = (stream.version or 0) + 1
+        return versions
     
     async def _get_next_sequence(self, session: AsyncSession) -> int:
         """Get next sequence number."""
-        seq_result = await session.execute(
-            select(func.max(Event.sequence_number))
-        )
-        max_seq = seq_result.scalar() or 0
-        return max_seq + 1
+        return (await self.sequence_allocator.allocate(session, 1))[0]
+    
+    async def _current_transaction_id(self, session: AsyncSession) -> int:
+        """Transaction ID that orders this session's events for replay."""
+        if session.bind.dialect.name != "postgresql":
+            return 0
+        return await session.scalar(CURRENT_TRANSACTION_ID)
+    
+    @staticmethod
+    def _insert_for(session: AsyncSession):
+        """Dialect ``insert`` construct supporting ``on_conflict_do_update``."""
+        if session.bind.dialect.name == "postgresql":
+            return postgresql_insert
+        return sqlite_insert
     
     async def _get_latest_event_for_stream(self,
                                           session: AsyncSession,
@@ -462,91 +1220,69 @@ class EnhancedEventStore:
     
     async def _reconstruct_state(self,
                                 session: AsyncSession,
-                                stream_id: str) -> Dict[str, Any]:
-        """Reconstruct state from events."""
-        # Get latest snapshot
-        snapshot = await self.get_latest_snapshot(stream_id)
+                                stream_id: str,
+                                up_to_version: Optional[int] = None) -> Dict[str, Any]:
+        """Reconstruct state from the latest snapshot and the events after it."""
+        snapshot = await self._get_latest_snapshot(session, stream_id)
         
         state = {}
+        from_version = 0
         if snapshot:
             state = snapshot.data.copy()
-            from_sequence = snapshot.sequence_number
-        else:
-            from_sequence = 0
+            from_version = snapshot.stream_version
         
         # Apply events after snapshot
         query = select(Event).filter(
             and_(
                 Event.stream_id == stream_id,
-                Event.sequence_number > from_sequence,
-                Event.event_type != "system.snapshot"
+                Event.stream_version > from_version,
+                Event.event_type != EventType.SYSTEM_SNAPSHOT
             )
-        ).order_by(Event.sequence_number)
-        
-        result = await session.execute(query)
-        events = result.scalars().all()
+        )
+        if up_to_version is not None:
+            query = query.filter(Event.stream_version <= up_to_version)
+        query = query.order_by(Event.stream_version).execution_options(yield_per=500)
         
-        for event in events:
+        result = await session.stream_scalars(query)
+        async for event in result:
             # Apply event to state (simplified)
             state.update(event.data)
         
         return state
     
-    async def _flush_wal(self):
-        """Flush write-ahead log to database."""
-        if not self.wal_buffer:
-            return
-        
-        async with self.wal_lock:
-            if not self.wal_buffer:
-                return
-            
-            events_to_flush = self.wal_buffer.copy()
-            self.wal_buffer.clear()
-        
-        # Batch insert for efficiency
-        async with self.session_factory() as session:
-            async with session.begin():
-                for event in events_to_flush:
-                    session.add(event)
-                
-                await session.commit()
-                
-                logger.debug("wal_flushed", count=len(events_to_flush))
-    
-    async def _wal_flush_loop(self):
-        """Background task to flush WAL periodically."""
-        logger.info("wal_flush_loop_started")
+    async def _compaction_loop(self):
+        """Background task for event compaction."""
+        logger.info("compaction_loop_started")
         
         while True:
             try:
-                await asyncio.sleep(self.wal_flush_interval)
-                await self._flush_wal()
+                await asyncio.sleep(self.compaction_interval)
+                await self.compact_events()
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error("wal_flush_error", error=str(e))
-                await asyncio.sleep(5)
+                logger.error("compaction_error", error=str(e))
+                await asyncio.sleep(60)
         
-        logger.info("wal_flush_loop_stopped")
+        logger.info("compaction_loop_stopped")
     
-    async def _compaction_loop(self):
-        """Background task for event compaction."""
-        logger.info("compaction_loop_started")
+    async def _snapshot_loop(self):
+        """Background task that snapshots streams past their thresholds."""
+        logger.info("snapshot_loop_started")
         
         while True:
             try:
-                await asyncio.sleep(self.compaction_interval)
-                await self.compact_events()
+                await asyncio.sleep(self.snapshot_check_interval)
+                await self.snapshot_due_streams()
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error("compaction_error", error=str(e))
+                logger.error("snapshot_error", error=str(e))
                 await asyncio.sleep(60)
         
-        logger.info("compaction_loop_stopped")
+        logger.info("snapshot_loop_stopped")
     
     async def get_metrics(self) -> Dict[str, Any]:
         """Get event store metrics."""
@@ -564,7 +1300,7 @@ class EnhancedEventStore:
             # Get snapshot count
             snapshot_count = await session.execute(
                 select(func.count(Event.id)).filter(
-                    Event.event_type == "system.snapshot"
+                    Event.event_type == EventType.SYSTEM_SNAPSHOT
                 )
             )
             
@@ -578,7 +1314,6 @@ class EnhancedEventStore:
                 "stream_count": stream_count.scalar() or 0,
                 "snapshot_count": snapshot_count.scalar() or 0,
                 "oldest_event": oldest_event.scalar(),
-                "wal_buffer_size": len(self.wal_buffer),
                 "retention_days": self.retention_days,
                 "compaction_enabled": self.compaction_enabled
             }
@@ -7,7 +7,7 @@ Utility functions for event store operations.
 from typing import Optional, Dict, Any
 from uuid import uuid4
 
-from ..models import ServiceType, MessageType
+from ..message_hub.core.models import ServiceType, MessageType
 from .models import EventType
 from .service import EventStore
 
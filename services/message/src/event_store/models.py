@@ -7,7 +7,9 @@ Database models for storing and retrieving events.
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Enum as SQLAEnum, ForeignKey
+from sqlalchemy import (
+    BigInteger, Column, Integer, String, JSON, DateTime, Enum as SQLAEnum, ForeignKey, Index
+)
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
@@ -39,6 +41,9 @@ class EventType(str, Enum):
     TRANSACTION_STARTED = "transaction.started"
     TRANSACTION_COMMITTED = "transaction.committed"
     TRANSACTION_ROLLED_BACK = "transaction.rolled_back"
+    
+    # Event store internals
+    SYSTEM_SNAPSHOT = "system.snapshot"
 
 class Event(Base):
     """
@@ -53,6 +58,15 @@ class Event(Base):
     """
     
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination of a single stream during replay
+        Index("ix_events_stream_sequence", "stream_id", "sequence_number"),
+        # Replay pages in commit order: transaction, then sequence
+        Index("ix_events_position", "transaction_id", "sequence_number"),
+        Index("ix_events_stream_position", "stream_id", "transaction_id", "sequence_number"),
+        # Snapshot rebuilds and compaction walk a stream by version
+        Index("ix_events_stream_version", "stream_id", "stream_version"),
+    )
     
     id = Column(Integer, primary_key=True)
     event_type = Column(SQLAEnum(EventType), nullable=False)
@@ -72,8 +86,14 @@ class Event(Base):
     causation_id = Column(String(36), nullable=True)
     
     # Event sequence tracking
-    sequence_number = Column(Integer, nullable=False)
+    sequence_number = Column(Integer, nullable=False, index=True)
+    # Appending Postgres transaction (0 elsewhere); orders replay, since
+    # sequence numbers are reserved in blocks and can commit out of order
+    transaction_id = Column(BigInteger, nullable=False, default=0, server_default="0")
     stream_id = Column(String(36), nullable=True)  # For event streams
+    # Position in the stream (1-based, commit-ordered); for snapshots, the
+    # last version they cover
+    stream_version = Column(Integer, nullable=True)
     
     def __repr__(self):
         return (f"<Event(id={self.id}, "
@@ -99,13 +119,22 @@ class EventStream(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     last_event_at = Column(DateTime, nullable=True)
     
+    # Number of events appended to the stream (optimistic concurrency token)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    # Snapshot bookkeeping: stream version covered by the latest automatic
+    # snapshot and approximate payload bytes appended since then
+    snapshot_version = Column(Integer, nullable=False, default=0, server_default="0")
+    bytes_since_snapshot = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Stream metadata
     stream_metadata = Column('metadata', JSON, nullable=True)
     
     def __repr__(self):
         return (f"<EventStream(id={self.id}, "
                 f"stream_id={self.stream_id}, "
-                f"type={self.stream_type})>")
+                f"type={self.stream_type}, "
+                f"version={self.version})>")
 
 class EventSubscription(Base):
     """
@@ -144,3 +173,47 @@ class EventSubscription(Base):
         return (f"<EventSubscription(id={self.id}, "
                 f"subscriber={self.subscriber_service}, "
                 f"last_seq={self.last_processed_sequence})>")
+
+class ReplayCheckpoint(Base):
+    """
+    Position of a (possibly interrupted) event replay.
+    
+    Replays started with a checkpoint ID resume after the position
+    (``last_transaction_id``, ``last_sequence``).
+    """
+    
+    __tablename__ = "replay_checkpoints"
+    
+    id = Column(Integer, primary_key=True)
+    checkpoint_id = Column(String(200), nullable=False, unique=True)
+    last_transaction_id = Column(BigInteger, nullable=False, default=0, server_default="0")
+    last_sequence = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return (f"<ReplayCheckpoint(checkpoint_id={self.checkpoint_id}, "
+                f"last_sequence={self.last_sequence})>")
+
+class CompactionProgress(Base):
+    """
+    Progress of an event compaction run.
+    
+    Compaction walks streams in ``stream_id`` order; an unfinished run is
+    resumed after ``last_stream_id`` with its original cutoff.
+    """
+    
+    __tablename__ = "compaction_progress"
+    
+    id = Column(Integer, primary_key=True)
+    before_date = Column(DateTime, nullable=False)
+    last_stream_id = Column(String(36), nullable=False, default="")
+    streams_processed = Column(Integer, nullable=False, default=0)
+    events_deleted = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return (f"<CompactionProgress(id={self.id}, "
+                f"before={self.before_date}, "
+                f"last_stream_id={self.last_stream_id})>")
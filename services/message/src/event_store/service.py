@@ -14,7 +14,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import func
 
 from .models import Event, EventStream, EventSubscription, EventType, Base
-from ..models import ServiceType
+from ..message_hub.core.models import ServiceType
 
 logger = structlog.get_logger()
 
@@ -0,0 +1,334 @@
+"""
+Message Hub Broadcast Engine
+
+Fan-out of events to groups of WebSocket connections. Each event is encoded
+once; every connection has its own bounded outbound queue and writer task,
+so a slow client only delays itself.
+
+The game session service keeps a copy with the same API in
+game_session.core.broadcast; changes to one should be mirrored in the other.
+"""
+
+import asyncio
+import json
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Queue lanes, most urgent first
+CRITICAL_LANE = 0
+HIGH_LANE = 1
+NORMAL_LANE = 2
+LOW_LANE = 3
+LANE_COUNT = 4
+
+# "Try again later" close code used when a consumer cannot keep up
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued frame
+    DROP_NEWEST = "drop_newest"  # Discard the incoming frame
+    DISCONNECT = "disconnect"    # Close the connection
+
+
+def encode_message(message: Any) -> str:
+    """Encode a message to the text frame sent to every recipient."""
+    if isinstance(message, str):
+        return message
+    if hasattr(message, "model_dump_json"):
+        return message.model_dump_json()
+    return json.dumps(message, default=str, separators=(",", ":"))
+
+
+class ConnectionSender:
+    """
+    Outbound queue and writer task for a single WebSocket.
+
+    Frames are held in one FIFO lane per priority and the writer always
+    sends from the most urgent non-empty lane. When the queue is full a
+    less urgent frame is evicted first, so combat traffic is never dropped
+    to make room for chat.
+    """
+
+    def __init__(self,
+                 websocket: Any,
+                 max_queue: int,
+                 policy: SlowConsumerPolicy,
+                 send_timeout: float,
+                 on_closed: Callable[["ConnectionSender", str], None]):
+        """Initialize sender and start its writer task."""
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.on_closed = on_closed
+        self.closed = False
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self._lanes: List[Deque[str]] = [deque() for _ in range(LANE_COUNT)]
+        self._size = 0
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def queued(self) -> int:
+        """Number of frames waiting to be sent."""
+        return self._size
+
+    def offer(self, frame: str, lane: int = NORMAL_LANE) -> bool:
+        """
+        Queue a frame without blocking.
+
+        Args:
+            frame: Encoded frame
+            lane: Queue lane, 0 being most urgent
+
+        Returns:
+            True if the frame was queued
+        """
+        if self.closed:
+            return False
+
+        if self._size >= self.max_queue and not self._make_room(lane):
+            self.frames_dropped += 1
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                self._close("slow_consumer")
+            return False
+
+        self._lanes[lane].append(frame)
+        self._size += 1
+        self._ready.set()
+        return True
+
+    async def stop(self):
+        """Stop the writer; frames still queued are discarded."""
+        self.closed = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def _make_room(self, lane: int) -> bool:
+        """Evict one frame to make room for a frame in ``lane``."""
+        # Anything less urgent goes first, regardless of policy
+        for victim in range(LANE_COUNT - 1, lane, -1):
+            if self._lanes[victim]:
+                break
+        else:
+            if self.policy != SlowConsumerPolicy.DROP_OLDEST or not self._lanes[lane]:
+                return False
+            victim = lane
+
+        self._lanes[victim].popleft()
+        self._size -= 1
+        self.frames_dropped += 1
+        return True
+
+    def _next_frame(self) -> str:
+        """Pop the next frame from the most urgent lane."""
+        for lane in self._lanes:
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        raise IndexError("no frames queued")
+
+    def _close(self, reason: str):
+        """Mark closed, stop writing and notify the owner."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+        if reason == "slow_consumer":
+            asyncio.create_task(self._close_socket())
+        self.on_closed(self, reason)
+
+    async def _close_socket(self):
+        """Close the socket of a consumer that fell behind."""
+        try:
+            await self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
+
+    async def _run(self):
+        """Writer loop."""
+        try:
+            while True:
+                while not self._size:
+                    self._ready.clear()
+                    await self._ready.wait()
+
+                frame = self._next_frame()
+                await asyncio.wait_for(
+                    self.websocket.send_text(frame),
+                    timeout=self.send_timeout
+                )
+                self.frames_sent += 1
+
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._close("send_timeout")
+        except Exception as e:
+            logger.debug("websocket_send_failed", error=str(e))
+            self._close("send_failed")
+
+
+class BroadcastEngine:
+    """
+    Fans events out to groups of connections.
+
+    Connections are registered under a group (e.g. a game session) and a
+    key unique within it. Broadcasting encodes the message once and offers
+    the frame to each connection's sender; it never waits on a socket.
+    """
+
+    def __init__(self,
+                 max_queue: int = 256,
+                 policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+                 send_timeout: float = 5.0,
+                 on_disconnect: Optional[Callable[[Hashable, Hashable, str], Awaitable[None]]] = None):
+        """
+        Initialize broadcast engine.
+
+        Args:
+            max_queue: Outbound frames buffered per connection
+            policy: Slow consumer policy applied when a buffer is full
+            send_timeout: Seconds a single send may take before the
+                connection is considered dead
+            on_disconnect: Called with (group, key, reason) when the engine
+                drops a connection that failed or fell behind
+        """
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.on_disconnect = on_disconnect
+        self._groups: Dict[Hashable, Dict[Hashable, ConnectionSender]] = {}
+        self.stats = {
+            "events_broadcast": 0,
+            "frames_queued": 0,
+            "frames_dropped": 0,
+            "connections_dropped": 0
+        }
+
+    def add(self, group: Hashable, key: Hashable, websocket: Any) -> ConnectionSender:
+        """Register a connection, replacing any previous one under the same key."""
+        senders = self._groups.setdefault(group, {})
+        previous = senders.pop(key, None)
+        if previous:
+            previous.closed = True
+            previous._task.cancel()
+
+        sender = ConnectionSender(
+            websocket,
+            max_queue=self.max_queue,
+            policy=self.policy,
+            send_timeout=self.send_timeout,
+            on_closed=lambda s, reason: self._handle_closed(group, key, s, reason)
+        )
+        senders[key] = sender
+        return sender
+
+    async def remove(self, group: Hashable, key: Hashable):
+        """Unregister a connection and stop its writer."""
+        senders = self._groups.get(group)
+        if not senders:
+            return
+        sender = senders.pop(key, None)
+        if not senders:
+            del self._groups[group]
+        if sender:
+            self.stats["frames_dropped"] += sender.frames_dropped
+            await sender.stop()
+
+    def broadcast(self,
+                  group: Hashable,
+                  message: Any,
+                  lane: int = NORMAL_LANE,
+                  exclude: Optional[Iterable[Hashable]] = None) -> int:
+        """
+        Queue a message for every connection in a group.
+
+        Args:
+            group: Connection group
+            message: Dict, pydantic model or pre-encoded string
+            lane: Queue lane, 0 being most urgent
+            exclude: Keys to skip
+
+        Returns:
+            Number of connections the message was queued for
+        """
+        senders = self._groups.get(group)
+        if not senders:
+            return 0
+
+        frame = encode_message(message)
+        skip = set(exclude) if exclude else ()
+        queued = 0
+        for key, sender in list(senders.items()):
+            if key in skip:
+                continue
+            if sender.offer(frame, lane):
+                queued += 1
+
+        self.stats["events_broadcast"] += 1
+        self.stats["frames_queued"] += queued
+        return queued
+
+    def send(self, group: Hashable, key: Hashable, message: Any, lane: int = NORMAL_LANE) -> bool:
+        """Queue a message for a single connection."""
+        sender = self._groups.get(group, {}).get(key)
+        if not sender:
+            return False
+        queued = sender.offer(encode_message(message), lane)
+        if queued:
+            self.stats["frames_queued"] += 1
+        return queued
+
+    def connection_count(self, group: Optional[Hashable] = None) -> int:
+        """Number of registered connections, overall or in one group."""
+        if group is not None:
+            return len(self._groups.get(group, {}))
+        return sum(len(senders) for senders in self._groups.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics."""
+        senders = [s for group in self._groups.values() for s in group.values()]
+        return {
+            **self.stats,
+            "frames_dropped": self.stats["frames_dropped"] + sum(s.frames_dropped for s in senders),
+            "connections": len(senders),
+            "frames_pending": sum(s.queued for s in senders)
+        }
+
+    async def close(self):
+        """Stop every writer."""
+        for group in list(self._groups):
+            for key in list(self._groups.get(group, {})):
+                await self.remove(group, key)
+
+    def _handle_closed(self, group: Hashable, key: Hashable, sender: ConnectionSender, reason: str):
+        """Drop a connection whose writer gave up."""
+        senders = self._groups.get(group)
+        if not senders or senders.get(key) is not sender:
+            return
+        del senders[key]
+        if not senders:
+            del self._groups[group]
+
+        self.stats["connections_dropped"] += 1
+        self.stats["frames_dropped"] += sender.frames_dropped
+        logger.warning("broadcast_connection_dropped",
+                      group=str(group),
+                      reason=reason,
+                      frames_dropped=sender.frames_dropped)
+
+        if self.on_disconnect:
+            asyncio.create_task(self.on_disconnect(group, key, reason))
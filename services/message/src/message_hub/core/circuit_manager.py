@@ -6,7 +6,7 @@ Manages circuit breakers for all service endpoints.
 
 from typing import Dict, Optional, Any
 import structlog
-from .circuit_breaker import CircuitBreaker
+from .circuit import CircuitBreaker
 from .models import ServiceType
 
 logger = structlog.get_logger()
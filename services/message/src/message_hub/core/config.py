@@ -46,6 +46,7 @@ class Settings(BaseSettings):
     EVENT_BATCH_SIZE: int = 100
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 5  # seconds
+    TRANSACTION_LOG_PATH: str = "data/transaction_coordinator.log"  # 2PC coordinator log
     
     # Circuit breaker settings
     CIRCUIT_BREAKER_THRESHOLD: int = 5
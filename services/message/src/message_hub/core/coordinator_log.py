@@ -0,0 +1,170 @@
+"""
+Transaction Coordinator Log
+
+Append-only write-ahead log of two-phase commit decisions, used to finish
+in-doubt transactions after a restart.
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LogRecordType(str, Enum):
+    """Coordinator log record types."""
+    PREPARING = "preparing"  # Participants recorded, prepare requests going out
+    COMMIT = "commit"        # Commit decided; must be delivered to every participant
+    ABORT = "abort"          # Abort decided
+    END = "end"              # All participants acknowledged the decision
+
+
+@dataclass
+class PendingTransaction:
+    """A transaction the log shows as not yet finished."""
+    transaction_id: str
+    participants: List[Dict[str, Any]] = field(default_factory=list)
+    decision: Optional[LogRecordType] = None
+
+
+class CoordinatorLog:
+    """
+    Durable coordinator log backed by an append-only JSON lines file.
+    
+    Decision records are fsynced before the coordinator acts on them.
+    Concurrent appends that arrive while a flush is in progress are written
+    and synced together, so parallel transactions share fsyncs.
+    """
+    
+    def __init__(self, path: str, compact_after: int = 10000):
+        """
+        Initialize coordinator log.
+        
+        Args:
+            path: Log file path
+            compact_after: Finished transactions allowed in the file before
+                it is rewritten with only the unfinished ones
+        """
+        self.path = path
+        self.compact_after = compact_after
+        self._pending: List[tuple] = []
+        self._flush_lock = asyncio.Lock()
+        self._ended_since_compaction = 0
+    
+    async def append(self, record_type: LogRecordType, transaction_id: str, **data):
+        """Append a record and wait until it is on disk."""
+        record = {
+            "type": record_type.value,
+            "transaction_id": transaction_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            **data
+        }
+        done = asyncio.get_running_loop().create_future()
+        self._pending.append((json.dumps(record, default=str), done))
+        
+        async with self._flush_lock:
+            if not done.done():
+                batch, self._pending = self._pending, []
+                try:
+                    await asyncio.to_thread(self._write, [line for line, _ in batch])
+                except Exception as e:
+                    for _, waiter in batch:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for _, waiter in batch:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        await done
+        
+        if record_type == LogRecordType.END:
+            self._ended_since_compaction += 1
+            if self._ended_since_compaction >= self.compact_after:
+                await self.compact()
+    
+    async def load_pending(self) -> List[PendingTransaction]:
+        """Read the log and return transactions without an END record."""
+        return list((await asyncio.to_thread(self._read_pending)).values())
+    
+    async def compact(self):
+        """Rewrite the log keeping only unfinished transactions."""
+        async with self._flush_lock:
+            pending = await asyncio.to_thread(self._read_pending)
+            await asyncio.to_thread(self._rewrite, pending)
+            self._ended_since_compaction = 0
+        
+        logger.info("coordinator_log_compacted",
+                   path=self.path,
+                   pending_transactions=len(pending))
+    
+    def _write(self, lines: List[str]):
+        """Append lines and fsync."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _read_pending(self) -> Dict[str, PendingTransaction]:
+        """Replay the log file."""
+        pending: Dict[str, PendingTransaction] = {}
+        if not os.path.exists(self.path):
+            return pending
+        
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final write from a crash; nothing after it was acknowledged
+                    logger.warning("coordinator_log_truncated_record", path=self.path)
+                    break
+                
+                tx_id = record["transaction_id"]
+                record_type = LogRecordType(record["type"])
+                if record_type == LogRecordType.END:
+                    pending.pop(tx_id, None)
+                    continue
+                
+                entry = pending.setdefault(tx_id, PendingTransaction(tx_id))
+                if record_type == LogRecordType.PREPARING:
+                    entry.participants = record.get("participants", [])
+                else:
+                    entry.decision = record_type
+        
+        return pending
+    
+    def _rewrite(self, pending: Dict[str, PendingTransaction]):
+        """Atomically replace the log with records for pending transactions."""
+        now = datetime.utcnow().isoformat()
+        lines = []
+        for entry in pending.values():
+            lines.append(json.dumps({
+                "type": LogRecordType.PREPARING.value,
+                "transaction_id": entry.transaction_id,
+                "timestamp": now,
+                "participants": entry.participants
+            }, default=str))
+            if entry.decision:
+                lines.append(json.dumps({
+                    "type": entry.decision.value,
+                    "transaction_id": entry.transaction_id,
+                    "timestamp": now
+                }))
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if lines:
+                f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -5,15 +5,33 @@ Coordinates distributed transactions across services.
 """
 
 import asyncio
-from typing import Dict, Optional, List, Any
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, List, Any
 import structlog
 from datetime import datetime, timedelta
+from prometheus_client import Counter, Histogram
 
-from .transaction import Transaction, TransactionState, TransactionPhase
+from .transactions import Transaction, TransactionState, TransactionPhase
+from .config import settings
+from .coordinator_log import CoordinatorLog, LogRecordType, PendingTransaction
 from .models import ServiceType, MessageType, ServiceMessage, ServiceResponse
 
 logger = structlog.get_logger()
 
+# Metrics
+TRANSACTION_COMMIT_LATENCY = Histogram(
+    "message_hub_transaction_commit_latency_seconds",
+    "Time from commit request to decision delivered to all participants",
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+)
+TRANSACTION_OUTCOMES = Counter(
+    "message_hub_transaction_outcomes_total",
+    "Transactions by outcome",
+    ["outcome"]
+)
+
+
 class TransactionManager:
     """
     Manages distributed transactions across services.
@@ -23,17 +41,46 @@ class TransactionManager:
     - Two-phase commit coordination
     - Rollback coordination
     - Transaction monitoring
+    
+    Prepare and commit requests fan out to all participants concurrently,
+    each bounded by ``participant_timeout``, so a transaction takes as long
+    as its slowest participant rather than the sum of all of them. Commit
+    and abort decisions are written to the coordinator log before they are
+    sent, and ``recover`` finishes whatever the log shows as in doubt.
     """
     
-    def __init__(self, message_router=None):
-        """Initialize transaction manager."""
+    def __init__(self,
+                 message_router=None,
+                 coordinator_log: Optional[CoordinatorLog] = None,
+                 log_path: Optional[str] = None):
+        """
+        Initialize transaction manager.
+        
+        Args:
+            message_router: Router used to reach participants
+            coordinator_log: Coordinator log to use instead of opening one
+            log_path: Coordinator log file; defaults to the
+                TRANSACTION_LOG_PATH setting
+        """
         self.message_router = message_router
+        self.coordinator_log = coordinator_log or CoordinatorLog(
+            log_path or settings.TRANSACTION_LOG_PATH
+        )
         self.active_transactions: Dict[str, Transaction] = {}
         self.completed_transactions: Dict[str, Transaction] = {}
         
+        # Committed or aborted, but not yet acknowledged by every participant
+        self.in_doubt: Dict[str, PendingTransaction] = {}
+        
         # Configuration
         self.transaction_timeout = 30  # seconds
         self.max_completed_transactions = 1000
+        self.participant_timeout = 5.0  # seconds per prepare/commit request
+        self.decision_retry_attempts = 3
+        self.decision_retry_delay = 0.5  # seconds, doubled per attempt
+        
+        # Recent commit latencies for percentile reporting
+        self.commit_latencies: Deque[float] = deque(maxlen=1000)
         
         # Start cleanup task
         asyncio.create_task(self._cleanup_old_transactions())
@@ -59,26 +106,44 @@ class TransactionManager:
         if not transaction:
             raise ValueError(f"Unknown transaction: {transaction_id}")
         
+        start = time.perf_counter()
+        participants = self._participant_records(transaction)
+        
         try:
+            await self.coordinator_log.append(
+                LogRecordType.PREPARING,
+                transaction_id,
+                participants=participants
+            )
+            
             # Phase 1: Prepare
             await self._prepare_all_participants(transaction)
-            
-            # Phase 2: Commit
-            await self._commit_all_participants(transaction)
-            
-            # Mark transaction complete
-            transaction.mark_committed()
-            self._move_to_completed(transaction)
-            return True
-            
+        
         except Exception as e:
             logger.error("transaction_commit_failed",
                         transaction_id=transaction_id,
                         error=str(e))
             
             # Attempt rollback
-            await self.rollback_transaction(transaction_id)
+            await self._abort(transaction, participants)
             return False
+        
+        # Decision point: once logged, the transaction commits no matter what
+        await self.coordinator_log.append(LogRecordType.COMMIT, transaction_id)
+        
+        # Phase 2: Commit
+        pending = PendingTransaction(transaction_id, participants, LogRecordType.COMMIT)
+        await self._deliver_decision(pending)
+        
+        # Mark transaction complete
+        transaction.mark_committed()
+        self._move_to_completed(transaction)
+        
+        latency = time.perf_counter() - start
+        self.commit_latencies.append(latency)
+        TRANSACTION_COMMIT_LATENCY.observe(latency)
+        TRANSACTION_OUTCOMES.labels(outcome="committed").inc()
+        return True
     
     async def rollback_transaction(self, transaction_id: str):
         """Rollback a transaction by reversing all operations."""
@@ -100,7 +165,7 @@ class TransactionManager:
                     )
                     
                     await self.message_router.route_message(message)
-                    
+                
                 except Exception as e:
                     logger.error("rollback_operation_failed",
                                transaction_id=transaction_id,
@@ -109,7 +174,7 @@ class TransactionManager:
                                error=str(e))
             
             transaction.mark_rolled_back()
-            
+        
         except Exception as e:
             logger.error("transaction_rollback_failed",
                         transaction_id=transaction_id,
@@ -119,69 +184,167 @@ class TransactionManager:
         finally:
             self._move_to_completed(transaction)
     
+    async def recover(self) -> int:
+        """
+        Finish transactions left in doubt by a previous run.
+        
+        Transactions with a logged commit decision are committed again;
+        transactions that never reached a decision are presumed aborted.
+        Participants must treat repeated decisions for the same
+        transaction_id as no-ops.
+        
+        Returns:
+            Number of in-doubt transactions found
+        """
+        pending = await self.coordinator_log.load_pending()
+        
+        for entry in pending:
+            if entry.decision is None:
+                await self.coordinator_log.append(LogRecordType.ABORT, entry.transaction_id)
+                entry.decision = LogRecordType.ABORT
+            
+            logger.warning("transaction_in_doubt_recovered",
+                         transaction_id=entry.transaction_id,
+                         decision=entry.decision.value,
+                         participants=len(entry.participants))
+        
+        await asyncio.gather(*(self._deliver_decision(entry) for entry in pending))
+        return len(pending)
+    
     async def _prepare_all_participants(self, transaction: Transaction):
         """Prepare phase: ask all participants to prepare for commit."""
-        prepare_tasks = []
-        
-        for service, operations in transaction.participants.items():
-            for op in operations:
-                message = ServiceMessage(
-                    source=ServiceType.MESSAGE_HUB,
-                    destination=service,
-                        message_type=MessageType.TRANSACTION_PREPARE,
-                    payload={
-                        "transaction_id": transaction.id,
-                        "operation": op["operation"],
-                        "original_payload": op["payload"]
-                    }
-                )
-                
-                prepare_tasks.append(
-                    self.message_router.route_message(message)
-                )
+        participants = self._participant_records(transaction)
         
         # Wait for all prepare responses
-        prepare_results = await asyncio.gather(*prepare_tasks, return_exceptions=True)
+        prepare_results = await asyncio.gather(*(
+            self._send_to_participant(
+                transaction.id,
+                participant,
+                MessageType.TRANSACTION_PREPARE
+            )
+            for participant in participants
+        ), return_exceptions=True)
         
         # Check for any failures
-        for result in prepare_results:
+        for participant, result in zip(participants, prepare_results):
             if isinstance(result, Exception) or result.status == "error":
-                raise Exception("Prepare phase failed")
-    
-    async def _commit_all_participants(self, transaction: Transaction):
-        """Commit phase: tell all participants to commit."""
-        commit_tasks = []
-        
-        for service, operations in transaction.participants.items():
-            for op in operations:
-                message = ServiceMessage(
-                    source=ServiceType.MESSAGE_HUB,
-                    destination=service,
-                        message_type=MessageType.TRANSACTION_COMMIT,
-                    payload={
-                        "transaction_id": transaction.id,
-                        "operation": op["operation"],
-                        "original_payload": op["payload"]
-                    }
-                )
-                
-                commit_tasks.append(
-                    self.message_router.route_message(message)
+                raise Exception(
+                    f"Prepare phase failed for {participant['service']}: "
+                    f"{result if isinstance(result, Exception) else result.error}"
                 )
+    
+    async def _abort(self, transaction: Transaction, participants: List[Dict[str, Any]]):
+        """Log an abort decision, release prepared participants and compensate."""
+        try:
+            await self.coordinator_log.append(LogRecordType.ABORT, transaction.id)
+            await self._deliver_decision(
+                PendingTransaction(transaction.id, participants, LogRecordType.ABORT)
+            )
+        except Exception as e:
+            logger.error("transaction_abort_failed",
+                        transaction_id=transaction.id,
+                        error=str(e))
+        
+        TRANSACTION_OUTCOMES.labels(outcome="aborted").inc()
+        await self.rollback_transaction(transaction.id)
+    
+    async def _deliver_decision(self, entry: PendingTransaction):
+        """
+        Send a logged decision to every participant, retrying failures.
+        
+        Participants that still have not acknowledged after the retries keep
+        the transaction in doubt; the cleanup loop retries it later.
+        """
+        message_type = (
+            MessageType.TRANSACTION_COMMIT
+            if entry.decision == LogRecordType.COMMIT
+            else MessageType.TRANSACTION_ROLLBACK
+        )
         
-        # Wait for all commit responses
-        commit_results = await asyncio.gather(*commit_tasks, return_exceptions=True)
+        remaining = entry.participants
+        delay = self.decision_retry_delay
+        for attempt in range(self.decision_retry_attempts):
+            remaining = await self._send_decision(entry.transaction_id, remaining, message_type)
+            if not remaining:
+                break
+            if attempt < self.decision_retry_attempts - 1:
+                await asyncio.sleep(delay)
+                delay *= 2
         
-        # Check for any failures
-        for result in commit_results:
+        if remaining:
+            self.in_doubt[entry.transaction_id] = PendingTransaction(
+                entry.transaction_id,
+                remaining,
+                entry.decision
+            )
+            logger.warning("transaction_decision_undelivered",
+                         transaction_id=entry.transaction_id,
+                         decision=entry.decision.value,
+                         participants=[p["service"] for p in remaining])
+            return
+        
+        self.in_doubt.pop(entry.transaction_id, None)
+        await self.coordinator_log.append(LogRecordType.END, entry.transaction_id)
+    
+    async def _send_decision(self,
+                             transaction_id: str,
+                             participants: List[Dict[str, Any]],
+                             message_type: MessageType) -> List[Dict[str, Any]]:
+        """Send a decision to participants concurrently; return those that failed."""
+        results = await asyncio.gather(*(
+            self._send_to_participant(transaction_id, participant, message_type)
+            for participant in participants
+        ), return_exceptions=True)
+        
+        failed = []
+        for participant, result in zip(participants, results):
             if isinstance(result, Exception) or result.status == "error":
-                raise Exception("Commit phase failed")
+                logger.warning("transaction_participant_failed",
+                             transaction_id=transaction_id,
+                             service=participant["service"],
+                             phase=message_type.value,
+                             error=str(result) if isinstance(result, Exception) else result.error)
+                failed.append(participant)
+        return failed
+    
+    async def _send_to_participant(self,
+                                   transaction_id: str,
+                                   participant: Dict[str, Any],
+                                   message_type: MessageType) -> ServiceResponse:
+        """Send one 2PC request, bounded by the participant timeout."""
+        message = ServiceMessage(
+            source=ServiceType.MESSAGE_HUB,
+            destination=ServiceType(participant["service"]),
+            message_type=message_type,
+            correlation_id=transaction_id,
+            payload={
+                "transaction_id": transaction_id,
+                "operation": participant["operation"],
+                "original_payload": participant["payload"]
+            }
+        )
+        return await asyncio.wait_for(
+            self.message_router.route_message(message),
+            timeout=self.participant_timeout
+        )
+    
+    def _participant_records(self, transaction: Transaction) -> List[Dict[str, Any]]:
+        """Flatten a transaction's participants into loggable records."""
+        return [
+            {
+                "service": service.value,
+                "operation": op["operation"],
+                "payload": op["payload"]
+            }
+            for service, operations in transaction.participants.items()
+            for op in operations
+        ]
     
     def _move_to_completed(self, transaction: Transaction):
         """Move transaction from active to completed."""
         if transaction.id in self.active_transactions:
             del self.active_transactions[transaction.id]
-            
+        
         self.completed_transactions[transaction.id] = transaction
         
         # Trim completed transactions if needed
@@ -213,6 +376,13 @@ class TransactionManager:
                                  transaction_id=tx_id)
                     await self.rollback_transaction(tx_id)
                 
+                # Retry decisions participants have not acknowledged yet
+                if self.in_doubt:
+                    await asyncio.gather(*(
+                        self._deliver_decision(entry)
+                        for entry in list(self.in_doubt.values())
+                    ))
+            
             except Exception as e:
                 logger.error("transaction_cleanup_error",
                            error=str(e))
@@ -220,11 +390,30 @@ class TransactionManager:
             # Sleep before next cleanup
             await asyncio.sleep(10)  # Check every 10 seconds
     
+    def get_commit_latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """Get p50/p95/p99 commit latency in seconds over recent commits."""
+        samples = sorted(self.commit_latencies)
+        if not samples:
+            return {"count": 0, "p50": None, "p95": None, "p99": None}
+        
+        def percentile(p: float) -> float:
+            index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+            return samples[index]
+        
+        return {
+            "count": len(samples),
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99)
+        }
+    
     def get_metrics(self) -> Dict[str, any]:
         """Get transaction manager metrics."""
         return {
             "active_transactions": list(self.active_transactions.keys()),
             "completed_transactions": list(self.completed_transactions.keys()),
+            "in_doubt_transactions": list(self.in_doubt.keys()),
+            "commit_latency": self.get_commit_latency_percentiles(),
             "transactions": {
                 "active": {
                     tx_id: tx.get_metrics()
@@ -1,6 +1,13 @@
 """Core data models."""
 
-from .base import ServiceType, MessageType, ServiceRegistration, ServiceStatus, ServiceMessage
+from .base import (
+    ServiceType,
+    MessageType,
+    ServiceRegistration,
+    ServiceStatus,
+    ServiceMessage,
+    ServiceResponse,
+)
 
 __all__ = [
     "ServiceType",
@@ -8,4 +15,5 @@ __all__ = [
     "ServiceRegistration",
     "ServiceStatus",
     "ServiceMessage",
+    "ServiceResponse",
 ]
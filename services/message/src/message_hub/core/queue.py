@@ -7,6 +7,7 @@ Implements message prioritization and intelligent queue management.
 import asyncio
 import json
 import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum, IntEnum
@@ -21,6 +22,93 @@ from .config import Settings
 logger = structlog.get_logger()
 
 
+# Atomically claims up to N messages across priority tiers, optionally
+# moving them into the in-flight lease set instead of dropping them.
+#
+# KEYS[1]    - queue size counter hash
+# KEYS[2]    - in-flight lease deadlines (sorted set, lease id -> deadline)
+# KEYS[3]    - in-flight lease payloads (hash, lease id -> raw message)
+# KEYS[4..]  - queue keys, priority-major (every service for CRITICAL, then HIGH, ...)
+# ARGV[1]    - maximum number of messages to claim
+# ARGV[2]    - maximum score to claim (inclusive)
+# ARGV[3]    - lease token ('' to claim without a lease)
+# ARGV[4]    - lease deadline (unix timestamp)
+# ARGV[5]    - number of services per priority tier (S)
+# ARGV[6..]  - S counter field names, followed by S per-service caps (-1 = no cap)
+DEQUEUE_BATCH_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local max_score = ARGV[2]
+local token = ARGV[3]
+local deadline = ARGV[4]
+local nservices = tonumber(ARGV[5])
+local claimed = {}
+local taken = {}
+for s = 1, nservices do
+    taken[s] = 0
+end
+
+for i = 4, #KEYS do
+    if #claimed >= limit then
+        break
+    end
+    local s = ((i - 4) % nservices) + 1
+    local want = limit - #claimed
+    local cap = tonumber(ARGV[5 + nservices + s])
+    if cap >= 0 then
+        want = math.min(want, cap - taken[s])
+    end
+    if want > 0 then
+        local batch = redis.call('ZRANGEBYSCORE', KEYS[i], '-inf', max_score, 'LIMIT', 0, want)
+        for _, member in ipairs(batch) do
+            redis.call('ZREM', KEYS[i], member)
+            claimed[#claimed + 1] = member
+            if token ~= '' then
+                local lease_id = token .. ':' .. #claimed
+                redis.call('ZADD', KEYS[2], deadline, lease_id)
+                redis.call('HSET', KEYS[3], lease_id, member)
+            end
+        end
+        taken[s] = taken[s] + #batch
+    end
+end
+
+for s = 1, nservices do
+    if taken[s] > 0 then
+        redis.call('HINCRBY', KEYS[1], ARGV[5 + s], -taken[s])
+    end
+end
+if #claimed > 0 then
+    redis.call('HINCRBY', KEYS[1], 'total', -#claimed)
+end
+
+return claimed
+"""
+
+# Re-leases expired in-flight messages to the caller (the reaper) so a crash
+# between reclaiming and re-enqueueing only delays redelivery.
+#
+# KEYS[1]    - in-flight lease deadlines
+# KEYS[2]    - in-flight lease payloads
+# ARGV[1]    - current time (unix timestamp)
+# ARGV[2]    - new deadline for reclaimed leases
+# ARGV[3]    - maximum number of leases to reclaim
+RECLAIM_EXPIRED_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3]))
+local result = {}
+for _, lease_id in ipairs(expired) do
+    local member = redis.call('HGET', KEYS[2], lease_id)
+    if member then
+        redis.call('ZADD', KEYS[1], ARGV[2], lease_id)
+        result[#result + 1] = lease_id
+        result[#result + 1] = member
+    else
+        redis.call('ZREM', KEYS[1], lease_id)
+    end
+end
+return result
+"""
+
+
 class MessagePriority(IntEnum):
     """Message priority levels."""
     CRITICAL = 1  # System critical messages
@@ -51,7 +139,7 @@ class PrioritizedMessage:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "message": self.message.model_dump(),
+            "message": self.message.model_dump(mode="json"),
             "priority": self.priority.value,
             "enqueued_at": self.enqueued_at.isoformat(),
             "deadline": self.deadline.isoformat() if self.deadline else None,
@@ -72,6 +160,14 @@ class PrioritizedMessage:
         )
 
 
+@dataclass
+class MessageLease:
+    """A claimed message held in-flight until it is acked or its lease expires."""
+    lease_id: str
+    message: PrioritizedMessage
+    deadline: datetime
+
+
 class PriorityQueueManager:
     """
     Manages priority-based message queuing with intelligent scheduling.
@@ -83,12 +179,13 @@ class PriorityQueueManager:
     - Adaptive throttling
     - Queue overflow handling
     - Fair scheduling with priority
+    - Lease-based in-flight tracking with visibility timeouts
     """
     
     def __init__(self, settings: Settings):
         """Initialize priority queue manager."""
         self.settings = settings
-        self.redis_client: Optional[aioredis.Redis] = None
+        self.redis_client: Optional[redis.Redis] = None
         
         # Queue configuration
         self.max_queue_size = 10000
@@ -115,33 +212,60 @@ class PriorityQueueManager:
             "messages_dequeued": 0,
             "messages_dropped": 0,
             "queue_overflows": 0,
-            "throttle_events": 0
+            "throttle_events": 0,
+            "messages_acked": 0,
+            "leases_expired": 0,
+            "messages_dead_lettered": 0
         }
         
         # Background processor
         self._processor_task = None
+        
+        # O(1) queue size bookkeeping ("total" plus one field per service)
+        self.size_key = "message_hub:queue:size"
+        self._dequeue_batch_script = None
+        
+        # In-flight leases
+        self.inflight_key = "message_hub:inflight"
+        self.inflight_messages_key = "message_hub:inflight:messages"
+        self.default_visibility_timeout = 30.0  # seconds
+        self.max_delivery_attempts = 5
+        self.reap_interval = 5.0  # seconds
+        self.reap_batch_size = 500
+        self._reclaim_script = None
+        self._reaper_task = None
+        
+        # Messages that ran out of delivery attempts, oldest first
+        self.dead_letter_key = "message_hub:dead_letter"
     
     async def initialize(self):
         """Initialize Redis connection and start processor."""
-        self.redis_client = await aioredis.from_url(
+        self.redis_client = redis.from_url(
             self.settings.redis_url,
             encoding="utf-8",
             decode_responses=True
         )
+        self._dequeue_batch_script = self.redis_client.register_script(DEQUEUE_BATCH_SCRIPT)
+        self._reclaim_script = self.redis_client.register_script(RECLAIM_EXPIRED_SCRIPT)
+        
+        # Seed the size counter from the sorted sets left by a previous run
+        await self.rebuild_size_counter()
         
         # Start background processor
         self._processor_task = asyncio.create_task(self._process_queues())
+        self._reaper_task = asyncio.create_task(self._reap_leases())
         
         logger.info("priority_queue_manager_initialized")
     
     async def shutdown(self):
         """Shutdown queue manager."""
-        if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._processor_task, self._reaper_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         if self.redis_client:
             await self.redis_client.close()
@@ -151,7 +275,8 @@ class PriorityQueueManager:
     async def enqueue(self,
                      message: ServiceMessage,
                      priority: Optional[MessagePriority] = None,
-                     deadline: Optional[datetime] = None) -> bool:
+                     deadline: Optional[datetime] = None,
+                     attempt_count: int = 0) -> bool:
         """
         Enqueue a message with priority.
         
@@ -159,6 +284,7 @@ class PriorityQueueManager:
             message: Message to enqueue
             priority: Message priority (auto-determined if not provided)
             deadline: Optional deadline for message processing
+            attempt_count: Delivery attempts already made (for requeues)
         
         Returns:
             True if message was enqueued, False if rejected
@@ -183,6 +309,7 @@ class PriorityQueueManager:
             priority=priority,
             enqueued_at=datetime.utcnow(),
             deadline=deadline,
+            attempt_count=attempt_count,
             processing_time_estimate=self._estimate_processing_time(message)
         )
         
@@ -192,11 +319,12 @@ class PriorityQueueManager:
         # Calculate score for sorted set (lower score = higher priority)
         score = self._calculate_score(prioritized_msg)
         
-        # Add to queue
-        await self.redis_client.zadd(
-            queue_key,
-            {json.dumps(prioritized_msg.to_dict()): score}
-        )
+        # Add to queue and bump the size counter in a single round trip
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(queue_key, {json.dumps(prioritized_msg.to_dict()): score})
+            pipe.hincrby(self.size_key, "total", 1)
+            pipe.hincrby(self.size_key, message.destination.value, 1)
+            await pipe.execute()
         
         self.stats["messages_enqueued"] += 1
         
@@ -260,7 +388,8 @@ class PriorityQueueManager:
                         continue
                     
                     # Remove from queue
-                    await self.redis_client.zrem(queue_key, raw_msg)
+                    if await self.redis_client.zrem(queue_key, raw_msg):
+                        await self._decrement_size(msg.message.destination, 1)
                     
                     messages.append(msg)
                     self.stats["messages_dequeued"] += 1
@@ -272,6 +401,265 @@ class PriorityQueueManager:
         
         return messages
     
+    async def dequeue_batch(self,
+                           n: int,
+                           service: Optional[ServiceType] = None) -> List[PrioritizedMessage]:
+        """
+        Atomically claim up to ``n`` messages in a single Redis round trip.
+        
+        Priority tiers are drained strictly in order (CRITICAL first). Service
+        quotas are applied as per-service caps inside the claim script, so
+        messages over quota stay queued instead of being dropped.
+        
+        Messages claimed this way are removed outright; use ``claim_batch``
+        when the worker must be able to crash without losing them.
+        
+        Args:
+            n: Maximum number of messages to claim
+            service: Specific service to dequeue for (None for all services)
+        
+        Returns:
+            List of prioritized messages in claim order
+        """
+        claimed = await self._claim(n, service)
+        return [msg for _, msg in claimed]
+    
+    async def claim_batch(self,
+                          n: int,
+                          service: Optional[ServiceType] = None,
+                          visibility_timeout: Optional[float] = None) -> List[MessageLease]:
+        """
+        Claim up to ``n`` messages under a processing lease.
+        
+        Claimed messages move to the in-flight set atomically with their
+        removal from the queue. They must be acked (or have their lease
+        extended) before the visibility timeout elapses, otherwise the reaper
+        re-enqueues them with ``attempt_count`` incremented.
+        
+        Args:
+            n: Maximum number of messages to claim
+            service: Specific service to dequeue for (None for all services)
+            visibility_timeout: Lease length in seconds (defaults to
+                ``default_visibility_timeout``)
+        
+        Returns:
+            List of leases in claim order
+        """
+        timeout = visibility_timeout or self.default_visibility_timeout
+        deadline = datetime.utcnow() + timedelta(seconds=timeout)
+        token = uuid.uuid4().hex
+        
+        claimed = await self._claim(n, service, lease_token=token, lease_deadline=deadline)
+        return [
+            MessageLease(lease_id=f"{token}:{position}", message=msg, deadline=deadline)
+            for position, msg in claimed
+        ]
+    
+    async def extend_lease(self, lease_id: str, visibility_timeout: float) -> bool:
+        """
+        Push a lease's deadline out to ``visibility_timeout`` seconds from now.
+        
+        Returns:
+            False if the lease no longer exists (acked or already reaped)
+        """
+        deadline = datetime.utcnow() + timedelta(seconds=visibility_timeout)
+        updated = await self.redis_client.zadd(
+            self.inflight_key,
+            {lease_id: deadline.timestamp()},
+            xx=True,
+            ch=True
+        )
+        return bool(updated)
+    
+    async def ack(self, lease_id: str) -> bool:
+        """
+        Acknowledge a leased message as processed and drop it.
+        
+        Returns:
+            False if the lease no longer exists
+        """
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.inflight_key, lease_id)
+            pipe.hdel(self.inflight_messages_key, lease_id)
+            removed, _ = await pipe.execute()
+        
+        if removed:
+            self.stats["messages_acked"] += 1
+        return bool(removed)
+    
+    async def nack(self,
+                   lease_id: str,
+                   new_priority: Optional[MessagePriority] = None) -> bool:
+        """
+        Give a leased message back to the queue immediately.
+        
+        Returns:
+            False if the lease no longer exists
+        """
+        raw_msg = await self.redis_client.hget(self.inflight_messages_key, lease_id)
+        if raw_msg is None:
+            return False
+        
+        await self.requeue(PrioritizedMessage.from_dict(json.loads(raw_msg)), new_priority)
+        return await self.ack(lease_id)
+    
+    async def reap_expired_leases(self) -> int:
+        """
+        Re-enqueue messages whose lease expired.
+        
+        Each expired lease is first re-leased to the reaper, then requeued with
+        ``attempt_count`` incremented, then acked. A reaper crash in between
+        leaves the lease to expire again, so delivery is at-least-once.
+        Messages out of delivery attempts are moved to the dead-letter list.
+        
+        Returns:
+            Number of leases reaped
+        """
+        now = datetime.utcnow()
+        reaper_deadline = now + timedelta(seconds=self.default_visibility_timeout)
+        
+        result = await self._reclaim_script(
+            keys=[self.inflight_key, self.inflight_messages_key],
+            args=[now.timestamp(), reaper_deadline.timestamp(), self.reap_batch_size]
+        )
+        
+        reaped = 0
+        for lease_id, raw_msg in zip(result[::2], result[1::2]):
+            try:
+                msg = PrioritizedMessage.from_dict(json.loads(raw_msg))
+                if msg.attempt_count + 1 >= self.max_delivery_attempts:
+                    await self._dead_letter(lease_id, msg)
+                    reaped += 1
+                    continue
+                elif not await self.requeue(msg):
+                    # Queue is full; leave the lease for the next pass
+                    continue
+                
+                await self.ack(lease_id)
+                reaped += 1
+            except Exception as e:
+                logger.error("lease_reap_error",
+                           lease_id=lease_id,
+                           error=str(e))
+        
+        if reaped:
+            self.stats["leases_expired"] += reaped
+            logger.info("expired_leases_reaped", count=reaped)
+        
+        return reaped
+    
+    async def _dead_letter(self, lease_id: str, message: PrioritizedMessage):
+        """Move a leased message that ran out of delivery attempts to the dead-letter list."""
+        entry = {
+            "message": message.to_dict(),
+            "lease_id": lease_id,
+            "attempts": message.attempt_count + 1,
+            "dead_lettered_at": datetime.utcnow().isoformat()
+        }
+        
+        # Recorded and released together, so a crash cannot lose the message
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.rpush(self.dead_letter_key, json.dumps(entry))
+            pipe.zrem(self.inflight_key, lease_id)
+            pipe.hdel(self.inflight_messages_key, lease_id)
+            await pipe.execute()
+        
+        self.stats["messages_dead_lettered"] += 1
+        logger.error("lease_attempts_exhausted",
+                   correlation_id=message.message.correlation_id,
+                   attempts=entry["attempts"])
+    
+    async def get_dead_letters(self,
+                               limit: int = 100,
+                               offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        List dead-lettered messages, oldest first.
+        
+        Returns:
+            Entries with the message, its last lease, attempt count and the
+            time it was dead-lettered
+        """
+        raw_entries = await self.redis_client.lrange(
+            self.dead_letter_key, offset, offset + limit - 1
+        )
+        return [json.loads(raw) for raw in raw_entries]
+    
+    async def replay_dead_letters(self, count: Optional[int] = None) -> int:
+        """
+        Re-enqueue dead-lettered messages, oldest first, with a fresh attempt count.
+        
+        A message is removed from the dead-letter list only after it was
+        enqueued, so a crash in between replays it twice rather than losing it.
+        
+        Args:
+            count: Maximum number of messages to replay (None for all)
+        
+        Returns:
+            Number of messages replayed
+        """
+        replayed = 0
+        while count is None or replayed < count:
+            raw_entry = await self.redis_client.lindex(self.dead_letter_key, 0)
+            if raw_entry is None:
+                break
+            
+            msg = PrioritizedMessage.from_dict(json.loads(raw_entry)["message"])
+            if not await self.enqueue(msg.message, msg.priority, msg.deadline):
+                # Queue is full; keep the rest for later
+                break
+            
+            await self.redis_client.lrem(self.dead_letter_key, 1, raw_entry)
+            replayed += 1
+        
+        if replayed:
+            logger.info("dead_letters_replayed", count=replayed)
+        return replayed
+    
+    async def _claim(self,
+                     n: int,
+                     service: Optional[ServiceType],
+                     lease_token: str = "",
+                     lease_deadline: Optional[datetime] = None) -> List[Tuple[int, PrioritizedMessage]]:
+        """Run the claim script and decode the result as (position, message) pairs."""
+        if n <= 0:
+            return []
+        
+        services = [service] if service else list(ServiceType)
+        caps = [self._reserve_service_quota(s, n) for s in services]
+        if all(cap == 0 for cap in caps):
+            return []
+        
+        keys = [self.size_key, self.inflight_key, self.inflight_messages_key] + [
+            self._get_queue_key(priority, s)
+            for priority in MessagePriority
+            for s in services
+        ]
+        args = [
+            n,
+            "+inf",
+            lease_token,
+            lease_deadline.timestamp() if lease_deadline else 0,
+            len(services)
+        ] + [s.value for s in services] + caps
+        
+        raw_messages = await self._dequeue_batch_script(keys=keys, args=args)
+        
+        claimed = []
+        for position, raw_msg in enumerate(raw_messages, start=1):
+            try:
+                claimed.append((position, PrioritizedMessage.from_dict(json.loads(raw_msg))))
+            except Exception as e:
+                logger.error("dequeue_error",
+                           error=str(e),
+                           raw_message=raw_msg)
+        
+        # Hand back quota reserved for messages that were not there to claim
+        self._release_unused_quota(services, caps, [msg for _, msg in claimed])
+        
+        self.stats["messages_dequeued"] += len(claimed)
+        
+        return claimed
+    
     async def requeue(self,
                      message: PrioritizedMessage,
                      new_priority: Optional[MessagePriority] = None) -> bool:
@@ -299,7 +687,8 @@ class PriorityQueueManager:
         return await self.enqueue(
             message.message,
             message.priority,
-            message.deadline
+            message.deadline,
+            attempt_count=message.attempt_count
         )
     
     async def get_queue_status(self,
@@ -319,6 +708,9 @@ class PriorityQueueManager:
             status["queues"][priority.name] = size
             status["total_size"] += size
         
+        status["in_flight"] = await self.redis_client.zcard(self.inflight_key)
+        status["dead_letter"] = await self.redis_client.llen(self.dead_letter_key)
+        
         # Determine overall status
         if status["total_size"] > self.max_queue_size * self.overflow_threshold:
             status["status"] = QueueStatus.OVERLOADED
@@ -355,6 +747,9 @@ class PriorityQueueManager:
             await self.redis_client.delete(queue_key)
             cleared += size
         
+        if service and cleared:
+            await self._decrement_size(service, cleared)
+        
         logger.info("queue_cleared",
                    priority=priority.name if priority else "all",
                    service=service.value if service else "all",
@@ -425,13 +820,42 @@ class PriorityQueueManager:
             return f"message_hub:queue:{service.value}:{priority.name}"
         return f"message_hub:queue:global:{priority.name}"
     
-    async def _get_queue_size(self) -> int:
-        """Get total queue size across all priorities."""
-        total = 0
-        for priority in MessagePriority:
-            queue_key = self._get_queue_key(priority, None)
-            total += await self.redis_client.zcard(queue_key)
-        return total
+    async def _get_queue_size(self, service: Optional[ServiceType] = None) -> int:
+        """Get queue size across all priorities from the size counter."""
+        size = await self.redis_client.hget(self.size_key, service.value if service else "total")
+        return max(0, int(size or 0))
+    
+    async def _decrement_size(self, service: ServiceType, count: int):
+        """Decrement the size counter after messages leave a service queue."""
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hincrby(self.size_key, "total", -count)
+            pipe.hincrby(self.size_key, service.value, -count)
+            await pipe.execute()
+    
+    async def rebuild_size_counter(self) -> int:
+        """
+        Recompute the size counter from the per-service sorted sets.
+        
+        Only needed at startup or after manual surgery on the queue keys;
+        normal enqueue/dequeue keeps the counter in step.
+        
+        Returns:
+            Total number of queued messages
+        """
+        sizes: Dict[str, int] = {}
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for service in ServiceType:
+                for priority in MessagePriority:
+                    pipe.zcard(self._get_queue_key(priority, service))
+            counts = await pipe.execute()
+        
+        per_service = len(MessagePriority)
+        for i, service in enumerate(ServiceType):
+            sizes[service.value] = sum(counts[i * per_service:(i + 1) * per_service])
+        sizes["total"] = sum(sizes.values())
+        
+        await self.redis_client.hset(self.size_key, mapping=sizes)
+        return sizes["total"]
     
     def _estimate_processing_time(self, message: ServiceMessage) -> float:
         """Estimate processing time for a message."""
@@ -468,6 +892,39 @@ class PriorityQueueManager:
         self.service_counters[service] += 1
         return True
     
+    def _reserve_service_quota(self, service: ServiceType, requested: int) -> int:
+        """
+        Reserve up to ``requested`` messages of a service's per-second quota.
+        
+        Returns:
+            Number of messages reserved, or -1 if the service has no quota
+        """
+        if service not in self.service_quotas:
+            return -1
+        
+        current_time = time.time()
+        if service not in self.service_reset_time or \
+           current_time - self.service_reset_time[service] >= 1.0:
+            self.service_counters[service] = 0
+            self.service_reset_time[service] = current_time
+        
+        reserved = max(0, min(requested, self.service_quotas[service] - self.service_counters[service]))
+        self.service_counters[service] += reserved
+        return reserved
+    
+    def _release_unused_quota(self,
+                              services: List[ServiceType],
+                              reserved: List[int],
+                              claimed: List[PrioritizedMessage]):
+        """Return quota reserved by ``dequeue_batch`` but not used by claimed messages."""
+        used: Dict[ServiceType, int] = defaultdict(int)
+        for msg in claimed:
+            used[msg.message.destination] += 1
+        
+        for service, cap in zip(services, reserved):
+            if cap > 0:
+                self.service_counters[service] -= cap - used[service]
+    
     async def _apply_throttling(self):
         """Apply throttling when queue is near capacity."""
         self.stats["throttle_events"] += 1
@@ -523,6 +980,23 @@ class PriorityQueueManager:
         
         logger.info("queue_processor_stopped")
     
+    async def _reap_leases(self):
+        """Background task that re-enqueues messages with expired leases."""
+        logger.info("lease_reaper_started")
+        
+        while True:
+            try:
+                # Keep going without sleeping while there is a backlog
+                if await self.reap_expired_leases() < self.reap_batch_size:
+                    await asyncio.sleep(self.reap_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("lease_reaper_error", error=str(e))
+                await asyncio.sleep(self.reap_interval)
+        
+        logger.info("lease_reaper_stopped")
+    
     async def set_service_quota(self, service: ServiceType, quota: int):
         """Set rate limit quota for a service."""
         self.service_quotas[service] = quota
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket
 from pydantic import ValidationError
 
 from .models.events import (
@@ -21,24 +21,63 @@ from .models.events import (
     GameEvent,
     CombatEvent,
 )
+from .broadcast import (
+    BroadcastEngine,
+    SlowConsumerPolicy,
+    CRITICAL_LANE,
+    HIGH_LANE,
+    NORMAL_LANE,
+    LOW_LANE,
+)
 
 logger = logging.getLogger(__name__)
 
+# Outbound queue lane for each event priority
+PRIORITY_LANES = {
+    GameEventPriority.CRITICAL: CRITICAL_LANE,
+    GameEventPriority.HIGH: HIGH_LANE,
+    GameEventPriority.NORMAL: NORMAL_LANE,
+    GameEventPriority.LOW: LOW_LANE,
+}
+
 
 class GameEventRelay:
     """Manages WebSocket connections and event relay for game sessions."""
     
-    def __init__(self):
-        """Initialize the relay manager."""
+    def __init__(
+        self,
+        max_queue: int = 256,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        send_timeout: float = 5.0
+    ):
+        """Initialize the relay manager.
+        
+        Args:
+            max_queue: Outbound events buffered per connection
+            slow_consumer_policy: What to do when a connection's buffer is full
+            send_timeout: Seconds a single send may take before the
+                connection is dropped
+        """
         # Map of session_id to list of connected clients
         self.active_sessions: Dict[str, Set[WebSocket]] = {}
         
         # Map of character_id to WebSocket for direct messages
         self.character_connections: Dict[str, WebSocket] = {}
         
+        # Map of WebSocket to its session for direct message routing
+        self.connection_sessions: Dict[WebSocket, str] = {}
+        
         # Set of combat sessions for priority handling
         self.active_combats: Set[str] = set()
         
+        # Per-connection outbound queues, keyed by session and socket
+        self.engine = BroadcastEngine(
+            max_queue=max_queue,
+            policy=slow_consumer_policy,
+            send_timeout=send_timeout,
+            on_disconnect=self._handle_dropped_connection
+        )
+        
     async def connect(
         self,
         websocket: WebSocket,
@@ -58,6 +97,8 @@ class GameEventRelay:
         if session_id not in self.active_sessions:
             self.active_sessions[session_id] = set()
         self.active_sessions[session_id].add(websocket)
+        self.connection_sessions[websocket] = session_id
+        self.engine.add(session_id, websocket, websocket)
         
         # Add character mapping if provided
         if character_id:
@@ -85,14 +126,20 @@ class GameEventRelay:
             session_id: Game session identifier
             character_id: Optional character identifier
         """
+        # Already cleaned up, e.g. dropped by the broadcast engine
+        if websocket not in self.connection_sessions:
+            return
+        
         # Remove from session map
         if session_id in self.active_sessions:
-            self.active_sessions[session_id].remove(websocket)
+            self.active_sessions[session_id].discard(websocket)
             if not self.active_sessions[session_id]:
                 del self.active_sessions[session_id]
+        self.connection_sessions.pop(websocket, None)
+        await self.engine.remove(session_id, websocket)
         
         # Remove character mapping
-        if character_id and character_id in self.character_connections:
+        if character_id and self.character_connections.get(character_id) is websocket:
             del self.character_connections[character_id]
             
         await self._broadcast_session_event(
@@ -166,24 +213,13 @@ class GameEventRelay:
                 "payload": event.payload
             }
             
-            # Send to all session connections
-            for websocket in self.active_sessions[session_id]:
-                try:
-                    await websocket.send_json(event_data)
-                except WebSocketDisconnect:
-                    await self.disconnect(
-                        websocket,
-                        session_id
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error sending event to websocket: {e}",
-                        extra={
-                            "session_id": session_id,
-                            "event_type": event.type
-                        }
-                    )
-                    
+            # Encode once and queue for every session connection
+            self.engine.broadcast(
+                session_id,
+                event_data,
+                lane=PRIORITY_LANES.get(event.priority, NORMAL_LANE)
+            )
+            
         except Exception as e:
             logger.error(
                 f"Error relaying event: {e}",
@@ -218,25 +254,9 @@ class GameEventRelay:
                 "payload": event.payload
             }
             
-            # Send to all session connections
-            if session_id in self.active_sessions:
-                for websocket in self.active_sessions[session_id]:
-                    try:
-                        await websocket.send_json(event_data)
-                    except WebSocketDisconnect:
-                        await self.disconnect(
-                            websocket,
-                            session_id
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error sending combat event: {e}",
-                            extra={
-                                "session_id": session_id,
-                                "combat_id": event.combat_id
-                            }
-                        )
-                        
+            # Combat events jump ahead of anything else queued
+            self.engine.broadcast(session_id, event_data, lane=CRITICAL_LANE)
+            
         except Exception as e:
             logger.error(
                 f"Error relaying combat event: {e}",
@@ -267,31 +287,41 @@ class GameEventRelay:
             "payload": payload
         }
         
-        try:
-            await websocket.send_json(message_data)
-        except WebSocketDisconnect:
-            # Character disconnected - clean up
-            session_id = None
-            for sid, connections in self.active_sessions.items():
-                if websocket in connections:
-                    session_id = sid
-                    break
-                    
-            if session_id:
-                await self.disconnect(
-                    websocket,
-                    session_id,
-                    character_id
-                )
-        except Exception as e:
-            logger.error(
-                f"Error sending direct message: {e}",
-                extra={
-                    "character_id": character_id,
-                    "message_type": message_type
-                }
+        session_id = self.connection_sessions.get(websocket)
+        if not session_id or not self.engine.send(
+            session_id,
+            websocket,
+            message_data,
+            lane=HIGH_LANE
+        ):
+            logger.warning(
+                f"Direct message not queued for character {character_id}",
+                extra={"message_type": message_type}
             )
             
+    async def _handle_dropped_connection(
+        self,
+        session_id: str,
+        websocket: WebSocket,
+        reason: str
+    ):
+        """Clean up after the broadcast engine drops a connection.
+        
+        Args:
+            session_id: Game session identifier
+            websocket: The dropped WebSocket connection
+            reason: Why the connection was dropped
+        """
+        logger.warning(
+            f"Dropping WebSocket connection: {reason}",
+            extra={"session_id": session_id}
+        )
+        character_id = next(
+            (cid for cid, ws in self.character_connections.items() if ws is websocket),
+            None
+        )
+        await self.disconnect(websocket, session_id, character_id)
+        
     async def _broadcast_session_event(
         self,
         session_id: str,
@@ -319,7 +349,8 @@ class GameEventRelay:
             metadata={
                 "timestamp": datetime.utcnow(),
                 "priority": priority
-            }
+            },
+            priority=priority
         )
         
         await self.relay_event(event)
\ No newline at end of file
@@ -6,18 +6,82 @@ Implements exponential backoff retry strategy and dead letter queue handling.
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from enum import Enum
 import structlog
 import redis.asyncio as redis
 from dataclasses import dataclass, asdict
+from prometheus_client import Counter, Histogram
 
 from .models import ServiceMessage, ServiceType, MessageType
 from .config import Settings
 
 logger = structlog.get_logger()
 
+# Metrics
+RETRY_DISPATCH_LATENCY = Histogram(
+    "message_hub_retry_dispatch_latency_seconds",
+    "Time spent re-routing a retried message",
+    ["destination", "outcome"]
+)
+
+RETRY_SCHEDULE_LAG = Histogram(
+    "message_hub_retry_schedule_lag_seconds",
+    "Delay between a retry becoming due and being dispatched",
+    ["destination"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0]
+)
+
+RETRY_ATTEMPTS = Counter(
+    "message_hub_retry_attempts_total",
+    "Retried deliveries by outcome",
+    ["destination", "outcome"]
+)
+
+RETRY_ATTEMPTS_TO_SUCCESS = Histogram(
+    "message_hub_retry_attempts_to_success",
+    "Attempt number on which a retried message was delivered",
+    ["destination"],
+    buckets=[1, 2, 3, 4, 5, 10]
+)
+
+# Atomically claims up to ARGV[2] records due at or before ARGV[1], moving
+# them into the in-flight set under a lease, and reports the score of the
+# next record still waiting (nil if empty).
+#
+# KEYS[1]    - retry queue (sorted set, record -> due time)
+# KEYS[2]    - in-flight retries (sorted set, record -> lease deadline)
+# ARGV[1]    - current time (unix timestamp)
+# ARGV[2]    - maximum number of records to claim
+# ARGV[3]    - lease deadline (unix timestamp)
+CLAIM_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(due) do
+    redis.call('ZREM', KEYS[1], member)
+    redis.call('ZADD', KEYS[2], ARGV[3], member)
+end
+local next_due = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {due, next_due[2] or false}
+"""
+
+# Moves in-flight retries whose lease expired (their dispatcher died or
+# stalled) back to the retry queue, due immediately.
+#
+# KEYS[1]    - in-flight retries
+# KEYS[2]    - retry queue
+# ARGV[1]    - current time (unix timestamp)
+# ARGV[2]    - maximum number of records to move
+REQUEUE_EXPIRED_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(expired) do
+    redis.call('ZREM', KEYS[1], member)
+    redis.call('ZADD', KEYS[2], ARGV[1], member)
+end
+return expired
+"""
+
 
 class RetryStatus(str, Enum):
     """Retry status for messages."""
@@ -93,14 +157,19 @@ class RetryManager:
     - Configurable max attempts
     - Dead letter queue for failed messages
     - Persistent retry state in Redis
-    - Automatic retry processing
+    - Automatic re-dispatch through the message router with
+      per-destination concurrency caps
+    - Claimed retries are leased until dispatched, so a crashed replica's
+      claims are requeued instead of lost
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, router: Optional[Any] = None):
         """Initialize retry manager."""
         self.settings = settings
+        self.router = router
         self.redis_client: Optional[redis.Redis] = None
         self.retry_queue_key = "message_hub:retry_queue"
+        self.inflight_key = "message_hub:retry_inflight"
         self.dead_letter_key = "message_hub:dead_letter_queue"
         self.retry_records_key = "message_hub:retry_records"
         
@@ -110,6 +179,35 @@ class RetryManager:
         self.max_attempts = 5  # Maximum retry attempts
         self.jitter_factor = 0.1  # Jitter factor for randomization
         
+        # Dispatcher configuration
+        self.claim_batch_size = 500  # Records claimed per Redis round trip
+        self.max_pending = 1000  # Claimed records not yet dispatched
+        self.max_idle_sleep = 5.0  # Upper bound so other replicas' retries are seen
+        self.default_destination_concurrency = 10
+        self.destination_concurrency: Dict[ServiceType, int] = {}
+        
+        # Claimed records are leased until dispatched; leases held by this
+        # process are renewed, so only a dead or stalled dispatcher's expire
+        self.lease_timeout = 30.0  # seconds
+        self.reap_interval = 5.0  # seconds
+        self.reap_batch_size = 500
+        
+        # Dispatcher state
+        self._claim_due_script = None
+        self._requeue_expired_script = None
+        self._leases: Set[str] = set()
+        self._reaper_task = None
+        self._destination_queues: Dict[ServiceType, asyncio.Queue] = {}
+        self._worker_tasks: List[asyncio.Task] = []
+        self._pending = 0
+        self._wakeup = asyncio.Event()
+        self._capacity_freed = asyncio.Event()
+        self.dispatch_stats = {
+            "dispatched": 0,
+            "succeeded": 0,
+            "failed": 0
+        }
+        
         # Background task handle
         self._retry_processor_task = None
     
@@ -120,22 +218,44 @@ class RetryManager:
             encoding="utf-8",
             decode_responses=True
         )
+        self._claim_due_script = self.redis_client.register_script(CLAIM_DUE_SCRIPT)
+        self._requeue_expired_script = self.redis_client.register_script(REQUEUE_EXPIRED_SCRIPT)
+        
+        # Recover retries claimed by a replica that died, even before this
+        # one has a router to dispatch with
+        self._reaper_task = asyncio.create_task(self._reap_leases())
         
-        # Start retry processor
-        self._retry_processor_task = asyncio.create_task(self._process_retries())
+        # Start retry processor once there is somewhere to send retries
+        if self.router:
+            self._retry_processor_task = asyncio.create_task(self._process_retries())
         
         logger.info("retry_manager_initialized")
     
+    def attach_router(self, router: Any):
+        """Attach the message router used to re-dispatch retries."""
+        self.router = router
+        if self.redis_client and not self._retry_processor_task:
+            self._retry_processor_task = asyncio.create_task(self._process_retries())
+    
+    def set_destination_concurrency(self, destination: ServiceType, limit: int):
+        """Cap concurrent retry deliveries to a destination (new workers only)."""
+        self.destination_concurrency[destination] = limit
+    
     async def shutdown(self):
         """Shutdown retry manager."""
-        if self._retry_processor_task:
-            self._retry_processor_task.cancel()
-            try:
-                await self._retry_processor_task
-            except asyncio.CancelledError:
-                pass
+        for task in [self._retry_processor_task, self._reaper_task, *self._worker_tasks]:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker_tasks.clear()
+        self._destination_queues.clear()
         
         if self.redis_client:
+            # Hand undispatched retries back now rather than when their leases expire
+            await self._release_leases()
             await self.redis_client.close()
         
         logger.info("retry_manager_shutdown")
@@ -251,6 +371,9 @@ class RetryManager:
             self.retry_queue_key,
             {json.dumps(record.to_dict()): score}
         )
+        
+        # Let the dispatcher recompute its sleep if this retry is due sooner
+        self._wakeup.set()
     
     async def _add_to_dead_letter(self, record: RetryRecord):
         """Add message to dead letter queue."""
@@ -288,49 +411,60 @@ class RetryManager:
         return delay + jitter
     
     async def _process_retries(self):
-        """Background task to process retry queue."""
+        """Background task that claims due retries and feeds the dispatch workers."""
         logger.info("retry_processor_started")
         
         while True:
             try:
-                # Get messages ready for retry
+                # Cleared before claiming so a retry scheduled meanwhile is not missed
+                self._wakeup.clear()
+                self._capacity_freed.clear()
+                
+                free = self.max_pending - self._pending
+                if free <= 0:
+                    await self._capacity_freed.wait()
+                    continue
+                
+                claim_size = min(self.claim_batch_size, free)
                 now = datetime.utcnow().timestamp()
-                messages = await self.redis_client.zrangebyscore(
-                    self.retry_queue_key,
-                    0,
-                    now,
-                    start=0,
-                    num=10
+                due, next_due = await self._claim_due_script(
+                    keys=[self.retry_queue_key, self.inflight_key],
+                    args=[now, claim_size, now + self.lease_timeout]
                 )
+                self._leases.update(due)
                 
-                for message_data in messages:
+                records = []
+                for message_data in due:
                     try:
                         record = RetryRecord.from_dict(json.loads(message_data))
-                        
-                        # Update status
                         record.status = RetryStatus.RETRYING
                         record.updated_at = datetime.utcnow()
-                        await self._store_retry_record(record)
-                        
-                        # Remove from retry queue
-                        await self.redis_client.zrem(self.retry_queue_key, message_data)
-                        
-                        # Notify that message is ready for retry
-                        # This would typically trigger the message router to retry
-                        logger.info("message_ready_for_retry",
-                                   message_id=record.message_id,
-                                   attempt=record.attempt_count)
-                        
-                        # In a real implementation, you would call the message router here
-                        # For now, we'll just mark it as processed
-                        
+                        records.append((record, message_data))
                     except Exception as e:
                         logger.error("retry_processing_error",
                                    error=str(e),
                                    message=message_data)
+                        await self._release_lease(message_data)
+                
+                if records:
+                    await self._store_retry_records([record for record, _ in records])
+                    for record, lease in records:
+                        self._pending += 1
+                        self._get_destination_queue(record.destination).put_nowait((record, lease))
+                
+                # More due work is waiting; claim again straight away
+                if len(due) == claim_size:
+                    continue
                 
-                # Sleep before next check
-                await asyncio.sleep(1)
+                delay = self.max_idle_sleep
+                if next_due is not None:
+                    delay = min(delay, max(0.0, float(next_due) - datetime.utcnow().timestamp()))
+                # asyncio.timeout, unlike wait_for, never swallows a shutdown cancel
+                try:
+                    async with asyncio.timeout(delay):
+                        await self._wakeup.wait()
+                except asyncio.TimeoutError:
+                    pass
                 
             except asyncio.CancelledError:
                 break
@@ -340,6 +474,190 @@ class RetryManager:
         
         logger.info("retry_processor_stopped")
     
+    def _get_destination_queue(self, destination: ServiceType) -> asyncio.Queue:
+        """Get the dispatch queue for a destination, starting its workers on first use."""
+        queue = self._destination_queues.get(destination)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._destination_queues[destination] = queue
+            concurrency = self.destination_concurrency.get(
+                destination,
+                self.default_destination_concurrency
+            )
+            for _ in range(concurrency):
+                self._worker_tasks.append(
+                    asyncio.create_task(self._dispatch_worker(queue))
+                )
+        return queue
+    
+    async def _dispatch_worker(self, queue: asyncio.Queue):
+        """Deliver retries for one destination, one at a time."""
+        while True:
+            record, lease = await queue.get()
+            try:
+                await self._dispatch(record)
+                # Only dropped once delivered or rescheduled
+                await self._release_lease(lease)
+            except Exception as e:
+                logger.error("retry_dispatch_error",
+                           message_id=record.message_id,
+                           error=str(e))
+                await self._requeue_lease(
+                    lease,
+                    self._calculate_backoff_delay(record.attempt_count)
+                )
+            finally:
+                self._pending -= 1
+                self._capacity_freed.set()
+                queue.task_done()
+    
+    async def _dispatch(self, record: RetryRecord):
+        """Re-route a single retry and record its outcome."""
+        destination = record.destination.value
+        message = ServiceMessage(
+            source=record.source,
+            destination=record.destination,
+            message_type=record.message_type,
+            correlation_id=record.correlation_id,
+            payload=record.payload
+        )
+        
+        lag = (datetime.utcnow() - record.next_retry_at).total_seconds()
+        RETRY_SCHEDULE_LAG.labels(destination=destination).observe(max(0.0, lag))
+        self.dispatch_stats["dispatched"] += 1
+        
+        error = None
+        start = time.perf_counter()
+        try:
+            response = await self.router.route_message(message)
+            if response.status != "success":
+                error = response.error or response.status
+        except Exception as e:
+            error = str(e)
+        
+        outcome = "success" if error is None else "failure"
+        RETRY_DISPATCH_LATENCY.labels(destination=destination, outcome=outcome).observe(
+            time.perf_counter() - start
+        )
+        RETRY_ATTEMPTS.labels(destination=destination, outcome=outcome).inc()
+        
+        if error is None:
+            self.dispatch_stats["succeeded"] += 1
+            RETRY_ATTEMPTS_TO_SUCCESS.labels(destination=destination).observe(record.attempt_count)
+            record.status = RetryStatus.SUCCESS
+            record.updated_at = datetime.utcnow()
+            await self._store_retry_record(record)
+            logger.info("retry_delivered",
+                       message_id=record.message_id,
+                       attempt=record.attempt_count)
+        else:
+            self.dispatch_stats["failed"] += 1
+            await self.schedule_retry(message, error, attempt_count=record.attempt_count)
+    
+    async def _release_lease(self, lease: str):
+        """Drop a claimed record from the in-flight set."""
+        await self.redis_client.zrem(self.inflight_key, lease)
+        self._leases.discard(lease)
+    
+    async def _requeue_lease(self, lease: str, delay: float):
+        """Move a claimed record back to the retry queue, due in ``delay`` seconds."""
+        # No longer renewed, so if the move fails the lease expires and is reaped
+        self._leases.discard(lease)
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.zrem(self.inflight_key, lease)
+                pipe.zadd(self.retry_queue_key, {lease: datetime.utcnow().timestamp() + delay})
+                await pipe.execute()
+        except Exception as e:
+            logger.error("retry_lease_requeue_error", error=str(e))
+    
+    async def _release_leases(self):
+        """Move every record this process holds back to the retry queue, due now."""
+        if not self._leases:
+            return
+        
+        now = datetime.utcnow().timestamp()
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.zrem(self.inflight_key, *self._leases)
+                pipe.zadd(self.retry_queue_key, {lease: now for lease in self._leases})
+                await pipe.execute()
+            self._leases.clear()
+        except Exception as e:
+            # The leases still expire and are requeued by another replica
+            logger.error("retry_lease_release_error", error=str(e))
+    
+    async def _renew_leases(self):
+        """Push the deadlines of the records this process holds out by a lease timeout."""
+        if not self._leases:
+            return
+        
+        deadline = datetime.utcnow().timestamp() + self.lease_timeout
+        await self.redis_client.zadd(
+            self.inflight_key,
+            {lease: deadline for lease in self._leases},
+            xx=True
+        )
+    
+    async def reap_expired_leases(self) -> int:
+        """
+        Requeue claimed retries whose lease expired.
+        
+        A lease expires when the process that claimed the record crashed or
+        stalled before dispatching it. The record goes back to the retry queue
+        due immediately and its stored status returns to pending.
+        
+        Returns:
+            Number of records requeued
+        """
+        expired = await self._requeue_expired_script(
+            keys=[self.inflight_key, self.retry_queue_key],
+            args=[datetime.utcnow().timestamp(), self.reap_batch_size]
+        )
+        if not expired:
+            return 0
+        
+        records = []
+        for message_data in expired:
+            try:
+                record = RetryRecord.from_dict(json.loads(message_data))
+                record.status = RetryStatus.PENDING
+                record.updated_at = datetime.utcnow()
+                records.append(record)
+            except Exception as e:
+                logger.error("retry_reap_error", error=str(e), message=message_data)
+        if records:
+            await self._store_retry_records(records)
+        
+        self._wakeup.set()
+        logger.warning("expired_retry_leases_requeued", count=len(expired))
+        return len(expired)
+    
+    async def _reap_leases(self):
+        """Background task that renews this process's leases and requeues expired ones."""
+        logger.info("retry_lease_reaper_started")
+        
+        while True:
+            try:
+                await self._renew_leases()
+                # Keep going without sleeping while there is a backlog
+                if await self.reap_expired_leases() < self.reap_batch_size:
+                    await asyncio.sleep(self.reap_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("retry_lease_reaper_error", error=str(e))
+                await asyncio.sleep(self.reap_interval)
+        
+        logger.info("retry_lease_reaper_stopped")
+    
+    async def _store_retry_records(self, records: List[RetryRecord]):
+        """Store several retry records in one round trip."""
+        await self.redis_client.hset(
+            self.retry_records_key,
+            mapping={record.message_id: json.dumps(record.to_dict()) for record in records}
+        )
+    
     async def mark_success(self, message_id: str):
         """Mark a message as successfully processed."""
         record = await self.get_retry_status(message_id)
@@ -353,6 +671,7 @@ class RetryManager:
     async def get_metrics(self) -> Dict[str, Any]:
         """Get retry metrics."""
         retry_count = await self.redis_client.zcard(self.retry_queue_key)
+        in_flight_count = await self.redis_client.zcard(self.inflight_key)
         dead_letter_count = await self.redis_client.llen(self.dead_letter_key)
         
         # Get status counts from retry records
@@ -371,9 +690,12 @@ class RetryManager:
         
         return {
             "retry_queue_size": retry_count,
+            "in_flight": in_flight_count,
             "dead_letter_queue_size": dead_letter_count,
             "status_counts": {k.value: v for k, v in status_counts.items()},
             "max_attempts": self.max_attempts,
             "base_delay": self.base_delay,
-            "max_delay": self.max_delay
+            "max_delay": self.max_delay,
+            "pending_dispatch": self._pending,
+            "dispatch": self.dispatch_stats.copy()
         }
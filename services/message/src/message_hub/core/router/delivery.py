@@ -0,0 +1,236 @@
+"""
+Message Hub Delivery Engine
+
+Per-destination HTTP client pools, cached registry lookups and off-path
+event recording used by the message router.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import structlog
+
+from ..models import ServiceType
+
+logger = structlog.get_logger()
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class DeliveryPoolConfig:
+    """Connection pool settings for one destination service."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0  # seconds
+    timeout: float = 30.0  # seconds
+    connect_timeout: float = 5.0  # seconds
+    http2: bool = False
+
+
+class DeliveryClientPool:
+    """
+    Keeps one tuned ``httpx.AsyncClient`` per destination service.
+
+    Clients are keyed by destination and base URL, so a service that
+    re-registers at a new address gets a fresh pool while the old one is
+    closed.
+    """
+
+    def __init__(self,
+                 default_config: Optional[DeliveryPoolConfig] = None,
+                 overrides: Optional[Dict[ServiceType, DeliveryPoolConfig]] = None):
+        """Initialize client pool."""
+        self.default_config = default_config or DeliveryPoolConfig()
+        self.overrides = overrides or {}
+        self._clients: Dict[ServiceType, Tuple[str, httpx.AsyncClient]] = {}
+
+    def get(self, destination: ServiceType, base_url: str) -> httpx.AsyncClient:
+        """Get the client for a destination, creating it on first use."""
+        entry = self._clients.get(destination)
+        if entry and entry[0] == base_url:
+            return entry[1]
+
+        if entry:
+            # Service moved; let in-flight requests on the old pool finish
+            asyncio.create_task(entry[1].aclose())
+
+        client = self._create_client(destination, base_url)
+        self._clients[destination] = (base_url, client)
+        return client
+
+    async def evict(self, destination: ServiceType):
+        """Close and forget a destination's client."""
+        entry = self._clients.pop(destination, None)
+        if entry:
+            await entry[1].aclose()
+
+    async def close(self):
+        """Close all clients."""
+        for destination in list(self._clients):
+            await self.evict(destination)
+
+    def _create_client(self, destination: ServiceType, base_url: str) -> httpx.AsyncClient:
+        """Create a client with the destination's pool settings."""
+        config = self.overrides.get(destination, self.default_config)
+
+        http2 = config.http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("http2_unavailable",
+                         destination=destination.value,
+                         hint="install httpx[http2]")
+            http2 = False
+
+        logger.info("delivery_pool_created",
+                   destination=destination.value,
+                   base_url=base_url,
+                   max_connections=config.max_connections,
+                   http2=http2)
+
+        return httpx.AsyncClient(
+            base_url=base_url,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout)
+        )
+
+
+class RegistryCache:
+    """
+    Caches service registration and status lookups for the router.
+
+    Entries expire after ``ttl`` seconds or when invalidated. Concurrent
+    misses for the same destination share a single registry lookup.
+    """
+
+    def __init__(self, registry: Any, ttl: float = 5.0):
+        """Initialize registry cache."""
+        self.registry = registry
+        self.ttl = ttl
+        self._entries: Dict[ServiceType, Tuple[float, Any, Any]] = {}
+        self._inflight: Dict[ServiceType, asyncio.Future] = {}
+
+    async def get(self, destination: ServiceType) -> Tuple[Any, Any]:
+        """Get ``(registration, status)`` for a destination."""
+        entry = self._entries.get(destination)
+        if entry and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+
+        pending = self._inflight.get(destination)
+        if pending:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[destination] = future
+        try:
+            service, status = await asyncio.gather(
+                self.registry.get_service(destination),
+                self.registry.get_service_status(destination)
+            )
+            # Unknown services are not cached so a registration shows up at once
+            if service:
+                self._entries[destination] = (time.monotonic() + self.ttl, service, status)
+            future.set_result((service, status))
+            return service, status
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a lookup nobody else awaited doesn't warn
+            future.exception()
+            raise
+        finally:
+            del self._inflight[destination]
+
+    def invalidate(self, destination: Optional[ServiceType] = None):
+        """Drop cached entries for one destination, or all of them."""
+        if destination is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(destination, None)
+
+
+class BatchedEventAppender:
+    """
+    Records delivery events off the routing hot path.
+
+    Events are queued and written by a background task in batches of up to
+    ``batch_size`` (or whatever accumulated within ``flush_interval``). The
+    queue is bounded, so a stalled event store slows producers down instead
+    of growing memory without limit.
+    """
+
+    def __init__(self,
+                 append_batch: Callable[[List[Any]], Awaitable[Any]],
+                 batch_size: int = 200,
+                 flush_interval: float = 0.05,
+                 max_pending: int = 10000):
+        """Initialize appender."""
+        self.append_batch = append_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "events_written": 0,
+            "batches_written": 0,
+            "write_errors": 0
+        }
+
+    async def submit(self, event: Any):
+        """Queue an event for writing."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        await self._queue.put(event)
+
+    async def flush(self):
+        """Wait until everything queued so far has been written."""
+        if self._task is not None:
+            await self._queue.join()
+
+    async def close(self):
+        """Flush pending events and stop the writer."""
+        await self.flush()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """Background writer loop."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.append_batch(batch)
+                self.stats["events_written"] += len(batch)
+                self.stats["batches_written"] += 1
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                logger.error("event_batch_write_failed",
+                           count=len(batch),
+                           error=str(e))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
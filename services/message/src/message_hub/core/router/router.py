@@ -7,15 +7,22 @@ Handles message routing and delivery between services.
 import structlog
 import httpx
 from circuitbreaker import circuit
-from typing import Optional, Any
+from typing import Optional, Any, List
 
-from .config import Settings
-from .models import ServiceMessage, ServiceResponse, ServiceType
-from .service_registry import ServiceRegistry
-from .circuit_breaker import CircuitBreakerOpen
-from .circuit_breaker_manager import CircuitBreakerManager
-from .event_store.service import EventStore
-from .event_store.helpers import message_to_event_type, create_event_metadata
+from ..config import Settings
+from ..models import ServiceMessage, ServiceResponse, ServiceType, MessageType
+from ..services import ServiceRegistry
+from ..circuit import CircuitBreakerOpen
+from ..circuit_manager import CircuitBreakerManager
+from ....event_store.service import EventStore
+from ....event_store.helpers import message_to_event_type, create_event_metadata
+from ....event_persistence import EventAppend
+from .delivery import (
+    BatchedEventAppender,
+    DeliveryClientPool,
+    DeliveryPoolConfig,
+    RegistryCache
+)
 
 logger = structlog.get_logger()
 
@@ -32,8 +39,34 @@ class MessageRouter:
         self.settings = settings
         self.registry = registry
         self.event_store = event_store
-        self.http_client = httpx.AsyncClient(timeout=settings.message_timeout)
+        self.clients = DeliveryClientPool(DeliveryPoolConfig(
+            max_connections=settings.delivery_max_connections,
+            max_keepalive_connections=settings.delivery_max_keepalive,
+            keepalive_expiry=settings.delivery_keepalive_expiry,
+            timeout=settings.message_timeout,
+            http2=settings.delivery_http2
+        ))
+        self.registry_cache = RegistryCache(registry, ttl=settings.registry_cache_ttl)
+        self.event_appender = BatchedEventAppender(
+            self._append_events,
+            batch_size=settings.event_batch_size,
+            flush_interval=settings.event_flush_interval,
+            max_pending=settings.event_max_pending
+        )
         self.circuit_breaker_manager = CircuitBreakerManager()
+        registry.add_listener(self.invalidate_service)
+    
+    def invalidate_service(self, destination: Optional[ServiceType] = None):
+        """
+        Drop cached registry data after a service registers, moves or
+        changes health. Pass None to invalidate every destination.
+        """
+        self.registry_cache.invalidate(destination)
+    
+    async def close(self):
+        """Flush recorded events and close delivery connections."""
+        await self.event_appender.close()
+        await self.clients.close()
     
     @circuit(
         failure_threshold=5,
@@ -43,13 +76,12 @@ class MessageRouter:
     async def route_message(self, message: ServiceMessage) -> ServiceResponse:
         """Route a message to its destination service."""
         try:
-            # Get destination service
-            service = await self.registry.get_service(message.destination)
+            # Get destination service and health (cached, lookups coalesced)
+            service, status = await self.registry_cache.get(message.destination)
             if not service:
                 raise ValueError(f"Unknown service: {message.destination}")
             
             # Check if service is healthy
-            status = await self.registry.get_service_status(message.destination)
             if status and status.status != "healthy":
                 raise ValueError(f"Service {message.destination} is unhealthy: {status.error}")
             
@@ -107,28 +139,34 @@ class MessageRouter:
         """Send a message to a service."""
         # Construct endpoint URL based on message type
         endpoint = self._get_endpoint_for_message(message)
-        url = f"{service.url}{endpoint}"
+        client = self.clients.get(message.destination, service.url)
         
         # Send message
-        response = await self.http_client.post(
-            url,
-            json=message.model_dump()
-        )
+        try:
+            response = await client.post(
+                endpoint,
+                json=message.model_dump(mode="json")
+            )
+        except httpx.TransportError:
+            # Address may be stale; re-resolve on the next message
+            self.registry_cache.invalidate(message.destination)
+            raise
         response.raise_for_status()
         
-        # Store event if message type has a corresponding event type
+        # Record event off the delivery path if the message type has one
         event_type = message_to_event_type(message.message_type)
         if event_type:
             metadata = create_event_metadata(
                 service_type=message.source,
                 correlation_id=message.correlation_id
             )
-            await self.event_store.append_event(
+            await self.event_appender.submit(EventAppend(
                 event_type=event_type,
                 source_service=message.source,
                 data=message.payload,
-                metadata=metadata
-            )
+                metadata=metadata,
+                correlation_id=message.correlation_id
+            ))
         
         return ServiceResponse(
             correlation_id=message.correlation_id,
@@ -136,11 +174,24 @@ class MessageRouter:
             data=response.json()
         )
     
+    async def _append_events(self, events: List[EventAppend]):
+        """Write a batch of delivery events to the event store."""
+        if hasattr(self.event_store, "append_events_durable"):
+            await self.event_store.append_events_durable(events)
+            return
+        
+        for event in events:
+            await self.event_store.append_event(
+                event_type=event.event_type,
+                source_service=event.source_service,
+                data=event.data,
+                metadata=event.metadata
+            )
+    
     def _get_endpoint_for_message(self, message: ServiceMessage) -> str:
         """Determine the appropriate endpoint for a message type."""
         
         # Map message types to endpoints
-        from .models import MessageType
         endpoints = {
             # Character Events routed as messages
             MessageType.CHARACTER_CREATED: "/v1/events",
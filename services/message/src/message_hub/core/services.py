@@ -8,7 +8,7 @@ import asyncio
 import time
 import structlog
 import httpx
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime, timedelta
 
 from .config import Settings
@@ -25,6 +25,7 @@ class ServiceRegistry:
         self.services: Dict[ServiceType, ServiceRegistration] = {}
         self.status_cache: Dict[ServiceType, ServiceStatus] = {}
         self.http_client = httpx.AsyncClient(timeout=settings.service_timeout)
+        self._listeners: List[Callable[[ServiceType], None]] = []
         
         # Start health check loop
         asyncio.create_task(self._health_check_loop())
@@ -52,6 +53,7 @@ class ServiceRegistry:
             # Update registration
             self.services[registration.name] = registration
             self.status_cache[registration.name] = status
+            self._notify(registration.name)
             
             logger.info("service_registered",
                        service=registration.name,
@@ -65,6 +67,35 @@ class ServiceRegistry:
                         error=str(e))
             raise
     
+    async def deregister_service(self, service_type: ServiceType) -> bool:
+        """Remove a service from the registry.
+        
+        Returns:
+            bool: True if the service was registered
+        """
+        if self.services.pop(service_type, None) is None:
+            return False
+        
+        self.status_cache.pop(service_type, None)
+        self._notify(service_type)
+        logger.info("service_deregistered", service=service_type)
+        return True
+    
+    def add_listener(self, callback: Callable[[ServiceType], None]):
+        """Call ``callback`` with the service type whenever a service
+        registers, deregisters or changes health."""
+        self._listeners.append(callback)
+    
+    def _notify(self, service_type: ServiceType):
+        """Tell listeners a service's registration or health changed."""
+        for callback in self._listeners:
+            try:
+                callback(service_type)
+            except Exception as e:
+                logger.error("registry_listener_error",
+                           service=service_type,
+                           error=str(e))
+    
     async def get_service(self, service_type: ServiceType) -> Optional[ServiceRegistration]:
         """Get registration information for a service."""
         return self.services.get(service_type)
@@ -132,17 +163,24 @@ class ServiceRegistry:
                 error=str(e)
             )
     
+    def _update_status(self, service_type: ServiceType, status: ServiceStatus):
+        """Store a health check result, notifying listeners if health changed."""
+        previous = self.status_cache.get(service_type)
+        self.status_cache[service_type] = status
+        if previous is None or previous.status != status.status:
+            self._notify(service_type)
+    
     async def _health_check_loop(self):
         """Continuous health check loop for all services."""
         while True:
             try:
-                for service_type, registration in self.services.items():
+                for service_type, registration in list(self.services.items()):
                     status = await self._check_service_health(
                         service_type,
                         registration.url,
                         registration.health_check
                     )
-                    self.status_cache[service_type] = status
+                    self._update_status(service_type, status)
                     
                     if status.status != "healthy":
                         logger.warning("service_unhealthy",
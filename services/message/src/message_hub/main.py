@@ -4,6 +4,8 @@ Message Hub - Main Application
 Central message hub for service-to-service communication in the D&D Character Creator.
 """
 
+from typing import Optional
+
 import structlog
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -48,12 +50,20 @@ event_persistence = EventPersistence()
 retry_manager = RetryManager()
 priority_queue_manager = PriorityQueueManager()
 message_router = MessageRouter(settings, service_registry)
+retry_manager.attach_router(message_router)
 transaction_manager = TransactionManager(message_router)
 metrics = MessageHubMetrics(app, circuit_breaker_manager=None)
 
 # Include event store API router
 app.include_router(event_router, prefix="/api")
 
+@app.on_event("startup")
+async def recover_transactions():
+    """Finish transactions left in doubt by a previous run."""
+    recovered = await transaction_manager.recover()
+    if recovered:
+        logger.warning("in_doubt_transactions_recovered", count=recovered)
+
 @app.post("/v1/messages/send")
 async def send_message(message: ServiceMessage) -> ServiceResponse:
     """Send a message from one service to another."""
@@ -197,6 +207,25 @@ async def get_queue_status():
         logger.error("queue_status_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/v1/queue/dead-letters")
+async def get_dead_letters(limit: int = 100, offset: int = 0):
+    """List messages that ran out of delivery attempts."""
+    try:
+        return await priority_queue_manager.get_dead_letters(limit=limit, offset=offset)
+    except Exception as e:
+        logger.error("dead_letters_failed", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/v1/queue/dead-letters/replay")
+async def replay_dead_letters(count: Optional[int] = None):
+    """Re-enqueue dead-lettered messages, oldest first."""
+    try:
+        replayed = await priority_queue_manager.replay_dead_letters(count)
+        return {"status": "replayed", "count": replayed}
+    except Exception as e:
+        logger.error("dead_letter_replay_failed", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Enhanced Service Registry endpoints
 @app.post("/v1/services/{service_name}/instances")
 async def register_service_instance(service_name: str, instance_url: str):
@@ -0,0 +1,86 @@
+"""
+Event Store Append Benchmark
+
+Reports appends/sec for EnhancedEventStore as the number of concurrent
+producers grows, for single appends and group commits. Requires PostgreSQL
+(``MESSAGE_HUB_BENCH_DATABASE_URL``, an asyncpg URL).
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.config import Settings
+from src.event_persistence import EnhancedEventStore, EventAppend
+from src.event_store.models import Base, EventType
+from src.models import ServiceType
+
+DATABASE_URL = os.getenv("MESSAGE_HUB_BENCH_DATABASE_URL")
+PRODUCER_COUNTS = [1, 4, 16, 64]
+EVENTS_PER_PRODUCER = 200
+GROUP_SIZE = 50
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(not DATABASE_URL, reason="MESSAGE_HUB_BENCH_DATABASE_URL not set"),
+]
+
+
+@pytest.fixture
+async def event_store():
+    """Enhanced event store against a scratch PostgreSQL database."""
+    store = EnhancedEventStore(Settings(database_url=DATABASE_URL))
+    store.compaction_enabled = False
+    await store.initialize()
+    yield store
+    async with store.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await store.shutdown()
+
+
+async def produce_single(store: EnhancedEventStore, producer: int):
+    """Append events one transaction at a time."""
+    for i in range(EVENTS_PER_PRODUCER):
+        await store.append_event_durable(
+            EventType.CHARACTER_UPDATED,
+            ServiceType.CHARACTER_SERVICE,
+            {"producer": producer, "i": i},
+            stream_id=f"bench-{producer}"
+        )
+
+
+async def produce_grouped(store: EnhancedEventStore, producer: int):
+    """Append events in group commits of GROUP_SIZE."""
+    for start in range(0, EVENTS_PER_PRODUCER, GROUP_SIZE):
+        await store.append_events_durable([
+            EventAppend(
+                event_type=EventType.CHARACTER_UPDATED,
+                source_service=ServiceType.CHARACTER_SERVICE,
+                data={"producer": producer, "i": i},
+                stream_id=f"bench-{producer}"
+            )
+            for i in range(start, start + GROUP_SIZE)
+        ])
+
+
+async def measure(store: EnhancedEventStore, producer, producers: int) -> float:
+    """Run ``producers`` concurrent producers and return appends/sec."""
+    start = time.perf_counter()
+    await asyncio.gather(*(producer(store, p) for p in range(producers)))
+    return producers * EVENTS_PER_PRODUCER / (time.perf_counter() - start)
+
+
+async def test_append_throughput_scaling(event_store):
+    """Appends/sec should grow with concurrent producers."""
+    print(f"\n{'producers':>9} {'single/s':>12} {'grouped/s':>12}")
+    single_rates = []
+    for producers in PRODUCER_COUNTS:
+        single = await measure(event_store, produce_single, producers)
+        grouped = await measure(event_store, produce_grouped, producers)
+        single_rates.append(single)
+        print(f"{producers:>9} {single:>12.0f} {grouped:>12.0f}")
+    
+    # Without the global lock, more producers must not be slower than one
+    assert max(single_rates[1:]) > single_rates[0]
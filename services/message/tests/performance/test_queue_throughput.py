@@ -0,0 +1,92 @@
+"""
+Priority Queue Throughput Benchmark
+
+Compares messages/sec of the per-message ``dequeue`` path against the
+script-backed ``dequeue_batch`` path. Requires a reachable Redis instance
+(``MESSAGE_HUB_BENCH_REDIS_URL``, defaults to a local Redis on db 15);
+``MESSAGE_HUB_BENCH_MESSAGES`` sets the message count.
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+import redis.asyncio as redis
+
+from src.message_hub.core.queue import PriorityQueueManager, MessagePriority
+from src.message_hub.core.models import ServiceMessage, ServiceType, MessageType
+
+REDIS_URL = os.getenv("MESSAGE_HUB_BENCH_REDIS_URL", "redis://localhost:6379/15")
+MESSAGE_COUNT = int(os.getenv("MESSAGE_HUB_BENCH_MESSAGES", "5000"))
+BATCH_SIZE = 100
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture
+async def queue_manager():
+    """Queue manager connected to a scratch Redis database."""
+    client = redis.from_url(REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip(f"Redis not available at {REDIS_URL}")
+    await client.flushdb()
+    await client.close()
+    
+    manager = PriorityQueueManager(SimpleNamespace(redis_url=REDIS_URL))
+    await manager.initialize()
+    manager.max_queue_size = MESSAGE_COUNT * 2
+    yield manager
+    await manager.redis_client.flushdb()
+    await manager.shutdown()
+
+
+async def fill_queue(manager: PriorityQueueManager, count: int):
+    """Enqueue ``count`` messages spread over every priority tier."""
+    priorities = list(MessagePriority)
+    for i in range(count):
+        await manager.enqueue(
+            ServiceMessage(
+                source=ServiceType.CHARACTER_SERVICE,
+                destination=ServiceType.RULES_SERVICE,
+                message_type=MessageType.CHARACTER_UPDATED,
+                correlation_id=f"bench-{i}",
+                payload={"character_id": str(i), "updates": {"level": 2}}
+            ),
+            priority=priorities[i % len(priorities)]
+        )
+
+
+async def drain(dequeue) -> float:
+    """Drain the queue with ``dequeue`` and return messages/sec."""
+    drained = 0
+    start = time.perf_counter()
+    while drained < MESSAGE_COUNT:
+        batch = await dequeue()
+        if not batch:
+            break
+        drained += len(batch)
+    elapsed = time.perf_counter() - start
+    assert drained == MESSAGE_COUNT
+    return drained / elapsed
+
+
+async def test_dequeue_batch_throughput(queue_manager):
+    """Batched dequeue should beat the per-message dequeue path."""
+    await fill_queue(queue_manager, MESSAGE_COUNT)
+    legacy_rate = await drain(
+        lambda: queue_manager.dequeue(service=ServiceType.RULES_SERVICE, batch_size=BATCH_SIZE)
+    )
+    
+    await fill_queue(queue_manager, MESSAGE_COUNT)
+    batch_rate = await drain(
+        lambda: queue_manager.dequeue_batch(BATCH_SIZE, service=ServiceType.RULES_SERVICE)
+    )
+    
+    print(f"\ndequeue:       {legacy_rate:10.0f} msg/s")
+    print(f"dequeue_batch: {batch_rate:10.0f} msg/s ({batch_rate / legacy_rate:.1f}x)")
+    
+    assert await queue_manager._get_queue_size() == 0
+    assert batch_rate > legacy_rate
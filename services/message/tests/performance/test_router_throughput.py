@@ -0,0 +1,176 @@
+"""
+Router Delivery Throughput Benchmark
+
+Measures routed messages/sec against a local keep-alive stub service,
+comparing the previous delivery path (shared client, registry lookups and
+an event store write on every message) with the delivery engine used by
+``MessageRouter`` (per-destination pools, cached registry lookups and
+batched event recording). Registry and event store latency are simulated.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.message_hub.core.models import ServiceType
+from src.message_hub.core.router.delivery import (
+    BatchedEventAppender,
+    DeliveryClientPool,
+    DeliveryPoolConfig,
+    RegistryCache
+)
+
+MESSAGE_COUNT = 2000
+CONCURRENCY_LEVELS = [1, 16, 64]
+REGISTRY_LATENCY = 0.001  # seconds per lookup
+EVENT_WRITE_LATENCY = 0.002  # seconds per transaction
+
+DESTINATION = ServiceType.CHARACTER_SERVICE
+PAYLOAD = {"character_id": "bench", "updates": {"level": 2}}
+
+pytestmark = pytest.mark.performance
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.1 keep-alive endpoint that acknowledges every POST."""
+    body = json.dumps({"accepted": True}).encode()
+    response = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(response)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def stub_service():
+    """Local stub destination service."""
+    server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+class StubRegistry:
+    """Registry with a fixed lookup latency."""
+
+    def __init__(self, url: str):
+        self.service = SimpleNamespace(url=url)
+        self.status = SimpleNamespace(status="healthy", error=None)
+        self.lookups = 0
+
+    async def get_service(self, service_type):
+        self.lookups += 1
+        await asyncio.sleep(REGISTRY_LATENCY)
+        return self.service
+
+    async def get_service_status(self, service_type):
+        self.lookups += 1
+        await asyncio.sleep(REGISTRY_LATENCY)
+        return self.status
+
+
+class StubEventStore:
+    """Event store with a fixed per-transaction latency."""
+
+    def __init__(self):
+        self.events = 0
+        self.transactions = 0
+        self._lock = asyncio.Lock()
+
+    async def append_event(self, **kwargs):
+        async with self._lock:
+            await asyncio.sleep(EVENT_WRITE_LATENCY)
+            self.events += 1
+            self.transactions += 1
+
+    async def append_events_durable(self, events):
+        async with self._lock:
+            await asyncio.sleep(EVENT_WRITE_LATENCY)
+            self.events += len(events)
+            self.transactions += 1
+
+
+async def run_load(route, concurrency: int) -> float:
+    """Route ``MESSAGE_COUNT`` messages with ``concurrency`` senders; return msg/s."""
+    remaining = iter(range(MESSAGE_COUNT))
+
+    async def sender():
+        for _ in remaining:
+            await route()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(sender() for _ in range(concurrency)))
+    return MESSAGE_COUNT / (time.perf_counter() - start)
+
+
+async def legacy_rate(url: str, concurrency: int) -> float:
+    """Throughput of the previous per-message delivery path."""
+    registry = StubRegistry(url)
+    store = StubEventStore()
+
+    async with httpx.AsyncClient(timeout=30) as client:
+        async def route():
+            service = await registry.get_service(DESTINATION)
+            await registry.get_service_status(DESTINATION)
+            response = await client.post(f"{service.url}/v1/events", json=PAYLOAD)
+            response.raise_for_status()
+            await store.append_event(data=PAYLOAD)
+
+        rate = await run_load(route, concurrency)
+
+    assert store.events == MESSAGE_COUNT
+    return rate
+
+
+async def engine_rate(url: str, concurrency: int) -> float:
+    """Throughput of the delivery engine path."""
+    registry = StubRegistry(url)
+    store = StubEventStore()
+    clients = DeliveryClientPool(DeliveryPoolConfig(max_keepalive_connections=64))
+    cache = RegistryCache(registry)
+    appender = BatchedEventAppender(store.append_events_durable)
+
+    async def route():
+        service, status = await cache.get(DESTINATION)
+        response = await clients.get(DESTINATION, service.url).post("/v1/events", json=PAYLOAD)
+        response.raise_for_status()
+        await appender.submit(PAYLOAD)
+
+    rate = await run_load(route, concurrency)
+    await appender.close()
+    await clients.close()
+
+    assert store.events == MESSAGE_COUNT
+    assert registry.lookups == 2
+    return rate
+
+
+async def test_router_delivery_throughput(stub_service):
+    """The delivery engine should out-route the per-message path under load."""
+    print()
+    for concurrency in CONCURRENCY_LEVELS:
+        before = await legacy_rate(stub_service, concurrency)
+        after = await engine_rate(stub_service, concurrency)
+        print(f"concurrency {concurrency:3d}: legacy {before:8.0f} msg/s, "
+              f"engine {after:8.0f} msg/s ({after / before:.1f}x)")
+        assert after > before
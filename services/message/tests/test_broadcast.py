@@ -0,0 +1,171 @@
+"""
+Tests for Broadcast Engine
+
+Covers encode-once fan-out, per-connection priority lanes and the slow
+consumer policies.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from src.message_hub.core.broadcast import (
+    BroadcastEngine,
+    SlowConsumerPolicy,
+    CRITICAL_LANE,
+    LOW_LANE,
+    SLOW_CONSUMER_CLOSE_CODE
+)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that can be paused to simulate a slow client."""
+
+    def __init__(self):
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.close = AsyncMock()
+
+    async def send_text(self, frame: str):
+        await self.gate.wait()
+        self.frames.append(frame)
+
+
+async def settle():
+    """Let writer tasks run."""
+    await asyncio.sleep(0.01)
+
+
+class TestBroadcastEngine:
+    """Test fan-out behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once_per_event(self):
+        """Every recipient should get the same encoded frame."""
+        engine = BroadcastEngine()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for i, ws in enumerate(sockets):
+            engine.add("session-1", i, ws)
+
+        queued = engine.broadcast("session-1", {"type": "game.state.updated", "hp": 7}, exclude={2})
+        await settle()
+
+        assert queued == 2
+        assert sockets[0].frames == sockets[1].frames == ['{"type":"game.state.updated","hp":7}']
+        assert sockets[2].frames == []
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """A stalled socket should not delay delivery to the rest of the session."""
+        engine = BroadcastEngine(max_queue=10)
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        slow.gate.clear()
+        engine.add("session-1", "slow", slow)
+        engine.add("session-1", "fast", fast)
+
+        for i in range(5):
+            engine.broadcast("session-1", {"n": i})
+        await settle()
+
+        assert len(fast.frames) == 5
+        assert slow.frames == []
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_combat_frames_sent_before_chat(self):
+        """Queued critical frames should overtake queued low-priority frames."""
+        engine = BroadcastEngine()
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        engine.add("session-1", "player", ws)
+
+        engine.broadcast("session-1", "chat-1", lane=LOW_LANE)
+        await settle()  # writer is now blocked sending chat-1
+        engine.broadcast("session-1", "chat-2", lane=LOW_LANE)
+        engine.broadcast("session-1", "attack", lane=CRITICAL_LANE)
+        ws.gate.set()
+        await settle()
+
+        assert ws.frames == ["chat-1", "attack", "chat-2"]
+        await engine.close()
+
+
+class TestSlowConsumerPolicy:
+    """Test behaviour when a connection's queue is full."""
+
+    async def _fill(self, policy, max_queue=2):
+        engine = BroadcastEngine(max_queue=max_queue, policy=policy)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        engine.add("session-1", "player", ws)
+        engine.broadcast("session-1", "in-flight")
+        await settle()
+        for name in ("a", "b"):
+            engine.broadcast("session-1", name, lane=LOW_LANE)
+        return engine, ws
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        """The oldest frame in the lane should be evicted."""
+        engine, ws = await self._fill(SlowConsumerPolicy.DROP_OLDEST)
+
+        engine.broadcast("session-1", "c", lane=LOW_LANE)
+        ws.gate.set()
+        await settle()
+
+        assert ws.frames == ["in-flight", "b", "c"]
+        assert engine.get_stats()["frames_dropped"] == 1
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_still_admits_urgent_frames(self):
+        """Incoming frames are dropped unless something less urgent can be evicted."""
+        engine, ws = await self._fill(SlowConsumerPolicy.DROP_NEWEST)
+
+        assert engine.broadcast("session-1", "c", lane=LOW_LANE) == 0
+        assert engine.broadcast("session-1", "attack", lane=CRITICAL_LANE) == 1
+        ws.gate.set()
+        await settle()
+
+        assert ws.frames == ["in-flight", "attack", "b"]
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_connection(self):
+        """A full queue should close the socket and notify the owner."""
+        on_disconnect = AsyncMock()
+        engine = BroadcastEngine(
+            max_queue=1,
+            policy=SlowConsumerPolicy.DISCONNECT,
+            on_disconnect=on_disconnect
+        )
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        engine.add("session-1", "player", ws)
+
+        engine.broadcast("session-1", "in-flight")
+        await settle()
+        engine.broadcast("session-1", "queued")
+        engine.broadcast("session-1", "overflow")
+        await settle()
+
+        ws.close.assert_awaited_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+        on_disconnect.assert_awaited_once_with("session-1", "player", "slow_consumer")
+        assert engine.connection_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_send_failure_drops_connection(self):
+        """A socket error should unregister the connection."""
+        on_disconnect = AsyncMock()
+        engine = BroadcastEngine(on_disconnect=on_disconnect)
+        ws = FakeWebSocket()
+        ws.send_text = AsyncMock(side_effect=RuntimeError("connection reset"))
+        engine.add("session-1", "player", ws)
+
+        engine.broadcast("session-1", {"n": 1})
+        await settle()
+
+        on_disconnect.assert_awaited_once_with("session-1", "player", "send_failed")
+        assert engine.connection_count("session-1") == 0
@@ -530,6 +530,139 @@ class TestLoadBalancingStrategies:
         assert 35 < count_1 < 65  # Should be around 50
 
 
+class TestCandidateSelection:
+    """Test precomputed candidate sets and load-aware strategies."""
+    
+    def _instances(self, count, **overrides):
+        return [
+            ServiceInstance(
+                service_type=ServiceType.CHARACTER_SERVICE,
+                instance_id=f"char-{i:03d}",
+                url=f"http://localhost:80{i:02d}",
+                health_check="/health",
+                version="1.0.0",
+                capabilities=[MessageType.CHARACTER_CREATED],
+                health_status=ServiceHealthStatus.HEALTHY,
+                **overrides
+            )
+            for i in range(count)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_candidates_reused_until_health_changes(self, registry, http_mock):
+        """Candidate sets are rebuilt only when instance health changes."""
+        instances = self._instances(3)
+        registry.instances[ServiceType.CHARACTER_SERVICE] = instances
+        
+        first = registry._get_candidates(ServiceType.CHARACTER_SERVICE, None, None)
+        assert registry._get_candidates(ServiceType.CHARACTER_SERVICE, None, None) is first
+        assert len(first.instances) == 3
+        
+        # Instance goes down
+        http_mock.get = AsyncMock(side_effect=Exception("Connection error"))
+        registry.health_check_history[instances[0].instance_id] = [False, False]
+        await registry._check_instance_health(instances[0])
+        
+        rebuilt = registry._get_candidates(ServiceType.CHARACTER_SERVICE, None, None)
+        assert rebuilt is not first
+        assert instances[0] not in rebuilt.instances
+    
+    @pytest.mark.asyncio
+    async def test_candidates_rebuilt_on_registration(self, registry, http_mock):
+        """Registering an instance invalidates the service's candidates."""
+        registry.instances[ServiceType.CHARACTER_SERVICE] = self._instances(2)
+        before = registry._get_candidates(ServiceType.CHARACTER_SERVICE, None, None)
+        
+        registry.healthy_threshold = 1
+        await registry.register_instance(
+            service_type=ServiceType.CHARACTER_SERVICE,
+            instance_id="char-new",
+            url="http://localhost:8100",
+            health_check="/health",
+            version="1.0.0",
+            capabilities=[MessageType.CHARACTER_CREATED]
+        )
+        
+        after = registry._get_candidates(ServiceType.CHARACTER_SERVICE, None, None)
+        assert after is not before
+        assert "char-new" in [inst.instance_id for inst in after.instances]
+    
+    @pytest.mark.asyncio
+    async def test_power_of_two_choices_avoids_loaded_instance(self, registry):
+        """The busiest instance is never chosen over a less loaded one."""
+        instances = self._instances(4)
+        instances[0].active_connections = 100
+        registry.instances[ServiceType.CHARACTER_SERVICE] = instances
+        registry.load_balancing_strategy = LoadBalancingStrategy.POWER_OF_TWO_CHOICES
+        
+        for _ in range(50):
+            selected = await registry.get_instance(ServiceType.CHARACTER_SERVICE)
+            assert selected.instance_id != "char-000"
+            await registry.release_instance(selected)
+    
+    @pytest.mark.asyncio
+    async def test_least_outstanding_requests(self, registry):
+        """Of two sampled instances, the one with fewer in flight per weight wins."""
+        instances = self._instances(3)
+        instances[0].active_connections = 4
+        instances[1].active_connections = 6
+        instances[1].weight = 3.0
+        instances[2].active_connections = 3
+        registry.instances[ServiceType.CHARACTER_SERVICE] = instances
+        registry.load_balancing_strategy = LoadBalancingStrategy.LEAST_OUTSTANDING_REQUESTS
+        
+        with patch("src.enhanced_service_registry.random.sample", return_value=instances[1:]):
+            selected = await registry.get_instance(ServiceType.CHARACTER_SERVICE)
+        assert selected.instance_id == "char-001"  # 6 / 3.0 = 2.0 beats 3
+        assert selected.active_connections == 7
+        
+        for _ in range(50):
+            selected = await registry.get_instance(ServiceType.CHARACTER_SERVICE)
+            assert selected.instance_id != "char-000"  # 4 per weight, the most loaded
+            await registry.release_instance(selected)
+    
+    @pytest.mark.asyncio
+    async def test_health_aware_falls_back_to_healthiest(self, registry):
+        """With no instance above the preferred score, the least degraded one is used."""
+        instances = self._instances(3)
+        for inst in instances:
+            inst.health_status = ServiceHealthStatus.DEGRADED
+            inst.total_requests = 10
+        instances[0].failed_requests = 5
+        instances[2].failed_requests = 2
+        registry.instances[ServiceType.CHARACTER_SERVICE] = instances
+        
+        selected = await registry.get_instance(ServiceType.CHARACTER_SERVICE)
+        assert selected.instance_id == "char-001"
+    
+    @pytest.mark.asyncio
+    async def test_health_checks_run_concurrently(self, registry, http_mock):
+        """All instances are probed in parallel, bounded by the concurrency limit."""
+        in_flight = 0
+        peak = 0
+        
+        async def slow_get(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return MagicMock(raise_for_status=MagicMock())
+        
+        http_mock.get = AsyncMock(side_effect=slow_get)
+        registry.instances[ServiceType.CHARACTER_SERVICE] = self._instances(10)
+        registry.health_check_jitter = 0
+        registry.health_check_concurrency = 4
+        
+        start = asyncio.get_event_loop().time()
+        await registry._run_health_checks()
+        elapsed = asyncio.get_event_loop().time() - start
+        
+        assert http_mock.get.await_count == 10
+        assert peak == 4
+        assert elapsed < 0.5  # Serial probing would take 10 x 0.05s
+
+
 class TestMetrics:
     """Test metrics collection."""
     
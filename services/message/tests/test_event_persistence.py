@@ -0,0 +1,477 @@
+"""
+Tests for Enhanced Event Store
+
+Test suite for group-commit appends, replay, snapshots and compaction.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select, text
+
+from src.config import Settings
+from src.event_persistence import (
+    EnhancedEventStore,
+    EventAppend,
+    EventReplayMode,
+    SequenceBlockAllocator
+)
+from src.event_store.models import CompactionProgress, Event, EventStream, EventType
+from src.models import ServiceType
+
+
+@pytest.fixture
+async def enhanced_store(db_engine, session_factory) -> EnhancedEventStore:
+    """Enhanced event store bound to the in-memory test database."""
+    store = EnhancedEventStore(Settings())
+    store.engine = db_engine
+    store.session_factory = session_factory
+    await store.sequence_allocator.initialize(db_engine)
+    return store
+
+
+def make_append(stream_id: str = None, **data) -> EventAppend:
+    """Build a pending character update event."""
+    return EventAppend(
+        event_type=EventType.CHARACTER_UPDATED,
+        source_service=ServiceType.CHARACTER_SERVICE,
+        data=data,
+        stream_id=stream_id
+    )
+
+
+class TestSequenceBlockAllocator:
+    """Test block-based sequence allocation."""
+    
+    @pytest.mark.asyncio
+    async def test_allocates_across_blocks(self, db_engine, session_factory):
+        """Test allocations spanning several blocks stay contiguous in-process."""
+        allocator = SequenceBlockAllocator(block_size=2)
+        await allocator.initialize(db_engine)
+        
+        async with session_factory() as session:
+            first = await allocator.allocate(session, 5)
+            second = await allocator.allocate(session, 1)
+        
+        assert first == [1, 2, 3, 4, 5]
+        assert second == [6]
+
+
+class TestGroupCommit:
+    """Test batched appends."""
+    
+    @pytest.mark.asyncio
+    async def test_append_batch(self, enhanced_store, session_factory):
+        """Test a batch gets ordered sequence numbers and one stream version per event."""
+        events = await enhanced_store.append_events_durable([
+            make_append("stream-a", hp=10),
+            make_append("stream-a", hp=9),
+            make_append("stream-b", hp=5),
+            make_append(None, note="unstreamed")
+        ])
+        
+        sequences = [event.sequence_number for event in events]
+        assert sequences == sorted(sequences)
+        assert len(set(sequences)) == 4
+        assert [event.stream_version for event in events] == [1, 2, 1, None]
+        
+        async with session_factory() as session:
+            assert await enhanced_store._get_stream_version(session, "stream-a") == 2
+            assert await enhanced_store._get_stream_version(session, "stream-b") == 1
+            stored = (await session.execute(select(Event))).scalars().all()
+            assert len(stored) == 4
+    
+    @pytest.mark.asyncio
+    async def test_single_append_uses_stream_version(self, enhanced_store, session_factory):
+        """Test optimistic concurrency on single appends reads EventStream.version."""
+        await enhanced_store.append_event_durable(
+            EventType.CHARACTER_CREATED,
+            ServiceType.CHARACTER_SERVICE,
+            {"name": "Aria"},
+            stream_id="stream-a",
+            expected_version=0
+        )
+        await enhanced_store.append_event_durable(
+            EventType.CHARACTER_UPDATED,
+            ServiceType.CHARACTER_SERVICE,
+            {"level": 2},
+            stream_id="stream-a",
+            expected_version=1
+        )
+        
+        async with session_factory() as session:
+            stream = (await session.execute(
+                select(EventStream).filter_by(stream_id="stream-a")
+            )).scalar_one()
+            assert stream.version == 2
+    
+    @pytest.mark.asyncio
+    async def test_expected_version_conflict(self, enhanced_store, session_factory):
+        """Test a stale expected version rejects the whole batch."""
+        await enhanced_store.append_events_durable([make_append("stream-a", hp=10)])
+        
+        with pytest.raises(ValueError, match="Concurrency conflict"):
+            await enhanced_store.append_events_durable(
+                [make_append("stream-a", hp=9), make_append("stream-b", hp=1)],
+                expected_versions={"stream-a": 0}
+            )
+        
+        async with session_factory() as session:
+            stored = (await session.execute(select(Event))).scalars().all()
+            assert len(stored) == 1
+            assert await enhanced_store._get_stream_version(session, "stream-b") == 0
+
+
+    @pytest.mark.asyncio
+    async def test_expected_version_on_missing_stream_conflicts(self, enhanced_store, session_factory):
+        """Test a non-zero expected version does not create the stream."""
+        with pytest.raises(ValueError, match="current version is 0"):
+            await enhanced_store.append_events_durable(
+                [make_append("stream-a", hp=10)],
+                expected_versions={"stream-a": 3}
+            )
+        
+        async with session_factory() as session:
+            streams = (await session.execute(select(EventStream))).scalars().all()
+            assert streams == []
+    
+    @pytest.mark.asyncio
+    async def test_append_to_stream_created_elsewhere(self, enhanced_store, session_factory):
+        """Test an unconditional first append joins a stream another writer created."""
+        async with session_factory() as session:
+            async with session.begin():
+                session.add(EventStream(stream_id="stream-a", stream_type="event_stream", version=2))
+        
+        await enhanced_store.append_events_durable([make_append("stream-a", hp=10)])
+        
+        async with session_factory() as session:
+            assert await enhanced_store._get_stream_version(session, "stream-a") == 3
+
+
+class TestSchemaUpgrade:
+    """Test upgrading tables created before stream versions existed."""
+    
+    @pytest.mark.asyncio
+    async def test_upgrade_backfills_stream_versions(self, db_engine, session_factory):
+        """Test missing columns are added and versions backfilled from events."""
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DROP TABLE event_streams"))
+            await conn.execute(text(
+                "CREATE TABLE event_streams ("
+                "id INTEGER PRIMARY KEY, stream_id VARCHAR(36) NOT NULL UNIQUE, "
+                "stream_type VARCHAR(50) NOT NULL, created_at DATETIME NOT NULL, "
+                "last_event_at DATETIME, metadata JSON)"
+            ))
+            await conn.execute(text(
+                "INSERT INTO event_streams (stream_id, stream_type, created_at) "
+                "VALUES ('stream-a', 'character', '2024-01-01')"
+            ))
+        
+        async with session_factory() as session:
+            async with session.begin():
+                session.add_all([
+                    Event(
+                        event_type=EventType.CHARACTER_UPDATED,
+                        event_id=f"event-{i}",
+                        source_service="character",
+                        data={"i": i},
+                        sequence_number=i,
+                        stream_id="stream-a" if i < 3 else "stream-b"
+                    )
+                    for i in range(5)
+                ])
+        
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_events_stream_version"))
+            await conn.execute(text("ALTER TABLE events DROP COLUMN stream_version"))
+            await conn.run_sync(EnhancedEventStore._upgrade_schema)
+            await conn.run_sync(EnhancedEventStore._upgrade_schema)
+        
+        async with session_factory() as session:
+            streams = {
+                stream.stream_id: stream
+                for stream in (await session.execute(select(EventStream))).scalars()
+            }
+        
+        assert {stream_id: stream.version for stream_id, stream in streams.items()} == \
+            {"stream-a": 3, "stream-b": 2}
+        assert streams["stream-a"].stream_type == "character"
+        assert streams["stream-b"].snapshot_version == 2
+        assert streams["stream-b"].bytes_since_snapshot == 0
+        
+        async with session_factory() as session:
+            versions = (await session.execute(
+                select(Event.stream_id, Event.stream_version).order_by(Event.sequence_number)
+            )).all()
+        assert versions == [
+            ("stream-a", 1), ("stream-a", 2), ("stream-a", 3), ("stream-b", 1), ("stream-b", 2)
+        ]
+
+
+class TestReplay:
+    """Test keyset-paginated replay."""
+    
+    @pytest.fixture
+    async def seeded_store(self, enhanced_store):
+        """Store with 25 events spread over three streams."""
+        await enhanced_store.append_events_durable([
+            make_append(f"stream-{i % 3}", i=i) for i in range(25)
+        ])
+        return enhanced_store
+    
+    @pytest.mark.asyncio
+    async def test_replay_from_beginning_in_order(self, seeded_store):
+        """Test every event is replayed once, in sequence order, in pages."""
+        batches = [
+            batch async for batch in seeded_store.replay_events(
+                EventReplayMode.FROM_BEGINNING,
+                batch_size=10
+            )
+        ]
+        
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        sequences = [event.sequence_number for batch in batches for event in batch]
+        assert sequences == sorted(sequences)
+        assert len(set(sequences)) == 25
+    
+    @pytest.mark.asyncio
+    async def test_replay_last_n_oldest_first(self, seeded_store):
+        """Test LAST_N_EVENTS yields the newest N events in ascending order."""
+        events = [
+            event
+            async for batch in seeded_store.replay_events(
+                EventReplayMode.LAST_N_EVENTS,
+                last_n=4,
+                batch_size=10
+            )
+            for event in batch
+        ]
+        
+        assert [event.data["i"] for event in events] == [21, 22, 23, 24]
+    
+    @pytest.mark.asyncio
+    async def test_replay_resumes_from_checkpoint(self, seeded_store):
+        """Test an interrupted replay continues after the last finished batch."""
+        async for batch in seeded_store.replay_events(
+            EventReplayMode.FROM_BEGINNING,
+            batch_size=10,
+            checkpoint_id="projection"
+        ):
+            break  # Interrupted before finishing the first batch
+        
+        assert await seeded_store.get_replay_checkpoint("projection") is None
+        
+        first_batch = []
+        async for batch in seeded_store.replay_events(
+            EventReplayMode.FROM_BEGINNING,
+            batch_size=10,
+            checkpoint_id="projection"
+        ):
+            if first_batch:
+                break  # Interrupted while handling the second batch
+            first_batch = batch
+        
+        assert await seeded_store.get_replay_checkpoint("projection") == \
+            (first_batch[-1].transaction_id, first_batch[-1].sequence_number)
+        
+        resumed = [
+            event.data["i"]
+            async for batch in seeded_store.replay_events(
+                EventReplayMode.FROM_BEGINNING,
+                batch_size=10,
+                checkpoint_id="projection"
+            )
+            for event in batch
+        ]
+        
+        assert resumed == list(range(10, 25))
+    
+    @pytest.mark.asyncio
+    async def test_replay_follows_commit_order(self, enhanced_store, session_factory):
+        """Test a lower sequence number committed later is not skipped on resume."""
+        async def commit(transaction_id, sequence_number):
+            async with session_factory() as session:
+                async with session.begin():
+                    session.add(Event(
+                        event_type=EventType.CHARACTER_UPDATED,
+                        event_id=f"event-{sequence_number}",
+                        source_service="character",
+                        data={"seq": sequence_number},
+                        sequence_number=sequence_number,
+                        transaction_id=transaction_id
+                    ))
+        
+        # Two processes reserved blocks 1000+ and 1+; the higher block commits first
+        await commit(1, 1000)
+        await commit(2, 5)
+        
+        async def replay():
+            return [
+                event.sequence_number
+                async for batch in enhanced_store.replay_events(
+                    EventReplayMode.FROM_BEGINNING,
+                    batch_size=10,
+                    checkpoint_id="projection"
+                )
+                for event in batch
+            ]
+        
+        assert await replay() == [1000, 5]
+        
+        await commit(3, 6)
+        
+        assert await replay() == [6]
+        assert await enhanced_store.get_replay_checkpoint("projection") == (3, 6)
+    
+    @pytest.mark.asyncio
+    async def test_partitioned_replay_keeps_stream_order(self, seeded_store):
+        """Test parallel replay covers every stream with per-stream ordering."""
+        per_stream = {}
+        
+        async def handler(events):
+            for event in events:
+                per_stream.setdefault(event.stream_id, []).append(event.sequence_number)
+        
+        stats = await seeded_store.replay_partitioned(handler, partitions=2, batch_size=4)
+        
+        assert stats == {"streams": 3, "events": 25}
+        assert set(per_stream) == {"stream-0", "stream-1", "stream-2"}
+        for sequences in per_stream.values():
+            assert sequences == sorted(sequences)
+
+
+class TestSnapshotsAndCompaction:
+    """Test automatic snapshots and chunked compaction."""
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_due_streams(self, enhanced_store, session_factory):
+        """Test streams past the event threshold get snapshotted once."""
+        enhanced_store.snapshot_every_events = 5
+        await enhanced_store.append_events_durable(
+            [make_append("busy", hp=i) for i in range(6)] + [make_append("quiet", hp=1)]
+        )
+        
+        assert await enhanced_store.snapshot_due_streams() == 1
+        assert await enhanced_store.snapshot_due_streams() == 0
+        
+        snapshot = await enhanced_store.get_latest_snapshot("busy")
+        assert snapshot.data == {"hp": 5}
+        assert await enhanced_store.get_latest_snapshot("quiet") is None
+        
+        async with session_factory() as session:
+            stream = (await session.execute(
+                select(EventStream).filter_by(stream_id="busy")
+            )).scalar_one()
+            assert stream.snapshot_version == 6
+            assert stream.bytes_since_snapshot == 0
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_follows_stream_versions(self, enhanced_store, session_factory):
+        """Test snapshots fold events by stream version, not sequence number."""
+        now = datetime.utcnow()
+        await self.commit_stream_events(session_factory, "stream-a", [
+            (1000, now, {"hp": 1}),
+            (5, now, {"hp": 2})
+        ])
+        
+        await enhanced_store.snapshot_stream("stream-a")
+        
+        snapshot = await enhanced_store.get_latest_snapshot("stream-a")
+        assert snapshot.data == {"hp": 2}
+        assert snapshot.stream_version == 2
+        assert snapshot.sequence_number == 0
+        
+        replayed = [
+            event.event_type
+            async for batch in enhanced_store.replay_events(EventReplayMode.FROM_BEGINNING)
+            for event in batch
+        ]
+        assert replayed == [EventType.CHARACTER_UPDATED] * 2
+    
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_events_newer_than_cutoff(self, enhanced_store, session_factory):
+        """Test compaction stops before the first event it has to keep."""
+        cutoff = datetime.utcnow()
+        await self.commit_stream_events(session_factory, "stream-a", [
+            (1, cutoff - timedelta(days=2), {"hp": 1}),
+            (2, cutoff + timedelta(hours=1), {"hp": 2}),
+            (3, cutoff - timedelta(days=1), {"hp": 3})
+        ])
+        
+        stats = await enhanced_store.compact_events(cutoff)
+        
+        assert stats["events_deleted"] == 1
+        async with session_factory() as session:
+            remaining = (await session.execute(
+                select(Event.stream_version, Event.event_type).order_by(Event.id)
+            )).all()
+            assert remaining == [
+                (2, EventType.CHARACTER_UPDATED),
+                (3, EventType.CHARACTER_UPDATED),
+                (1, EventType.SYSTEM_SNAPSHOT)
+            ]
+            assert await enhanced_store._reconstruct_state(session, "stream-a") == {"hp": 3}
+    
+    @staticmethod
+    async def commit_stream_events(session_factory, stream_id, events):
+        """Store (sequence, timestamp, data) events as stream versions 1..n."""
+        async with session_factory() as session:
+            async with session.begin():
+                session.add(EventStream(
+                    stream_id=stream_id, stream_type="event_stream", version=len(events)
+                ))
+                session.add_all([
+                    Event(
+                        event_type=EventType.CHARACTER_UPDATED,
+                        event_id=f"{stream_id}-{version}",
+                        source_service="character",
+                        data=data,
+                        sequence_number=sequence_number,
+                        stream_id=stream_id,
+                        stream_version=version,
+                        timestamp=timestamp
+                    )
+                    for version, (sequence_number, timestamp, data) in enumerate(events, start=1)
+                ])
+    
+    @pytest.mark.asyncio
+    async def test_compaction_preserves_state(self, enhanced_store, session_factory):
+        """Test compaction replaces old events with a snapshot of the same state."""
+        enhanced_store.compaction_chunk_size = 2
+        await enhanced_store.append_events_durable(
+            [make_append("stream-a", hp=i, name="Aria") for i in range(5)]
+        )
+        
+        stats = await enhanced_store.compact_events(datetime.utcnow() + timedelta(days=1))
+        
+        assert stats == {"streams_processed": 1, "events_deleted": 5}
+        async with session_factory() as session:
+            remaining = (await session.execute(select(Event))).scalars().all()
+            assert [event.event_type for event in remaining] == [EventType.SYSTEM_SNAPSHOT]
+            assert await enhanced_store._reconstruct_state(session, "stream-a") == \
+                {"hp": 4, "name": "Aria"}
+            
+            progress = (await session.execute(select(CompactionProgress))).scalar_one()
+            assert progress.completed_at is not None
+            assert progress.last_stream_id == "stream-a"
+    
+    @pytest.mark.asyncio
+    async def test_compaction_resumes_unfinished_run(self, enhanced_store, session_factory):
+        """Test an interrupted run continues after the last finished stream."""
+        await enhanced_store.append_events_durable(
+            [make_append(f"stream-{i}", hp=i) for i in range(3)]
+        )
+        async with session_factory() as session:
+            async with session.begin():
+                session.add(CompactionProgress(
+                    before_date=datetime.utcnow() + timedelta(days=1),
+                    last_stream_id="stream-0"
+                ))
+        
+        stats = await enhanced_store.compact_events()
+        
+        assert stats["streams_processed"] == 2
+        async with session_factory() as session:
+            untouched = (await session.execute(
+                select(Event).filter_by(stream_id="stream-0")
+            )).scalars().all()
+            assert [event.event_type for event in untouched] == [EventType.CHARACTER_UPDATED]
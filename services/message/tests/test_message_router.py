@@ -0,0 +1,157 @@
+"""
+Tests for Message Router
+
+Routes messages end to end through MessageRouter: registry lookup, delivery
+over the destination's client pool, event recording and cache invalidation
+on registry changes.
+"""
+
+import pytest
+import pytest_asyncio
+import httpx
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from src.config import Settings
+from src.event_store.models import EventType
+from src.message_hub.core.models import (
+    ServiceMessage,
+    ServiceRegistration,
+    ServiceStatus,
+    ServiceType,
+    MessageType
+)
+from src.message_hub.core.router import MessageRouter
+from src.message_hub.core.services import ServiceRegistry
+
+
+def registration(url: str) -> ServiceRegistration:
+    """Create a rules service registration."""
+    return ServiceRegistration(
+        name=ServiceType.RULES_SERVICE,
+        url=url,
+        health_check="/health",
+        version="1.0.0",
+        capabilities=[MessageType.CHARACTER_UPDATED]
+    )
+
+
+def status(url: str, state: str = "healthy") -> ServiceStatus:
+    """Create a health check result."""
+    return ServiceStatus(
+        name=ServiceType.RULES_SERVICE,
+        url=url,
+        status=state,
+        last_check=datetime.utcnow(),
+        latency=0.001,
+        error=None if state == "healthy" else "down"
+    )
+
+
+def make_message() -> ServiceMessage:
+    """Create a character update bound for the rules service."""
+    return ServiceMessage(
+        source=ServiceType.CHARACTER_SERVICE,
+        destination=ServiceType.RULES_SERVICE,
+        message_type=MessageType.CHARACTER_UPDATED,
+        correlation_id="corr-123",
+        payload={"character_id": "123"}
+    )
+
+
+@pytest.fixture
+def requests():
+    """Requests received by the stub destination services."""
+    return []
+
+
+@pytest_asyncio.fixture
+async def registry():
+    """Service registry whose health checks always pass."""
+    registry = ServiceRegistry(Settings())
+    registry._check_service_health = AsyncMock(
+        side_effect=lambda service_type, url, health_check: status(url)
+    )
+    yield registry
+    await registry.http_client.aclose()
+
+
+@pytest_asyncio.fixture
+async def router(registry, requests):
+    """Router delivering to an in-process stub service."""
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"accepted": True})
+
+    router = MessageRouter(Settings(), registry, MagicMock(append_events_durable=AsyncMock()))
+    router.clients._create_client = lambda destination, base_url: httpx.AsyncClient(
+        base_url=base_url, transport=httpx.MockTransport(handle)
+    )
+    yield router
+    await router.close()
+
+
+@pytest.mark.asyncio
+async def test_routes_message_and_records_event(router, registry, requests):
+    """A message is delivered to its destination and recorded as an event."""
+    await registry.register_service(registration("http://rules:8000"))
+
+    response = await router.route_message(make_message())
+
+    assert response.status == "success"
+    assert response.data == {"accepted": True}
+    request, = requests
+    assert str(request.url) == "http://rules:8000/v1/events"
+
+    await router.close()
+    events, = router.event_store.append_events_durable.await_args.args
+    assert [event.event_type for event in events] == [EventType.CHARACTER_UPDATED]
+    assert events[0].correlation_id == "corr-123"
+
+
+@pytest.mark.asyncio
+async def test_unknown_destination(router):
+    """Messages for unregistered services fail without a delivery attempt."""
+    response = await router.route_message(make_message())
+
+    assert response.status == "error"
+    assert "Unknown service" in response.error
+
+
+@pytest.mark.asyncio
+async def test_reregistration_invalidates_cache(router, registry, requests):
+    """A service that re-registers at a new address is routed there at once."""
+    await registry.register_service(registration("http://rules:8000"))
+    await router.route_message(make_message())
+
+    await registry.register_service(registration("http://rules-2:8000"))
+    await router.route_message(make_message())
+
+    assert [request.url.host for request in requests] == ["rules", "rules-2"]
+
+
+@pytest.mark.asyncio
+async def test_deregistration_invalidates_cache(router, registry, requests):
+    """A deregistered service stops receiving messages at once."""
+    await registry.register_service(registration("http://rules:8000"))
+    await router.route_message(make_message())
+
+    assert await registry.deregister_service(ServiceType.RULES_SERVICE) is True
+    response = await router.route_message(make_message())
+
+    assert response.status == "error"
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_health_change_invalidates_cache(router, registry, requests):
+    """A service that turns unhealthy stops receiving messages at once."""
+    await registry.register_service(registration("http://rules:8000"))
+    await router.route_message(make_message())
+
+    registry._update_status(ServiceType.RULES_SERVICE, status("http://rules:8000", "unhealthy"))
+    response = await router.route_message(make_message())
+
+    assert response.status == "error"
+    assert "unhealthy" in response.error
+    assert len(requests) == 1
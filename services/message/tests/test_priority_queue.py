@@ -31,7 +31,17 @@ async def redis_mock():
     redis.zrem = AsyncMock(return_value=1)
     redis.zremrangebyscore = AsyncMock(return_value=0)
     redis.delete = AsyncMock(return_value=1)
+    redis.hget = AsyncMock(return_value=None)
+    redis.hset = AsyncMock(return_value=1)
     redis.close = AsyncMock()
+    
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+    pipeline.__aexit__ = AsyncMock(return_value=False)
+    pipeline.execute = AsyncMock(return_value=[1, 1, 1])
+    redis.pipeline = MagicMock(return_value=pipeline)
+    
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[]))
     return redis
 
 
@@ -156,8 +166,7 @@ class TestPriorityQueueManager:
     @pytest.mark.asyncio
     async def test_enqueue_success(self, queue_manager, sample_message, redis_mock):
         """Test enqueueing a message."""
-        redis_mock.zcard = AsyncMock(return_value=10)  # Queue not full
-        redis_mock.zadd = AsyncMock(return_value=1)
+        redis_mock.hget = AsyncMock(return_value="10")  # Queue not full
         
         success = await queue_manager.enqueue(
             sample_message,
@@ -166,13 +175,17 @@ class TestPriorityQueueManager:
         
         assert success is True
         assert queue_manager.stats["messages_enqueued"] == 1
-        redis_mock.zadd.assert_called_once()
+        pipeline = redis_mock.pipeline.return_value
+        pipeline.zadd.assert_called_once()
+        pipeline.hincrby.assert_any_call(queue_manager.size_key, "total", 1)
+        pipeline.hincrby.assert_any_call(
+            queue_manager.size_key, sample_message.destination.value, 1
+        )
     
     @pytest.mark.asyncio
     async def test_enqueue_with_deadline(self, queue_manager, sample_message, redis_mock):
         """Test enqueueing with deadline."""
-        redis_mock.zcard = AsyncMock(return_value=10)
-        redis_mock.zadd = AsyncMock(return_value=1)
+        redis_mock.hget = AsyncMock(return_value="10")
         
         deadline = datetime.utcnow() + timedelta(minutes=10)
         success = await queue_manager.enqueue(
@@ -184,7 +197,7 @@ class TestPriorityQueueManager:
         assert success is True
         
         # Verify the message was added with correct score
-        call_args = redis_mock.zadd.call_args[0]
+        call_args = redis_mock.pipeline.return_value.zadd.call_args[0]
         message_data = list(call_args[1].keys())[0]
         parsed_data = json.loads(message_data)
         
@@ -194,7 +207,7 @@ class TestPriorityQueueManager:
     @pytest.mark.asyncio
     async def test_enqueue_queue_overflow(self, queue_manager, sample_message, redis_mock):
         """Test queue overflow handling."""
-        redis_mock.zcard = AsyncMock(return_value=10000)  # Queue full
+        redis_mock.hget = AsyncMock(return_value="10000")  # Queue full
         
         success = await queue_manager.enqueue(sample_message)
         
@@ -279,11 +292,74 @@ class TestPriorityQueueManager:
         assert dequeued[0].priority == MessagePriority.CRITICAL
         assert dequeued[1].priority == MessagePriority.NORMAL
     
+    @pytest.mark.asyncio
+    async def test_dequeue_batch_single_script_call(self, queue_manager, redis_mock):
+        """Test batched dequeue claims every tier in one script call."""
+        messages = [
+            PrioritizedMessage(
+                message=ServiceMessage(
+                    source=ServiceType.CHARACTER_SERVICE,
+                    destination=ServiceType.RULES_SERVICE,
+                    message_type=MessageType.CHARACTER_UPDATED,
+                    correlation_id=f"msg-{i}",
+                    payload={}
+                ),
+                priority=priority,
+                enqueued_at=datetime.utcnow()
+            )
+            for i, priority in enumerate([MessagePriority.CRITICAL, MessagePriority.NORMAL])
+        ]
+        script = redis_mock.register_script.return_value
+        script.return_value = [json.dumps(m.to_dict()) for m in messages]
+        
+        dequeued = await queue_manager.dequeue_batch(10, service=ServiceType.RULES_SERVICE)
+        
+        assert [m.priority for m in dequeued] == [MessagePriority.CRITICAL, MessagePriority.NORMAL]
+        assert queue_manager.stats["messages_dequeued"] == 2
+        script.assert_awaited_once()
+        
+        keys = script.call_args.kwargs["keys"]
+        args = script.call_args.kwargs["args"]
+        assert keys[0] == queue_manager.size_key
+        assert keys[3:] == [
+            queue_manager._get_queue_key(p, ServiceType.RULES_SERVICE)
+            for p in MessagePriority
+        ]
+        assert args[:5] == [10, "+inf", "", 0, 1]
+        assert args[5:] == [ServiceType.RULES_SERVICE.value, -1]
+        redis_mock.zrangebyscore.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_dequeue_batch_respects_service_quota(self, queue_manager, redis_mock):
+        """Test batched dequeue caps the claim at the remaining service quota."""
+        queue_manager.service_quotas[ServiceType.RULES_SERVICE] = 3
+        script = redis_mock.register_script.return_value
+        script.return_value = []
+        
+        await queue_manager.dequeue_batch(10, service=ServiceType.RULES_SERVICE)
+        
+        assert script.call_args.kwargs["args"][-1] == 3
+        # Nothing was claimed, so the reserved quota is handed back
+        assert queue_manager.service_counters[ServiceType.RULES_SERVICE] == 0
+        
+        queue_manager.service_counters[ServiceType.RULES_SERVICE] = 3
+        assert await queue_manager.dequeue_batch(10, service=ServiceType.RULES_SERVICE) == []
+        assert script.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_queue_size_reads_counter(self, queue_manager, redis_mock):
+        """Test queue size is a single counter read."""
+        redis_mock.hget = AsyncMock(return_value="42")
+        redis_mock.zcard.reset_mock()
+        
+        assert await queue_manager._get_queue_size() == 42
+        redis_mock.hget.assert_awaited_once_with(queue_manager.size_key, "total")
+        redis_mock.zcard.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_requeue_message(self, queue_manager, sample_message, redis_mock):
         """Test requeuing a message."""
-        redis_mock.zcard = AsyncMock(return_value=10)
-        redis_mock.zadd = AsyncMock(return_value=1)
+        redis_mock.hget = AsyncMock(return_value="10")
         
         msg = PrioritizedMessage(
             message=sample_message,
@@ -313,7 +389,8 @@ class TestPriorityQueueManager:
             200,  # HIGH
             500,  # NORMAL
             150,  # LOW
-            50    # DEFERRED
+            50,   # DEFERRED
+            7     # In-flight
         ])
         
         status = await queue_manager.get_queue_status()
@@ -321,6 +398,7 @@ class TestPriorityQueueManager:
         assert status["total_size"] == 1000
         assert status["queues"]["CRITICAL"] == 100
         assert status["queues"]["NORMAL"] == 500
+        assert status["in_flight"] == 7
         assert status["status"] == QueueStatus.ACTIVE
     
     @pytest.mark.asyncio
@@ -329,7 +407,8 @@ class TestPriorityQueueManager:
         # Set queue size to trigger throttling
         redis_mock.zcard = AsyncMock(side_effect=[
             9100,  # Above throttle threshold (90%)
-            9100, 9100, 9100, 9100  # For status check
+            9100, 9100, 9100, 9100,  # For status check
+            0  # In-flight
         ])
         
         status = await queue_manager.get_queue_status()
@@ -441,7 +520,7 @@ class TestMetrics:
     @pytest.mark.asyncio
     async def test_get_metrics(self, queue_manager, redis_mock):
         """Test getting queue metrics."""
-        redis_mock.zcard = AsyncMock(side_effect=[10, 20, 30, 15, 5])
+        redis_mock.zcard = AsyncMock(side_effect=[10, 20, 30, 15, 5, 0])
         
         # Simulate some activity
         queue_manager.stats["messages_enqueued"] = 100
@@ -0,0 +1,177 @@
+"""
+Tests for Priority Queue Leases
+
+Lease-based in-flight tracking, the expired-lease reaper and dead letters,
+run against fakeredis so the claim and reclaim scripts execute.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis as fakeredis
+
+from src.message_hub.core import queue as queue_module
+from src.message_hub.core.queue import PriorityQueueManager, MessagePriority
+from src.message_hub.core.models import ServiceMessage, ServiceType, MessageType
+
+
+@pytest_asyncio.fixture
+async def queue_manager():
+    """Queue manager on a fresh fakeredis instance."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    manager = PriorityQueueManager(SimpleNamespace(redis_url="redis://fake"))
+    with patch.object(queue_module.redis, "from_url", return_value=client):
+        await manager.initialize()
+    yield manager
+    await manager.shutdown()
+
+
+def make_message(correlation_id: str = "test-correlation-id") -> ServiceMessage:
+    """Create a sample service message."""
+    return ServiceMessage(
+        source=ServiceType.CHARACTER_SERVICE,
+        destination=ServiceType.RULES_SERVICE,
+        message_type=MessageType.CHARACTER_UPDATED,
+        correlation_id=correlation_id,
+        payload={"character_id": "123", "updates": {"level": 2}}
+    )
+
+
+async def expire(manager: PriorityQueueManager, lease_id: str):
+    """Move a lease's deadline into the past."""
+    await manager.redis_client.zadd(manager.inflight_key, {lease_id: 0}, xx=True)
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_creates_leases(queue_manager):
+    """Claimed messages leave the queue and are held in-flight under a lease."""
+    for i in range(3):
+        await queue_manager.enqueue(make_message(f"msg-{i}"), MessagePriority.NORMAL)
+
+    leases = await queue_manager.claim_batch(
+        2, service=ServiceType.RULES_SERVICE, visibility_timeout=10
+    )
+
+    assert [lease.message.message.correlation_id for lease in leases] == ["msg-0", "msg-1"]
+    assert len({lease.lease_id for lease in leases}) == 2
+    assert await queue_manager._get_queue_size() == 1
+    deadlines = dict(await queue_manager.redis_client.zrange(
+        queue_manager.inflight_key, 0, -1, withscores=True
+    ))
+    assert set(deadlines) == {lease.lease_id for lease in leases}
+    assert deadlines[leases[0].lease_id] == pytest.approx(leases[0].deadline.timestamp())
+
+
+@pytest.mark.asyncio
+async def test_extend_lease(queue_manager):
+    """Extending only touches leases that still exist."""
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL)
+    lease, = await queue_manager.claim_batch(1, visibility_timeout=1)
+
+    assert await queue_manager.extend_lease(lease.lease_id, 60) is True
+    deadline = await queue_manager.redis_client.zscore(queue_manager.inflight_key, lease.lease_id)
+    assert deadline > lease.deadline.timestamp() + 30
+
+    assert await queue_manager.extend_lease("gone:1", 60) is False
+    assert await queue_manager.redis_client.zscore(queue_manager.inflight_key, "gone:1") is None
+
+
+@pytest.mark.asyncio
+async def test_ack(queue_manager):
+    """Acking drops the lease once."""
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL)
+    lease, = await queue_manager.claim_batch(1)
+
+    assert await queue_manager.ack(lease.lease_id) is True
+    assert await queue_manager.ack(lease.lease_id) is False
+    assert queue_manager.stats["messages_acked"] == 1
+    assert await queue_manager.redis_client.zcard(queue_manager.inflight_key) == 0
+    assert await queue_manager.redis_client.hlen(queue_manager.inflight_messages_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_nack_requeues(queue_manager):
+    """Nacking gives the message back with one more attempt recorded."""
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL)
+    lease, = await queue_manager.claim_batch(1)
+
+    assert await queue_manager.nack(lease.lease_id) is True
+
+    requeued, = await queue_manager.dequeue_batch(1)
+    assert requeued.attempt_count == 1
+    assert await queue_manager.redis_client.zcard(queue_manager.inflight_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_reap_expired_leases_requeues(queue_manager):
+    """Expired leases are requeued with attempt_count incremented."""
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL, attempt_count=1)
+    live, = await queue_manager.claim_batch(1, visibility_timeout=60)
+    await queue_manager.enqueue(make_message("expired"), MessagePriority.NORMAL, attempt_count=1)
+    lease, = await queue_manager.claim_batch(1, visibility_timeout=60)
+    await expire(queue_manager, lease.lease_id)
+
+    assert await queue_manager.reap_expired_leases() == 1
+    assert queue_manager.stats["leases_expired"] == 1
+
+    requeued, = await queue_manager.dequeue_batch(5)
+    assert requeued.message.correlation_id == "expired"
+    assert requeued.attempt_count == 2
+    inflight = await queue_manager.redis_client.zrange(queue_manager.inflight_key, 0, -1)
+    assert inflight == [live.lease_id]
+
+
+@pytest.mark.asyncio
+async def test_reap_dead_letters_exhausted_messages(queue_manager):
+    """Messages out of delivery attempts are dead-lettered, not requeued."""
+    attempts = queue_manager.max_delivery_attempts
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL, attempt_count=attempts - 1)
+    lease, = await queue_manager.claim_batch(1)
+    await expire(queue_manager, lease.lease_id)
+
+    assert await queue_manager.reap_expired_leases() == 1
+
+    assert queue_manager.stats["messages_dead_lettered"] == 1
+    assert await queue_manager._get_queue_size() == 0
+    assert await queue_manager.redis_client.zcard(queue_manager.inflight_key) == 0
+    entry, = await queue_manager.get_dead_letters()
+    assert entry["lease_id"] == lease.lease_id
+    assert entry["attempts"] == attempts
+
+
+@pytest.mark.asyncio
+async def test_replay_dead_letters(queue_manager):
+    """Dead letters are re-enqueued with a fresh attempt count, then removed."""
+    attempts = queue_manager.max_delivery_attempts
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL, attempt_count=attempts - 1)
+    lease, = await queue_manager.claim_batch(1)
+    await expire(queue_manager, lease.lease_id)
+    await queue_manager.reap_expired_leases()
+
+    assert await queue_manager.replay_dead_letters() == 1
+
+    assert await queue_manager.get_dead_letters() == []
+    replayed, = await queue_manager.dequeue_batch(1)
+    assert replayed.attempt_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reaper_task_redelivers(queue_manager):
+    """The background reaper requeues leases that expire while it runs."""
+    queue_manager.reap_interval = 0.01
+    queue_manager._reaper_task.cancel()
+    queue_manager._reaper_task = asyncio.create_task(queue_manager._reap_leases())
+    await queue_manager.enqueue(make_message(), MessagePriority.NORMAL)
+    await queue_manager.claim_batch(1, visibility_timeout=0.05)
+
+    for _ in range(50):
+        await asyncio.sleep(0.02)
+        if await queue_manager._get_queue_size():
+            break
+
+    requeued, = await queue_manager.dequeue_batch(1)
+    assert requeued.attempt_count == 1
+    assert requeued.message.correlation_id == "test-correlation-id"
@@ -0,0 +1,158 @@
+"""
+Tests for Retry Dispatch
+
+Leased re-dispatch of due retries through the message router, run against
+fakeredis so the claim and requeue scripts execute.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis as fakeredis
+
+from src.message_hub.core import retry as retry_module
+from src.message_hub.core.retry import RetryManager, RetryRecord, RetryStatus
+from src.message_hub.core.models import ServiceType, MessageType
+
+
+@pytest.fixture
+def router_mock():
+    """Mock message router that delivers everything."""
+    router = AsyncMock()
+    router.route_message = AsyncMock(return_value=SimpleNamespace(status="success", error=None))
+    return router
+
+
+@pytest_asyncio.fixture
+async def retry_manager(router_mock):
+    """Retry manager on a fresh fakeredis instance."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    manager = RetryManager(SimpleNamespace(redis_url="redis://fake"), router=router_mock)
+    manager.base_delay = 60
+    with patch.object(retry_module.redis, "from_url", return_value=client):
+        await manager.initialize()
+    yield manager
+    await manager.shutdown()
+
+
+def make_record(attempt_count: int = 1, **fields) -> RetryRecord:
+    """Create a retry record that is due now."""
+    return RetryRecord(
+        message_id=fields.pop("message_id", "msg-123"),
+        correlation_id="corr-123",
+        source=ServiceType.CHARACTER_SERVICE,
+        destination=ServiceType.RULES_SERVICE,
+        message_type=MessageType.CHARACTER_UPDATED,
+        payload={"character_id": "123"},
+        attempt_count=attempt_count,
+        max_attempts=5,
+        next_retry_at=datetime.utcnow() - timedelta(seconds=1),
+        status=RetryStatus.PENDING,
+        **fields
+    )
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    """Poll until ``condition`` returns something truthy."""
+    for _ in range(int(timeout / 0.01)):
+        result = await condition()
+        if result:
+            return result
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+@pytest.mark.asyncio
+async def test_due_retry_is_routed_and_released(retry_manager, router_mock):
+    """A due retry is claimed under a lease, re-routed, then released."""
+    await retry_manager._add_to_retry_queue(make_record())
+
+    await wait_for(lambda: asyncio.sleep(0, result=retry_manager.dispatch_stats["succeeded"]))
+
+    routed = router_mock.route_message.call_args[0][0]
+    assert routed.correlation_id == "corr-123"
+    assert routed.destination == ServiceType.RULES_SERVICE
+    assert await retry_manager.redis_client.zcard(retry_manager.inflight_key) == 0
+    assert await retry_manager.redis_client.zcard(retry_manager.retry_queue_key) == 0
+    assert not retry_manager._leases
+    status = await retry_manager.get_retry_status("msg-123")
+    assert status.status == RetryStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_failed_dispatch_is_rescheduled(retry_manager, router_mock):
+    """A failed re-delivery goes back on the retry queue with one more attempt."""
+    router_mock.route_message.return_value = SimpleNamespace(status="error", error="boom")
+    await retry_manager._add_to_retry_queue(make_record(attempt_count=2))
+
+    await wait_for(lambda: asyncio.sleep(0, result=retry_manager.dispatch_stats["failed"]))
+    await wait_for(lambda: retry_manager.redis_client.zcard(retry_manager.retry_queue_key))
+
+    rescheduled, = await retry_manager.redis_client.zrange(retry_manager.retry_queue_key, 0, -1)
+    assert json.loads(rescheduled)["attempt_count"] == 3
+    assert json.loads(rescheduled)["error"] == "boom"
+    assert await retry_manager.redis_client.zcard(retry_manager.inflight_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_error_requeues_lease(retry_manager):
+    """A retry whose dispatch raises is requeued with backoff and no longer renewed."""
+    retry_manager._dispatch = AsyncMock(side_effect=RuntimeError("redis down"))
+    await retry_manager._add_to_retry_queue(make_record())
+
+    await wait_for(lambda: asyncio.sleep(0, result=retry_manager._dispatch.called))
+    await wait_for(lambda: asyncio.sleep(0, result=retry_manager._pending == 0))
+
+    (member, due), = await retry_manager.redis_client.zrange(
+        retry_manager.retry_queue_key, 0, -1, withscores=True
+    )
+    assert json.loads(member)["message_id"] == "msg-123"
+    assert due > datetime.utcnow().timestamp() + 30
+    assert await retry_manager.redis_client.zcard(retry_manager.inflight_key) == 0
+    assert not retry_manager._leases
+    assert retry_manager._pending == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_requeued(retry_manager):
+    """Retries claimed by a dead dispatcher go back to the retry queue."""
+    lease = json.dumps(make_record().to_dict())
+    await retry_manager.redis_client.zadd(retry_manager.inflight_key, {lease: 0})
+
+    assert await retry_manager.reap_expired_leases() == 1
+
+    assert await retry_manager.redis_client.zcard(retry_manager.inflight_key) == 0
+    status = await retry_manager.get_retry_status("msg-123")
+    assert status.status == RetryStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_held_leases(retry_manager):
+    """Undispatched claims are handed back on shutdown."""
+    lease = json.dumps(make_record().to_dict())
+    await retry_manager.redis_client.zadd(retry_manager.inflight_key, {lease: 1e10})
+    retry_manager._leases.add(lease)
+    client = retry_manager.redis_client
+    client.close = AsyncMock()
+
+    await retry_manager.shutdown()
+
+    assert await client.zcard(retry_manager.inflight_key) == 0
+    assert await client.zrange(retry_manager.retry_queue_key, 0, -1) == [lease]
+    assert not retry_manager._leases
+
+
+@pytest.mark.asyncio
+async def test_destination_concurrency_cap(retry_manager):
+    """Each destination gets only its configured number of workers."""
+    retry_manager.set_destination_concurrency(ServiceType.RULES_SERVICE, 3)
+
+    retry_manager._get_destination_queue(ServiceType.RULES_SERVICE)
+    retry_manager._get_destination_queue(ServiceType.RULES_SERVICE)
+
+    assert len(retry_manager._worker_tasks) == 3
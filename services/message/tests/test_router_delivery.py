@@ -0,0 +1,134 @@
+"""
+Tests for Router Delivery Engine
+
+Covers registry lookup caching and coalescing, per-destination client
+pools and batched event recording.
+"""
+
+import pytest
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.message_hub.core.models import ServiceType
+from src.message_hub.core.router.delivery import (
+    BatchedEventAppender,
+    DeliveryClientPool,
+    DeliveryPoolConfig,
+    RegistryCache
+)
+
+
+@pytest.fixture
+def registry_mock():
+    """Mock service registry with a slow lookup."""
+    async def get_service(service_type):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(url="http://character:8000")
+
+    registry = AsyncMock()
+    registry.get_service = AsyncMock(side_effect=get_service)
+    registry.get_service_status = AsyncMock(
+        return_value=SimpleNamespace(status="healthy", error=None)
+    )
+    return registry
+
+
+class TestRegistryCache:
+    """Test cached registry lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced(self, registry_mock):
+        """Concurrent misses should share one registry round trip."""
+        cache = RegistryCache(registry_mock, ttl=60)
+
+        results = await asyncio.gather(
+            *(cache.get(ServiceType.CHARACTER_SERVICE) for _ in range(10))
+        )
+
+        assert registry_mock.get_service.await_count == 1
+        assert all(service.url == "http://character:8000" for service, _ in results)
+
+        # Served from cache until invalidated
+        await cache.get(ServiceType.CHARACTER_SERVICE)
+        assert registry_mock.get_service.await_count == 1
+
+        cache.invalidate(ServiceType.CHARACTER_SERVICE)
+        await cache.get(ServiceType.CHARACTER_SERVICE)
+        assert registry_mock.get_service.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_service_not_cached(self, registry_mock):
+        """A missing registration should be looked up again next time."""
+        registry_mock.get_service = AsyncMock(return_value=None)
+        cache = RegistryCache(registry_mock, ttl=60)
+
+        await cache.get(ServiceType.RULES_SERVICE)
+        await cache.get(ServiceType.RULES_SERVICE)
+
+        assert registry_mock.get_service.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lookup_error_propagates_to_waiters(self, registry_mock):
+        """Every coalesced caller should see the registry failure."""
+        registry_mock.get_service_status = AsyncMock(side_effect=RuntimeError("redis down"))
+        cache = RegistryCache(registry_mock)
+
+        results = await asyncio.gather(
+            cache.get(ServiceType.CHARACTER_SERVICE),
+            cache.get(ServiceType.CHARACTER_SERVICE),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestDeliveryClientPool:
+    """Test per-destination client pools."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_per_destination(self):
+        """Clients are shared per destination and replaced when the URL moves."""
+        pool = DeliveryClientPool(DeliveryPoolConfig(max_connections=10))
+
+        first = pool.get(ServiceType.CHARACTER_SERVICE, "http://character:8000")
+        assert pool.get(ServiceType.CHARACTER_SERVICE, "http://character:8000") is first
+        assert pool.get(ServiceType.RULES_SERVICE, "http://rules:8000") is not first
+
+        moved = pool.get(ServiceType.CHARACTER_SERVICE, "http://character-2:8000")
+        assert moved is not first
+
+        await pool.close()
+
+
+class TestBatchedEventAppender:
+    """Test off-path event recording."""
+
+    @pytest.mark.asyncio
+    async def test_events_written_in_batches(self):
+        """Queued events should be grouped into few writes."""
+        append_batch = AsyncMock()
+        appender = BatchedEventAppender(append_batch, batch_size=50, flush_interval=0.05)
+
+        for i in range(120):
+            await appender.submit({"n": i})
+        await appender.close()
+
+        written = [event for call in append_batch.await_args_list for event in call.args[0]]
+        assert written == [{"n": i} for i in range(120)]
+        assert append_batch.await_count <= 3
+        assert appender.stats["events_written"] == 120
+
+    @pytest.mark.asyncio
+    async def test_write_failure_does_not_stop_writer(self):
+        """A failed batch is counted and later batches still go through."""
+        append_batch = AsyncMock(side_effect=[RuntimeError("db down"), None])
+        appender = BatchedEventAppender(append_batch, batch_size=1, flush_interval=0)
+
+        await appender.submit({"n": 1})
+        await appender.flush()
+        await appender.submit({"n": 2})
+        await appender.close()
+
+        assert appender.stats["write_errors"] == 1
+        assert appender.stats["events_written"] == 1
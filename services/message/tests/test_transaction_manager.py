@@ -0,0 +1,184 @@
+"""
+Tests for Transaction Manager
+
+Covers parallel two-phase commit, the coordinator log and in-doubt recovery.
+"""
+
+import pytest
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from src.message_hub.core.config import settings
+from src.message_hub.core.managers import TransactionManager
+from src.message_hub.core.coordinator_log import CoordinatorLog, LogRecordType
+from src.message_hub.core.models import ServiceResponse, ServiceType, MessageType
+
+
+def ok(message):
+    return ServiceResponse(correlation_id=message.correlation_id, status="success", data={})
+
+
+@pytest.fixture
+def coordinator_log(tmp_path):
+    """Coordinator log in a scratch directory."""
+    return CoordinatorLog(str(tmp_path / "coordinator.log"))
+
+
+@pytest.fixture
+def router_mock():
+    """Router that acknowledges every message after a short delay."""
+    async def route_message(message):
+        await asyncio.sleep(0.05)
+        return ok(message)
+
+    router = AsyncMock()
+    router.route_message = AsyncMock(side_effect=route_message)
+    return router
+
+
+async def new_transaction(manager, services):
+    transaction = await manager.begin_transaction()
+    for service in services:
+        transaction.add_participant(
+            service,
+            MessageType.CHARACTER_UPDATED,
+            {"character_id": "char-1"}
+        )
+    return transaction
+
+
+def sent_types(router, message_type):
+    return [
+        call.args[0].destination
+        for call in router.route_message.await_args_list
+        if call.args[0].message_type == message_type
+    ]
+
+
+class TestTwoPhaseCommit:
+    """Test commit coordination."""
+
+    @pytest.mark.asyncio
+    async def test_participants_contacted_in_parallel(self, router_mock, coordinator_log):
+        """Commit latency should track the slowest participant, not the sum."""
+        manager = TransactionManager(router_mock, coordinator_log=coordinator_log)
+        services = [ServiceType.CHARACTER_SERVICE, ServiceType.INVENTORY_SERVICE, ServiceType.RULES_SERVICE]
+        transaction = await new_transaction(manager, services)
+
+        start = time.perf_counter()
+        assert await manager.commit_transaction(transaction.id) is True
+        elapsed = time.perf_counter() - start
+
+        # Two rounds of 50ms; serial delivery would take six
+        assert elapsed < 0.25
+        assert sorted(sent_types(router_mock, MessageType.TRANSACTION_COMMIT)) == sorted(services)
+        assert await coordinator_log.load_pending() == []
+        assert manager.get_commit_latency_percentiles()["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prepare_timeout_aborts(self, router_mock, coordinator_log):
+        """A participant that misses the prepare deadline aborts the transaction."""
+        async def route_message(message):
+            if (message.destination == ServiceType.RULES_SERVICE
+                    and message.message_type == MessageType.TRANSACTION_PREPARE):
+                await asyncio.sleep(1)
+            return ok(message)
+
+        router_mock.route_message = AsyncMock(side_effect=route_message)
+        manager = TransactionManager(router_mock, coordinator_log=coordinator_log)
+        manager.participant_timeout = 0.05
+        transaction = await new_transaction(
+            manager,
+            [ServiceType.CHARACTER_SERVICE, ServiceType.RULES_SERVICE]
+        )
+
+        assert await manager.commit_transaction(transaction.id) is False
+        assert sent_types(router_mock, MessageType.TRANSACTION_COMMIT) == []
+        assert len(sent_types(router_mock, MessageType.TRANSACTION_ROLLBACK)) == 2
+        assert transaction.id in manager.completed_transactions
+
+    @pytest.mark.asyncio
+    async def test_undelivered_commit_stays_in_doubt(self, router_mock, coordinator_log):
+        """Commit failures after the decision are retried, never rolled back."""
+        async def route_message(message):
+            if (message.destination == ServiceType.INVENTORY_SERVICE
+                    and message.message_type == MessageType.TRANSACTION_COMMIT):
+                raise ConnectionError("inventory service down")
+            return ok(message)
+
+        router_mock.route_message = AsyncMock(side_effect=route_message)
+        manager = TransactionManager(router_mock, coordinator_log=coordinator_log)
+        manager.decision_retry_delay = 0
+        transaction = await new_transaction(
+            manager,
+            [ServiceType.CHARACTER_SERVICE, ServiceType.INVENTORY_SERVICE]
+        )
+
+        assert await manager.commit_transaction(transaction.id) is True
+        assert transaction.id in manager.in_doubt
+        assert sent_types(router_mock, MessageType.TRANSACTION_ROLLBACK) == []
+
+        pending = await coordinator_log.load_pending()
+        assert [(p.transaction_id, p.decision) for p in pending] == [
+            (transaction.id, LogRecordType.COMMIT)
+        ]
+
+
+class TestRecovery:
+    """Test in-doubt recovery from the coordinator log."""
+
+    @pytest.mark.asyncio
+    async def test_recover_finishes_logged_decisions(self, router_mock, coordinator_log):
+        """Committed transactions are re-committed; undecided ones are aborted."""
+        participant = {
+            "service": ServiceType.CHARACTER_SERVICE.value,
+            "operation": MessageType.CHARACTER_UPDATED.value,
+            "payload": {"character_id": "char-1"}
+        }
+        await coordinator_log.append(LogRecordType.PREPARING, "tx-commit", participants=[participant])
+        await coordinator_log.append(LogRecordType.COMMIT, "tx-commit")
+        await coordinator_log.append(LogRecordType.PREPARING, "tx-undecided", participants=[participant])
+        await coordinator_log.append(LogRecordType.PREPARING, "tx-done", participants=[participant])
+        await coordinator_log.append(LogRecordType.ABORT, "tx-done")
+        await coordinator_log.append(LogRecordType.END, "tx-done")
+
+        # A fresh coordinator, as after a restart
+        manager = TransactionManager(router_mock, coordinator_log=CoordinatorLog(coordinator_log.path))
+        assert await manager.recover() == 2
+
+        decisions = {
+            call.args[0].payload["transaction_id"]: call.args[0].message_type
+            for call in router_mock.route_message.await_args_list
+        }
+        assert decisions == {
+            "tx-commit": MessageType.TRANSACTION_COMMIT,
+            "tx-undecided": MessageType.TRANSACTION_ROLLBACK
+        }
+        assert await coordinator_log.load_pending() == []
+
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_pending_transactions(self, coordinator_log):
+        """Compaction drops finished transactions only."""
+        await coordinator_log.append(LogRecordType.PREPARING, "tx-1", participants=[])
+        await coordinator_log.append(LogRecordType.COMMIT, "tx-1")
+        await coordinator_log.append(LogRecordType.END, "tx-1")
+        await coordinator_log.append(LogRecordType.PREPARING, "tx-2", participants=[])
+        await coordinator_log.append(LogRecordType.COMMIT, "tx-2")
+
+        await coordinator_log.compact()
+
+        with open(coordinator_log.path) as f:
+            assert len(f.readlines()) == 2
+        pending = await coordinator_log.load_pending()
+        assert [(p.transaction_id, p.decision) for p in pending] == [("tx-2", LogRecordType.COMMIT)]
+
+    @pytest.mark.asyncio
+    async def test_log_path_comes_from_settings(self, router_mock, tmp_path, monkeypatch):
+        """Without an explicit log, the coordinator opens TRANSACTION_LOG_PATH."""
+        path = str(tmp_path / "configured.log")
+        monkeypatch.setattr(settings, "TRANSACTION_LOG_PATH", path)
+
+        manager = TransactionManager(router_mock)
+
+        assert manager.coordinator_log.path == path
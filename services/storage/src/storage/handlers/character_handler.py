@@ -3,35 +3,61 @@
 This module implements the storage interface for character data through message-based interactions.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
-from storage.core.errors import NotFoundError
-from storage.core.handler import BaseMessageHandler
-from storage.repositories.character_repository import CharacterRepository
-from storage.schemas.character import (
-    CharacterResponse,
-    InventoryItemResponse,
-    JournalEntryResponse,
-    ExperienceEntryResponse,
-    QuestResponse,
-    NPCRelationshipResponse,
-    CampaignEventResponse,
-    EventImpactResponse,
-    CharacterProgressResponse,
-)
-
-class CharacterMessageHandler(BaseMessageHandler):
+if TYPE_CHECKING:
+    # Only needed for annotations; the handler works with any repository
+    from storage.repositories.character_repository import CharacterRepository
+
+# Batch request types and the single request type and result key they batch
+BATCH_GET_TYPES = {
+    "storage.character.batch_get": ("storage.character.get_character", "character"),
+    "storage.character.inventory_item.batch_get": ("storage.character.get_inventory_item", "item"),
+    "storage.character.journal_entry.batch_get": ("storage.character.get_journal_entry", "entry"),
+    "storage.character.experience_entry.batch_get": ("storage.character.get_experience_entry", "entry"),
+    "storage.character.quest.batch_get": ("storage.character.get_quest", "quest"),
+    "storage.character.npc_relationship.batch_get": ("storage.character.get_npc_relationship", "relationship"),
+    "storage.character.campaign_event.batch_get": ("storage.character.get_campaign_event", "event"),
+    "storage.character.event_impact.batch_get": ("storage.character.get_event_impact", "impact"),
+    "storage.character.character_progress.batch_get": ("storage.character.get_character_progress", "progress"),
+}
+
+
+class CharacterMessageHandler:
     """Handler for character database operations via messages."""
 
-    def __init__(self, character_repository: CharacterRepository):
+    def __init__(self, character_repository: "CharacterRepository"):
         self.repository = character_repository
 
     async def handle_message(self, message_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming messages based on type."""
+        # Batch operations; results are returned in request order, and a
+        # request that fails is answered with {"error": message}
+        if message_type == "storage.character.batch_get":
+            return {"results": await self._get_characters(data["requests"])}
+
+        elif message_type == "storage.character.sheet.batch_get":
+            return {"results": [
+                await self._get_batch_item(self._get_character_sheet, request)
+                for request in data["requests"]
+            ]}
+
+        elif message_type in BATCH_GET_TYPES:
+            single_type, result_key = BATCH_GET_TYPES[message_type]
+
+            async def get(request: Dict[str, Any]) -> Any:
+                response = await self.handle_message(single_type, request)
+                return response[result_key]
+
+            # The session is shared, so requests are handled one at a time
+            return {"results": [
+                await self._get_batch_item(get, request)
+                for request in data["requests"]
+            ]}
+
         # Core character operations
-        if message_type == "storage.character.get_character":
+        elif message_type == "storage.character.get_character":
             character = await self.repository.get_character(UUID(data["id"]))
             return {"character": character.model_dump() if character else None}
 
@@ -325,4 +351,57 @@ class CharacterMessageHandler(BaseMessageHandler):
             )
             return {"progress": progress.model_dump() if progress else None}
 
-        raise ValueError(f"Unknown message type: {message_type}")
\ No newline at end of file
+        raise ValueError(f"Unknown message type: {message_type}")
+
+    async def _get_characters(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Get the characters of a batch in one query."""
+        results: List[Any] = [None] * len(requests)
+        ids: Dict[int, UUID] = {}
+        for index, request in enumerate(requests):
+            try:
+                ids[index] = UUID(request["id"])
+            except (KeyError, TypeError, ValueError):
+                results[index] = {"error": f"Invalid character ID in request {request}"}
+
+        try:
+            characters = {
+                character.id: character
+                for character in await self.repository.get_characters(list(ids.values()))
+            }
+        except Exception as e:
+            for index in ids:
+                results[index] = {"error": str(e)}
+            return results
+
+        for index, id in ids.items():
+            results[index] = characters[id].model_dump() if id in characters else None
+        return results
+
+    async def _get_batch_item(
+        self,
+        get: Callable[[Dict[str, Any]], Awaitable[Any]],
+        request: Dict[str, Any]
+    ) -> Any:
+        """Get the result of one batch request, or the error it failed with."""
+        try:
+            return await get(request)
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _get_character_sheet(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a character with its inventory, journal and progress."""
+        response = await self.handle_message("storage.character.get_character", request)
+        if not response["character"]:
+            return None
+
+        # A sheet holds every item and entry, so the lists are not paged
+        related = {"character_id": request["id"], "limit": None}
+        inventory = await self.handle_message("storage.character.list_inventory_items", related)
+        journal = await self.handle_message("storage.character.list_journal_entries", related)
+        progress = await self.handle_message("storage.character.get_character_progress", related)
+        return {
+            "character": response["character"],
+            "inventory": inventory["items"],
+            "journal_entries": journal["entries"],
+            "progress": progress["progress"],
+        }
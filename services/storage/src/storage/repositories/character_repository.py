@@ -60,6 +60,23 @@ class CharacterRepository(BaseRepository):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_characters(self, character_ids: List[UUID]) -> List[Character]:
+        """Get the characters with the given IDs in one query."""
+        query = select(Character).where(
+            and_(
+                Character.id.in_(character_ids),
+                Character.is_deleted == False
+            )
+        ).options(
+            selectinload(Character.inventory),
+            selectinload(Character.spellcasting),
+            selectinload(Character.conditions),
+            selectinload(Character.journal_entries),
+            selectinload(Character.class_resources)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
     async def update_character(self, character_id: UUID, character_data: Dict) -> Optional[Character]:
         """Update a character."""
         if not character_data:
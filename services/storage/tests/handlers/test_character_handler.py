@@ -0,0 +1,149 @@
+"""Tests for the character message handler batch operations."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from storage.handlers.character_handler import CharacterMessageHandler
+
+
+def record(**fields):
+    """Create a repository record that dumps to its fields."""
+    return SimpleNamespace(**fields, model_dump=lambda: dict(fields))
+
+
+@pytest.fixture
+def repository():
+    """Create a mock character repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def handler(repository):
+    """Create a character message handler."""
+    return CharacterMessageHandler(repository)
+
+
+@pytest.mark.asyncio
+async def test_character_batch_uses_one_query(handler, repository):
+    """Characters are loaded in one query and returned in request order."""
+    ids = [uuid4() for _ in range(3)]
+    repository.get_characters.return_value = [
+        record(id=id, name=f"Character {i}") for i, id in enumerate(ids[:2])
+    ]
+
+    response = await handler.handle_message("storage.character.batch_get", {
+        "requests": [{"id": str(ids[2])}, {"id": str(ids[1])}, {"id": str(ids[0])}]
+    })
+
+    repository.get_characters.assert_awaited_once_with([ids[2], ids[1], ids[0]])
+    assert response["results"] == [
+        None,
+        {"id": ids[1], "name": "Character 1"},
+        {"id": ids[0], "name": "Character 0"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_character_batch_reports_invalid_requests(handler, repository):
+    """An invalid ID fails its own request only."""
+    id = uuid4()
+    repository.get_characters.return_value = [record(id=id)]
+
+    response = await handler.handle_message("storage.character.batch_get", {
+        "requests": [{"id": "not-a-uuid"}, {"id": str(id)}]
+    })
+
+    assert set(response["results"][0]) == {"error"}
+    assert response["results"][1] == {"id": id}
+    repository.get_characters.assert_awaited_once_with([id])
+
+
+@pytest.mark.asyncio
+async def test_character_batch_query_failure(handler, repository):
+    """A failed query is reported for every request of the batch."""
+    repository.get_characters.side_effect = RuntimeError("connection lost")
+
+    response = await handler.handle_message("storage.character.batch_get", {
+        "requests": [{"id": str(uuid4())}, {"id": str(uuid4())}]
+    })
+
+    assert response["results"] == [{"error": "connection lost"}] * 2
+
+
+@pytest.mark.asyncio
+async def test_entity_batch_isolates_failures(handler, repository):
+    """Other entities are read one at a time and fail one at a time."""
+    ids = [uuid4() for _ in range(3)]
+    items = {ids[0]: record(id=ids[0], name="Rope"), ids[2]: record(id=ids[2], name="Torch")}
+
+    async def get_inventory_item(item_id, character_id):
+        if item_id == ids[1]:
+            raise RuntimeError("row locked")
+        return items.get(item_id)
+
+    repository.get_inventory_item.side_effect = get_inventory_item
+
+    response = await handler.handle_message("storage.character.inventory_item.batch_get", {
+        "requests": [{"id": str(id)} for id in ids] + [{"id": str(uuid4())}]
+    })
+
+    assert response["results"] == [
+        {"id": ids[0], "name": "Rope"},
+        {"error": "row locked"},
+        {"id": ids[2], "name": "Torch"},
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sheet_batch(handler, repository):
+    """Sheets hold every item and entry, and a missing character has none."""
+    id, missing = uuid4(), uuid4()
+    repository.get_character.side_effect = (
+        lambda character_id: record(id=id) if character_id == id else None
+    )
+    repository.list_inventory_items.return_value = [record(name="Rope")]
+    repository.list_journal_entries.return_value = [record(content="Day 1")]
+    repository.get_character_progress.return_value = record(level=3)
+
+    response = await handler.handle_message("storage.character.sheet.batch_get", {
+        "requests": [{"id": str(id)}, {"id": str(missing)}]
+    })
+
+    assert response["results"] == [
+        {
+            "character": {"id": id},
+            "inventory": [{"name": "Rope"}],
+            "journal_entries": [{"content": "Day 1"}],
+            "progress": {"level": 3},
+        },
+        None,
+    ]
+    assert repository.list_inventory_items.await_args.kwargs["limit"] is None
+    assert repository.list_journal_entries.await_args.kwargs["limit"] is None
+
+
+@pytest.mark.asyncio
+async def test_sheet_batch_isolates_failures(handler, repository):
+    """A sheet that cannot be read fails its own request only."""
+    id, broken = uuid4(), uuid4()
+    repository.get_character.side_effect = lambda character_id: record(id=character_id)
+    repository.list_inventory_items.return_value = []
+    repository.list_journal_entries.return_value = []
+
+    async def get_character_progress(character_id):
+        if character_id == broken:
+            raise RuntimeError("progress unavailable")
+        return None
+
+    repository.get_character_progress.side_effect = get_character_progress
+
+    response = await handler.handle_message("storage.character.sheet.batch_get", {
+        "requests": [{"id": str(broken)}, {"id": str(id)}]
+    })
+
+    assert response["results"][0] == {"error": "progress unavailable"}
+    assert response["results"][1]["character"] == {"id": id}